@@ -0,0 +1,733 @@
+"""
+PostgreSQL: общая база для нескольких процессов бота (пул asyncpg).
+
+Запросы database.py написаны на общем для SQLite и PostgreSQL подмножестве SQL;
+PostgresConnection принимает их в том же виде, что и aiosqlite:
+плейсхолдеры '?' и ':name' переводятся в $1, $2, ..., а транзакции
+открываются неявно перед первой записью и закрываются commit()/rollback(),
+как в модуле sqlite3.
+
+Схема создаётся своими миграциями (MIGRATIONS): их номера совпадают
+с миграциями SQLite в database.py, номер схемы хранится в schema_version.
+"""
+from contextlib import asynccontextmanager
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple, Union
+
+from backends import Backend
+
+# Ключ pg_advisory_xact_lock: миграции двух процессов не выполняются одновременно
+_MIGRATION_LOCK_ID = 7_201_604
+
+_WRITE_KEYWORDS = ('INSERT', 'UPDATE', 'DELETE')
+_ROW_KEYWORDS = ('SELECT', 'WITH', 'VALUES')
+
+
+def _import_asyncpg():
+    try:
+        import asyncpg
+    except ImportError as e:
+        raise RuntimeError(
+            "DATABASE_URL points to PostgreSQL, but asyncpg is not installed: "
+            "pip install asyncpg"
+        ) from e
+    return asyncpg
+
+
+@lru_cache(maxsize=1024)
+def _compile_query(sql: str) -> Tuple[str, Tuple[Union[int, str], ...]]:
+    """
+    '?' и ':name' -> $1, $2, ...; строки, идентификаторы в кавычках
+    и комментарии не трогаются. Возвращает текст запроса и ключи
+    параметров по порядку номеров ($1 — первый ключ).
+    """
+    out = []
+    keys: List[Union[int, str]] = []
+    numbers = {}
+    positional = 0
+    i, n = 0, len(sql)
+    while i < n:
+        ch = sql[i]
+        if ch in ("'", '"'):
+            end = sql.find(ch, i + 1)
+            # Удвоенная кавычка внутри строки — экранирование, строка продолжается
+            while end != -1 and sql.startswith(ch, end + 1):
+                end = sql.find(ch, end + 2)
+            end = n if end == -1 else end + 1
+            out.append(sql[i:end])
+            i = end
+        elif sql.startswith('--', i):
+            end = sql.find('\n', i)
+            end = n if end == -1 else end
+            out.append(sql[i:end])
+            i = end
+        elif sql.startswith('/*', i):
+            end = sql.find('*/', i + 2)
+            end = n if end == -1 else end + 2
+            out.append(sql[i:end])
+            i = end
+        elif ch == '?':
+            keys.append(positional)
+            positional += 1
+            out.append(f'${len(keys)}')
+            i += 1
+        elif (ch == ':' and i + 1 < n and (sql[i + 1].isalpha() or sql[i + 1] == '_')
+              and (i == 0 or sql[i - 1] != ':')):
+            j = i + 1
+            while j < n and (sql[j].isalnum() or sql[j] == '_'):
+                j += 1
+            name = sql[i + 1:j]
+            if name not in numbers:
+                keys.append(name)
+                numbers[name] = len(keys)
+            out.append(f'${numbers[name]}')
+            i = j
+        else:
+            out.append(ch)
+            i += 1
+    return ''.join(out), tuple(keys)
+
+
+def translate_query(sql: str, parameters: Any = None) -> Tuple[str, list]:
+    """Запрос в стиле sqlite3 -> запрос asyncpg и список аргументов"""
+    query, keys = _compile_query(sql)
+    if not keys:
+        return query, []
+    return query, [parameters[key] for key in keys]
+
+
+def _status_rowcount(status: str) -> int:
+    """rowcount из статуса команды: 'INSERT 0 5' -> 5, 'UPDATE 3' -> 3"""
+    command, _, rest = status.partition(' ')
+    if command in _WRITE_KEYWORDS and rest:
+        return int(rest.rsplit(' ', 1)[-1])
+    return -1
+
+
+def _decode_numeric(value: str):
+    """
+    numeric -> int или float, как отдаёт SQLite.
+
+    SUM() по bigint в PostgreSQL возвращает numeric, а отчёты бота
+    смешивают счётчики с float в арифметике; Decimal там не нужен.
+    """
+    number = Decimal(value)
+    if number == number.to_integral_value():
+        return int(number)
+    return float(number)
+
+
+async def _init_connection(raw):
+    await raw.set_type_codec(
+        'numeric', encoder=str, decoder=_decode_numeric,
+        schema='pg_catalog', format='text'
+    )
+
+
+class PostgresCursor:
+    """Результат запроса с интерфейсом курсора aiosqlite (строки уже получены)"""
+
+    def __init__(self, rows: list, rowcount: int):
+        self._rows = rows
+        self._position = 0
+        self.rowcount = rowcount
+
+    async def fetchone(self):
+        if self._position >= len(self._rows):
+            return None
+        row = self._rows[self._position]
+        self._position += 1
+        return row
+
+    async def fetchall(self) -> list:
+        rows = self._rows[self._position:]
+        self._position = len(self._rows)
+        return rows
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        row = await self.fetchone()
+        if row is None:
+            raise StopAsyncIteration
+        return row
+
+    async def close(self):
+        self._rows = []
+
+
+class _ExecuteResult:
+    """execute() можно и ждать (await), и открывать как async with — как в aiosqlite"""
+
+    def __init__(self, coro):
+        self._coro = coro
+        self._cursor: Optional[PostgresCursor] = None
+
+    def __await__(self):
+        return self._coro.__await__()
+
+    async def __aenter__(self) -> PostgresCursor:
+        self._cursor = await self._coro
+        return self._cursor
+
+    async def __aexit__(self, *exc_info):
+        await self._cursor.close()
+
+
+class PostgresConnection:
+    """Соединение asyncpg с интерфейсом соединения aiosqlite"""
+
+    def __init__(self, raw):
+        self._raw = raw
+
+    @property
+    def in_transaction(self) -> bool:
+        return self._raw.is_in_transaction()
+
+    def execute(self, sql: str, parameters: Any = None) -> _ExecuteResult:
+        return _ExecuteResult(self._execute(sql, parameters))
+
+    async def _execute(self, sql: str, parameters: Any) -> PostgresCursor:
+        statement = sql.strip().rstrip(';')
+        keyword = statement.split(None, 1)[0].upper()
+
+        if keyword == 'BEGIN':
+            # BEGIN IMMEDIATE SQLite: в PostgreSQL блокировки берутся по строкам
+            await self._raw.execute('BEGIN')
+            return PostgresCursor([], -1)
+        if keyword in _WRITE_KEYWORDS:
+            await self._begin_implicit()
+
+        query, args = translate_query(statement, parameters)
+        if keyword in _ROW_KEYWORDS or 'RETURNING' in statement.upper():
+            rows = await self._raw.fetch(query, *args)
+            return PostgresCursor(rows, len(rows) if keyword in _WRITE_KEYWORDS else -1)
+
+        status = await self._raw.execute(query, *args)
+        return PostgresCursor([], _status_rowcount(status))
+
+    async def executemany(self, sql: str, seq_of_parameters):
+        statement = sql.strip().rstrip(';')
+        await self._begin_implicit()
+        query, keys = _compile_query(statement)
+        await self._raw.executemany(
+            query, [[parameters[key] for key in keys] for parameters in seq_of_parameters]
+        )
+
+    async def _begin_implicit(self):
+        # Как sqlite3: запись открывает транзакцию, её закрывает commit()
+        if not self._raw.is_in_transaction():
+            await self._raw.execute('BEGIN')
+
+    async def commit(self):
+        if self._raw.is_in_transaction():
+            await self._raw.execute('COMMIT')
+
+    async def rollback(self):
+        if self._raw.is_in_transaction():
+            await self._raw.execute('ROLLBACK')
+
+
+class PostgresBackend(Backend):
+    """Пул asyncpg; читающие соединения — REPEATABLE READ READ ONLY из того же пула"""
+
+    dialect = 'postgresql'
+
+    def __init__(self, dsn: str, size: int, read_size: int):
+        self.dsn = dsn
+        self.size = size
+        self.read_size = read_size
+        self._pool = None
+
+    async def open(self):
+        asyncpg = _import_asyncpg()
+        self._pool = await asyncpg.create_pool(
+            self.dsn,
+            min_size=1,
+            max_size=self.size + self.read_size,
+            init=_init_connection,
+        )
+
+    async def close(self):
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            await pool.close()
+
+    @asynccontextmanager
+    async def acquire(self):
+        async with self._pool.acquire() as raw:
+            db = PostgresConnection(raw)
+            try:
+                yield db
+            finally:
+                # Незакоммиченная транзакция не должна утекать в следующий запрос
+                await db.rollback()
+
+    @asynccontextmanager
+    async def acquire_read(self):
+        async with self._pool.acquire() as raw:
+            db = PostgresConnection(raw)
+            # Снимок на всю транзакцию: цифры отчёта согласованы между собой
+            await raw.execute('BEGIN ISOLATION LEVEL REPEATABLE READ READ ONLY')
+            try:
+                yield db
+            finally:
+                await db.rollback()
+
+    async def get_schema_version(self, db) -> int:
+        async with db.execute("SELECT to_regclass('schema_version') IS NOT NULL") as cursor:
+            if not (await cursor.fetchone())[0]:
+                return 0
+        async with db.execute('SELECT version FROM schema_version WHERE id = 1') as cursor:
+            row = await cursor.fetchone()
+            return row[0] if row else 0
+
+    async def begin_migration(self, db):
+        await db.execute('BEGIN')
+        await db.execute('SELECT pg_advisory_xact_lock(?)', (_MIGRATION_LOCK_ID,))
+        await db.execute('''
+            CREATE TABLE IF NOT EXISTS schema_version (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                version INTEGER NOT NULL
+            )
+        ''')
+
+    async def set_schema_version(self, db, version: int):
+        await db.execute('''
+            INSERT INTO schema_version (id, version) VALUES (1, ?)
+            ON CONFLICT (id) DO UPDATE SET version = excluded.version
+        ''', (version,))
+
+
+# ==================== Schema Migrations ====================
+
+# Значение CURRENT_TIMESTAMP в SQLite: UTC-строка 'YYYY-MM-DD HH:MM:SS'
+_NOW_UTC = "to_char(now() AT TIME ZONE 'UTC', 'YYYY-MM-DD HH24:MI:SS')"
+
+# База SQLite работает без PRAGMA foreign_keys: ссылки между таблицами
+# не проверяются, поэтому и здесь внешние ключи не объявлены —
+# одинаковое поведение удалений на обоих бэкендах.
+_SCHEMA_007 = [
+    f'''
+    CREATE TABLE users (
+        user_id BIGINT PRIMARY KEY,
+        username TEXT,
+        first_name TEXT,
+        has_paid INTEGER DEFAULT 0,
+        has_paid_fmd INTEGER DEFAULT 0,
+        has_paid_bundle INTEGER DEFAULT 0,
+        payment_request_date TEXT,
+        fmd_payment_request_date TEXT,
+        bundle_payment_request_date TEXT,
+        has_paid_dry INTEGER DEFAULT 0,
+        dry_payment_request_date TEXT,
+        created_at TEXT DEFAULT {_NOW_UTC},
+        entitlements INTEGER GENERATED ALWAYS AS (
+            (COALESCE(has_paid, 0) != 0)::int
+            | ((COALESCE(has_paid_fmd, 0) != 0)::int << 1)
+            | ((COALESCE(has_paid_bundle, 0) != 0)::int << 2)
+            | ((COALESCE(has_paid_dry, 0) != 0)::int << 3)
+        ) STORED
+    )
+    ''',
+    f'''
+    CREATE TABLE payment_requests (
+        id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+        user_id BIGINT NOT NULL,
+        status TEXT CHECK(status IN ('pending', 'approved', 'rejected')) DEFAULT 'pending',
+        admin_message_id BIGINT,
+        product_type TEXT DEFAULT 'main',
+        created_at TEXT DEFAULT {_NOW_UTC}
+    )
+    ''',
+    f'''
+    CREATE TABLE recipes (
+        id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+        calories INTEGER NOT NULL,
+        day INTEGER NOT NULL,
+        meal_type TEXT CHECK(meal_type IN ('breakfast', 'lunch', 'dinner')) NOT NULL,
+        content TEXT NOT NULL,
+        updated_at TEXT DEFAULT {_NOW_UTC},
+        updated_by TEXT,
+        UNIQUE(calories, day, meal_type)
+    )
+    ''',
+    f'''
+    CREATE TABLE user_events (
+        id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+        user_id BIGINT NOT NULL,
+        event_type TEXT NOT NULL,
+        metadata TEXT,
+        created_at TEXT DEFAULT {_NOW_UTC}
+    )
+    ''',
+    f'''
+    CREATE TABLE followup_messages (
+        id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+        user_id BIGINT NOT NULL,
+        message_type TEXT NOT NULL,
+        scheduled_at TEXT NOT NULL,
+        sent_at TEXT,
+        status TEXT CHECK(status IN ('pending', 'sent', 'cancelled', 'failed')) DEFAULT 'pending',
+        created_at TEXT DEFAULT {_NOW_UTC}
+    )
+    ''',
+    f'''
+    CREATE TABLE calculator_results (
+        id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+        user_id BIGINT NOT NULL,
+        gender TEXT,
+        age INTEGER,
+        height DOUBLE PRECISION,
+        weight DOUBLE PRECISION,
+        steps INTEGER,
+        cardio INTEGER,
+        strength INTEGER,
+        goal TEXT,
+        hormones TEXT,
+        level TEXT,
+        calories DOUBLE PRECISION,
+        protein INTEGER,
+        fats INTEGER,
+        carbs DOUBLE PRECISION,
+        created_at TEXT DEFAULT {_NOW_UTC}
+    )
+    ''',
+    f'''
+    CREATE TABLE broadcasts (
+        id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+        content TEXT NOT NULL,
+        audience TEXT NOT NULL CHECK(audience IN ('all', 'start_only', 'rejected', 'no_screenshot')),
+        scheduled_at TEXT NOT NULL,
+        status TEXT CHECK(status IN ('pending', 'sending', 'sent', 'cancelled')) DEFAULT 'pending',
+        created_by BIGINT NOT NULL,
+        created_by_username TEXT,
+        sent_count INTEGER DEFAULT 0,
+        failed_count INTEGER DEFAULT 0,
+        media_type TEXT CHECK(media_type IN ('photo', 'video', NULL)),
+        media_file_id TEXT,
+        buttons TEXT,
+        created_at TEXT DEFAULT {_NOW_UTC},
+        sent_at TEXT
+    )
+    ''',
+    f'''
+    CREATE TABLE broadcast_templates (
+        id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+        name TEXT,
+        content TEXT NOT NULL,
+        created_by BIGINT NOT NULL,
+        created_by_username TEXT,
+        media_type TEXT CHECK(media_type IN ('photo', 'video', NULL)),
+        media_file_id TEXT,
+        buttons TEXT,
+        created_at TEXT DEFAULT {_NOW_UTC}
+    )
+    ''',
+    f'''
+    CREATE TABLE auto_broadcasts (
+        id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+        trigger_type TEXT NOT NULL CHECK(trigger_type IN ('only_start', 'no_payment', 'rejected', 'no_screenshot')),
+        content TEXT NOT NULL,
+        delay_hours INTEGER NOT NULL DEFAULT 24,
+        is_active INTEGER DEFAULT 1,
+        created_by BIGINT NOT NULL,
+        created_by_username TEXT,
+        sent_count INTEGER DEFAULT 0,
+        media_type TEXT CHECK(media_type IN ('photo', 'video', NULL)),
+        media_file_id TEXT,
+        buttons TEXT,
+        created_at TEXT DEFAULT {_NOW_UTC}
+    )
+    ''',
+    f'''
+    CREATE TABLE auto_broadcast_sent (
+        id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+        auto_broadcast_id BIGINT NOT NULL,
+        user_id BIGINT NOT NULL,
+        sent_at TEXT DEFAULT {_NOW_UTC},
+        UNIQUE(auto_broadcast_id, user_id)
+    )
+    ''',
+    f'''
+    CREATE TABLE broadcast_chains (
+        id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+        name TEXT NOT NULL,
+        description TEXT,
+        trigger_type TEXT NOT NULL CHECK(trigger_type IN ('manual', 'subscription_end', 'payment_approved', 'custom')),
+        is_active INTEGER DEFAULT 1,
+        created_by BIGINT NOT NULL,
+        created_by_username TEXT,
+        created_at TEXT DEFAULT {_NOW_UTC}
+    )
+    ''',
+    f'''
+    CREATE TABLE chain_steps (
+        id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+        chain_id BIGINT NOT NULL,
+        step_order INTEGER NOT NULL,
+        content TEXT NOT NULL,
+        media_type TEXT CHECK(media_type IN ('photo', 'video', NULL)),
+        media_file_id TEXT,
+        delay_hours INTEGER DEFAULT 0,
+        created_at TEXT DEFAULT {_NOW_UTC},
+        UNIQUE(chain_id, step_order)
+    )
+    ''',
+    f'''
+    CREATE TABLE chain_step_buttons (
+        id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+        step_id BIGINT NOT NULL,
+        button_text TEXT NOT NULL,
+        button_order INTEGER NOT NULL,
+        action_type TEXT NOT NULL CHECK(action_type IN ('next_step', 'goto_step', 'url', 'command', 'stop_chain', 'payment_main', 'payment_fmd', 'payment_bundle')),
+        action_value TEXT,
+        next_step_id BIGINT,
+        created_at TEXT DEFAULT {_NOW_UTC}
+    )
+    ''',
+    f'''
+    CREATE TABLE chain_user_state (
+        id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+        user_id BIGINT NOT NULL,
+        chain_id BIGINT NOT NULL,
+        current_step_id BIGINT NOT NULL,
+        status TEXT CHECK(status IN ('active', 'completed', 'stopped')) DEFAULT 'active',
+        started_at TEXT DEFAULT {_NOW_UTC},
+        last_action_at TEXT,
+        next_message_at TEXT,
+        UNIQUE(user_id, chain_id)
+    )
+    ''',
+    f'''
+    CREATE TABLE chain_message_history (
+        id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+        user_id BIGINT NOT NULL,
+        chain_id BIGINT NOT NULL,
+        step_id BIGINT NOT NULL,
+        button_clicked TEXT,
+        sent_at TEXT DEFAULT {_NOW_UTC}
+    )
+    ''',
+    '''
+    CREATE TABLE daily_rollups (
+        day TEXT NOT NULL,
+        product TEXT NOT NULL,
+        new_users INTEGER DEFAULT 0,
+        starts INTEGER DEFAULT 0,
+        payment_clicks INTEGER DEFAULT 0,
+        screenshots INTEGER DEFAULT 0,
+        approvals INTEGER DEFAULT 0,
+        rejections INTEGER DEFAULT 0,
+        followups_sent INTEGER DEFAULT 0,
+        calculator_completions INTEGER DEFAULT 0,
+        PRIMARY KEY (day, product)
+    )
+    ''',
+    '''
+    CREATE TABLE rollup_state (
+        name TEXT PRIMARY KEY,
+        value TEXT
+    )
+    ''',
+    '''
+    CREATE TABLE chain_message_totals (
+        chain_id BIGINT PRIMARY KEY,
+        archived_messages INTEGER NOT NULL DEFAULT 0
+    )
+    ''',
+
+    # Индексы — те же, что у SQLite (миграции 001, 003, 005)
+    'CREATE INDEX idx_followup_pending ON followup_messages(status, scheduled_at)',
+    'CREATE INDEX idx_user_events_type ON user_events(event_type, created_at)',
+    'CREATE INDEX idx_broadcasts_pending ON broadcasts(status, scheduled_at)',
+    'CREATE INDEX idx_chain_user_state_active ON chain_user_state(status, next_message_at)',
+    'CREATE INDEX idx_chain_steps_order ON chain_steps(chain_id, step_order)',
+    'CREATE INDEX idx_user_events_user_type ON user_events(user_id, event_type, created_at)',
+    'CREATE INDEX idx_payment_requests_user ON payment_requests(user_id, status, product_type)',
+    'CREATE INDEX idx_payment_requests_status ON payment_requests(status, created_at)',
+    'CREATE INDEX idx_users_created_at ON users(created_at)',
+    'CREATE INDEX idx_users_paid ON users(payment_request_date) WHERE has_paid = 1',
+    'CREATE INDEX idx_calculator_results_user ON calculator_results(user_id, created_at)',
+    'CREATE INDEX idx_calculator_results_created ON calculator_results(created_at)',
+    'CREATE INDEX idx_followup_user_type ON followup_messages(user_id, message_type, status)',
+    "CREATE INDEX idx_followup_sent ON followup_messages(sent_at) WHERE status = 'sent'",
+    'CREATE INDEX idx_chain_user_state_chain ON chain_user_state(chain_id, status)',
+    'CREATE INDEX idx_chain_step_buttons_step ON chain_step_buttons(step_id, button_order)',
+    'CREATE INDEX idx_chain_message_history_chain ON chain_message_history(chain_id)',
+    'CREATE INDEX idx_users_created_has_paid ON users(created_at, user_id) WHERE has_paid = 1',
+    'CREATE INDEX idx_users_created_has_paid_fmd ON users(created_at, user_id) WHERE has_paid_fmd = 1',
+    'CREATE INDEX idx_users_created_has_paid_bundle ON users(created_at, user_id) WHERE has_paid_bundle = 1',
+    'CREATE INDEX idx_users_created_has_paid_dry ON users(created_at, user_id) WHERE has_paid_dry = 1',
+
+    # Поиск пользователей (вместо FTS5 trigram из миграции 006): точное
+    # совпадение username и подстроки LIKE '%...%' по триграммным индексам
+    'CREATE EXTENSION IF NOT EXISTS pg_trgm',
+    'CREATE INDEX idx_users_username_lower ON users(LOWER(username))',
+    'CREATE INDEX idx_users_username_trgm ON users USING gin (LOWER(username) gin_trgm_ops)',
+    'CREATE INDEX idx_users_first_name_trgm ON users USING gin (LOWER(first_name) gin_trgm_ops)',
+
+    # instr() из SQLite: разбор metadata в агрегатах daily_rollups
+    '''
+    CREATE OR REPLACE FUNCTION instr(text, text) RETURNS integer
+    LANGUAGE sql IMMUTABLE STRICT
+    AS 'SELECT strpos($1, $2)'
+    ''',
+
+    # Архив run_retention() (в SQLite — отдельный файл через ATTACH)
+    'CREATE SCHEMA IF NOT EXISTS archive',
+]
+
+
+async def _migration_007_base_schema(db):
+    """Схема целиком в состоянии миграции 007 SQLite"""
+    for statement in _SCHEMA_007:
+        await db.execute(statement)
+
+
+# Секунды Unix рядом с текстовыми метками времени (EPOCH_COLUMNS в database.py);
+# старые строки заполняет database.backfill_timestamps()
+_SCHEMA_008 = [
+    'ALTER TABLE users ADD COLUMN created_ts BIGINT, ADD COLUMN payment_request_ts BIGINT',
+    'ALTER TABLE payment_requests ADD COLUMN created_ts BIGINT',
+    'ALTER TABLE calculator_results ADD COLUMN created_ts BIGINT',
+    'ALTER TABLE user_events ADD COLUMN created_ts BIGINT',
+    '''
+    ALTER TABLE followup_messages
+        ADD COLUMN scheduled_ts BIGINT, ADD COLUMN sent_ts BIGINT, ADD COLUMN created_ts BIGINT
+    ''',
+    'ALTER TABLE broadcasts ADD COLUMN scheduled_ts BIGINT',
+    'ALTER TABLE auto_broadcast_sent ADD COLUMN sent_ts BIGINT',
+    'ALTER TABLE chain_user_state ADD COLUMN next_message_ts BIGINT',
+    'ALTER TABLE chain_message_history ADD COLUMN sent_ts BIGINT',
+
+    # Те же замены индексов, что и в миграции 008 SQLite
+    'DROP INDEX IF EXISTS idx_followup_pending',
+    'DROP INDEX IF EXISTS idx_followup_sent',
+    'DROP INDEX IF EXISTS idx_broadcasts_pending',
+    'DROP INDEX IF EXISTS idx_chain_user_state_active',
+    'DROP INDEX IF EXISTS idx_calculator_results_created',
+    'DROP INDEX IF EXISTS idx_user_events_type',
+    'DROP INDEX IF EXISTS idx_user_events_user_type',
+    'CREATE INDEX idx_users_created_ts ON users(created_ts)',
+    'CREATE INDEX idx_users_paid_ts ON users(payment_request_ts) WHERE has_paid = 1',
+    'CREATE INDEX idx_user_events_type_ts ON user_events(event_type, created_ts)',
+    'CREATE INDEX idx_user_events_user_type_ts ON user_events(user_id, event_type, created_ts)',
+    'CREATE INDEX idx_calculator_results_created_ts ON calculator_results(created_ts)',
+    'CREATE INDEX idx_followup_pending_ts ON followup_messages(status, scheduled_ts)',
+    "CREATE INDEX idx_followup_sent_ts ON followup_messages(sent_ts) WHERE status = 'sent'",
+    'CREATE INDEX idx_broadcasts_pending_ts ON broadcasts(status, scheduled_ts)',
+    'CREATE INDEX idx_chain_user_state_active_ts ON chain_user_state(status, next_message_ts)',
+]
+
+
+async def _migration_008_epoch_timestamps(db):
+    """Колонки времени в секундах Unix и индексы выборок за период"""
+    for statement in _SCHEMA_008:
+        await db.execute(statement)
+
+
+# Состояние воронки по пользователям (см. миграцию 009 SQLite)
+_SCHEMA_009 = [
+    '''
+    CREATE TABLE user_funnel (
+        user_id BIGINT PRIMARY KEY,
+        last_start_ts BIGINT,
+        last_click_ts BIGINT,
+        last_screenshot_ts BIGINT,
+        last_calc_started_ts BIGINT,
+        last_calculator_ts BIGINT,
+        first_followup_ts BIGINT,
+        followups_sent INTEGER NOT NULL DEFAULT 0
+    )
+    ''',
+    'CREATE INDEX idx_payment_requests_created_ts ON payment_requests(created_ts)',
+]
+
+
+async def _migration_009_user_funnel(db):
+    """Состояние воронки по пользователям и индекс заявок за период"""
+    for statement in _SCHEMA_009:
+        await db.execute(statement)
+
+
+# daily_rollups в новом виде и без user_funnel (см. миграцию 010 SQLite)
+_SCHEMA_010 = [
+    'DROP TABLE IF EXISTS daily_rollups',
+    '''
+    CREATE TABLE daily_rollups (
+        day TEXT NOT NULL,
+        product TEXT NOT NULL,
+        new_users INTEGER NOT NULL DEFAULT 0,
+        started_users INTEGER NOT NULL DEFAULT 0,
+        clicked_users INTEGER NOT NULL DEFAULT 0,
+        screenshot_users INTEGER NOT NULL DEFAULT 0,
+        clicked_screenshot_users INTEGER NOT NULL DEFAULT 0,
+        engaged_users INTEGER NOT NULL DEFAULT 0,
+        paid_users INTEGER NOT NULL DEFAULT 0,
+        calculator_users INTEGER NOT NULL DEFAULT 0,
+        approvals INTEGER NOT NULL DEFAULT 0,
+        rejections INTEGER NOT NULL DEFAULT 0,
+        followups_sent INTEGER NOT NULL DEFAULT 0,
+        followups_only_start INTEGER NOT NULL DEFAULT 0,
+        followups_clicked_payment INTEGER NOT NULL DEFAULT 0,
+        followup_users INTEGER NOT NULL DEFAULT 0,
+        followup_paid_users INTEGER NOT NULL DEFAULT 0,
+        paid_after_followup_users INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (day, product)
+    )
+    ''',
+    "DELETE FROM rollup_state WHERE name IN ('daily_rollups_refreshed_at', 'user_funnel_backfill')",
+    'DROP TABLE IF EXISTS user_funnel',
+    "CREATE INDEX idx_followup_user_sent_ts ON followup_messages(user_id, sent_ts) WHERE status = 'sent'",
+]
+
+
+async def _migration_010_rollup_first_steps(db):
+    """daily_rollups считает первые шаги пользователей; user_funnel больше не нужна"""
+    for statement in _SCHEMA_010:
+        await db.execute(statement)
+
+
+_SCHEMA_011 = [
+    # LIKE 'ab%' по нижнему регистру: триграммам нужно от 3 символов
+    'CREATE INDEX idx_users_username_prefix ON users(LOWER(username) text_pattern_ops)',
+    'CREATE INDEX idx_users_first_name_prefix ON users(LOWER(first_name) text_pattern_ops)',
+]
+
+
+async def _migration_011_user_search_prefix(db):
+    """Индексы начала имени: короткие запросы поиска пользователей"""
+    for statement in _SCHEMA_011:
+        await db.execute(statement)
+
+
+_SCHEMA_012 = [
+    '''
+    CREATE TABLE cache_generations (
+        name TEXT PRIMARY KEY,
+        generation INTEGER NOT NULL DEFAULT 0
+    )
+    ''',
+    "INSERT INTO cache_generations (name) VALUES ('users'), ('recipes')",
+]
+
+
+async def _migration_012_cache_generations(db):
+    """Счётчики изменений закэшированных данных для других процессов бота (CacheSync)"""
+    for statement in _SCHEMA_012:
+        await db.execute(statement)
+
+
+# Номер миграции -> функция, номера общие с MIGRATIONS в database.py.
+# Схема PostgreSQL появилась на версии 7, поэтому начинается сразу с неё
+MIGRATIONS = [
+    (7, _migration_007_base_schema),
+    (8, _migration_008_epoch_timestamps),
+    (9, _migration_009_user_funnel),
+    (10, _migration_010_rollup_first_steps),
+    (11, _migration_011_user_search_prefix),
+    (12, _migration_012_cache_generations),
+]
@@ -0,0 +1,138 @@
+"""
+SQLite: файл базы рядом с ботом, пулы соединений aiosqlite.
+
+Запись идёт через основной пул, отчёты админки — через отдельный пул
+соединений только для чтения (mode=ro), который открывается при первом отчёте.
+"""
+import asyncio
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import List, Optional
+
+import aiosqlite
+
+from backends import Backend
+
+
+class ConnectionPool:
+    """
+    Пул долгоживущих соединений с SQLite.
+
+    Соединения открываются один раз при старте бота и переиспользуются всеми
+    функциями модуля: не нужно на каждый запрос поднимать новый поток aiosqlite,
+    заново открывать файл и прогревать кэш страниц.
+    """
+
+    def __init__(self, database: str, size: int, readonly: bool = False):
+        self.database = database
+        self.size = size
+        self.readonly = readonly
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._connections: List[aiosqlite.Connection] = []
+
+    async def open(self):
+        """Открыть все соединения пула"""
+        for _ in range(self.size):
+            if self.readonly:
+                # mode=ro: запись через такое соединение невозможна в принципе
+                uri = f'{Path(self.database).absolute().as_uri()}?mode=ro'
+                conn = await aiosqlite.connect(uri, uri=True)
+            else:
+                conn = await aiosqlite.connect(self.database)
+                if not self._connections:
+                    # Действует только на новый пустой файл: освобождённые
+                    # архивацией страницы возвращаются ОС через incremental_vacuum
+                    await conn.execute('PRAGMA auto_vacuum = INCREMENTAL')
+                    # WAL: читатели не блокируют запись и не ждут её.
+                    # Режим хранится в файле базы, достаточно одного соединения
+                    await conn.execute('PRAGMA journal_mode = WAL')
+                    # Соединения mode=ro не могут сами создать файл -shm:
+                    # первое чтение создаёт его, и он живёт, пока открыт пул
+                    async with conn.execute('SELECT COUNT(*) FROM sqlite_master') as cursor:
+                        await cursor.fetchone()
+            conn.row_factory = aiosqlite.Row
+            self._connections.append(conn)
+            self._queue.put_nowait(conn)
+
+    async def close(self):
+        """Дождаться возврата всех соединений и закрыть их"""
+        for _ in range(len(self._connections)):
+            await self._queue.get()
+        for conn in self._connections:
+            await conn.close()
+        self._connections.clear()
+
+    @asynccontextmanager
+    async def acquire(self):
+        """Взять соединение из пула на время блока async with"""
+        conn = await self._queue.get()
+        try:
+            yield conn
+        finally:
+            # Незакоммиченная транзакция (например, после ошибки) не должна
+            # держать блокировку записи и утекать в следующий запрос
+            if conn.in_transaction:
+                await conn.rollback()
+            self._queue.put_nowait(conn)
+
+
+class SQLiteBackend(Backend):
+    """Файл SQLite в режиме WAL: пул записи и ленивый пул только для чтения"""
+
+    dialect = 'sqlite'
+
+    def __init__(self, database: str, size: int, read_size: int):
+        self.database = database
+        self.size = size
+        self.read_size = read_size
+        self._pool: Optional[ConnectionPool] = None
+        self._read_pool: Optional[ConnectionPool] = None
+        self._read_pool_lock = asyncio.Lock()
+
+    async def open(self):
+        # Основной пул создаёт файл базы и включает WAL
+        pool = ConnectionPool(self.database, self.size)
+        await pool.open()
+        self._pool = pool
+
+    async def close(self):
+        if self._read_pool is not None:
+            pool, self._read_pool = self._read_pool, None
+            await pool.close()
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            await pool.close()
+
+    @asynccontextmanager
+    async def acquire(self):
+        async with self._pool.acquire() as db:
+            yield db
+
+    async def _open_read_pool(self) -> ConnectionPool:
+        """Пул соединений только для чтения; открывается при первом отчёте"""
+        async with self._read_pool_lock:
+            if self._read_pool is None:
+                pool = ConnectionPool(self.database, self.read_size, readonly=True)
+                await pool.open()
+                self._read_pool = pool
+        return self._read_pool
+
+    @asynccontextmanager
+    async def acquire_read(self):
+        # В WAL читающая транзакция видит один снимок базы, а запись бота
+        # в это время не ждёт; pool.acquire откатит её на выходе
+        pool = self._read_pool or await self._open_read_pool()
+        async with pool.acquire() as db:
+            await db.execute('BEGIN')
+            yield db
+
+    async def get_schema_version(self, db) -> int:
+        async with db.execute('PRAGMA user_version') as cursor:
+            return (await cursor.fetchone())[0]
+
+    async def begin_migration(self, db):
+        # IMMEDIATE: параллельный запуск дождётся нас и увидит новую версию
+        await db.execute('BEGIN IMMEDIATE')
+
+    async def set_schema_version(self, db, version: int):
+        await db.execute(f'PRAGMA user_version = {int(version)}')
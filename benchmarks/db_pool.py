@@ -0,0 +1,101 @@
+"""
+Бенчмарк пула соединений: задержка одного запроса до и после перехода на пул.
+
+Запуск из корня репозитория:
+    python -m benchmarks.db_pool --iterations 2000
+
+«До» — как было раньше: новое aiosqlite.connect() на каждый вызов.
+«После» — функции database.py через общий пул соединений
+(для log_event — ещё и с фоновым буфером событий).
+База создаётся во временной папке, рабочая bot_database.db не трогается.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from datetime import datetime
+
+import aiosqlite
+
+import database as db
+from database import EventType
+
+USER_ID = 1
+
+
+async def legacy_check_payment_status(user_id: int) -> bool:
+    """check_payment_status в старом виде (соединение на каждый запрос)"""
+    async with aiosqlite.connect(db.DATABASE_NAME) as conn:
+        async with conn.execute(
+            'SELECT has_paid FROM users WHERE user_id = ?', (user_id,)
+        ) as cursor:
+            row = await cursor.fetchone()
+            return bool(row[0]) if row else False
+
+
+async def legacy_log_event(user_id: int, event_type: str, metadata: str = None):
+    """log_event в старом виде (соединение на каждый запрос)"""
+    async with aiosqlite.connect(db.DATABASE_NAME) as conn:
+        await conn.execute('''
+            INSERT INTO user_events (user_id, event_type, metadata, created_at)
+            VALUES (?, ?, ?, ?)
+        ''', (user_id, event_type, metadata, datetime.now().isoformat()))
+        await conn.commit()
+
+
+async def measure(func, iterations: int, *args) -> list:
+    """Выполнить func iterations раз, вернуть задержки в миллисекундах"""
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await func(*args)
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def print_row(name: str, samples: list):
+    samples = sorted(samples)
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(f"  {name:<34} mean {statistics.mean(samples):7.3f} ms | "
+          f"p50 {statistics.median(samples):7.3f} ms | p95 {p95:7.3f} ms")
+
+
+async def run(iterations: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        db.DATABASE_NAME = os.path.join(tmp, 'bench.db')
+        await db.init_pool()
+        await db.init_db()
+        await db.add_user(USER_ID, 'bench', 'Bench')
+
+        print(f"check_payment_status ({iterations} вызовов):")
+        print_row("до: connect на каждый запрос",
+                  await measure(legacy_check_payment_status, iterations, USER_ID))
+        print_row("после: пул соединений",
+                  await measure(db.check_payment_status, iterations, USER_ID))
+
+        print(f"\nlog_event ({iterations} вызовов):")
+        print_row("до: connect на каждый запрос",
+                  await measure(legacy_log_event, iterations, USER_ID, EventType.START_COMMAND))
+        print_row("после: пул соединений",
+                  await measure(db.log_event, iterations, USER_ID, EventType.START_COMMAND))
+
+        db.start_event_buffer()
+        print_row("после: пул + буфер событий",
+                  await measure(db.log_event, iterations, USER_ID, EventType.START_COMMAND))
+        await db.stop_event_buffer()
+        print(f"  буфер: {db.get_event_buffer_stats()}")
+
+        await db.close_pool()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--iterations', type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(run(args.iterations))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+Бенчмарк базы рецептов: время импорта и память до и после перехода
+на скомпилированные файлы.
+
+Запуск из корня репозитория:
+    python generate_recipes.py --compile
+    python -m benchmarks.recipe_store --runs 5
+
+«До» — как было раньше: импорт модуля со всеми текстами в виде литералов
+(сейчас это data/recipes_source.py, тот же объём кода).
+«После» — импорт data.recipes (словари программ ещё не загружены)
+и отдельно первое обращение к каждой программе.
+Каждый замер — отдельный процесс: с готовым .pyc («тёплый» запуск)
+и без него («холодный», как после деплоя в чистый контейнер).
+Память — текущий RSS процесса (/proc/self/statm; на других ОС — пиковый)
+за вычетом пустого интерпретатора.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+# Модули стандартной библиотеки, которые в боте и так уже загружены
+# (aiogram, logging) — их импорт не относится к рецептам
+PROBE = '''
+import collections.abc, hashlib, importlib.util, json, logging, marshal, os, resource, sys, time
+started = time.perf_counter()
+{code}
+elapsed = (time.perf_counter() - started) * 1000
+try:
+    with open('/proc/self/statm') as statm:
+        rss_kb = int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') // 1024
+except OSError:
+    rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{'ms': elapsed, 'rss_kb': rss_kb}}))
+'''
+
+SCENARIOS = [
+    ('пустой интерпретатор', 'pass'),
+    # Без пакета data: его __init__ уже импортирует новый data.recipes
+    ('до: импорт литералов',
+     "spec = importlib.util.spec_from_file_location('recipes_source', 'data/recipes_source.py'); "
+     "spec.loader.exec_module(importlib.util.module_from_spec(spec))"),
+    ('после: импорт data.recipes', 'import data.recipes'),
+    ('после: + RECIPES[1500]', 'import data.recipes as r; r.RECIPES[1500]'),
+    ('после: + все три программы',
+     'import data.recipes as r; r.RECIPES[1500]; r.FMD_RECIPES[1]; r.DRY_RECIPES[1]'),
+]
+
+
+def probe(code: str, cold: bool) -> dict:
+    env = dict(os.environ, PYTHONPATH=os.getcwd())
+    with tempfile.TemporaryDirectory() as cache:
+        if cold:
+            # Пустой кэш байткода и запрет его записи: каждый модуль компилируется заново
+            env.update(PYTHONPYCACHEPREFIX=cache, PYTHONDONTWRITEBYTECODE='1')
+        output = subprocess.run(
+            [sys.executable, '-c', PROBE.format(code=code)],
+            env=env, capture_output=True, text=True, check=True,
+        ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run(runs: int):
+    # Прогреваем .pyc для тёплых замеров
+    for _, code in SCENARIOS:
+        probe(code, cold=False)
+
+    for cold in (False, True):
+        print(f"\n{'Холодный' if cold else 'Тёплый'} запуск ({runs} процессов на сценарий):")
+        baseline_rss = None
+        for name, code in SCENARIOS:
+            samples = [probe(code, cold) for _ in range(runs)]
+            ms = statistics.median(sample['ms'] for sample in samples)
+            rss = statistics.median(sample['rss_kb'] for sample in samples) / 1024
+            if baseline_rss is None:
+                baseline_rss = rss
+                print(f"  {name:<30} RSS {rss:6.1f} MB")
+                continue
+            print(f"  {name:<30} {ms:7.2f} ms | RSS +{rss - baseline_rss:5.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+    run(args.runs)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,209 @@
+"""
+Бенчмарк отчётов админки: get_stats() и get_weekly_report().
+
+Запуск из корня репозитория:
+    python -m benchmarks.reports --users 200000 --events 2000000
+
+«До» — прежний набор из ~30 отдельных запросов (воспроизведён ниже как есть).
+«После» — текущие функции database.py: суммы daily_rollups и хвоста после
+последнего пересчёта. Сравниваются показатели, смысл которых не изменился
+(COMPARABLE_KEYS): «оплатившие» теперь считаются по одобренным оплатам, а
+неделя — с полуночи шесть дней назад.
+"""
+import argparse
+import asyncio
+import os
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import database as db
+from database import EventType
+from benchmarks.synthetic import build_database
+
+ONLY_START_SQL = '''
+    SELECT COUNT(*) FROM users u
+    WHERE u.has_paid = 0
+    AND NOT EXISTS (
+        SELECT 1 FROM user_events e
+        WHERE e.user_id = u.user_id
+        AND e.event_type IN (?, ?, ?)
+    )
+'''
+ONLY_START_PARAMS = (EventType.PAYMENT_BUTTON_CLICKED, EventType.SCREENSHOT_SENT, EventType.CALCULATOR_STARTED)
+
+CLICKED_NO_SCREENSHOT_SQL = '''
+    SELECT COUNT(DISTINCT e1.user_id) FROM user_events e1
+    WHERE e1.event_type = ?
+    AND NOT EXISTS (
+        SELECT 1 FROM user_events e2
+        WHERE e2.user_id = e1.user_id
+        AND e2.event_type = ?
+    )
+'''
+CLICKED_NO_SCREENSHOT_PARAMS = (EventType.PAYMENT_BUTTON_CLICKED, EventType.SCREENSHOT_SENT)
+
+
+# Показатели, которые прежняя и текущая версии считают одинаково
+COMPARABLE_KEYS = {
+    'total_users', 'pending_payments', 'pending_now', 'started_users', 'clicked_payment_btn',
+    'sent_screenshot', 'clicked_but_no_screenshot', 'clicked_no_screenshot_total',
+    'followup_sent', 'followup_users',
+}
+
+
+def legacy_stats_queries(week_ago: str) -> list:
+    """Запросы прежней get_stats(): (ключ, SQL, параметры)"""
+    return [
+        ('total_users', 'SELECT COUNT(*) FROM users', ()),
+        ('paid_users', 'SELECT COUNT(*) FROM users WHERE has_paid = 1', ()),
+        ('pending_payments', "SELECT COUNT(DISTINCT user_id) FROM payment_requests WHERE status = 'pending'", ()),
+        ('started_users', 'SELECT COUNT(DISTINCT user_id) FROM user_events WHERE event_type = ?',
+         (EventType.START_COMMAND,)),
+        ('clicked_payment_btn', 'SELECT COUNT(DISTINCT user_id) FROM user_events WHERE event_type = ?',
+         (EventType.PAYMENT_BUTTON_CLICKED,)),
+        ('sent_screenshot', 'SELECT COUNT(DISTINCT user_id) FROM user_events WHERE event_type = ?',
+         (EventType.SCREENSHOT_SENT,)),
+        ('only_start', ONLY_START_SQL, ONLY_START_PARAMS),
+        ('clicked_but_no_screenshot', CLICKED_NO_SCREENSHOT_SQL, CLICKED_NO_SCREENSHOT_PARAMS),
+        ('new_users_7d', 'SELECT COUNT(*) FROM users WHERE created_at >= ?', (week_ago,)),
+        ('paid_7d', 'SELECT COUNT(*) FROM users WHERE has_paid = 1 AND payment_request_date >= ?', (week_ago,)),
+        ('followup_sent', "SELECT COUNT(*) FROM followup_messages WHERE status = 'sent'", ()),
+        ('followup_users', "SELECT COUNT(DISTINCT user_id) FROM followup_messages WHERE status = 'sent'", ()),
+        ('paid_after_followup', '''
+            SELECT COUNT(DISTINCT f.user_id) FROM followup_messages f
+            JOIN users u ON f.user_id = u.user_id
+            WHERE f.status = 'sent' AND u.has_paid = 1 AND u.payment_request_date > f.sent_at
+        ''', ()),
+        ('ignored_followup', '''
+            SELECT COUNT(DISTINCT f.user_id) FROM followup_messages f
+            JOIN users u ON f.user_id = u.user_id
+            WHERE f.status = 'sent' AND u.has_paid = 0
+        ''', ()),
+    ]
+
+
+def legacy_weekly_queries(week_ago: str) -> list:
+    """Запросы прежней get_weekly_report(): (ключ, SQL, параметры)"""
+    return [
+        ('total_users', 'SELECT COUNT(*) FROM users', ()),
+        ('total_paid', 'SELECT COUNT(*) FROM users WHERE has_paid = 1', ()),
+        ('new_users_week', 'SELECT COUNT(*) FROM users WHERE created_at >= ?', (week_ago,)),
+        ('paid_week', 'SELECT COUNT(*) FROM users WHERE has_paid = 1 AND payment_request_date >= ?', (week_ago,)),
+        ('payment_requests_week', 'SELECT COUNT(*) FROM payment_requests WHERE created_at >= ?', (week_ago,)),
+        ('approved_week', "SELECT COUNT(*) FROM payment_requests WHERE status = 'approved' AND created_at >= ?",
+         (week_ago,)),
+        ('rejected_week', "SELECT COUNT(*) FROM payment_requests WHERE status = 'rejected' AND created_at >= ?",
+         (week_ago,)),
+        ('pending_now', "SELECT COUNT(*) FROM payment_requests WHERE status = 'pending'", ()),
+        ('started_week', 'SELECT COUNT(DISTINCT user_id) FROM user_events WHERE event_type = ? AND created_at >= ?',
+         (EventType.START_COMMAND, week_ago)),
+        ('clicked_payment_week',
+         'SELECT COUNT(DISTINCT user_id) FROM user_events WHERE event_type = ? AND created_at >= ?',
+         (EventType.PAYMENT_BUTTON_CLICKED, week_ago)),
+        ('screenshot_week', 'SELECT COUNT(DISTINCT user_id) FROM user_events WHERE event_type = ? AND created_at >= ?',
+         (EventType.SCREENSHOT_SENT, week_ago)),
+        ('followup_sent_week', "SELECT COUNT(*) FROM followup_messages WHERE status = 'sent' AND sent_at >= ?",
+         (week_ago,)),
+        ('paid_after_followup_week', '''
+            SELECT COUNT(DISTINCT f.user_id) FROM followup_messages f
+            JOIN users u ON f.user_id = u.user_id
+            WHERE f.status = 'sent' AND f.sent_at >= ? AND u.has_paid = 1 AND u.payment_request_date > f.sent_at
+        ''', (week_ago,)),
+        ('calculator_completed_week', 'SELECT COUNT(DISTINCT user_id) FROM calculator_results WHERE created_at >= ?',
+         (week_ago,)),
+        ('only_start_total', ONLY_START_SQL, ONLY_START_PARAMS),
+        ('clicked_no_screenshot_total', CLICKED_NO_SCREENSHOT_SQL, CLICKED_NO_SCREENSHOT_PARAMS),
+    ]
+
+
+async def run_legacy(queries: list, timeout: float) -> dict:
+    """Выполнить прежние запросы по очереди; по истечении timeout прервать"""
+    result = {}
+    async with db.connection() as conn:
+        loop = asyncio.get_running_loop()
+        watchdog = loop.call_later(timeout, lambda: asyncio.ensure_future(conn.interrupt()))
+        try:
+            for key, sql, params in queries:
+                async with conn.execute(sql, params) as cursor:
+                    row = await cursor.fetchone()
+                    result[key] = row[0] if row else 0
+        except sqlite3.OperationalError:
+            # interrupted: прежняя реализация не уложилась в timeout
+            pass
+        finally:
+            watchdog.cancel()
+    return result
+
+
+async def timed(coro) -> tuple:
+    started = time.perf_counter()
+    result = await coro
+    return result, time.perf_counter() - started
+
+
+def compare(name: str, legacy: dict, current: dict):
+    legacy = {k: v for k, v in legacy.items() if k in COMPARABLE_KEYS}
+    mismatched = {k: (v, current.get(k)) for k, v in legacy.items() if current.get(k) != v}
+    if mismatched:
+        print(f"  ⚠️ {name}: расхождения (до, после): {mismatched}")
+    else:
+        print(f"  ✓ {name}: все {len(legacy)} сравнимых показателей совпадают")
+
+
+async def run(users: int, events: int, path: str, legacy_timeout: float):
+    if not os.path.exists(path):
+        print(f"Генерация базы: {users} пользователей, {events} событий...")
+        started = time.perf_counter()
+        await build_database(path, users, events)
+        print(f"  готово за {time.perf_counter() - started:.1f} с")
+    db.DATABASE_NAME = path
+    await db.init_pool()
+
+    # Пересчёт по расписанию: после первого запуска — только последние дни
+    rows, refresh_time = await timed(db.refresh_daily_rollups())
+    print(f"\nrefresh_daily_rollups: {rows} строк за {refresh_time * 1000:.1f} ms")
+
+    for name, build_queries, func in (
+        ('get_stats', legacy_stats_queries, db.get_stats),
+        ('get_weekly_report', legacy_weekly_queries, db.get_weekly_report),
+    ):
+        # Граница недели та же, что посчитает func (с точностью до миллисекунд)
+        week_ago = (datetime.now() - timedelta(days=7)).isoformat()
+        current, current_time = await timed(func())
+        queries = build_queries(week_ago)
+        legacy, legacy_time = await timed(run_legacy(queries, legacy_timeout))
+
+        print(f"\n{name}:")
+        if len(legacy) < len(queries):
+            print(f"  до:    {len(queries) + 1:2d} запросов   не уложились в {legacy_timeout:.0f} с "
+                  f"(выполнено {len(legacy)})")
+            speedup = f"> x{legacy_time / current_time:.1f}"
+        else:
+            print(f"  до:    {len(queries) + 1:2d} запросов   {legacy_time * 1000:10.1f} ms")
+            speedup = f"x{legacy_time / current_time:.1f}"
+        print(f"  после: daily_rollups {current_time * 1000:10.1f} ms ({speedup})")
+        compare(name, legacy, current)
+
+    await db.close_pool()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--users', type=int, default=200_000)
+    parser.add_argument('--events', type=int, default=2_000_000)
+    parser.add_argument('--db', help='путь к базе (если файла нет — будет сгенерирован)')
+    parser.add_argument('--legacy-timeout', type=float, default=300,
+                        help='сколько секунд ждать прежнюю реализацию')
+    args = parser.parse_args()
+
+    if args.db:
+        asyncio.run(run(args.users, args.events, args.db, args.legacy_timeout))
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            asyncio.run(run(args.users, args.events, os.path.join(tmp, 'bench.db'), args.legacy_timeout))
+
+
+if __name__ == '__main__':
+    main()
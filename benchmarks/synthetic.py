@@ -0,0 +1,130 @@
+"""
+Генерация синтетической базы для бенчмарков.
+
+Схема создаётся настоящим database.init_db(), данные заливаются одним
+рекурсивным CTE на таблицу — 2M событий вставляются за десяток секунд.
+"""
+import os
+import sqlite3
+
+import database as db
+from database import EventType
+
+# Из слогов и имён собираются username/first_name, похожие на настоящие
+USERNAME_PARTS = (
+    'anna', 'kate', 'mari', 'olga', 'lena', 'nata', 'vika', 'dasha', 'yulia', 'sveta',
+    'fit', 'slim', 'life', 'mom', 'style', 'sport', 'happy', 'sun', 'green', 'blue',
+)
+FIRST_NAMES = (
+    'Анна', 'Екатерина', 'Мария', 'Ольга', 'Елена', 'Наталья', 'Виктория', 'Дарья',
+    'Юлия', 'Светлана', 'Ирина', 'Татьяна', 'Алина', 'Ксения', 'Полина', 'Anna',
+    'Maria', 'Kate', 'Olga', 'Elena',
+)
+
+EVENT_TYPES = (
+    EventType.START_COMMAND,
+    EventType.START_COMMAND,
+    EventType.START_COMMAND,
+    EventType.RATION_VIEWED,
+    EventType.RATION_VIEWED,
+    EventType.PAYMENT_BUTTON_CLICKED,
+    EventType.SCREENSHOT_SENT,
+    EventType.CALCULATOR_STARTED,
+    EventType.CALCULATOR_FINISHED,
+    EventType.PAYMENT_APPROVED,
+)
+
+
+async def build_database(path: str, users: int, events: int, days: int = 90):
+    """Создать базу path с users пользователями и events событиями за days дней"""
+    if os.path.exists(path):
+        os.remove(path)
+    db.DATABASE_NAME = path
+    await db.init_pool()
+    await db.init_db()
+    await db.close_pool()
+
+    conn = sqlite3.connect(path)
+
+    def pick(values: tuple, expr: str) -> str:
+        """SQL-выражение: элемент values по номеру expr"""
+        cases = ' '.join(f"WHEN {i} THEN '{v}'" for i, v in enumerate(values))
+        return f'CASE ({expr}) % {len(values)} {cases} END'
+
+    event_type_case = 'CASE abs(random()) % {} {} END'.format(
+        len(EVENT_TYPES),
+        ' '.join(f"WHEN {i} THEN '{t}'" for i, t in enumerate(EVENT_TYPES))
+    )
+    # Время строки — секунды Unix ts (колонки *_ts), текстовые метки из него
+    # в форматах бота: CURRENT_TIMESTAMP (UTC) и isoformat() местного времени
+    ago = f"CAST(strftime('%s', 'now') AS INTEGER) - abs(random()) % {days * 86400}"
+    local_iso = "strftime('%Y-%m-%dT%H:%M:%S', ts, 'unixepoch', 'localtime')"
+    utc_text = "datetime(ts, 'unixepoch')"
+    conn.executescript(f'''
+        PRAGMA journal_mode = OFF;
+        PRAGMA synchronous = OFF;
+
+        WITH RECURSIVE seq(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM seq WHERE x < {users}),
+        src AS MATERIALIZED (
+            SELECT x, {ago} AS ts, CASE WHEN abs(random()) % 8 = 0 THEN {ago} END AS paid_ts
+            FROM seq
+        )
+        INSERT INTO users (
+            user_id, username, first_name, has_paid,
+            payment_request_date, payment_request_ts, created_at, created_ts
+        )
+        SELECT x,
+               CASE WHEN x % 10 < 3 THEN NULL ELSE
+                   {pick(USERNAME_PARTS, 'x')} || '_' || {pick(USERNAME_PARTS, 'x / 20')} || (x % 997)
+               END,
+               {pick(FIRST_NAMES, 'x / 7')},
+               abs(random()) % 10 = 0,
+               CASE WHEN paid_ts IS NOT NULL
+                    THEN strftime('%Y-%m-%dT%H:%M:%S', paid_ts, 'unixepoch', 'localtime')
+               END,
+               paid_ts,
+               {utc_text},
+               ts
+        FROM src;
+
+        WITH RECURSIVE seq(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM seq WHERE x < {events}),
+        src AS MATERIALIZED (SELECT x, {ago} AS ts FROM seq)
+        INSERT INTO user_events (user_id, event_type, created_at, created_ts)
+        SELECT 1 + abs(random()) % {users}, {event_type_case}, {local_iso}, ts
+        FROM src;
+
+        WITH RECURSIVE seq(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM seq WHERE x < {users // 10}),
+        src AS MATERIALIZED (SELECT x, {ago} AS ts FROM seq)
+        INSERT INTO payment_requests (user_id, status, admin_message_id, product_type, created_at, created_ts)
+        SELECT 1 + abs(random()) % {users},
+               CASE abs(random()) % 3 WHEN 0 THEN 'pending' WHEN 1 THEN 'approved' ELSE 'rejected' END,
+               x,
+               CASE abs(random()) % 4 WHEN 0 THEN 'main' WHEN 1 THEN 'fmd' WHEN 2 THEN 'bundle' ELSE 'dry' END,
+               {utc_text}, ts
+        FROM src;
+
+        WITH RECURSIVE seq(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM seq WHERE x < {users // 4}),
+        src AS MATERIALIZED (SELECT x, {ago} AS ts FROM seq)
+        INSERT INTO followup_messages (
+            user_id, message_type, scheduled_at, scheduled_ts, sent_at, sent_ts, status, created_at, created_ts
+        )
+        SELECT 1 + abs(random()) % {users},
+               CASE abs(random()) % 2 WHEN 0 THEN 'only_start' ELSE 'clicked_payment' END,
+               {local_iso}, ts, {local_iso}, ts,
+               CASE abs(random()) % 4 WHEN 0 THEN 'pending' WHEN 1 THEN 'cancelled' ELSE 'sent' END,
+               {local_iso}, ts
+        FROM src;
+
+        WITH RECURSIVE seq(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM seq WHERE x < {users // 10}),
+        src AS MATERIALIZED (SELECT x, {ago} AS ts FROM seq)
+        INSERT INTO calculator_results (user_id, gender, age, calories, created_at, created_ts)
+        SELECT 1 + abs(random()) % {users}, 'female', 30, 1600, {local_iso}, ts
+        FROM src;
+    ''')
+    conn.commit()
+    conn.close()
+
+    # Агрегаты по залитой истории, как после первого пересчёта в боте
+    await db.init_pool()
+    await db.refresh_daily_rollups()
+    await db.close_pool()
@@ -0,0 +1,80 @@
+"""
+Бенчмарк поиска пользователей в админке: search_user_by_username_or_id().
+
+Запуск из корня репозитория:
+    python -m benchmarks.user_search --users 500000
+
+«До» — прежний LOWER(...) LIKE '%q%' по всей таблице users.
+«После» — текущая функция database.py (FTS5 trigram + поиск по id).
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+import database as db
+from benchmarks.db_pool import measure, print_row
+from benchmarks.synthetic import build_database
+
+
+async def legacy_search(query: str) -> list:
+    """Прежний поиск по подстроке"""
+    search_query = query.lstrip('@').lower()
+    async with db.connection() as conn:
+        async with conn.execute('''
+            SELECT user_id, username, first_name, has_paid, has_paid_fmd, has_paid_bundle, has_paid_dry, created_at
+            FROM users
+            WHERE LOWER(username) LIKE ? OR LOWER(first_name) LIKE ?
+            ORDER BY created_at DESC
+            LIMIT 50
+        ''', (f'%{search_query}%', f'%{search_query}%')) as cursor:
+            return [dict(row) for row in await cursor.fetchall()]
+
+
+async def run(users: int, path: str, iterations: int):
+    if not os.path.exists(path):
+        print(f"Генерация базы: {users} пользователей...")
+        started = time.perf_counter()
+        await build_database(path, users, events=0)
+        print(f"  готово за {time.perf_counter() - started:.1f} с")
+    db.DATABASE_NAME = path
+    await db.init_pool()
+    await db.init_db()
+
+    sample = await db.get_user(users // 3 * 3 + 1) or {}
+    queries = [
+        ('username целиком', f"@{sample.get('username') or 'anna_fit1'}"),
+        ('часть username', 'sport_sun'),
+        ('имя (кириллица)', 'Светлана'),
+        ('часть имени', 'ксен'),
+        ('нет совпадений', 'qwzx'),
+        ('user_id', str(users // 2)),
+    ]
+
+    for name, query in queries:
+        found = len(await db.search_user_by_username_or_id(query))
+        print(f"\n«{query}» — {name}, найдено {found}:")
+        if not query.isdigit():
+            print_row("до: LIKE '%q%'", await measure(legacy_search, max(iterations // 20, 5), query))
+        print_row("после: FTS5 trigram", await measure(db.search_user_by_username_or_id, iterations, query))
+
+    await db.close_pool()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--users', type=int, default=500_000)
+    parser.add_argument('--iterations', type=int, default=200)
+    parser.add_argument('--db', help='путь к базе (если файла нет — будет сгенерирован)')
+    args = parser.parse_args()
+
+    if args.db:
+        asyncio.run(run(args.users, args.db, args.iterations))
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            asyncio.run(run(args.users, os.path.join(tmp, 'bench.db'), args.iterations))
+
+
+if __name__ == '__main__':
+    main()
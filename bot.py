@@ -11,11 +11,14 @@ from apscheduler import AsyncScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.triggers.cron import CronTrigger
 
-from config import BOT_TOKEN, ADMIN_CHANNEL_ID
+from config import (
+    BOT_TOKEN, ADMIN_CHANNEL_ID, DATABASE_URL, SCHEDULER_ENABLED, BACKUP_DIR, BACKUP_KEEP,
+)
 import database as db
 from handlers import user_router, admin_router, calculator_router
 from followup import process_pending_followups, schedule_new_followups, process_pending_broadcasts, process_auto_broadcasts, process_chain_messages
 from keyboards.admin_kb import get_stats_detail_keyboard
+from data.recipe_store import ensure_compiled
 
 
 # Настройка логирования
@@ -82,6 +85,40 @@ async def task_process_chain_messages():
         logger.error(f"Error in task_process_chain_messages: {e}")
 
 
+async def task_refresh_daily_rollups():
+    """Задача: дозаполнение дневных агрегатов для отчётов"""
+    try:
+        rows = await db.refresh_daily_rollups()
+        logger.debug(f"Daily rollups refreshed: {rows} rows")
+    except Exception as e:
+        logger.error(f"Error in task_refresh_daily_rollups: {e}")
+
+
+async def task_run_retention():
+    """Задача: перенос старых строк журнальных таблиц в архив"""
+    try:
+        stats = await db.run_retention()
+        tables = ', '.join(
+            f"{table}={result['archived']}" for table, result in stats['tables'].items())
+        logger.info(
+            f"Retention: archived {stats['archived']} rows ({tables}), "
+            f"vacuumed {stats['vacuumed_pages']} pages in {stats['duration_ms']} ms")
+    except Exception as e:
+        logger.error(f"Error in task_run_retention: {e}")
+
+
+async def task_run_backup():
+    """Задача: горячий снимок базы SQLite"""
+    try:
+        stats = await db.run_backup()
+        if stats:
+            logger.info(
+                f"Backup: {stats['path']} ({stats['size_bytes']} bytes, {stats['pages']} pages) "
+                f"in {stats['duration_ms']} ms, removed {stats['removed']} old snapshots")
+    except Exception as e:
+        logger.error(f"Error in task_run_backup: {e}")
+
+
 async def task_send_weekly_report():
     """
     Задача: отправка детального недельного отчёта в админ-чат.
@@ -171,21 +208,32 @@ async def task_send_weekly_report():
 
 async def on_startup(bot: Bot):
     """Действия при запуске бота"""
-    # БД уже инициализирована в main(), но вызываем снова на всякий случай
-    # (CREATE TABLE IF NOT EXISTS безопасен)
-    await db.init_db()
-    await db.init_chain_tables()  # Инициализация таблиц цепочек рассылок
-
+    # Схема БД уже приведена к актуальной версии в main()
     bot_info = await bot.get_me()
     logger.info(f"Bot started: @{bot_info.username}")
     logger.info("Follow-up scheduler is running")
 
 
 async def on_shutdown(bot: Bot):
-    """Действия при остановке бота"""
+    """Действия при остановке polling (база закрывается в main после остановки scheduler)"""
     logger.info("Bot is shutting down...")
 
 
+async def close_database():
+    """
+    Остановить сверку кэшей, дописать буфер событий и закрыть пул. Вызывается один раз, когда
+    polling и задачи scheduler уже остановлены и никто не берёт соединения.
+    """
+    await db.stop_cache_sync()
+    await db.stop_event_buffer()
+    logger.info(f"Event buffer flushed: {db.get_event_buffer_stats()}")
+    logger.info(f"User cache: {db.get_user_cache_stats()}")
+    for item in db.get_query_stats(limit=10):
+        logger.info(f"Query stats: {item}")
+    await db.close_pool()
+    logger.info("Database pool closed")
+
+
 async def main():
     """Главная функция запуска бота"""
     global scheduler, bot_instance
@@ -220,14 +268,43 @@ async def main():
     logger.info("Starting bot...")
 
     try:
-        # Инициализируем БД ДО запуска scheduler (чтобы таблицы существовали)
-        await db.init_db()
-        await db.init_chain_tables()  # Инициализация таблиц цепочек рассылок
-        logger.info("Database initialized")
+        # Пул соединений живёт всё время работы бота и закрывается в finally ниже
+        db.DATABASE_URL = DATABASE_URL
+        db.BACKUP_DIR = BACKUP_DIR
+        db.BACKUP_KEEP = BACKUP_KEEP
+        await db.init_pool()
+
+        # Применяем миграции схемы ДО запуска scheduler (чтобы таблицы существовали)
+        applied = await db.init_db()
+        logger.info(
+            f"Database initialized (schema version {db.SCHEMA_VERSION}, "
+            f"applied migrations: {applied or 'none'})")
+
+        # Скомпилированные рецепты проверяются до приёма апдейтов: сборка
+        # индекса не должна выпасть на первый обработчик
+        if await asyncio.to_thread(ensure_compiled):
+            logger.warning("Compiled recipes were missing or stale, rebuilt at startup")
+
+        # Счётчики изменений запоминаются до загрузки кэшей: правки других
+        # процессов бота, сделанные после этого, сбросят кэши этого процесса
+        await db.start_cache_sync()
+
+        # Правки рецептов админами читаются из памяти, а не из БД на каждый просмотр
+        overrides = await db.load_recipe_overrides()
+        logger.info(f"Recipe overrides loaded: {len(overrides)}")
+
+        # События аналитики пишутся в БД фоновыми пачками
+        db.start_event_buffer()
 
         # Удаляем вебхук (на случай если был) и пропускаем накопившиеся апдейты
         await bot_instance.delete_webhook(drop_pending_updates=True)
 
+        if not SCHEDULER_ENABLED:
+            # Фоновые задачи выполняет другой процесс, работающий с той же базой
+            logger.info("Scheduler is disabled (SCHEDULER_ENABLED=0)")
+            await dp.start_polling(bot_instance)
+            return
+
         # ==================== Scheduler для follow-up сообщений ====================
         async with AsyncScheduler() as scheduler:
             # Задача 1: Отправка запланированных follow-up сообщений (каждые 5 минут)
@@ -272,13 +349,42 @@ async def main():
                 id="weekly_report"
             )
 
+            # Задача 7: Дневные агрегаты для отчётов
+            await scheduler.add_schedule(
+                task_refresh_daily_rollups,
+                IntervalTrigger(minutes=db.ROLLUP_REFRESH_INTERVAL_MINUTES),
+                id="refresh_daily_rollups"
+            )
+
+            # Задача 8: Архивация старых событий и истории рассылок (каждую ночь в 04:30)
+            await scheduler.add_schedule(
+                task_run_retention,
+                CronTrigger(hour=4, minute=30),
+                id="run_retention"
+            )
+
+            # Задача 9: Горячий снимок базы SQLite (каждую ночь в 04:00, до архивации)
+            await scheduler.add_schedule(
+                task_run_backup,
+                CronTrigger(hour=4, minute=0),
+                id="run_backup"
+            )
+
             # Запускаем scheduler в фоне
             await scheduler.start_in_background()
             logger.info("Follow-up scheduler started")
 
-            # Запуск polling
-            await dp.start_polling(bot_instance)
+            try:
+                # Запуск polling
+                await dp.start_polling(bot_instance)
+            finally:
+                # Останавливаем scheduler до закрытия пула: выполняющиеся задачи
+                # (рассылки, архивация, снимок) отменяются, а выход из async with
+                # дожидается их завершения — соединения возвращаются в пул
+                await scheduler.stop()
     finally:
+        # Scheduler уже остановлен (или не запускался) — закрываем базу один раз
+        await close_database()
         await bot_instance.session.close()
 
 
@@ -0,0 +1,283 @@
+"""Check query plans of database.py
+
+Собирает все SQL-запросы из database.py, прогоняет их через
+EXPLAIN QUERY PLAN на пустой базе с актуальной схемой (database.init_db())
+и завершается с кодом 1, если горячий запрос читает большую таблицу целиком.
+Запросы из f-строк раскрываются всеми значениями подстановок (FSTRING_VALUES):
+f-строка запроса, которую собрать не удалось, тоже считается нарушением.
+
+    python check_query_plans.py          # только нарушения
+    python check_query_plans.py -v       # планы всех запросов
+"""
+import ast
+import asyncio
+import os
+import re
+import sqlite3
+import sys
+import tempfile
+
+import database as db
+
+DATABASE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'database.py')
+
+# Таблицы, растущие вместе с аудиторией. Полный проход по ним в горячем пути — ошибка
+LARGE_TABLES = {
+    'users',
+    'user_events',
+    'payment_requests',
+    'followup_messages',
+    'calculator_results',
+    'auto_broadcast_sent',
+    'chain_user_state',
+    'chain_message_history',
+}
+
+# Функции, которые по смыслу читают таблицы целиком: отчёты и выгрузки админки.
+# Функция -> (таблицы, которые ей можно читать целиком, причина); полный проход
+# по любой другой большой таблице в этих функциях — такое же нарушение
+FULL_SCAN_ALLOWED = {
+    'get_users_by_status': ({'users'}, 'выгрузка списков пользователей'),
+    'get_user_counts': ({'users'}, 'счётчики оплативших в меню управления пользователями'),
+    'count_users': ({'users'}, 'число пользователей в списке с фильтром'),
+    'count_audience': ({'users'}, 'размер аудитории рассылки или цепочки'),
+    'start_chain_for_users': ({'users'}, 'запись всей аудитории в цепочку одним запросом'),
+}
+
+# Функции только для PostgreSQL: их план в SQLite ничего не говорит
+POSTGRES_ONLY = {
+    '_search_users_postgres',
+    '_add_archive_columns_postgres',
+}
+
+SQL_START = re.compile(r'\s*(SELECT|WITH|INSERT|UPDATE|DELETE)\b', re.IGNORECASE)
+SCAN_DETAIL = re.compile(r'^SCAN (?:TABLE )?(\w+)')
+TABLE_ALIAS = re.compile(r'\b(?:FROM|JOIN)\s+(\w+)(?:\s+(?:AS\s+)?(\w+))?', re.IGNORECASE)
+STRING_LITERAL = re.compile(r"'[^']*'")
+ORDER_BY_LIMIT = re.compile(r'\bORDER BY\b[^()]*\bLIMIT\s+\S+\s*$', re.IGNORECASE)
+INDEX_WALK = re.compile(r' USING (?:COVERING )?INDEX ')
+
+
+def _audience_conditions() -> list:
+    """Условия аудиторий рассылок и цепочек (_AUDIENCE_CONDITIONS)"""
+    return [condition for condition, _ in db._AUDIENCE_CONDITIONS.values()]
+
+
+def _auto_broadcast_conditions() -> list:
+    """Условия авто-рассылок в том виде, в каком их собирает _auto_broadcast_condition()"""
+    return [db._auto_broadcast_condition(1, trigger, 1)[0] for trigger in db._AUTO_BROADCAST_CONDITIONS]
+
+
+def _user_page_contexts() -> list:
+    """get_users_page(): каждый фильтр в обе стороны, с курсором и без"""
+    contexts = []
+    for condition in db.USER_LIST_FILTERS.values():
+        for backward in (False, True):
+            order = 'ASC' if backward else 'DESC'
+            contexts.append({'condition': condition, 'order': order})
+            contexts.append({
+                'condition': condition + f" AND (created_at, user_id) {'>' if backward else '<'} ("
+                                         "(SELECT created_at FROM users WHERE user_id = ?), ?)",
+                'order': order,
+            })
+    return contexts
+
+
+def _backfill_contexts() -> list:
+    """backfill_timestamps(): переменные цикла по EPOCH_COLUMNS"""
+    return [
+        {
+            'table': table,
+            'key': 'user_id' if table == 'users' else 'id',
+            'text_columns': ', '.join(text for _, text in columns),
+            'assignments': ', '.join(f'{ts} = COALESCE({ts}, ?)' for ts, _ in columns),
+        }
+        for table, columns in db.EPOCH_COLUMNS.items()
+    ]
+
+
+# Значения локальных переменных, которые функции подставляют в f-строки:
+# функция -> наборы {имя: значение}. Запрос проверяется с каждым набором,
+# так что условие из таблицы аудиторий или фильтров не выпадает из проверки.
+# Имена модуля database подставляются сами; f-строка запроса, которую не
+# удалось собрать, — такое же нарушение, как полный проход
+FSTRING_VALUES = {
+    'backfill_timestamps': _backfill_contexts(),
+    # Одно смещение от UTC на весь период и переход на летнее/зимнее время внутри него
+    '_rollup_rows': [{'offsets': [(0, 10800)]}, {'offsets': [(0, 7200), (1000, 10800)]}],
+    '_archive_table': [
+        {'table': table, 'time_column': time_column, 'removable': removable,
+         'schema': 'main', 'placeholders': '?, ?'}
+        for table, (time_column, removable) in db._RETENTION_RULES.items()
+    ],
+    # Пачки iter_audience_user_ids() и iter_auto_broadcast_eligible_user_ids()
+    '_iter_user_id_batches': [
+        {'condition': condition} for condition in _audience_conditions() + _auto_broadcast_conditions()
+    ],
+    'count_audience': [{'condition': condition} for condition in _audience_conditions()],
+    'start_chain_for_users': [{'condition': condition} for condition in _audience_conditions()],
+    'mark_auto_broadcast_sent_many': [{'values': '(?, ?, ?), (?, ?, ?)'}],
+    'update_chain': [{'set_clause': 'name = ?, is_active = ?'}],
+    'update_chain_step': [{'set_clause': 'content = ?, delay_hours = ?'}],
+    'update_user_chain_state': [{'updates': ['current_step_id = ?', 'status = ?', 'last_action_at = ?']}],
+    'get_users_page': _user_page_contexts(),
+    'count_users': [{'condition': condition} for condition in db.USER_LIST_FILTERS.values()],
+}
+
+
+class _NullParams(dict):
+    """Именованные параметры: любой :name подставляется как NULL"""
+
+    def __missing__(self, key):
+        return None
+
+
+def render_fstring(node: ast.JoinedStr, function: str, path: str = DATABASE_FILE) -> tuple:
+    """
+    Тексты f-строки со всеми наборами FSTRING_VALUES функции.
+
+    Возвращает (тексты, ошибка): ошибка — обычно имя, для которого нет значения.
+    """
+    code = compile(ast.Expression(body=node), path, 'eval')
+    texts = []
+    for context in FSTRING_VALUES.get(function, [{}]):
+        try:
+            texts.append(eval(code, vars(db), dict(context)))
+        except Exception as e:
+            return [], f'{type(e).__name__}: {e}'
+    return list(dict.fromkeys(texts)), None
+
+
+def collect_statements(path: str = DATABASE_FILE) -> tuple:
+    """
+    Все SQL-строки модуля: (запросы, несобранные).
+
+    Запросы — (функция, строка, текст), f-строка даёт запрос на каждый
+    набор значений. Несобранные — f-строки, которые начинаются как запрос,
+    но подставить их переменные не удалось: (функция, строка, ошибка).
+    """
+    tree = ast.parse(open(path, encoding='utf-8').read())
+    statements = []
+    unrendered = []
+
+    def visit(node, function):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            function = node.name
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            if SQL_START.match(node.value):
+                statements.append((function, node.lineno, node.value))
+            return
+        if isinstance(node, ast.JoinedStr):
+            # Запрос — f-строка, которая начинается с SQL или со строковой константы модуля
+            head = node.values[0]
+            if isinstance(head, ast.Constant):
+                if not SQL_START.match(head.value):
+                    return
+            elif not (isinstance(head.value, ast.Name)
+                      and isinstance(getattr(db, head.value.id, None), str)):
+                return
+            texts, error = render_fstring(node, function, path)
+            if error:
+                unrendered.append((function, node.lineno, error))
+            for sql in texts:
+                if SQL_START.match(sql):
+                    statements.append((function, node.lineno, sql))
+            return
+        for child in ast.iter_child_nodes(node):
+            visit(child, function)
+
+    visit(tree, None)
+    return statements, unrendered
+
+
+def explain(conn: sqlite3.Connection, sql: str) -> list:
+    """Детали EXPLAIN QUERY PLAN; параметры подставляются как NULL"""
+    bare = STRING_LITERAL.sub("''", sql)
+    if re.search(r'(?<!:):\w+', bare):
+        params = _NullParams()
+    else:
+        params = [None] * bare.count('?')
+    return [row[3] for row in conn.execute('EXPLAIN QUERY PLAN ' + sql, params)]
+
+
+def full_scans(sql: str, plan: list) -> list:
+    """Полные проходы по большим таблицам: (таблица, деталь плана) с учётом алиасов"""
+    aliases = {}
+    for table, alias in TABLE_ALIAS.findall(sql):
+        aliases[table] = table
+        if alias and alias.upper() not in ('WHERE', 'ON', 'JOIN', 'LEFT', 'INNER', 'GROUP', 'ORDER'):
+            aliases[alias] = table
+
+    # Обход индекса в порядке ORDER BY с LIMIT читает LIMIT строк (первая страница списка)
+    limited = (ORDER_BY_LIMIT.search(sql)
+               and not any(detail.startswith('USE TEMP B-TREE') for detail in plan))
+
+    scans = []
+    for detail in plan:
+        if limited and INDEX_WALK.search(detail):
+            continue
+        match = SCAN_DETAIL.match(detail)
+        if match and aliases.get(match.group(1)) in LARGE_TABLES:
+            scans.append((aliases[match.group(1)], detail))
+    return scans
+
+
+async def _create_schema(path: str):
+    db.DATABASE_NAME = path
+    await db.init_pool()
+    await db.init_db()
+    await db.close_pool()
+
+
+def main() -> int:
+    verbose = '-v' in sys.argv[1:]
+
+    path = os.path.join(tempfile.mkdtemp(), 'query_plans.db')
+    asyncio.run(_create_schema(path))
+    conn = sqlite3.connect(path)
+    # Архив run_retention(): те же таблицы в схеме archive
+    conn.execute("ATTACH DATABASE ':memory:' AS archive")
+    for table in db._RETENTION_RULES:
+        conn.execute(f'CREATE TABLE archive.{table} AS SELECT * FROM main.{table} WHERE 0')
+
+    statements, unrendered = collect_statements()
+    violations = [
+        f"  database.py:{lineno} {function}: f-строку не удалось собрать ({error}), "
+        f"добавьте значения в FSTRING_VALUES"
+        for function, lineno, error in unrendered
+        if function not in POSTGRES_ONLY
+    ]
+    for function, lineno, sql in statements:
+        if function in POSTGRES_ONLY:
+            continue
+        try:
+            plan = explain(conn, sql)
+        except sqlite3.Error as e:
+            violations.append(f"  database.py:{lineno} {function}: {e}")
+            continue
+
+        if verbose:
+            print(f"database.py:{lineno} {function}")
+            for detail in plan:
+                print(f"    {detail}")
+
+        allowed = FULL_SCAN_ALLOWED.get(function, (set(), None))[0]
+        scans = [detail for table, detail in full_scans(sql, plan) if table not in allowed]
+        if scans:
+            violations.append(
+                f"  database.py:{lineno} {function}: " + '; '.join(scans))
+
+    print(f"Checked {len(statements)} statements "
+          f"(schema version {db.SCHEMA_VERSION})")
+    if violations:
+        print("\nFull table scans in hot queries and unrendered statements:")
+        for violation in violations:
+            print(violation)
+        return 1
+
+    print("  None!")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,7 +2,7 @@
 from collections import Counter
 import re
 
-with open('data/recipes.py', 'r', encoding='utf-8') as f:
+with open('data/recipes_source.py', 'r', encoding='utf-8') as f:
     content = f.read()
 
 # Find all calorie ranges
@@ -29,6 +29,16 @@ for cal in ['1700', '1800', '2000', '2100']:
 if '1900' not in cal_ranges:
     issues.append(f"  - 1900 is missing completely")
 
+# Сумма калорий приёмов пищи за день против номинала программы
+from data.recipe_index import get_recipe_index
+
+for problem in get_recipe_index().validate_days():
+    actual = problem['actual'] if problem['actual'] is not None else 'no КБЖУ for some meals'
+    issues.append(
+        f"  - {problem['program']} {problem['calories'] or ''} day {problem['day']}: "
+        f"{actual} kcal vs nominal {problem['expected']}"
+    )
+
 if issues:
     for issue in issues:
         print(issue)
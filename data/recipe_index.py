@@ -0,0 +1,483 @@
+"""
+Индекс разобранных рецептов всех программ в колоночном виде.
+
+При сборке (generate_recipes.py --compile) каждый приём пищи разбирается
+data.recipe_parser в запись: название, ингредиенты с количествами, КБЖУ.
+Записи хранятся колонками — по массиву на поле, строка = приём пищи,
+плюс отдельная таблица ингредиентов со ссылкой на строку приёма пищи.
+Рядом лежат готовые индексы: диапазон строк каждой калорийности
+и порядок строк по КБЖУ приёма пищи и по доле белков, жиров и углеводов
+в его калорийности. Запрос вида «ужины от 40 г белка до 500 ккал» —
+бинарный поиск по индексу и проверка нескольких десятков строк.
+
+Для поиска по продуктам есть обратный индекс: слово из названий продуктов
+и блюда -> строки приёмов пищи, где оно встречается. Слова запроса
+сравниваются с ним по началу слова, а общие слова («рыба», «мясо»)
+раскрываются в группы продуктов (SEARCH_GROUPS).
+
+Индекс строится из исходных рецептов; правки админов в нём не учитываются.
+"""
+import math
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from data.recipe_parser import (
+    MEAL_TYPES, STOP_WORDS, iter_meals, name_terms, normalize_name, parse_day_total, parse_meal, stem,
+)
+
+PROGRAM_CODES = ('rations', 'fmd', 'dry')
+NUTRIENTS = ('kcal', 'protein', 'fat', 'carbs')
+# Ккал на грамм: доля нутриента в калорийности приёма пищи
+_KCAL_PER_GRAM = {'protein': 4, 'fat': 9, 'carbs': 4}
+RATIOS = tuple(f'{nutrient}_ratio' for nutrient in _KCAL_PER_GRAM)
+
+# Номинальная калорийность дня программ без уровней (у рационов — сам уровень)
+NOMINAL_CALORIES = {'dry': 1500}
+CALORIE_TOLERANCE = 0.10  # Допустимое отклонение суммы дня от номинала
+
+# Слово запроса (после stem) -> начала слов продуктов, которые оно означает
+SEARCH_GROUPS: Dict[str, Tuple[str, ...]] = {
+    'рыб': ('рыб', 'треск', 'минта', 'горбуш', 'лосос', 'семг', 'форел', 'тунец', 'тунц', 'судак',
+            'скумбр', 'хек', 'сельди', 'сельдь', 'селедк', 'окун', 'дорад', 'сибас', 'пангасиус', 'тилапи'),
+    'морепродукт': ('кревет', 'кальмар', 'миди', 'осьмин', 'гребеш', 'морепродукт'),
+    'куриц': ('куриц', 'курин', 'курочк', 'цыпл'),
+    'мяс': ('мяс', 'говя', 'свин', 'телят', 'баран', 'индей', 'куриц', 'курин', 'фарш', 'бекон',
+            'ветчин', 'печень', 'печени', 'печенк'),
+    'говядин': ('говя',),
+    'свинин': ('свин',),
+    'молочн': ('молок', 'молоч', 'кефир', 'творог', 'творож', 'йогурт', 'сыр', 'сметан', 'сливк',
+               'сливочн', 'ряженк', 'моцарел', 'фет', 'сулугуни', 'пармезан', 'гауда'),
+    'яйц': ('яйц', 'яичн', 'желток', 'белок'),
+    'орех': ('орех', 'миндал', 'кешью', 'арахис', 'фундук', 'фисташ'),
+    'гриб': ('гриб', 'шампиньон'),
+    'гречк': ('гречк', 'гречн', 'гречих'),
+}
+
+_NAN = float('nan')
+
+
+def _ratio(nutrient: str, grams: float, kcal: float) -> float:
+    if math.isnan(grams) or math.isnan(kcal) or kcal <= 0:
+        return _NAN
+    return grams * _KCAL_PER_GRAM[nutrient] / kcal
+
+
+def build_index(programs: Dict[str, dict]) -> Dict:
+    """
+    Разобрать все приёмы пищи программ в колонки для index.marshal.
+
+    Массивы хранятся байтами (array.tobytes), остальное — списками и словарями:
+    marshal пишет и читает их без разбора текста.
+    """
+    columns = {name: array('H') for name in ('calories', 'day')}
+    columns.update({name: array('B') for name in ('program', 'meal')})
+    columns.update({name: array('d') for name in NUTRIENTS})
+    titles: List[str] = []
+    ingredient_meal = array('H')
+    ingredient_quantity = array('d')
+    ingredient_names: List[str] = []
+    ingredient_keys: List[str] = []
+    ingredient_units: List[str] = []
+    postings: Dict[str, List[int]] = {}
+    levels: Dict[Tuple[str, int], Tuple[int, int]] = {}
+
+    for program, calories, day, meal_type, text in iter_meals(programs):
+        row = len(titles)
+        start, _ = levels.get((program, calories), (row, row))
+        levels[(program, calories)] = (start, row + 1)
+
+        meal = parse_meal(text)
+        columns['program'].append(PROGRAM_CODES.index(program))
+        columns['calories'].append(calories)
+        columns['day'].append(day)
+        columns['meal'].append(MEAL_TYPES.index(meal_type))
+        for nutrient in NUTRIENTS:
+            value = meal[nutrient]
+            columns[nutrient].append(_NAN if value is None else value)
+        titles.append(meal['title'])
+
+        terms = set(name_terms(meal['title']))
+        for ingredient in meal['ingredients']:
+            ingredient_meal.append(row)
+            ingredient_names.append(ingredient['name'])
+            ingredient_keys.append(normalize_name(ingredient['name']))
+            terms.update(name_terms(ingredient['name']))
+            ingredient_units.append(ingredient['unit'])
+            quantity = ingredient['quantity']
+            ingredient_quantity.append(_NAN if quantity is None else quantity)
+        for term in terms:
+            postings.setdefault(term, []).append(row)
+
+    # Порядок строк по значению: NaN (нет данных) в индекс не попадают
+    orders = {}
+    kcal = columns['kcal']
+    for name, values in [(nutrient, columns[nutrient]) for nutrient in NUTRIENTS] + [
+        (f'{nutrient}_ratio', [_ratio(nutrient, grams, kcal[row]) for row, grams in enumerate(columns[nutrient])])
+        for nutrient in _KCAL_PER_GRAM
+    ]:
+        rows = sorted((row for row, value in enumerate(values) if not math.isnan(value)),
+                      key=lambda row: values[row])
+        orders[name] = array('H', rows).tobytes()
+
+    # Калорийность дня из блока info у FMD и Сушки
+    day_totals = {}
+    for program in ('fmd', 'dry'):
+        for day, meals in programs.get(program, {}).items():
+            total = parse_day_total(meals.get('info'))
+            if total is not None:
+                day_totals[(program, day)] = total
+
+    return {
+        'columns': {name: values.tobytes() for name, values in columns.items()},
+        'titles': titles,
+        'ingredients': {
+            'meal': ingredient_meal.tobytes(),
+            'quantity': ingredient_quantity.tobytes(),
+            'name': ingredient_names,
+            'key': ingredient_keys,
+            'unit': ingredient_units,
+        },
+        'levels': levels,
+        'orders': orders,
+        'day_totals': day_totals,
+        # Обратный индекс: словарь слов по алфавиту и строки для каждого слова
+        'terms': {
+            'vocabulary': sorted(postings),
+            'rows': [array('H', postings[term]).tobytes() for term in sorted(postings)],
+        },
+    }
+
+
+def _product_stem(word: str) -> str:
+    """Слово названия продукта без окончания и беглой гласной («огурец», «огурцы» -> «огурц»)"""
+    word = stem(word)
+    if len(word) > 4 and word.endswith(('ец', 'ок')):
+        return word[:-2] + word[-1]
+    return word
+
+
+def _unpack(typecode: str, data: bytes) -> array:
+    values = array(typecode)
+    values.frombytes(data)
+    return values
+
+
+class RecipeIndex:
+    """
+    Разобранные рецепты: колонки приёмов пищи, ингредиентов и индексы по ним.
+
+    Строки приёмов пищи идут по программам, калорийностям и дням, так что
+    строки одной калорийности занимают непрерывный диапазон.
+    """
+
+    def __init__(self, data: Dict):
+        types = {'calories': 'H', 'day': 'H', 'program': 'B', 'meal': 'B'}
+        self.columns: Dict[str, array] = {
+            name: _unpack(types.get(name, 'd'), values) for name, values in data['columns'].items()
+        }
+        self.titles: List[str] = data['titles']
+        self.levels: Dict[Tuple[str, int], Tuple[int, int]] = data['levels']
+        self.day_totals: Dict[Tuple[str, int], float] = data['day_totals']
+
+        ingredients = data['ingredients']
+        self.ingredient_meal = _unpack('H', ingredients['meal'])
+        self.ingredient_quantity = _unpack('d', ingredients['quantity'])
+        self.ingredient_names: List[str] = ingredients['name']
+        self.ingredient_keys: List[str] = ingredients['key']
+        self.ingredient_units: List[str] = ingredients['unit']
+        self.vocabulary: List[str] = data['terms']['vocabulary']
+        self._term_rows: List[array] = [_unpack('H', rows) for rows in data['terms']['rows']]
+
+        # Доли БЖУ считаются один раз при загрузке, индексы — готовые из файла
+        kcal = self.columns['kcal']
+        for nutrient in _KCAL_PER_GRAM:
+            self.columns[f'{nutrient}_ratio'] = array('d', (
+                _ratio(nutrient, grams, kcal[row]) for row, grams in enumerate(self.columns[nutrient])
+            ))
+        self._meal_rows: List[List[int]] = [[] for _ in MEAL_TYPES]
+        for row, meal in enumerate(self.columns['meal']):
+            self._meal_rows[meal].append(row)
+        self._orders: Dict[str, Tuple[array, List[float]]] = {}
+        for name, rows in data['orders'].items():
+            rows = _unpack('H', rows)
+            values = self.columns[name]
+            self._orders[name] = (rows, [values[row] for row in rows])
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def meal(self, row: int) -> Dict:
+        """Приём пищи по номеру строки; неизвестные КБЖУ — None"""
+        columns = self.columns
+        result = {
+            'program': PROGRAM_CODES[columns['program'][row]],
+            'calories': columns['calories'][row],
+            'day': columns['day'][row],
+            'meal_type': MEAL_TYPES[columns['meal'][row]],
+            'title': self.titles[row],
+        }
+        for nutrient in NUTRIENTS:
+            value = columns[nutrient][row]
+            result[nutrient] = None if value != value else value
+        return result
+
+    def _candidates(self, program: Optional[str], calories: Optional[int], meal_type: Optional[str],
+                    ranges: Dict[str, Tuple[Optional[float], Optional[float]]]):
+        """Строки, которые проходят все условия, покрытые индексами (пересечение от меньшего)"""
+        candidates = []
+        if program is not None and calories is not None:
+            start, stop = self.levels.get((program, calories), (0, 0))
+            candidates.append(range(start, stop))
+        if meal_type is not None:
+            candidates.append(self._meal_rows[MEAL_TYPES.index(meal_type)])
+        for name, (low, high) in ranges.items():
+            if name not in self._orders:
+                continue
+            rows, values = self._orders[name]
+            start = 0 if low is None else bisect_left(values, low)
+            stop = len(values) if high is None else bisect_right(values, high)
+            candidates.append(rows[start:stop])
+        if not candidates:
+            return range(len(self))
+
+        candidates.sort(key=len)
+        result = candidates[0]
+        for rows in candidates[1:]:
+            allowed = set(rows)
+            result = [row for row in result if row in allowed]
+        return result
+
+    def find_rows(self, program: Optional[str] = None, calories: Optional[int] = None,
+                  meal_type: Optional[str] = None, day: Optional[int] = None,
+                  **ranges: Tuple[Optional[float], Optional[float]]) -> List[int]:
+        """
+        Номера строк приёмов пищи по условиям; диапазоны — (от, до)
+        включительно, None — без границы.
+
+        Поля диапазонов: kcal, protein, fat, carbs (граммы) и protein_ratio,
+        fat_ratio, carbs_ratio (доля в калорийности, 0..1). Например, ужины
+        от 40 г белка до 500 ккал:
+            find_meals(meal_type='dinner', protein=(40, None), kcal=(None, 500))
+        Строки без нужного значения (нет КБЖУ) под диапазон не попадают.
+        """
+        for name in ranges:
+            if name not in self.columns or name in ('calories', 'day', 'program', 'meal'):
+                raise ValueError(f'Unknown nutrition field: {name}')
+        columns = self.columns
+        # Точные условия проверяются как диапазоны (v, v) по своим колонкам
+        checks = [
+            (columns[name], low, high) for name, (low, high) in ranges.items()
+        ] + [
+            (columns[name], value, value) for name, value in (
+                ('program', None if program is None else PROGRAM_CODES.index(program)),
+                ('calories', calories),
+                ('meal', None if meal_type is None else MEAL_TYPES.index(meal_type)),
+                ('day', day),
+            ) if value is not None
+        ]
+
+        result = []
+        for row in self._candidates(program, calories, meal_type, ranges):
+            for values, low, high in checks:
+                value = values[row]
+                # NaN не проходит ни одно сравнение
+                if not ((low is None or value >= low) and (high is None or value <= high)):
+                    break
+            else:
+                result.append(row)
+        return result
+
+    def find_meals(self, program: Optional[str] = None, calories: Optional[int] = None,
+                   meal_type: Optional[str] = None, day: Optional[int] = None,
+                   **ranges: Tuple[Optional[float], Optional[float]]) -> List[Dict]:
+        """То же, что find_rows(), но сразу приёмами пищи (см. meal())"""
+        return [self.meal(row) for row in self.find_rows(program, calories, meal_type, day, **ranges)]
+
+    def match_term(self, term: str) -> Set[int]:
+        """
+        Строки приёмов пищи, где встречается слово запроса: по началу слова
+        после stem(), общие слова — по всей группе из SEARCH_GROUPS.
+        """
+        term = stem(term)
+        rows: Set[int] = set()
+        for prefix in SEARCH_GROUPS.get(term, ()) + (term,):
+            position = bisect_left(self.vocabulary, prefix)
+            while position < len(self.vocabulary) and self.vocabulary[position].startswith(prefix):
+                rows.update(self._term_rows[position])
+                position += 1
+        return rows
+
+    def search(self, include: Sequence[str] = (), exclude: Sequence[str] = (),
+               program: Optional[str] = None, calories: Optional[int] = None,
+               meal_type: Optional[str] = None) -> List[int]:
+        """
+        Номера строк приёмов пищи, в которых есть все продукты include
+        и нет ни одного из exclude, например search(['курица'], ['рыба']).
+        """
+        rows = self.find_rows(program, calories, meal_type)
+        for term in include:
+            matched = self.match_term(term)
+            rows = [row for row in rows if row in matched]
+        excluded: Set[int] = set()
+        for term in exclude:
+            excluded |= self.match_term(term)
+        return [row for row in rows if row not in excluded]
+
+    def search_days(self, include: Sequence[str] = (), exclude: Sequence[str] = (),
+                    program: Optional[str] = None,
+                    calories: Optional[int] = None) -> List[Tuple[str, int, int]]:
+        """
+        Дни (программа, калории, день), где каждый продукт include есть хотя бы
+        в одном приёме пищи, а продуктов exclude нет ни в одном:
+        search_days(exclude=['рыба']) — дни без рыбы.
+        """
+        columns = self.columns
+        days: Dict[Tuple[str, int, int], List[int]] = {}
+        for row in self.find_rows(program, calories):
+            key = (PROGRAM_CODES[columns['program'][row]], columns['calories'][row], columns['day'][row])
+            days.setdefault(key, []).append(row)
+
+        included = [self.match_term(term) for term in include]
+        excluded: Set[int] = set()
+        for term in exclude:
+            excluded |= self.match_term(term)
+        return [
+            key for key, rows in days.items()
+            if all(any(row in matched for row in rows) for matched in included)
+            and not any(row in excluded for row in rows)
+        ]
+
+    def day_rows(self, program: str, calories: int, first_day: int, last_day: int) -> range:
+        """Строки приёмов пищи дней first_day..last_day (дни уровня идут по порядку)"""
+        start, stop = self.levels.get((program, calories), (0, 0))
+        days = self.columns['day']
+        return range(bisect_left(days, first_day, start, stop), bisect_right(days, last_day, start, stop))
+
+    def shopping_list(self, program: str, calories: int, first_day: int, last_day: int) -> List[Dict]:
+        """
+        Продукты на дни first_day..last_day: количества ингредиентов всех
+        приёмов пищи, сложенные по продукту и единице измерения.
+
+        Продукты сводятся по словам названия без окончаний («оливковое масло»,
+        «масло оливковое», «оливкового масла» — один продукт). Возвращает
+        [{name, amounts: [(количество, единица)], to_taste}] по алфавиту;
+        to_taste — продукт встречается без количества («соль, специи»).
+        """
+        rows = self.day_rows(program, calories, first_day, last_day)
+        meal = self.ingredient_meal
+        # Ингредиенты записаны по порядку строк приёмов пищи
+        start = bisect_left(meal, rows.start)
+        stop = bisect_left(meal, rows.stop, start)
+
+        products: Dict[Tuple[str, ...], Dict] = {}
+        for position in range(start, stop):
+            key_name = self.ingredient_keys[position]
+            quantity = self.ingredient_quantity[position]
+            if quantity != quantity:
+                # «Соль, перец, зелень» — каждый продукт отдельно, без количества
+                names, unit = [name.strip() for name in re.split(r',|\sи\s', key_name)], None
+            else:
+                names, unit = [key_name], self.ingredient_units[position]
+            for name in names:
+                if not name:
+                    continue
+                key = tuple(sorted(_product_stem(word) for word in name.split()))
+                product = products.setdefault(key, {'names': {}, 'amounts': {}, 'to_taste': False})
+                product['names'][name] = product['names'].get(name, 0) + 1
+                if unit is None:
+                    product['to_taste'] = True
+                else:
+                    product['amounts'][unit] = product['amounts'].get(unit, 0.0) + quantity
+
+        result = []
+        for product in products.values():
+            # Название — самое частое написание продукта в этих днях
+            name = max(product['names'].items(), key=lambda item: (item[1], -len(item[0])))[0]
+            result.append({
+                'name': name[:1].upper() + name[1:],
+                'amounts': sorted((round(quantity, 2), unit) for unit, quantity in product['amounts'].items()),
+                'to_taste': product['to_taste'] and not product['amounts'],
+            })
+        return sorted(result, key=lambda product: product['name'])
+
+    def day_totals_by_meals(self) -> Dict[Tuple[str, int, int], Optional[float]]:
+        """Сумма калорий приёмов пищи по дням; None, если у какого-то приёма нет КБЖУ"""
+        totals: Dict[Tuple[str, int, int], Optional[float]] = {}
+        columns = self.columns
+        for row in range(len(self)):
+            key = (PROGRAM_CODES[columns['program'][row]], columns['calories'][row], columns['day'][row])
+            kcal = columns['kcal'][row]
+            current = totals.get(key, 0.0)
+            totals[key] = None if current is None or math.isnan(kcal) else current + kcal
+        return totals
+
+    def validate_days(self, tolerance: float = CALORIE_TOLERANCE) -> List[Dict]:
+        """
+        Дни, калорийность которых расходится с номиналом больше чем на tolerance.
+
+        Рационы: сумма приёмов пищи против уровня калорийности. FMD: сумма
+        приёмов пищи против калорийности дня из блока info. Сушка (КБЖУ
+        указаны только на день): калорийность из info против NOMINAL_CALORIES.
+        """
+        problems = []
+        for (program, calories, day), actual in sorted(self.day_totals_by_meals().items()):
+            if program == 'rations':
+                expected = calories
+            elif program == 'dry':
+                expected = NOMINAL_CALORIES['dry']
+                actual = self.day_totals.get((program, day))
+            else:
+                expected = self.day_totals.get((program, day))
+            if expected is None:
+                continue
+            deviation = None if actual is None else (actual - expected) / expected
+            if deviation is None or abs(deviation) > tolerance:
+                problems.append({
+                    'program': program,
+                    'calories': calories,
+                    'day': day,
+                    'expected': expected,
+                    'actual': None if actual is None else round(actual, 1),
+                    'deviation': None if deviation is None else round(deviation, 3),
+                })
+        return problems
+
+
+def parse_search_query(query: str) -> Dict:
+    """
+    Запрос поиска -> {include, exclude, calories}.
+
+    «курица -рыба», «курица без рыбы», «без рыбы 1600»: слово с «-» или «!»
+    в начале и слово после «без» исключаются, число — калорийность рациона.
+    """
+    include: List[str] = []
+    exclude: List[str] = []
+    calories = None
+    negate = False
+    for word in re.findall(r'[-!]?[а-яёa-z0-9]+', query.lower()):
+        if word == 'без':
+            negate = True
+            continue
+        if word.isdigit():
+            calories = int(word)
+            continue
+        if word[0] in '-!':
+            negate, word = True, word[1:]
+        if len(word) > 2 and word not in STOP_WORDS:
+            (exclude if negate else include).append(word)
+        negate = False
+    return {'include': include, 'exclude': exclude, 'calories': calories}
+
+
+_index: Optional[RecipeIndex] = None
+
+
+def get_recipe_index() -> RecipeIndex:
+    """Индекс рецептов; загружается из data/compiled/index.marshal при первом обращении"""
+    global _index
+    if _index is None:
+        from data.recipe_store import INDEX, load_compiled
+        _index = RecipeIndex(load_compiled(INDEX))
+    return _index
@@ -0,0 +1,221 @@
+"""
+Разбор текста приёма пищи в структурированную запись.
+
+Текст рецепта — HTML-разметка Telegram (см. generate_recipes.parse_meal):
+заголовок «🌅 <b>Завтрак — Название</b>», строки ингредиентов «• Продукт — 100 г»
+и одна или несколько строк «<b>КБЖУ…:</b> 358,6 ккал | Б: 13,6 г | Ж: 3,6 г | У: 71,1 г»
+(у блюд с гарниром или салатом — отдельно на каждую часть).
+Разбор выполняется при сборке базы рецептов, а не на каждый запрос.
+"""
+import re
+from typing import Dict, List, Optional, Tuple
+
+_TITLE_RE = re.compile(r'<b>[^<—]*—\s*(.+?)</b>')
+_NUTRITION_RE = re.compile(
+    r'КБЖУ(?P<part>[^:<]*):?</b>:?\s*~?(?P<kcal>\d+(?:[.,]\d+)?)\s*ккал'
+    r'(?:\s*\|\s*Б:\s*(?P<protein>\d+(?:[.,]\d+)?)\s*[гГ]?'
+    r'\s*\|\s*Ж:\s*(?P<fat>\d+(?:[.,]\d+)?)\s*[гГ]?'
+    r'\s*\|\s*У:\s*(?P<carbs>\d+(?:[.,]\d+)?))?'
+)
+_DAY_TOTAL_RE = re.compile(r'(?:КБЖУ на день|Общая калорийность):?</b>:?\s*~?(\d+(?:[.,]\d+)?)\s*ккал')
+
+_FRACTIONS = {'½': 0.5, '¼': 0.25, '¾': 0.75, '⅓': 1 / 3, '⅔': 2 / 3}
+_QUANTITY = r'\d+(?:[.,]\d+)?|\d+/\d+|[½¼¾⅓⅔]'
+_INGREDIENT_RE = re.compile(
+    rf'^(?P<name>.+?)\s*[—–-]?\s*'
+    # Жирность («Молоко 2,5% — 50 г») — часть названия, а не количество
+    rf'(?P<qty>{_QUANTITY})(?![.,]?\d|\s*%)(?:\s*[-–]\s*(?P<qty_max>{_QUANTITY}))?'
+    r'\s*(?P<unit>[^\d(,+]*?)\.?\s*(?P<note>[(,+].*)?$'
+)
+
+# Написание единицы -> (единица после нормализации, множитель к ней)
+UNITS: Dict[str, Tuple[str, float]] = {
+    'г': ('г', 1), 'гр': ('г', 1), 'грамм': ('г', 1),
+    'кг': ('г', 1000),
+    'мл': ('мл', 1),
+    'л': ('мл', 1000), 'литр': ('мл', 1000), 'литра': ('мл', 1000),
+    'шт': ('шт', 1),
+    'ст. л': ('ст. л.', 1), 'ст.л': ('ст. л.', 1), 'ст. ложка': ('ст. л.', 1),
+    'ст. ложки': ('ст. л.', 1),
+    'ч. л': ('ч. л.', 1), 'ч.л': ('ч. л.', 1), 'ч. ложка': ('ч. л.', 1),
+    'ч. ложки': ('ч. л.', 1), 'ч. д': ('ч. л.', 1),
+    'зубчик': ('зубчик', 1), 'зубчика': ('зубчик', 1), 'зубчиков': ('зубчик', 1),
+    'кусочек': ('кусочек', 1), 'кусочка': ('кусочек', 1), 'кусочков': ('кусочек', 1),
+    'щепотка': ('щепотка', 1), 'щепотки': ('щепотка', 1), 'щепоток': ('щепотка', 1),
+}
+
+_NORMALIZED_UNITS = {unit for unit, _ in UNITS.values()}
+# Единицы, которые в покупках не складываются: «Соль — 2 щепотки» — по вкусу
+_TO_TASTE_UNITS = {'щепотка'}
+
+MEAL_TYPES = ('breakfast', 'snack', 'lunch', 'dinner')
+
+# Слова, по которым не ищут: служебные и «для подачи», «по желанию»
+STOP_WORDS = frozenset({
+    'для', 'или', 'без', 'при', 'под', 'вкусу', 'желанию', 'подачи', 'украшения',
+    'любая', 'любой', 'любые', 'выбор', 'выбору', 'свой', 'вкус', 'жирности',
+})
+# Окончания, которые срезаются у слов запроса (длинные раньше коротких)
+_ENDINGS = (
+    'ами', 'ями', 'ого', 'его', 'ому', 'ему', 'ыми', 'ими',
+    'ая', 'яя', 'ое', 'ее', 'ые', 'ие', 'ый', 'ий', 'ой', 'ей', 'ам', 'ям', 'ах', 'ях', 'ов', 'ев', 'ом', 'ем',
+    'а', 'я', 'ы', 'и', 'о', 'е', 'у', 'ю', 'ь', 'й',
+)
+
+
+def _number(value: Optional[str]) -> Optional[float]:
+    if value is None:
+        return None
+    if value in _FRACTIONS:
+        return _FRACTIONS[value]
+    if '/' in value:
+        numerator, denominator = value.split('/')
+        return int(numerator) / int(denominator)
+    return float(value.replace(',', '.'))
+
+
+def normalize_unit(unit: str) -> Tuple[str, float]:
+    """Единица измерения в едином написании и множитель количества к ней"""
+    unit = unit.strip().rstrip('.').strip()
+    return UNITS.get(unit, (unit, 1))
+
+
+def normalize_name(name: str) -> str:
+    """
+    Название продукта в едином написании: строчные буквы, «ё» -> «е»,
+    без жирности («сметана 10%») и уточнений в скобках.
+    """
+    name = name.lower().replace('ё', 'е')
+    name = re.sub(r'\([^)]*\)?|\d+(?:[.,]\d+)?\s*%(?:\s*жирности)?', ' ', name)
+    return ' '.join(name.split()).strip(' ,-—–:+')
+
+
+def name_terms(text: str) -> List[str]:
+    """Слова названия для поиска: строчные, «ё» -> «е», без коротких и служебных"""
+    words = re.findall(r'[а-яa-z]+', text.lower().replace('ё', 'е'))
+    words = [word for word in words if len(word) > 2 and word not in STOP_WORDS]
+    # «Яйцо куриное» — это яйцо, а не курица
+    if any(word.startswith(('яйц', 'яиц')) for word in words):
+        words = [word for word in words if not word.startswith(('курин', 'перепел'))]
+    return words
+
+
+def stem(word: str) -> str:
+    """Слово запроса без окончания («курица» -> «куриц», «рыбы» -> «рыб»), не короче трёх букв"""
+    word = word.lower().replace('ё', 'е')
+    for ending in _ENDINGS:
+        if word.endswith(ending) and len(word) - len(ending) >= 3:
+            return word[:-len(ending)]
+    return word
+
+
+def parse_ingredient(line: str) -> Dict:
+    """
+    Строка «• Продукт — 100 г (примечание)» -> {name, quantity, unit, note}.
+
+    Количество приводится к единице из UNITS (кг -> г, л -> мл), у диапазона
+    «1-2 шт» берётся верхняя граница. Для «Соль, специи по вкусу»
+    quantity — None, unit — пустая строка. Так же — «по вкусу» с количеством
+    в note — разбираются строки, где количество не относится к одному
+    продукту: «Зеленый лук, сельдерей — 200 г», «1 целое яйцо + 3 белка»,
+    и щепотки («Соль — 2 щепотки»).
+    """
+    body = line.lstrip('•-* ').strip()
+    match = _INGREDIENT_RE.match(body)
+    if match:
+        name = match.group('name').strip(' -—–:')
+        unit, factor = normalize_unit(match.group('unit'))
+        # Количество в начале строки или «+» — строка целиком описывает
+        # несколько продуктов; через запятую (вне скобок и не «2,5%») —
+        # общее количество на продукты не делится
+        if name.endswith('+') or re.match(_QUANTITY, name):
+            return {'name': body, 'quantity': None, 'unit': '', 'note': ''}
+        if re.search(r',(?!\d)', re.sub(r'\([^)]*\)?', '', name)) or unit in _TO_TASTE_UNITS:
+            note = body[match.end('name'):].strip(' -—–:')
+            return {'name': name, 'quantity': None, 'unit': '', 'note': note}
+        # Единица не из словаря — допускаем одно слово («2 ломтика»),
+        # более длинный хвост скорее часть названия («1/2-я часть бедер»)
+        if not unit or unit in _NORMALIZED_UNITS or re.fullmatch(r'[а-яё]+', unit):
+            quantity = _number(match.group('qty_max') or match.group('qty'))
+            return {
+                'name': name,
+                'quantity': quantity * factor,
+                'unit': unit or 'шт',
+                'note': (match.group('note') or '').strip(),
+            }
+    name = re.split(r'\s+[—–-]\s+|\s+по вкусу', body, maxsplit=1)[0]
+    return {'name': name.strip(' -—–:'), 'quantity': None, 'unit': '', 'note': ''}
+
+
+def parse_nutrition(text: str) -> Optional[Tuple[Optional[float], ...]]:
+    """
+    Сумма всех строк КБЖУ приёма пищи: (ккал, белки, жиры, углеводы) или None.
+
+    Если в строке указаны только калории («~100 ккал»), БЖУ — None.
+    """
+    total = None
+    for match in _NUTRITION_RE.finditer(text):
+        if match.group('part').strip().startswith('на день'):
+            continue
+        values = tuple(_number(match.group(key)) for key in ('kcal', 'protein', 'fat', 'carbs'))
+        if total is None:
+            total = values
+        else:
+            total = tuple(
+                None if a is None or b is None else a + b for a, b in zip(total, values))
+    return total
+
+
+def parse_day_total(info: str) -> Optional[float]:
+    """Калорийность дня из блока info у FMD и Сушки («КБЖУ на день», «Общая калорийность»)"""
+    match = _DAY_TOTAL_RE.search(info or '')
+    return _number(match.group(1)) if match else None
+
+
+def parse_meal(text: str) -> Dict:
+    """Текст приёма пищи -> {title, ingredients, kcal, protein, fat, carbs}"""
+    title_match = _TITLE_RE.search(text.split('\n', 1)[0])
+    if title_match:
+        title = title_match.group(1).strip()
+    else:
+        # «🍎 <b>Перекус</b>» — без названия блюда
+        title = re.sub(r'<[^>]+>', '', text.split('\n', 1)[0]).strip(' 🌅🍽🌙🍎')
+
+    ingredients: List[Dict] = []
+    for line in text.split('\n'):
+        line = line.strip()
+        if not line.startswith('•'):
+            continue
+        # «• Помидор - 50 г, перец - 40 г» — несколько продуктов в одной строке
+        parts = line.lstrip('• ').split(', ')
+        if len(parts) > 1 and all(re.search(r'\d', part) for part in parts):
+            ingredients.extend(parse_ingredient(part) for part in parts)
+        else:
+            ingredients.append(parse_ingredient(line))
+
+    nutrition = parse_nutrition(text)
+    kcal, protein, fat, carbs = nutrition if nutrition else (None, None, None, None)
+    return {
+        'title': title,
+        'ingredients': ingredients,
+        'kcal': kcal,
+        'protein': protein,
+        'fat': fat,
+        'carbs': carbs,
+    }
+
+
+def iter_meals(programs: Dict[str, dict]):
+    """
+    Все приёмы пищи всех программ: (программа, калории, день, приём пищи, текст).
+
+    programs — {'rations': RECIPES, 'fmd': FMD_RECIPES, 'dry': DRY_RECIPES};
+    у FMD и Сушки калорийность одна, вместо неё 0.
+    """
+    for program, recipes in programs.items():
+        levels = recipes.items() if program == 'rations' else [(0, recipes)]
+        for calories, days in levels:
+            for day in sorted(days):
+                for meal_type in MEAL_TYPES:
+                    if meal_type in days[day]:
+                        yield program, calories, day, meal_type, days[day][meal_type]
@@ -0,0 +1,184 @@
+"""
+Скомпилированная база рецептов: по одному файлу marshal на программу.
+
+Тексты рационов, FMD и Сушки редактируются в data/recipes_source.py,
+а бот читает их из data/compiled/<программа>.marshal, которые собирает
+python generate_recipes.py --compile. Файл программы читается
+и разбирается целиком при первом обращении к ней: импорт data.recipes
+больше не разбирает и не держит в памяти весь исходник.
+
+Там же лежит index.marshal — разобранные рецепты всех программ
+в колоночном виде (data/recipe_index.py).
+
+В каждом файле записан sha256 исходника и модулей разбора. Файлы собирает
+деплой, а бот при запуске проверяет их (ensure_compiled) до приёма апдейтов.
+Если файла всё же нет или он устарел в момент обращения, всё собирается из
+recipes_source.py в памяти (с предупреждением в логе) и файлы пересобираются.
+"""
+import hashlib
+import logging
+import marshal
+import os
+from collections.abc import Mapping
+from typing import Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+STORE_FORMAT = 1
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+SOURCE_PATH = os.path.join(DATA_DIR, 'recipes_source.py')
+# Разбор рецептов тоже влияет на содержимое индекса
+BUILD_PATHS = (
+    SOURCE_PATH,
+    os.path.join(DATA_DIR, 'recipe_parser.py'),
+    os.path.join(DATA_DIR, 'recipe_index.py'),
+)
+COMPILED_DIR = os.path.join(DATA_DIR, 'compiled')
+
+# Программа -> словарь в recipes_source.py
+PROGRAMS = {
+    'rations': 'RECIPES',
+    'fmd': 'FMD_RECIPES',
+    'dry': 'DRY_RECIPES',
+}
+# Индекс разобранных рецептов всех программ (см. data/recipe_index.py)
+INDEX = 'index'
+
+_source_digest: Optional[str] = None
+
+
+def source_digest() -> Optional[str]:
+    """sha256 исходника и модулей разбора (None, если выкатили только скомпилированные файлы)"""
+    global _source_digest
+    if _source_digest is None and os.path.exists(SOURCE_PATH):
+        digest = hashlib.sha256()
+        for path in BUILD_PATHS:
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+        _source_digest = digest.hexdigest()
+    return _source_digest
+
+
+def compiled_path(name: str, directory: Optional[str] = None) -> str:
+    return os.path.join(directory or COMPILED_DIR, f'{name}.marshal')
+
+
+def _build_artifacts() -> Dict[str, object]:
+    """Содержимое всех файлов: словари программ и индекс по ним"""
+    from data import recipes_source
+    from data.recipe_index import build_index
+
+    artifacts = {program: getattr(recipes_source, name) for program, name in PROGRAMS.items()}
+    artifacts[INDEX] = build_index(artifacts)
+    return artifacts
+
+
+def _write_artifacts(artifacts: Dict[str, object], directory: Optional[str] = None) -> Dict[str, int]:
+    os.makedirs(directory or COMPILED_DIR, exist_ok=True)
+    digest = source_digest()
+    sizes = {}
+    for name, data in artifacts.items():
+        payload = marshal.dumps((STORE_FORMAT, digest, data))
+        path = compiled_path(name, directory)
+        # Читатель в другом процессе не должен увидеть недописанный файл
+        with open(f'{path}.tmp', 'wb') as f:
+            f.write(payload)
+        os.replace(f'{path}.tmp', path)
+        sizes[name] = len(payload)
+    return sizes
+
+
+def compile_recipes(directory: Optional[str] = None) -> Dict[str, int]:
+    """Собрать файлы программ и индекса из recipes_source.py; возвращает их размеры в байтах"""
+    return _write_artifacts(_build_artifacts(), directory)
+
+
+def ensure_compiled() -> bool:
+    """
+    Пересобрать файлы, если какого-то нет или он устарел.
+    Возвращает True, если файлы пришлось собрать.
+    """
+    if all(_read_compiled(name) is not None for name in (*PROGRAMS, INDEX)):
+        return False
+    compile_recipes()
+    return True
+
+
+def _read_compiled(name: str):
+    """Прочитать скомпилированный файл; None, если его нет, он повреждён или устарел"""
+    try:
+        with open(compiled_path(name), 'rb') as f:
+            store_format, digest, data = marshal.loads(f.read())
+    except (OSError, ValueError, EOFError, TypeError):
+        return None
+    if store_format != STORE_FORMAT:
+        return None
+    expected = source_digest()
+    if expected is not None and digest != expected:
+        return None
+    return data
+
+
+def load_compiled(name: str):
+    """
+    Содержимое скомпилированного файла программы или индекса.
+
+    Если файла нет или он устарел, всё собирается из recipes_source.py
+    в памяти и записывается заново. В работающем боте так быть не должно:
+    файлы собирает деплой и ensure_compiled() при запуске, поэтому сборка
+    в обработчике сопровождается предупреждением.
+    """
+    data = _read_compiled(name)
+    if data is not None:
+        return data
+
+    logger.warning(
+        f"Compiled recipes '{name}' are missing or stale, building from recipes_source.py "
+        f"on first use (run: python generate_recipes.py --compile)")
+    artifacts = _build_artifacts()
+    try:
+        _write_artifacts(artifacts)
+    except OSError as e:
+        logger.warning(f"Could not write compiled recipes: {e}")
+    return artifacts[name]
+
+
+class RecipeProgram(Mapping):
+    """
+    Рецепты одной программы с интерфейсом словаря (только чтение).
+
+    Содержимое загружается при первом обращении: RECIPES[1200][3],
+    RECIPES.get(...), keys(), len() и in работают как у обычного dict.
+    """
+
+    def __init__(self, program: str):
+        if program not in PROGRAMS:
+            raise ValueError(f'Unknown recipe program: {program}')
+        self.program = program
+        self._data: Optional[dict] = None
+
+    @property
+    def data(self) -> dict:
+        if self._data is None:
+            self._data = load_compiled(self.program)
+        return self._data
+
+    @property
+    def loaded(self) -> bool:
+        return self._data is not None
+
+    def __getitem__(self, key):
+        return self.data[key]
+
+    def __iter__(self) -> Iterator:
+        return iter(self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __contains__(self, key) -> bool:
+        return key in self.data
+
+    def __repr__(self) -> str:
+        state = f'{len(self._data)} entries' if self._data is not None else 'not loaded'
+        return f'<RecipeProgram {self.program}: {state}>'
@@ -0,0 +1,7943 @@
+# База рецептов — исходник для редактирования.
+# Бот читает не этот модуль, а скомпилированные файлы data/compiled/*.marshal:
+# после правок выполните python generate_recipes.py --compile
+# Структура: RECIPES[калории][день] = {"breakfast": ..., "lunch": ..., "dinner": ...}
+
+RECIPES = {
+    1200: {
+        1: {
+            "breakfast": """🌅 <b>Завтрак — Гречневая каша с ягодами</b>
+
+<b>Ингредиенты:</b>
+• Гречневая крупа — 100 г
+• Сахарозаменитель по вкусу
+• Свежие ягоды (или замороженные) — 120 г
+
+<b>Приготовление:</b>
+1. Отварите гречневую крупу в подслащенной воде до готовности
+2. Подавайте кашу с ягодами
+
+<b>КБЖУ:</b> 358,6 ккал | Б: 13,6 г | Ж: 3,6 г | У: 71,1 г""",
+
+            "lunch": """🍽 <b>Обед — Макароны с беконом</b>
+
+<b>Ингредиенты:</b>
+• Бекон сырокопченый — 40 г
+• Макароны ТСП — 80 г
+
+<b>Приготовление:</b>
+1. Отварите макароны в подсоленной воде
+2. Обжарьте бекон на сухой сковороде и добавьте макароны
+
+<b>КБЖУ:</b> 444 ккал | Б: 12,3 г | Ж: 18,4 г | У: 55,76 г""",
+
+            "dinner": """🌙 <b>Ужин — Запеченный стейк форели</b>
+
+<b>Ингредиенты:</b>
+• Стейк форели — 200 г
+• Оливковое масло — 10 г
+• Соль, специи по вкусу
+
+<b>Приготовление:</b>
+1. Форель сбрызните лимоном, натрите маслом, солью и специями
+2. Заверните в фольгу и запекайте 30 минут при 200°C
+
+<b>КБЖУ:</b> 425 ккал | Б: 57,6 г | Ж: 21,2 г | У: 0 г"""
+        },
+        2: {
+            "breakfast": """🌅 <b>Завтрак — Овсянка с фруктами и орехами</b>
+
+<b>Ингредиенты:</b>
+• Овсянка — 50 г
+• Молоко 1,5% — 180 мл
+• Банан — 50 г
+• Орехи — 10 г
+• Сахарозаменитель по вкусу
+
+<b>Приготовление:</b>
+1. Сварите овсянку в молоке или воде до готовности
+2. Добавьте нарезанный банан и орехи
+
+<b>КБЖУ:</b> 359 ккал | Б: 13,2 г | Ж: 10 г | У: 56 г""",
+
+            "lunch": """🍽 <b>Обед — Филе окуня с рисом</b>
+
+<b>Ингредиенты:</b>
+• Филе окуня — 150 г
+• Рис Басмати — 70 г
+• Соль, специи по вкусу
+
+<b>Приготовление:</b>
+1. Отварите рис до готовности
+2. Филе окуня промойте, обсушите бумажным полотенцем
+3. Посыпьте специями, солью
+4. Заверните в фольгу, запекайте 20 минут при 200°C, затем разверните и запекайте ещё 10 минут
+
+<b>КБЖУ:</b> 348 ккал | Б: 32 г | Ж: 1,9 г | У: 49,7 г""",
+
+            "dinner": """🌙 <b>Ужин — Говядина с фунчозой</b>
+
+<b>Ингредиенты:</b>
+• Говядина тазобедренная — 150 г
+• Фунчоза — 50 г
+• Красный перец — 70 г
+• Помидор — 50 г
+• Чеснок — 1 зубчик
+• Соевый соус — 50 мл
+• Оливковое масло — 1 ч.л.
+• Соль, перец по вкусу
+
+<b>Приготовление:</b>
+1. Половину чеснока положите в кипяток, добавьте фунчозу на 5 минут
+2. Вторую половину обжарьте на сковороде с маслом
+3. Добавьте нарезанные овощи
+4. Нарежьте говядину кубиками, приправьте, добавьте к овощам, жарьте до готовности
+5. Добавьте фунчозу и перемешайте
+
+<b>КБЖУ:</b> 540 ккал | Б: 33 г | Ж: 24 г | У: 51 г"""
+        },
+        3: {
+            "breakfast": """🌅 <b>Завтрак — Фруктовый йогурт с мюсли</b>
+
+<b>Ингредиенты:</b>
+• Греческий йогурт — 150 г
+• Мюсли — 50 г
+• Банан — 50 г
+• Клубника — 50 г
+• Мёд или кленовый сироп — 1 ч.л.
+
+<b>Приготовление:</b>
+1. Выложите йогурт в чашку или тарелку
+2. Добавьте мюсли и нарезанные фрукты
+3. Полейте мёдом или сиропом
+
+<b>КБЖУ:</b> 407 ккал | Б: 14,7 г | Ж: 19 г | У: 44,7 г""",
+
+            "lunch": """🍽 <b>Обед — Отварная гречка с жареным куриным филе и овощами</b>
+
+<b>Ингредиенты:</b>
+• Гречка — 60 г
+• Куриное филе — 100 г
+• Овощная смесь — 100 г
+• Соль, специи по вкусу
+
+<b>Приготовление:</b>
+1. Отварите гречку
+2. Куриное филе нарежьте, посолите и поперчите
+3. Обжарьте овощи на сковороде с небольшим количеством воды
+4. Добавьте курицу, жарьте по 5 минут с каждой стороны
+5. Подавайте со свежими овощами
+
+<b>КБЖУ:</b> 351 ккал | Б: 33,5 г | Ж: 3,5 г | У: 47 г""",
+
+            "dinner": """🌙 <b>Ужин — Паста с томатным соусом</b>
+
+<b>Ингредиенты:</b>
+• Спагетти — 70 г
+• Томатный соус — 200 г
+• Чеснок — 2 зубчика
+• Оливковое масло — 1/2 ст. л.
+• Соль, перец по вкусу
+
+<b>Приготовление:</b>
+1. Отварите пасту до готовности
+2. В сковороде разогрейте масло, обжарьте чеснок до золотистого цвета
+3. Добавьте томатный соус, приправьте солью и перцем, готовьте 5-7 минут
+4. Перемешайте пасту с соусом и подавайте горячей
+
+<b>КБЖУ:</b> 457 ккал | Б: 11,6 г | Ж: 21,4 г | У: 61,4 г"""
+        },
+        4: {
+            "breakfast": """🌅 <b>Завтрак — Тосты с авокадо и помидорами</b>
+
+<b>Ингредиенты:</b>
+• Хлеб — 80 г (2 кусочка по 40 г)
+• Авокадо — 70 г
+• Помидор — 1 шт
+• Соль и перец по вкусу
+
+<b>Приготовление:</b>
+1. Поджарьте тосты
+2. Разомните авокадо вилкой и намажьте на тосты
+3. Нарежьте помидор ломтиками и выложите сверху
+4. Посолите и поперчите по вкусу
+
+<b>КБЖУ:</b> 361 ккал | Б: 8,5 г | Ж: 13 г | У: 46 г""",
+
+            "lunch": """🍽 <b>Обед — Отварной булгур с тилапией</b>
+
+<b>Ингредиенты:</b>
+• Филе тилапии — 150 г
+• Булгур — 70 г
+• Оливковое масло — 5 г
+
+<b>Приготовление:</b>
+1. Отварите булгур до готовности
+2. Тилапию промойте, посолите, поперчите и обжарьте с двух сторон на среднем огне по 5 минут
+3. Накройте крышкой, уменьшите огонь и готовьте ещё 5 минут
+
+<b>КБЖУ:</b> 427 ккал | Б: 38,7 г | Ж: 8,4 г | У: 40 г""",
+
+            "dinner": """🌙 <b>Ужин — Чилийский красный карри с курицей</b>
+
+<b>Ингредиенты:</b>
+• Куриное филе — 250 г
+• Лук — 1/2 шт
+• Чеснок — 1 зубчик
+• Красная карри-паста — 1 ст.л.
+• Кокосовое молоко — 200 мл
+• Оливковое масло — 1/2 ст.л.
+• Соль, перец по вкусу
+• Свежая кинза для подачи
+
+<b>Приготовление:</b>
+1. В кастрюле разогрейте масло, обжарьте лук и чеснок до мягкости
+2. Добавьте курицу, обжаривайте до золотистого цвета
+3. Добавьте карри-пасту, перемешайте и готовьте ещё 1-2 минуты
+4. Влейте кокосовое молоко, доведите до кипения, убавьте огонь и тушите 20-25 минут
+5. Подавайте с рисом или овощами, посыпав кинзой
+
+<b>КБЖУ:</b> 455 ккал | Б: 54 г | Ж: 22 г | У: 10,1 г"""
+        },
+        5: {
+            "breakfast": """🌅 <b>Завтрак — Омлет с овощами и сыром</b>
+
+<b>Ингредиенты:</b>
+• Яйца — 3 шт
+• Помидор — 30 г
+• Перец — 30 г
+• Лук — 20 г
+• Тёртый сыр — 20 г
+• Соль, перец по вкусу
+
+<b>Приготовление:</b>
+1. Взбейте яйца, добавьте нарезанные овощи, соль и перец
+2. Разогрейте сковороду, влейте яичную смесь
+3. Посыпьте сыром и готовьте до упругости омлета
+
+<b>КБЖУ:</b> 326 ккал | Б: 24,7 г | Ж: 22,5 г | У: 6,1 г""",
+
+            "lunch": """🍽 <b>Обед — Макароны с куриными котлетами</b>
+
+<b>Ингредиенты:</b>
+• Макароны ТСП — 60 г
+• Куриное филе — 150 г
+• Яйцо — 1 шт
+• Оливковое масло — 5 г
+• Соль, специи, укроп по вкусу
+
+<b>Приготовление:</b>
+1. Отварите макароны
+2. Куриное филе мелко нарежьте, добавьте яйцо, специи, укроп и сформируйте котлеты
+3. Обжарьте котлеты на масле по 5 минут с каждой стороны
+4. Накройте крышкой и оставьте ещё 5 минут на слабом огне
+
+<b>КБЖУ:</b> 500 ккал | Б: 46 г | Ж: 11,8 г | У: 35 г""",
+
+            "dinner": """🌙 <b>Ужин — Филе окуня, запечённое с картофелем</b>
+
+<b>Ингредиенты:</b>
+• Филе окуня — 150 г
+• Картофель — 140 г
+• Сыр гауда — 20 г
+• Оливковое масло — 10 г
+• Зелень по вкусу
+
+<b>Приготовление:</b>
+1. Отварите картофель 10 минут
+2. Сделайте надрез, добавьте тёртый сыр и зелень
+3. Заверните в фольгу, запекайте 15 минут при 200°C
+4. Филе окуня посолите, поперчите, заверните в фольгу и запекайте 20 минут
+5. Разверните фольгу и выпекайте ещё 10 минут
+
+<b>КБЖУ:</b> 390 ккал | Б: 35 г | Ж: 18 г | У: 23 г"""
+        },
+        6: {
+            "breakfast": """🌅 <b>Завтрак — Каша рисовая с курицей и беконом</b>
+
+<b>Ингредиенты:</b>
+• Рис Басмати — 35 г
+• Томаты — 100 г
+• Бекон варено-копченый — 40 г
+• Куриное филе — 80 г
+• Зелень, соль, перец по вкусу
+
+<b>Приготовление:</b>
+1. Обжарьте бекон на сухой сковороде
+2. Добавьте курицу и рис, обжаривайте несколько минут
+3. Добавьте нарезанные томаты, заливайте водой и варите до готовности
+4. Добавьте зелень, соль, перец
+
+<b>КБЖУ:</b> 420 ккал | Б: 31 г | Ж: 20 г | У: 28 г""",
+
+            "lunch": """🍽 <b>Обед — ПП хачапури</b>
+
+<b>Ингредиенты:</b>
+• Творог 5% — 100 г
+• Яйцо — 1 шт
+• Желток — 1 шт
+• Рисовая мука — 40 г
+• Разрыхлитель — 1/2 ч.л.
+• Лёгкий сыр — 40 г
+
+<b>Приготовление:</b>
+1. Смешайте творог, яйцо, муку и разрыхлитель
+2. Сформируйте лодочку и выпекайте 10 минут при 180°C
+3. Достаньте, добавьте тёртый сыр, снова в духовку
+4. Добавьте желток и выпекайте ещё пару минут
+
+<b>КБЖУ:</b> 512 ккал | Б: 42 г | Ж: 21 г | У: 35,8 г""",
+
+            "dinner": """🌙 <b>Ужин — Отварная гречка с куриным фаршем и томатной пастой</b>
+
+<b>Ингредиенты:</b>
+• Гречка — 50 г
+• Куриное филе — 100 г
+• Оливковое масло — 5 г
+• Томатная паста — 10 г
+• Соль, специи, зелень по вкусу
+
+<b>Приготовление:</b>
+1. Отварите гречку
+2. Измельчите курицу в фарш, обжарьте на масле
+3. Добавьте томатную пасту, тушите 10 минут
+4. Смешайте с гречкой, дайте настояться 5 минут
+
+<b>КБЖУ:</b> 319 ккал | Б: 29 г | Ж: 8,1 г | У: 32,1 г"""
+        },
+        7: {
+            "breakfast": """🌅 <b>Завтрак — Лаваш с сыром и яйцом</b>
+
+<b>Ингредиенты:</b>
+• Лаваш армянский — 70 г
+• Яйцо — 1 шт
+• Сыр сулугуни — 40 г
+• Соль, специи, зелень
+
+<b>Приготовление:</b>
+1. Вырежьте из лаваша 2 круга по размеру сковороды
+2. Натрите сыр на крупной тёрке
+3. Выложите один круг лаваша на разогретую сковороду, добавьте взбитое яйцо и половину сыра
+4. Посолите, добавьте специи и зелень
+5. Накройте вторым кругом, переверните, посыпьте оставшимся сыром
+
+<b>КБЖУ:</b> 368 ккал | Б: 21 г | Ж: 16,4 г | У: 33,7 г""",
+
+            "lunch": """🍽 <b>Обед — Макароны с яйцом и сыром</b>
+
+<b>Ингредиенты:</b>
+• Макароны ТСП — 60 г
+• Яйцо — 2 шт
+• Сыр — 30 г
+
+<b>Приготовление:</b>
+1. Отварите макароны
+2. Переложите макароны на разогретую сковороду, добавьте яйцо и тёртый сыр
+3. Готовьте 3 минуты под крышкой
+
+<b>КБЖУ:</b> 483 ккал | Б: 27 г | Ж: 21,3 г | У: 48,3 г""",
+
+            "dinner": """🌙 <b>Ужин — Говядина с луком и овощами</b>
+
+<b>Ингредиенты:</b>
+• Говяжья вырезка — 130 г
+• Лук — 50 г
+• Овощная смесь — 100 г
+• Соль, специи по вкусу
+
+<b>Приготовление:</b>
+1. Нарежьте лук кольцами и быстро обжарьте
+2. Добавьте овощи, тушите 10 минут под крышкой
+3. Нарежьте говядину небольшими кусочками, обжарьте по 7 минут с каждой стороны
+
+<b>КБЖУ:</b> 360 ккал | Б: 27,7 г | Ж: 21 г | У: 15,2 г"""
+        },
+        8: {
+            "breakfast": """🌅 <b>Завтрак — Горячий сэндвич с яйцом</b>
+
+<b>Ингредиенты:</b>
+• Хлеб ц/з — 60 г
+• Яйцо — 1 шт
+• Сливочное масло — 6 г
+• Ветчина из индейки — 30 г
+• Сыр 15% — 15 г
+• Специи по вкусу
+
+<b>Приготовление:</b>
+1. Из одного кусочка хлеба вырежьте мякиш
+2. На сковороду выложите хлеб, в отверстие разбейте яйцо
+3. Добавьте ветчину и сыр, накройте вторым кусочком хлеба
+4. Намажьте сверху маслом, переверните и обжарьте
+
+<b>КБЖУ:</b> 348 ккал | Б: 19 г | Ж: 18 г | У: 25 г""",
+
+            "lunch": """🍽 <b>Обед — Отварной картофель с говядиной</b>
+
+<b>Ингредиенты:</b>
+• Говяжья вырезка — 150 г
+• Оливковое масло — 5 г
+• Чеснок — 1 зубчик
+• Соевый соус — 15 г
+• Картофель — 120 г
+• Соль, специи по вкусу
+
+<b>Приготовление:</b>
+1. Отварите картофель
+2. Нарежьте говядину полосками, обжарьте на сильном огне 10 минут
+3. Добавьте чеснок, соевый соус, тушите 5 минут
+4. Подавайте с очищенным картофелем
+
+<b>КБЖУ:</b> 399 ккал | Б: 27,8 г | Ж: 19 г | У: 24,8 г""",
+
+            "dinner": """🌙 <b>Ужин — Креветки с чесночным соусом</b>
+
+<b>Ингредиенты:</b>
+• Креветки очищенные — 350 г
+• Чеснок — 4 зубчика
+• Оливковое масло — 2 ст.л.
+• Лимонный сок — 2 ст.л.
+• Петрушка, соль, перец
+
+<b>Приготовление:</b>
+1. Разогрейте масло, обжарьте чеснок
+2. Добавьте креветки, посолите, поперчите
+3. Полейте лимонным соком, готовьте ещё 1-2 минуты
+4. Подавайте с петрушкой и ломтиком лимона
+
+<b>КБЖУ:</b> 461 ккал | Б: 69,7 г | Ж: 15,2 г | У: 12,7 г"""
+        },
+        9: {
+            "breakfast": """🌅 <b>Завтрак — Тосты с бананом и арахисовой пастой</b>
+
+<b>Ингредиенты:</b>
+• Хлеб ц/з — 60 г
+• Арахисовая паста — 20 г
+• Банан — 40 г
+• Тыквенные семечки — 5 г
+
+<b>Приготовление:</b>
+1. Поджарьте хлеб в тостере
+2. Намажьте арахисовую пасту
+3. Добавьте нарезанный банан
+4. Посыпьте тыквенными семечками
+
+<b>КБЖУ:</b> 324 ккал | Б: 13 г | Ж: 20 г | У: 43 г""",
+
+            "lunch": """🍽 <b>Обед — Паста с сыром и грибами</b>
+
+<b>Ингредиенты:</b>
+• Макароны ТСП — 60 г
+• Сливки 33% — 50 г
+• Шампиньоны — 100 г
+• Сыр моцарелла — 30 г
+
+<b>Приготовление:</b>
+1. Отварите макароны
+2. Грибы обжарьте на сильном огне пару минут
+3. Добавьте сливки, уменьшите огонь
+4. Добавьте макароны, сыр, специи и зелень
+
+<b>КБЖУ:</b> 489 ккал | Б: 20,4 г | Ж: 24 г | У: 48 г""",
+
+            "dinner": """🌙 <b>Ужин — Стейк форели и печёный картофель</b>
+
+<b>Ингредиенты:</b>
+• Стейк форели — 200 г
+• Картофель — 130 г
+• Оливковое масло — 10 г
+• Лимон (цедра) — 0,5 шт
+• Чеснок — 2 зубчика
+• Паприка — 1 ч.л.
+• Тмин — 1 ч.л.
+• Красный перец — на кончике ножа
+• Соль, чёрный перец
+
+<b>Приготовление:</b>
+1. Отварите картофель 20 минут
+2. Смешайте цедру лимона, специи, чеснок и масло
+3. Маринуйте рыбу 5 минут
+4. Обжарьте форель по 5 минут с каждой стороны
+5. Очистите картофель, обжарьте 5 минут под крышкой
+
+<b>КБЖУ:</b> 419 ккал | Б: 42 г | Ж: 30 г | У: 25 г"""
+        },
+        10: {
+            "breakfast": """🌅 <b>Завтрак — Овсяноблин</b>
+
+<b>Ингредиенты:</b>
+• Овсянка долгой варки — 30 г
+• Яйцо — 1 шт
+• Белок — 1 шт
+• Сахарозаменитель, сода, корица (по желанию)
+
+<b>Приготовление:</b>
+1. Превратите овсянку в муку с помощью кофемолки
+2. Добавьте сахарозаменитель, соду и корицу
+3. Добавьте яйцо и белок, перемешайте с ложкой воды
+4. Вылейте тесто на разогретую сковороду
+5. Жарьте под крышкой с обеих сторон
+
+<b>КБЖУ:</b> 206 ккал | Б: 13,3 г | Ж: 8,9 г | У: 21,7 г""",
+
+            "lunch": """🍽 <b>Обед — Тушеные овощи с красной чечевицей</b>
+
+<b>Ингредиенты:</b>
+• Красная чечевица — 100 г
+• Морковь — 1 шт
+• Красный перец — 1 шт
+• Кабачок — 1 шт
+• Луковица — ½ шт
+• Томатная паста — 2 ст.л.
+• Овощной бульон — 0,7 л
+• Оливковое масло — 1 ст.л.
+• Соль и перец по вкусу
+
+<b>Приготовление:</b>
+1. Замочите чечевицу на ночь
+2. Разогрейте масло в кастрюле, обжарьте лук до прозрачности
+3. Добавьте морковь, перец и кабачок, тушите 5 минут
+4. Добавьте чечевицу, томатную пасту и бульон
+5. Доведите до кипения, уменьшите огонь и тушите 20-25 минут
+
+<b>КБЖУ:</b> 510 ккал | Б: 23,4 г | Ж: 8 г | У: 81,1 г""",
+
+            "dinner": """🌙 <b>Ужин — Запеченный картофель с горбушей</b>
+
+<b>Ингредиенты:</b>
+• Стейк горбуши — 200 г
+• Картофель — 130 г
+• Лук — 30 г
+• Морковь — 100 г
+• Оливковое масло — 10 г
+• Специи, соль, зелень
+
+<b>Приготовление:</b>
+1. Приготовьте овощную подушку: нарежьте лук и морковь, запеките в духовке с маслом
+2. Посолите и поперчите горбушу, смазывайте маслом
+3. Запекайте на овощной подушке 20-25 минут при 220°C
+4. Запеките картофель в микроволновке 10-15 минут
+5. Разрежьте картофель, добавьте масло и запеките ещё 10 минут
+
+<b>КБЖУ:</b> 501 ккал | Б: 43 г | Ж: 20,3 г | У: 37,7 г"""
+        },
+        11: {
+            "breakfast": """🌅 <b>Завтрак — Рисовый блин с яблоком</b>
+
+<b>Ингредиенты:</b>
+• Рис (белый длиннозерный) — 50 г
+• Яйцо — 1 шт
+• Яичный белок — 1 шт
+• Яблоко — 50 г
+• Корица, сахзам по вкусу
+
+<b>Приготовление:</b>
+1. Отварите рис, слегка остудите
+2. Добавьте яйцо и белки, перемешайте
+3. Добавьте тертое яблоко и сухие ингредиенты
+4. Жарьте с обеих сторон до золотистой корочки под крышкой
+
+<b>КБЖУ:</b> 291 ккал | Б: 13,8 г | Ж: 6,6 г | У: 44,6 г""",
+
+            "lunch": """🍽 <b>Обед — Лосось с макаронами и овощами</b>
+
+<b>Ингредиенты:</b>
+• Стейк лосося — 150 г
+• Макароны ТСП — 60 г
+• Оливковое масло — 5 г
+• Овощная смесь — 100 г
+
+<b>Приготовление:</b>
+1. Отварите макароны
+2. Помойте и обсушите лосося, посолите и поперчите
+3. Обжарьте лосося с обеих сторон по 7 минут
+4. Добавьте овощи и тушите ещё 5 минут
+
+<b>КБЖУ:</b> 514 ккал | Б: 38 г | Ж: 18 г | У: 51 г""",
+
+            "dinner": """🌙 <b>Ужин — Хачапури в духовке</b>
+
+<b>Ингредиенты:</b>
+• Яйцо — 1 шт
+• Яичный желток — 1 шт
+• Творог 2% — 150 г
+• Рисовая мука — 20 г
+• Сыр — 20 г
+• Соль, специи по вкусу
+
+<b>Приготовление:</b>
+1. Смешайте творог, яйцо, муку и соль
+2. Сформируйте лодочку и отправьте в разогретую духовку на 20 минут при 200°C
+3. Добавьте тертый сыр и верните в духовку, запекайте ещё 5 минут
+4. В центр добавьте желток, запекайте 2 минуты
+
+<b>КБЖУ:</b> 450 ккал | Б: 43,6 г | Ж: 21,8 г | У: 22 г"""
+        },
+        12: {
+            "breakfast": """🌅 <b>Завтрак — Отварная овсянка и яйца</b>
+
+<b>Ингредиенты:</b>
+• Овсянка — 60 г
+• Яйца — 2 шт
+
+<b>Приготовление:</b>
+1. Отварите овсянку 10 минут и оставьте под крышкой на 5 минут
+2. Отварите яйца до желаемой консистенции
+
+<b>КБЖУ:</b> 367 ккал | Б: 20 г | Ж: 13,8 г | У: 37,9 г""",
+
+            "lunch": """🍽 <b>Обед — Куриное филе в сливках с грибами под сырной шапочкой</b>
+
+<b>Ингредиенты:</b>
+• Куриное филе — 100 г
+• Шампиньоны — 80 г
+• Сливки 33% — 30 г
+• Сыр гауда — 30 г
+• Оливковое масло — 5 г
+
+<b>Приготовление:</b>
+1. Нарежьте грибы и обжарьте 3 минуты
+2. Мелко нарежьте куриное филе, обжарьте 5-7 минут
+3. Добавьте сливки
+4. Посыпьте натертым сыром
+5. Дайте настояться 3 минуты
+
+<b>КБЖУ:</b> 344 ккал | Б: 32,8 г | Ж: 22,4 г | У: 2 г""",
+
+            "dinner": """🌙 <b>Ужин — Овощная лепешка с сыром</b>
+
+<b>Ингредиенты:</b>
+• Кабачок — 100 г
+• Морковь — 50 г
+• Сыр — 30 г
+• Яйцо — 1 шт
+• Сметана 20% — 30 г
+• Рисовая мука — 60 г
+• Зелень по вкусу
+
+<b>Приготовление:</b>
+1. Натрите овощи, отожмите лишнюю жидкость
+2. Добавьте сыр, яйцо, сметану и рисовую муку
+3. Перемешайте
+4. Жарьте на сковороде под крышкой до готовности
+
+<b>КБЖУ:</b> 501 ккал | Б: 19,4 г | Ж: 22 г | У: 58 г"""
+        },
+        13: {
+            "breakfast": """🌅 <b>Завтрак — Рисовая каша на кокосовом молоке и вареное яйцо</b>
+
+<b>Ингредиенты:</b>
+• Рис — 50 г
+• Кокосовое молоко 1,5% — 50 г
+• Яйцо — 1 шт
+• Голубика — 15 г
+• Тыквенные семечки — 10 г
+• Сахарозаменитель по вкусу
+
+<b>Приготовление:</b>
+1. Варите рисовую кашу на воде
+2. Добавьте кокосовое молоко и сахарозаменитель
+3. Яйцо варите 2-5 минут
+4. В кашу добавьте голубику и тыквенные семечки
+
+<b>КБЖУ:</b> 322 ккал | Б: 11,7 г | Ж: 9,9 г | У: 46,9 г""",
+
+            "lunch": """🍽 <b>Обед — Горбуша в духовке с макаронами</b>
+
+<b>Ингредиенты:</b>
+• Стейк горбуши — 150 г
+• Макароны ТСП — 25 г
+• Морковь — 50 г
+• Лук — 25 г
+• Оливковое масло — 5 г
+• Зелень по вкусу
+
+<b>Приготовление:</b>
+1. Отварите макароны
+2. Промойте горбушу, удалите лишнее
+3. Нарежьте овощи, выложите на фольгу, сбрызните маслом
+4. Положите горбушу на овощи, посолите и поперчите
+5. Заверните в фольгу и запекайте в духовке 20 минут
+6. Приоткройте фольгу и выпекайте еще 10 минут
+
+<b>КБЖУ:</b> 350 ккал | Б: 34 г | Ж: 15 г | У: 24 г""",
+
+            "dinner": """🌙 <b>Ужин — Говяжьи тефтели в томатном соусе</b>
+
+<b>Ингредиенты:</b>
+• Фарш говяжий — 200 г
+• Рис (белый длиннозерный) — 40 г
+• Томатная паста — 30 г
+• Мука — 10 г
+
+<b>Приготовление:</b>
+1. Отварите рис до полуготовности
+2. В контейнере смешайте фарш и рис
+3. Сформируйте тефтели
+4. Обжарьте тефтели с обеих сторон по 3 минуты
+5. Добавьте кипяток, чтобы покрыть тефтели наполовину
+6. Добавьте томатную пасту и муку, перемешайте
+7. Накройте крышкой и тушите 20 минут
+
+<b>КБЖУ:</b> 528 ккал | Б: 45 г | Ж: 14 г | У: 52 г"""
+        },
+        14: {
+            "breakfast": """🌅 <b>Завтрак — Хлебцы с творожным сыром и слабосоленой рыбой</b>
+
+<b>Ингредиенты:</b>
+• Хлебцы — 30 г
+• Творожный сыр — 50 г
+• Слабосоленая рыба — 50 г
+• Огурец — 40 г
+
+<b>Приготовление:</b>
+1. Намажьте творожный сыр на хлебцы
+2. Нарежьте огурец и выложите на сыр
+3. Нарежьте рыбу и выложите на хлебцы
+
+<b>КБЖУ:</b> 322 ккал | Б: 14,5 г | Ж: 22,2 г | У: 16,5 г""",
+
+            "lunch": """🍽 <b>Обед — Индейка с грибами</b>
+
+<b>Ингредиенты:</b>
+• Шампиньоны — 100 г
+• Филе индейки — 200 г
+• Соль, специи, зелень по вкусу
+
+<b>Приготовление:</b>
+1. Нарежьте грибы и обжаривайте на сильном огне 2 минуты
+2. Нарежьте индейку, солите и жарьте с грибами по 3 минуты с каждой стороны
+3. Тушите под крышкой 5 минут
+
+<b>КБЖУ:</b> 195 ккал | Б: 42 г | Ж: 2 г | У: 0,6 г""",
+
+            "dinner": """🌙 <b>Ужин — Горбуша в духовке с макаронами</b>
+
+<b>Ингредиенты:</b>
+• Стейк горбуши — 300 г
+• Макароны ТСП — 50 г
+• Морковь — 100 г
+• Лук — 50 г
+• Оливковое масло — 5 г
+• Зелень по вкусу
+
+<b>Приготовление:</b>
+1. Отварите макароны
+2. Промойте и подготовьте горбушу
+3. Нарежьте овощи и выложите их на фольгу, сбрызните маслом
+4. Положите горбушу на овощи, посолите и поперчите
+5. Заверните в фольгу и запекайте в духовке 20 минут
+6. Приоткройте фольгу и выпекайте еще 10 минут
+
+<b>КБЖУ:</b> 694 ккал | Б: 68,7 г | Ж: 25 г | У: 47 г"""
+        }
+    },
+
+    1300: {
+        1: {
+            "breakfast": """🌅 <b>Завтрак — Гречневые блинчики на молоке</b>
+
+<b>Ингредиенты:</b>
+• Гречневая мука – 100 г
+• Молоко – 150 мл
+• Вода – 50 мл
+• Яйцо – 1 шт
+• Щепотка соли
+• Сахарозаменитель – по вкусу
+
+<b>Приготовление:</b>
+1. Смешать все ингредиенты до получения однородного теста
+2. Разогреть сковороду и приготовить блинчики до золотистого цвета
+3. Подавать с мёдом, сметаной или свежими фруктами
+
+<b>КБЖУ:</b> 549 ккал | Б: 25 г | Ж: 12,4 г | У: 81 г""",
+
+            "lunch": """🍽 <b>Обед — Говяжий фарш с сельдереем и зелёным луком</b>
+
+<b>Ингредиенты:</b>
+• Фарш говяжий (постное мясо) – 180 г
+• Помидоры черри – 30 г
+• Сельдерей – 30 г
+• Зелёный лук – 30 г
+
+<b>Приготовление:</b>
+1. Обжарить фарш на среднем огне 10 минут
+2. Накрыть крышкой и тушить до готовности
+3. Добавить нарезанные сельдерей, лук, помидоры, перемешать и подать
+
+<b>КБЖУ:</b> 266 ккал | Б: 37,5 г | Ж: 11,5 г | У: 2,9 г""",
+
+            "dinner": """🌙 <b>Ужин — Паста с сыром и грибами</b>
+
+<b>Ингредиенты:</b>
+• Макароны цельнозерновые – 60 г
+• Сливки 33% – 50 г
+• Шампиньоны – 100 г
+• Сыр моцарелла – 30 г
+• Соль, специи – по вкусу
+• Зелень – по вкусу
+
+<b>Приготовление:</b>
+1. Отварить макароны до готовности в подсоленной воде
+2. Грибы нарезать кольцами, обжарить на сухой сковороде на сильном огне пару минут
+3. Добавить к грибам сливки, уменьшить огонь, перемешать
+4. Добавить макароны, натёртый сыр, специи, зелень, перемешать
+
+<b>КБЖУ:</b> 489 ккал | Б: 20 г | Ж: 24 г | У: 48 г"""
+        },
+        2: {
+            "breakfast": """🌅 <b>Завтрак — Овсяная каша с протеином</b>
+
+<b>Ингредиенты:</b>
+• Овсяные хлопья – 50 г
+• Протеин – 20 г
+• Миндаль – 15 г
+• Молоко 1,5% – 220 мл
+
+<b>Приготовление:</b>
+1. Залить хлопья половиной молока, нагреть в микроволновке 3-5 минут
+2. Оставить под крышкой на 15-20 минут
+3. Добавить оставшиеся ингредиенты, перемешать
+
+<b>КБЖУ:</b> 453 ккал | Б: 29,7 г | Ж: 16,8 г | У: 49,3 г""",
+
+            "lunch": """🍽 <b>Обед — Паста с креветками</b>
+
+<b>Ингредиенты:</b>
+• Креветки очищенные – 100 г
+• Макароны цельнозерновые – 50 г
+• Сливки 33% – 20 г
+• Сыр Гауда – 20 г
+• Зелень – по вкусу
+• Соль, специи – по вкусу
+
+<b>Приготовление:</b>
+1. Отварить макароны до готовности
+2. Разогреть сковороду, выложить креветки, посолить, добавить специи
+3. Добавить макароны, готовить на среднем огне под крышкой 3 минуты
+4. Влить сливки, натереть сыр, посыпать зеленью, перемешать, оставить настаиваться 1 минуту
+
+<b>КБЖУ:</b> 386 ккал | Б: 30 г | Ж: 13 г | У: 36 г""",
+
+            "dinner": """🌙 <b>Ужин — Жареные креветки с овощами</b>
+
+<b>Ингредиенты:</b>
+• Креветки очищенные (замороженные) – 250 г
+• Оливковое масло – 10 г
+• Овощи на выбор – 200 г
+• Зелень – по вкусу
+
+<b>Приготовление:</b>
+1. Обжарить креветки на сковороде с маслом по 2 минуты на среднем огне
+2. Подавать с овощами и мелко нарезанной зеленью
+
+<b>КБЖУ:</b> 500 ккал | Б: 82 г | Ж: 13,4 г | У: 10 г"""
+        },
+        3: {
+            "breakfast": """🌅 <b>Завтрак — Греческий йогурт с фруктами и гранолой</b>
+
+<b>Ингредиенты:</b>
+• Греческий йогурт – 150 г
+• Гранола – 50 г
+• Ягоды или фрукты – 100 г
+
+<b>Приготовление:</b>
+1. Добавить нарезанные фрукты (ягоды, яблоко или грушу) к греческому йогурту
+2. Посыпать сверху гранолой
+
+<b>КБЖУ:</b> 359 ккал | Б: 14,7 г | Ж: 18,3 г | У: 33 г""",
+
+            "lunch": """🍽 <b>Обед — Печёная картошка с жареной курочкой и зелёным луком</b>
+
+<b>Ингредиенты:</b>
+• Куриное филе – 200 г
+• Картофель – 200 г
+• Масло сливочное – 10 г
+• Соль, специи – по вкусу
+• Зелёный лук – по вкусу
+
+<b>Приготовление:</b>
+1. Отварить картофель в мундире (20 минут после закипания)
+2. Куриное филе нарезать, посолить, поперчить, обжарить по 5 минут с каждой стороны
+3. Очистить картофель, нарезать на 4 части, посолить
+4. Добавить картофель на сковороду с курицей, жарить под крышкой ещё 3 минуты с каждой стороны
+5. Добавить сливочное масло и зелень
+
+<b>КБЖУ:</b> 446 ккал | Б: 50 г | Ж: 11,2 г | У: 32 г""",
+
+            "dinner": """🌙 <b>Ужин — Треска с картофельным пюре и брокколи</b>
+
+<b>Ингредиенты:</b>
+• Филе трески – 150 г
+• Картофель – 200 г
+• Молоко 2,5% – 50 мл
+• Брокколи – 100 г
+• Оливковое масло – 10 г
+• Соль, перец – по вкусу
+
+<b>Приготовление:</b>
+1. Отварить картофель, размять в пюре с молоком и небольшим количеством масла
+2. Запечь треску в духовке при 180°C с оливковым маслом и специями (15 минут)
+3. Отварить брокколи до мягкости
+4. Подавать треску с пюре и брокколи
+
+<b>КБЖУ:</b> 520 ккал | Б: 40 г | Ж: 15 г | У: 50 г"""
+        },
+        4: {
+            "breakfast": """🌅 <b>Завтрак — Творожные блинчики</b>
+
+<b>Ингредиенты:</b>
+• Творог мягкий 0% – 200 г
+• Яйцо – 2 шт
+• Молоко 2,5% – 150 мл
+• Рисовая мука – 45 г
+• Сахарозаменитель – по вкусу
+
+<b>Приготовление:</b>
+1. Перемешать все ингредиенты до однородной массы
+2. Выпекать на сковороде по 2 минуты с каждой стороны
+
+<b>КБЖУ:</b> 549 ккал | Б: 43,3 г | Ж: 16 г | У: 52 г""",
+
+            "lunch": """🍽 <b>Обед — Филе окуня с макаронами</b>
+
+<b>Ингредиенты:</b>
+• Филе морского окуня – 250 г
+• Макароны цельнозерновые – 70 г
+• Соль, специи – по вкусу
+
+<b>Приготовление:</b>
+1. Отварить макароны до готовности
+2. Промыть филе окуня, обсушить бумажным полотенцем
+3. Посыпать филе солью и специями
+4. Завернуть в фольгу, выпекать в духовке при 200°C в течение 20 минут
+5. Развернуть фольгу, запекать ещё 10 минут
+
+<b>КБЖУ:</b> 440 ккал | Б: 53,2 г | Ж: 2,3 г | У: 48 г""",
+
+            "dinner": """🌙 <b>Ужин — Индейка с грибами</b>
+
+<b>Ингредиенты:</b>
+• Шампиньоны - 150 г
+• Филе индейки - 200 г
+• Соль, специи, зелень
+• Оливковое масло - чайная ложка для обжарки
+
+<b>Приготовление:</b>
+1. Грибы моем, режем кольцами и жарим на сильном огне 2 минуты
+2. Индейку мелко режем, солим, жарим на сковороде с грибами по 3 минуты с каждой стороны
+3. Тушим под крышкой 5 минут
+
+<b>КБЖУ:</b> 329 ккал | Б: 44 г | Ж: 10,6 г | У: 0,1 г"""
+        },
+        5: {
+            "breakfast": """🌅 <b>Завтрак — Тосты с творожным сыром, курочкой и слабосоленой рыбой, яйцом</b>
+
+<b>Ингредиенты:</b>
+• Цельнозерновой хлеб – 80 г
+• Творожный сыр – 40 г
+• Слабосоленая рыба – 40 г
+• Куриное филе – 100 г
+• Яйцо – 1 шт
+
+<b>Приготовление:</b>
+1. Поджарить хлеб в тостере
+2. Нарезать филе, обжарить с двух сторон по 3 минуты
+3. Собрать тосты: один смазать творожным сыром, выложить очищенное яйцо и курицу; другой смазать сыром и положить рыбу
+
+<b>КБЖУ:</b> 552 ккал | Б: 46,6 г | Ж: 16,8 г | У: 40,6 г""",
+
+            "lunch": """🍽 <b>Обед — Фарш говяжий с рисом и сельдереем</b>
+
+<b>Ингредиенты:</b>
+• Говяжий фарш – 200 г (140 ккал на 100 г)
+• Рис Жасмин – 35 г
+• Сельдерей – 50 г
+• Петрушка, укроп – по вкусу
+
+<b>Приготовление:</b>
+1. Отварить рис до готовности
+2. Разогреть сковороду, выложить фарш, перемешать, разбивая комки
+3. Жарить 10 минут, постоянно переворачивая
+4. Добавить нарезанный сельдерей и зелень, обжарить с фаршем до готовности
+5. Добавить рис, перемешать
+
+<b>КБЖУ:</b> 437 ккал | Б: 47,8 г | Ж: 14,3 г | У: 26,7 г""",
+
+            "dinner": """🌙 <b>Ужин — Салат с лососем и огурцом</b>
+
+<b>Ингредиенты:</b>
+• Лосось слабосолёный – 80 г
+• Огурец – 80 г
+• Авокадо – 50 г
+• Салатные листья – 30 г
+• Лимонный сок – 5 г
+• Оливковое масло – 5 г
+• Соль, перец – по вкусу
+
+<b>Приготовление:</b>
+1. Нарезать лосось и авокадо кубиками
+2. Огурец нарезать соломкой
+3. Смешать все ингредиенты с листьями салата
+4. Заправить лимонным соком и маслом, приправить по вкусу
+
+<b>КБЖУ:</b> 350 ккал | Б: 24 г | Ж: 14 г | У: 10 г"""
+        },
+        6: {
+            "breakfast": """🌅 <b>Завтрак — Рис с яичницей, сыром, беконом и зеленью</b>
+
+<b>Ингредиенты:</b>
+• Рис белый – 40 г
+• Яйца – 2 шт
+• Белок – 1 шт
+• Сыр – 30 г
+• Бекон – 30 г
+• Оливковое масло – 10 г
+• Зелень – по вкусу
+• Соль, специи – по вкусу
+
+<b>Приготовление:</b>
+1. Отварить рис до готовности
+2. Разогреть сковороду с маслом, разбить яйца, добавить белки
+3. Жарить 3 минуты под крышкой, добавить соль, специи
+4. Посыпать тертым сыром, зеленью, добавить бекон
+
+<b>КБЖУ:</b> 624 ккал | Б: 33,7 г | Ж: 39,5 г | У: 32,7 г""",
+
+            "lunch": """🍽 <b>Обед — Тилапия с овощами</b>
+
+<b>Ингредиенты:</b>
+• Филе тилапии - 250 г
+• Морковь - 100 г
+• Лук - 50 г
+
+<b>Приготовление:</b>
+1. На разогретую сковороду выкладываем тилапию и обжариваем 5-7 минут с каждой стороны
+2. Добавляем тертую морковь и нарезанный лук, жарим еще 3 минуты
+
+<b>КБЖУ:</b> 295 ккал | Б: 54 г | Ж: 4,5 г | У: 12,1 г""",
+
+            "dinner": """🌙 <b>Ужин — Салат из фарша</b>
+
+<b>Ингредиенты:</b>
+• Постный фарш говяжий – 100 г
+• Перепелиные яйца – 4 шт
+• Авокадо – 80 г
+• Руккола – 100 г
+• Помидоры черри – 100 г
+• Огурцы – 100 г
+• Соль, перец – по вкусу
+
+<b>Приготовление:</b>
+1. Обжарить фарш без масла до готовности
+2. Нарезать авокадо, огурцы, черри
+3. Смешать с рукколой и вареными перепелиными яйцами
+
+<b>КБЖУ:</b> 463 ккал | Б: 33,8 г | Ж: 30,5 г | У: 12,7 г"""
+        },
+        7: {
+            "breakfast": """🌅 <b>Завтрак — Сырные вафли с авокадо</b>
+
+<b>Ингредиенты:</b>
+• Овсянка – 40 г
+• Яйцо – 1 шт
+• Сыр – 40 г
+• Авокадо – 40 г
+• Сливочное масло – 10 г
+• Соль, специи – по вкусу
+• Щепотка соды
+
+<b>Приготовление:</b>
+1. Перемолоть овсянку в муку с помощью кофемолки или блендера
+2. Добавить соль, специи, соду
+3. Вмешать яйцо, добавить 1 ст. л. воды
+4. Натереть сыр, добавить в тесто, перемешать
+5. Выпекать в разогретой вафельнице до золотистой корочки
+6. Размять авокадо вилкой, добавить соль, специи, выложить на вафли
+
+<b>КБЖУ:</b> 574 ккал | Б: 23 г | Ж: 37 г | У: 37 г""",
+
+            "lunch": """🍽 <b>Обед — ПП хачапури</b>
+
+<b>Ингредиенты:</b>
+• Творог 5% – 100 г
+• Яйцо – 1 шт
+• Желток – 1 шт
+• Рисовая мука – 40 г
+• Разрыхлитель – ½ ч. л.
+• Легкий сыр – 40 г
+
+<b>Приготовление:</b>
+1. Смешать творог, яйцо, муку и разрыхлитель вилкой
+2. Сформировать лодочку и выпекать в разогретой до 180°C духовке 10 минут
+3. Достать, посыпать тертым сыром и снова поставить в духовку
+4. Добавить желток и запекать ещё 2 минуты
+
+<b>КБЖУ:</b> 512 ккал | Б: 42 г | Ж: 22,1 г | У: 35,8 г""",
+
+            "dinner": """🌙 <b>Ужин — Печёная картошка с жареной курочкой и зелёным луком</b>
+
+<b>Ингредиенты:</b>
+• Куриное филе – 130 г
+• Картофель – 130 г
+• Соль, специи – по вкусу
+• Зелёный лук – по вкусу
+
+<b>Приготовление:</b>
+1. Отварить картофель в мундире (20 минут после закипания)
+2. Нарезать куриное филе, посолить, поперчить, обжарить на сковороде по 5 минут с каждой стороны
+3. Очистить и нарезать картофель на 4 части, посолить
+4. Добавить картофель на сковороду с курицей, жарить под крышкой 3 минуты с каждой стороны
+5. Подавать с овощным салатом
+
+<b>КБЖУ:</b> 278 ккал | Б: 32 г | Ж: 4 г | У: 25 г"""
+        },
+        8: {
+            "breakfast": """🌅 <b>Завтрак — Сэндвич с беконом и яйцом</b>
+
+<b>Ингредиенты:</b>
+• Хлеб – 80 г (2 ломтика)
+• Бекон – 40 г
+• Яйцо – 1 шт
+• Помидор – 1 шт
+• Листья салата – по вкусу
+• Оливковое масло – 5 г
+• Соль, перец – по вкусу
+
+<b>Приготовление:</b>
+1. Обжарить бекон до хрустящей корочки, отложить
+2. Обжарить яйцо в той же сковороде
+3. Подрумянить ломтики хлеба с небольшим количеством масла
+4. Собрать сэндвич: слой салата, помидоры, бекон, яйцо
+5. Посолить, поперчить
+
+<b>КБЖУ:</b> 543 ккал | Б: 23,6 г | Ж: 29,3 г | У: 42,2 г""",
+
+            "lunch": """🍽 <b>Обед — Рис с курицей и овощами в соевом соусе</b>
+
+<b>Ингредиенты:</b>
+• Лук – 70 г
+• Смесь овощей «Мексиканская» – 100 г
+• Куриное филе – 150 г
+• Рис (белый длиннозерный) – 70 г
+• Оливковое масло – 5 г
+• Соевый соус – 30 г
+• Соль – по вкусу
+
+<b>Приготовление:</b>
+1. Нарезать лук, обжарить с овощами 5-7 минут
+2. Добавить нарезанное куриное филе, соевый соус, тушить 5-7 минут
+3. Добавить рис, залить кипятком, накрыть крышкой
+4. Готовить на медленном огне до готовности риса
+
+<b>КБЖУ:</b> 537 ккал | Б: 45,3 г | Ж: 7,5 г | У: 74,9 г""",
+
+            "dinner": """🌙 <b>Ужин — Салат с тунцом</b>
+
+<b>Ингредиенты:</b>
+• Огурцы – 100 г
+• Тунец консервированный – 100 г
+• Яйцо – 1 шт
+• Греческий йогурт – 30 г
+• Соль, специи, петрушка – по вкусу
+
+<b>Приготовление:</b>
+1. Нарезать огурец кубиками
+2. Размять тунец вилкой, смешать с огурцом, заправить йогуртом
+3. Посолить, добавить зелень
+4. Сварить яйцо-пашот или нарезать отварное кубиками, добавить в салат
+
+<b>КБЖУ:</b> 254 ккал | Б: 30,3 г | Ж: 12,5 г | У: 4,2 г"""
+        },
+        9: {
+            "breakfast": """🌅 <b>Завтрак — Панкейки с кленовым сиропом</b>
+
+<b>Ингредиенты:</b>
+• Мука – 110 г
+• Яйцо – 1 шт
+• Молоко – 120 мл
+• Растительное масло – 1 ст. л.
+• Сахарозаменитель – по вкусу
+• Разрыхлитель – 1 ч. л.
+• Ванильный экстракт, корица – по желанию
+• Кленовый сироп – по вкусу
+
+<b>Приготовление:</b>
+1. Смешать все ингредиенты до однородной массы
+2. Добавить ванильный экстракт или корицу по желанию
+3. Разогреть сковороду, смазать маслом
+4. Вылить тесто, формируя панкейки, жарить до золотистой корочки с обеих сторон
+5. Подавать с кленовым сиропом
+
+<b>КБЖУ:</b> 680 ккал | Б: 21 г | Ж: 26,6 г | У: 90 г""",
+
+            "lunch": """🍽 <b>Обед — Лосось с макаронами и овощами</b>
+
+<b>Ингредиенты:</b>
+• Стейк лосося – 100 г
+• Макароны цельнозерновые – 35 г
+• Оливковое масло – 5 г
+• Овощная смесь – 50 г
+
+<b>Приготовление:</b>
+1. Отварить макароны до готовности
+2. Промыть лосось, обсушить, удалить чешую
+3. Посолить, поперчить, смазать маслом, сбрызнуть лимонным соком
+4. Обжарить на сковороде по 7 минут с каждой стороны
+5. Добавить овощи, тушить 5 минут с водой
+
+<b>КБЖУ:</b> 320 ккал | Б: 25 г | Ж: 11 г | У: 30 г""",
+
+            "dinner": """🌙 <b>Ужин — Куриная шаурма с овощами, йогуртовым соусом и орехами</b>
+
+<b>Ингредиенты:</b>
+• Куриное филе – 90 г
+• Лаваш – 35 г
+• Помидор – 40 г
+• Огурец – 40 г
+• Лист салата – 25 г
+• Йогурт натуральный – 15 г
+• Орехи (миндаль) – 4 г
+• Чеснок, специи – по вкусу
+
+<b>Приготовление:</b>
+1. Нарезать куриное филе, обжарить без масла
+2. Нарезать овощи
+3. Смешать йогурт с чесноком и специями
+4. Завернуть начинку в лаваш, добавить орехи
+5. Обжарить на сухой сковороде
+
+<b>КБЖУ:</b> 311 ккал | Б: 30 г | Ж: 12 г | У: 30 г"""
+        },
+        10: {
+            "breakfast": """🌅 <b>Завтрак — Тост с бананом, ореховым маслом и сливочным сыром</b>
+
+<b>Ингредиенты:</b>
+• Хлеб цельнозерновой – 60 г (2 ломтика)
+• Банан – 80 г
+• Ореховое масло – 20 г
+• Сливочный сыр – 40 г
+
+<b>Приготовление:</b>
+1. Обжарить тосты на сковороде или в тостере
+2. Намазать сливочный сыр
+3. Выложить нарезанный банан
+4. Полить ореховым маслом
+
+<b>КБЖУ:</b> 475 ккал | Б: 7,5 г | Ж: 30,5 г | У: 42,3 г""",
+
+            "lunch": """🍽 <b>Обед — Макароны с куриным филе</b>
+
+<b>Ингредиенты:</b>
+• Макароны ТСП - 70 г
+• Куриное филе - 150 г
+• Грибы шампиньоны - 70 г
+• Оливковое масло - 10 мл
+• Соль, специи по вкусу
+
+<b>Приготовление:</b>
+1. Отварить макароны до готовности
+2. Нарезать куриное филе, посолить, поперчить и обжарить
+3. Нарезать грибы кубиками, добавить к курице
+4. Соединить с макаронами и перемешать
+
+<b>КБЖУ:</b> 515 ккал | Б: 45 г | Ж: 12,2 г | У: 48,8 г""",
+
+            "dinner": """🌙 <b>Ужин — Отбивная индейки на гриле с зеленым луком и сельдереем</b>
+
+<b>Ингредиенты:</b>
+• Филе индейки - 200 г
+• Соль, специи по вкусу
+• Зеленый лук, сельдерей - 150 г
+• Растительное масло - 10 г
+
+<b>Приготовление:</b>
+1. Отбить филе молоточком с двух сторон
+2. Добавить специи, соль и жарим на гриле по 5 минут с двух сторон
+3. В конце добавить нарезанный лук и сельдерей
+
+<b>КБЖУ:</b> 318 ккал | Б: 15 г | Ж: 19 г | У: 32 г"""
+        },
+        11: {
+            "breakfast": """🌅 <b>Завтрак — Яичный рулет с овощами</b>
+
+<b>Ингредиенты:</b>
+• Яйца – 2 шт
+• Морковь – 20 г
+• Перец – 35 г
+• Лук – 15 г
+• Твердый сыр – 25 г
+• Соль, перец – по вкусу
+• Оливковое масло – 5 г
+
+<b>Приготовление:</b>
+1. Разогреть духовку до 180°C
+2. Выложить овощи на противень, смазанный маслом
+3. Запекать 10-15 минут до мягкости
+4. Взбить яйца, добавить соль, перец, натертый сыр, перемешать
+5. Вылить яичную смесь на противень с овощами
+6. Запекать 10-12 минут до застывания
+7. Аккуратно свернуть рулет, нарезать порционно
+
+<b>КБЖУ:</b> 326 ккал | Б: 21 г | Ж: 24 г | У: 5 г""",
+
+            "lunch": """🍽 <b>Обед — Фарш говяжий с рисом, сыром и мексиканской смесью</b>
+
+<b>Ингредиенты:</b>
+• Фарш говяжий (постный) – 150 г
+• Рис Жасмин – 35 г
+• Мексиканская овощная смесь – 100 г
+• Сыр Гауда – 30 г
+
+<b>Приготовление:</b>
+1. Отварить рис до готовности
+2. Обжарить фарш, разбивая комки, добавить овощную смесь
+3. Жарить 10 минут, постоянно помешивая
+4. Добавить рис, сверху натереть сыр
+
+<b>КБЖУ:</b> 553 ккал | Б: 42 г | Ж: 19 г | У: 43 г""",
+
+            "dinner": """🌙 <b>Ужин — Пицца из лаваша</b>
+
+<b>Ингредиенты:</b>
+• Лаваш (бездрожжевой) – 50 г
+• Яйца – 3 шт
+• Молоко – 50 мл
+• Помидоры – 50 г
+• Сыр сулугуни – 30 г
+• Куриное филе – 30 г
+• Соль, перец, зелень – по вкусу
+
+<b>Приготовление:</b>
+1. Нарезать лаваш
+2. Смешать с яйцами, молоком, специями
+3. Выложить на разогретую сковороду
+4. Добавить нарезанное куриное филе, помидоры, посыпать сыром
+5. Готовить под крышкой 15 минут на медленном огне
+
+<b>КБЖУ:</b> 495 ккал | Б: 38 г | Ж: 24 г | У: 26 г"""
+        },
+        12: {
+            "breakfast": """🌅 <b>Завтрак — Ленивый овсяноблин с творогом</b>
+
+<b>Ингредиенты:</b>
+• Овсяные хлопья – 30 г
+• Творог 5% – 60 г
+• Молоко 2,5% – 50 г
+• Яйцо – 1 шт
+• Соль – 2 щепотки
+• Мёд – 10 г
+
+<b>Приготовление:</b>
+1. Взбить яйца с солью, добавить молоко, творог, овсяные хлопья
+2. Перемешать, оставить на 2-3 минуты
+3. Разогреть сковороду, слегка смазать маслом, вылить смесь
+4. Накрыть крышкой, готовить 6-7 минут
+5. Перевернуть, обжарить ещё 2-3 минуты без крышки
+
+<b>КБЖУ:</b> 323 ккал | Б: 22 г | Ж: 12 г | У: 32 г""",
+
+            "lunch": """🍽 <b>Обед — Горбуша в духовке с рисом</b>
+
+<b>Ингредиенты:</b>
+• Стейк горбуши – 200 г
+• Рис Жасмин – 45 г
+• Морковь – 50 г
+• Лук – 25 г
+• Оливковое масло – 5 г
+• Зелень – по вкусу
+
+<b>Приготовление:</b>
+1. Отварить рис до готовности
+2. Подготовить горбушу, нарезать овощи
+3. Выложить овощи в фольгу, сбрызнуть маслом
+4. Сверху уложить горбушу, посолить, поперчить
+5. Завернуть в фольгу, запекать 20 минут при 200°C
+6. Развернуть, запекать ещё 10 минут
+
+<b>КБЖУ:</b> 667 ккал | Б: 45 г | Ж: 23,3 г | У: 62 г""",
+
+            "dinner": """🌙 <b>Ужин — Салат с яйцом и тунцом</b>
+
+<b>Ингредиенты:</b>
+• Яйцо (варёное) – 1 шт (50 г)
+• Тунец консервированный – 80 г
+• Огурец – 50 г
+• Листья салата – 30 г
+• Оливковое масло – 5 г
+• Лимонный сок – 5 г
+• Соль, перец – по вкусу
+
+<b>Приготовление:</b>
+1. Нарезать яйцо и огурец кубиками
+2. Слить жидкость из тунца, размять вилкой
+3. Смешать все ингредиенты с листьями салата
+4. Заправить маслом и лимонным соком, приправить по вкусу
+
+<b>КБЖУ:</b> 310 ккал | Б: 28 г | Ж: 10 г | У: 8 г"""
+        },
+        13: {
+            "breakfast": """🌅 <b>Завтрак — Фриттата с картофелем и сыром</b>
+
+<b>Ингредиенты:</b>
+• Яйца – 1 шт
+• Яичный белок – 1 шт
+• Картофель – 100 г
+• Тертый сыр – 40 г
+• Лук – 20 г
+• Зеленый лук – 10 г
+• Оливковое масло – 5 г
+• Соль, перец – по вкусу
+
+<b>Приготовление:</b>
+1. Отварить картофель, нарезать кубиками
+2. Взбить яйца и белки, добавить соль, перец
+3. Разогреть сковороду, смазать маслом
+4. Выложить картофель, лук и сыр
+5. Полить яичной смесью, готовить до золотистой корочки
+
+<b>КБЖУ:</b> 319 ккал | Б: 21 г | Ж: 23 г | У: 19 г""",
+
+            "lunch": """🍽 <b>Обед — Тайский карри с курицей</b>
+
+<b>Ингредиенты:</b>
+• Куриное филе – 200 г
+• Карри-паста – 1 ст. л.
+• Морковь – 65 г
+• Красный перец – 60 г
+• Кабачок – 100 г
+• Луковица – 40 г
+• Кокосовое молоко – 200 мл
+• Оливковое масло – ½ ст. л.
+• Чеснок – 1 зубчик
+• Соль, перец – по вкусу
+• Свежая кинза – для украшения
+
+<b>Приготовление:</b>
+1. Разогреть масло, обжарить лук и чеснок до мягкости
+2. Добавить курицу, обжарить до золотистой корочки
+3. Влить кокосовое молоко, добавить карри-пасту, перемешать
+4. Добавить нарезанные овощи, тушить 10-15 минут
+5. Приправить солью, перцем, украсить кинзой
+
+<b>КБЖУ:</b> 654 ккал | Б: 52,8 г | Ж: 37,5 г | У: 23 г""",
+
+            "dinner": """🌙 <b>Ужин — Греческий салат</b>
+
+<b>Ингредиенты:</b>
+• Огурец – 50 г
+• Помидор – 50 г
+• Красный лук – 20 г
+• Оливки (без косточек) – 40 г
+• Фета – 60 г
+• Оливковое масло – 5 г
+• Лимонный сок – 1 ст. л.
+• Свежая зелень – по вкусу
+• Соль, перец – по вкусу
+
+<b>Приготовление:</b>
+1. Нарезать огурцы, помидоры, лук, оливки, фету
+2. Смешать масло, лимонный сок, соль, перец
+3. Полить салат заправкой, перемешать
+4. Посыпать зеленью перед подачей
+
+<b>КБЖУ:</b> 294 ккал | Б: 12 г | Ж: 23,8 г | У: 8 г"""
+        },
+        14: {
+            "breakfast": """🌅 <b>Завтрак — Творожные оладьи</b>
+
+<b>Ингредиенты:</b>
+• Творог 5% – 150 г
+• Яйцо – 1 шт
+• Мука – 40 г
+• Сахарозаменитель – по вкусу
+• Разрыхлитель – ½ ч. л.
+• Ванильный экстракт – по желанию
+• Растительное масло – 5 г
+
+<b>Приготовление:</b>
+1. Смешать все ингредиенты до однородной массы
+2. Добавить ванильный экстракт
+3. Разогреть сковороду, смазать маслом
+4. Выложить тесто, жарить до золотистой корочки
+
+<b>КБЖУ:</b> 457 ккал | Б: 36 г | Ж: 19 г | У: 33,3 г""",
+
+            "lunch": """🍽 <b>Обед — Отварные куриные ножки с рисом</b>
+
+<b>Ингредиенты:</b>
+• Рис Басмати – 70 г
+• Куриные ножки – 150 г
+• Соль, специи – по вкусу
+
+<b>Приготовление:</b>
+1. Отварить рис до готовности
+2. Куриные ножки промыть, опустить в кипящую воду
+3. Подсолить, варить 20-30 минут
+
+<b>КБЖУ:</b> 462 ккал | Б: 30 г | Ж: 15,4 г | У: 50 г""",
+
+            "dinner": """🌙 <b>Ужин — Макароны с куриными котлетами</b>
+
+<b>Ингредиенты:</b>
+• Макароны цельнозерновые – 50 г
+• Куриное филе – 150 г
+• Соль, специи – по вкусу
+• Яйцо – 1 шт
+• Оливковое масло – 5 г
+• Укроп – по вкусу
+
+<b>Приготовление:</b>
+1. Отварить макароны до готовности
+2. Куриное филе мелко нарезать, добавить яйцо, специи, зелень, сформировать котлетки
+3. Разогреть сковороду с маслом, обжарить котлетки по 5 минут с каждой стороны
+4. Накрыть крышкой, готовить ещё 5 минут на медленном огне
+
+<b>КБЖУ:</b> 445 ккал | Б: 46 г | Ж: 11 г | У: 35 г"""
+        }
+    },
+
+    1400: {
+        1: {
+            "breakfast": """🌅 <b>Завтрак — Тосты с тунцом</b>
+
+<b>Ингредиенты:</b>
+• Хлеб цельнозерновой — 60 г
+• Тунец в собственном соку — 40 г
+• Яйцо куриное — 1 шт
+• Огурец — 50 г
+• Лук красный — 20 г
+• Творожный сыр — 20 г
+• Сметана 15% - 20 г
+• Соль, перец — по вкусу
+
+<b>Приготовление:</b>
+1. Хлеб нарезать и обжарить на сухой сковороде по 2 минуты с каждой стороны
+2. Яйцо варить 3−4 минуты после закипания, остудить, нарезать мелким кубиком
+3. Лук и огурец нарезать мелкими кубиками
+4. Тунец размять вилкой, добавить остальные ингредиенты, перемешать
+5. Выложить на тосты, посыпать зеленью по желанию
+
+<b>КБЖУ:</b> 353 ккал | Б: 22 г | Ж: 14,8 г | У: 31,5 г""",
+
+            "lunch": """🍽 <b>Обед — Курочка с булгуром и овощами</b>
+
+<b>Ингредиенты:</b>
+• Булгур — 30 г
+• Лук — 0,5 шт
+• Морковь — 0,5 шт
+• Растительное масло — 1 ч. л.
+• Филе бедра куриного — 150 г
+• Шампиньоны — 70 г
+• Кабачок — 100 г
+• Помидоры черри — 50 г
+• Соевый соус — 2 ст. л.
+• Чеснок — 1 зубчик
+• Соль, перец — по вкусу
+
+<b>Приготовление:</b>
+1. Филе и кабачок нарезать небольшими кусочками, шампиньоны очистить
+2. Смешать с помидорами, соевым соусом, чесноком, солью, оставить мариноваться 15−20 минут
+3. Лук нарезать, морковь натереть, булгур промыть
+4. Обжарить лук, добавить морковь, тушить 5 минут
+5. Добавить булгур, специи, залить водой и тушить 15−20 минут
+6. Запекать курицу с овощами в духовке при 180 °C 15−20 минут
+
+<b>КБЖУ:</b> 488 ккал | Б: 45 г | Ж: 7 г | У: 35 г""",
+
+            "dinner": """🌙 <b>Ужин — Филе карпа в духовке с макаронами</b>
+
+<b>Ингредиенты:</b>
+• Макароны цельнозерновые — 50 г
+• Филе карпа — 250 г
+• Соль, перец, специи для рыбы
+• Оливковое масло — 5 г
+
+<b>Приготовление:</b>
+1. Отварить макароны до готовности
+2. Натереть филе карпа маслом и посыпать специями
+3. Завернуть рыбу в фольгу
+4. Запекать в духовке при 180 °C 20−25 минут
+
+<b>КБЖУ:</b> 495 ккал | Б: 46 г | Ж: 14 г | У: 35 г"""
+        },
+        2: {
+            "breakfast": """🌅 <b>Завтрак — Овсяные оладушки с глазуньей, красной рыбой и авокадо</b>
+
+<b>Ингредиенты:</b>
+• Овсяные хлопья — 30 г
+• Кефир — 20 г
+• Яйцо — 1 шт
+• Авокадо — 40 г
+• Яйцо куриное — 1 шт
+• Красная рыба — 20 г
+• Соль, специи — по вкусу
+
+<b>Приготовление:</b>
+1. Взбить ингредиенты для оладушек в блендере
+2. Жарить блинчики по 2 минуты с каждой стороны
+3. Размять авокадо, добавить специи
+4. Нарезать рыбу
+5. Приготовить глазунью
+6. Собрать оладушки с начинкой
+
+<b>КБЖУ:</b> 421 ккал | Б: 24 г | Ж: 24 г | У: 24 г""",
+
+            "lunch": """🍽 <b>Обед — Пицца из лаваша</b>
+
+<b>Ингредиенты:</b>
+• Лаваш бездрожжевой — 50 г
+• Яйца — 3 шт
+• Молоко — 50 мл
+• Помидоры — 50 г
+• Сыр сулугуни — 30 г
+• Куриное филе — 30 г
+• Соль, перец, зелень — по вкусу
+
+<b>Приготовление:</b>
+1. Нарезать лаваш
+2. Смешать с яйцами, молоком, специями
+3. Выложить на разогретую сковороду
+4. Добавить куриное филе, помидоры, посыпать сыром
+5. Готовить под крышкой 15 минут на медленном огне
+
+<b>КБЖУ:</b> 495 ккал | Б: 38 г | Ж: 24 г | У: 26 г""",
+
+            "dinner": """🌙 <b>Ужин — Куриные котлетки с сырной прослойкой + Салат «Летний»</b>
+
+<b>Ингредиенты (котлетки):</b>
+• Филе куриное — 140 г
+• Яйцо — 1 шт
+• Сыр Гауда — 30 г
+• Соль, специи — по вкусу
+
+<b>Ингредиенты (салат):</b>
+• Огурец — 150 г
+• Редис — 150 г
+• Укроп — 15 г
+• Йогурт натуральный — 100 г
+• Оливковое масло — 1 ч. л.
+• Соль, специи — по вкусу
+
+<b>Приготовление:</b>
+1. Измельчить филе в фарш, добавить яйцо, специи
+2. Сформировать котлетки, в центр каждой положить сыр
+3. Обжарить под крышкой по 5 минут с каждой стороны
+4. Нарезать овощи для салата, заправить йогуртом и маслом
+
+<b>КБЖУ:</b> 479 ккал | Б: 52 г | Ж: 20 г | У: 16 г"""
+        },
+        3: {
+            "breakfast": """🌅 <b>Завтрак — Творожная запеканка</b>
+
+<b>Ингредиенты:</b>
+• Творог 5% - 200 г
+• Яйцо — 1 шт
+• Кукурузный крахмал — 40 г
+• Ванильный сахар — 10 г
+
+<b>Приготовление:</b>
+1. Смешать все ингредиенты и взбить блендером
+2. Выложить смесь в силиконовую форму
+3. Выпекать в духовке при 180 °C 40−45 минут
+
+<b>КБЖУ:</b> 491 ккал | Б: 43,9 г | Ж: 17,6 г | У: 32,1 г""",
+
+            "lunch": """🍽 <b>Обед — Плов с курицей</b>
+
+<b>Ингредиенты:</b>
+• Лук — 80 г
+• Морковь — 100 г
+• Куриное филе — 150 г
+• Рис белый длиннозерный — 70 г
+• Оливковое масло — 5 г
+• Соль, специи — по вкусу
+
+<b>Приготовление:</b>
+1. Обжарить лук и морковь
+2. Добавить нарезанное куриное филе
+3. Тушить под крышкой 5−7 минут
+4. Добавить рис, залить кипятком и тушить 20−25 минут
+
+<b>КБЖУ:</b> 522 ккал | Б: 41,2 г | Ж: 7,44 г | У: 71,5 г""",
+
+            "dinner": """🌙 <b>Ужин — Салат с яйцом и тунцом</b>
+
+<b>Ингредиенты:</b>
+• Яйцо варёное — 1 шт (50 г)
+• Тунец консервированный — 80 г
+• Огурец — 50 г
+• Листья салата — 30 г
+• Оливковое масло — 5 г
+• Лимонный сок — 5 г
+• Соль, перец — по вкусу
+
+<b>Приготовление:</b>
+1. Нарезать яйцо и огурец кубиками
+2. Размять тунец вилкой
+3. Смешать все ингредиенты с листьями салата
+4. Заправить маслом и лимонным соком
+
+<b>КБЖУ:</b> 310 ккал | Б: 28 г | Ж: 10 г | У: 8 г"""
+        },
+        4: {
+            "breakfast": """🌅 <b>Завтрак — Сырные блинчики</b>
+
+<b>Ингредиенты:</b>
+• Яйцо — 1 шт
+• Кефир 2% - 50 г
+• Овсянка — 25 г
+• Сыр 45% жирности — 20 г
+• Разрыхлитель — 1/3 ч. л.
+• Растительное масло — 1 ч. л.
+• Соль, перец, зелень — по вкусу
+
+<b>Приготовление:</b>
+1. Смешать яйца, кефир, овсянку, соль и разрыхлитель
+2. Натереть сыр, нарезать зелень
+3. Смешать с тестом, оставить на 5−10 минут
+4. Жарить блинчики с обеих сторон
+
+<b>КБЖУ:</b> 215 ккал | Б: 13,5 г | Ж: 14,6 г | У: 6,1 г""",
+
+            "lunch": """🍽 <b>Обед — Индейка с киноа и овощами</b>
+
+<b>Ингредиенты:</b>
+• Филе индейки — 150 г
+• Киноа сухая — 70 г
+• Болгарский перец — 80 г
+• Кабачок — 80 г
+• Оливковое масло — 10 г
+• Соль, специи — по вкусу
+
+<b>Приготовление:</b>
+1. Отварить киноа до готовности
+2. Обжарить индейку, добавить овощи и тушить
+3. Смешать с киноа, приправить специями
+
+<b>КБЖУ:</b> 580 ккал | Б: 45 г | Ж: 12 г | У: 50 г""",
+
+            "dinner": """🌙 <b>Ужин — Паста с креветками и лимонным соусом + Салат с яйцом и авокадо</b>
+
+<b>Ингредиенты (паста):</b>
+• Макароны цельнозерновые — 60 г
+• Креветки очищенные — 100 г
+• Чеснок — 5 г
+• Лимонный сок — 5 г
+• Оливковое масло — 5 г
+• Соль, специи — по вкусу
+
+<b>Ингредиенты (салат):</b>
+• Яйцо варёное — 1 шт (50 г)
+• Авокадо — 50 г
+• Огурец — 50 г
+• Листья салата — 30 г
+• Оливковое масло — 5 г
+• Лимонный сок — 5 г
+• Соль, перец — по вкусу
+
+<b>Приготовление:</b>
+1. Отварить макароны до готовности
+2. Обжарить креветки с чесноком
+3. Смешать с макаронами, сбрызнуть лимонным соком
+4. Нарезать ингредиенты для салата, смешать и заправить
+
+<b>КБЖУ:</b> 600 ккал | Б: 38 г | Ж: 21 г | У: 41 г"""
+        },
+        5: {
+            "breakfast": """🌅 <b>Завтрак — Сырники</b>
+
+<b>Ингредиенты:</b>
+• Творог 5% - 120 г
+• Яйцо — 1 шт
+• Ванильный сахар — 5 г
+• Мука рисовая — 20 г
+• Мука для обвалки
+• Мёд — 1 ч. л.
+• Ягоды — 50 г
+• Соль — по вкусу
+
+<b>Приготовление:</b>
+1. Смешать все ингредиенты в миске
+2. Сформировать сырники, обвалять в муке
+3. Жарить на медленном огне под крышкой
+4. Подавать с мёдом и ягодами
+
+<b>КБЖУ:</b> 326 ккал | Б: 28 г | Ж: 10 г | У: 33 г""",
+
+            "lunch": """🍽 <b>Обед — Боул с курицей терияки и гречкой</b>
+
+<b>Ингредиенты:</b>
+• Филе куриное — 120 г
+• Гречка — 50 г
+• Огурец — 0,5 шт
+• Редис — 4 шт
+• Сыр твёрдый — 20 г
+• Помидоры черри — 5 шт
+• Соевый соус — 2 ст. л.
+• Томатная паста — 1 ч. л.
+• Мёд — 1 ч. л.
+• Кунжут — 0,5 ч. л.
+
+<b>Приготовление:</b>
+1. Приготовить гречку
+2. Обжарить филе кубиками 5 минут
+3. Добавить соусы, тушить 2−3 минуты
+4. Нарезать овощи, сыр натереть
+5. Собрать боул
+
+<b>КБЖУ:</b> 482 ккал | Б: 45 г | Ж: 10 г | У: 52 г""",
+
+            "dinner": """🌙 <b>Ужин — Говяжий фарш с сыром</b>
+
+<b>Ингредиенты:</b>
+• Говяжий фарш — 200 г
+• Сыр Гауда — 40 г
+• Оливковое масло — 10 г
+• Соль, перец — по вкусу
+
+<b>Приготовление:</b>
+1. Фарш посолить, поперчить, обжарить 7 минут
+2. Натереть сыр
+3. Подавать со свежими овощами
+
+<b>КБЖУ:</b> 500 ккал | Б: 47 г | Ж: 34 г | У: 0 г"""
+        },
+        6: {
+            "breakfast": """🌅 <b>Завтрак — Ленивый овсяноблин с творогом</b>
+
+<b>Ингредиенты:</b>
+• Овсяные хлопья — 30 г
+• Творог 5% - 60 г
+• Молоко 2,5% - 50 г
+• Яйцо — 1 шт
+• Соль — 2 щепотки
+• Мёд — 10 г
+
+<b>Приготовление:</b>
+1. Взбить яйца с солью, добавить молоко, творог, овсяные хлопья
+2. Оставить на 2−3 минуты
+3. Вылить на сковороду, готовить 6−7 минут под крышкой
+4. Перевернуть, обжарить ещё 2−3 минуты
+
+<b>КБЖУ:</b> 323 ккал | Б: 22 г | Ж: 12 г | У: 32 г""",
+
+            "lunch": """🍽 <b>Обед — Филе окуня с рисом + Салат с яйцом и авокадо</b>
+
+<b>Ингредиенты (рыба):</b>
+• Филе морского окуня — 150 г
+• Рис — 70 г
+• Соль, специи для рыбы — по вкусу
+
+<b>Ингредиенты (салат):</b>
+• Яйцо варёное — 1 шт (50 г)
+• Авокадо — 50 г
+• Огурец — 50 г
+• Листья салата — 30 г
+• Оливковое масло — 5 г
+• Лимонный сок — 5 г
+• Соль, перец — по вкусу
+
+<b>Приготовление:</b>
+1. Отварить рис до готовности
+2. Промыть филе, обсушить, посыпать специями
+3. Завернуть в фольгу, запекать при 200 °C 20 минут
+4. Раскрыть и запекать ещё 10 минут
+5. Приготовить салат, смешав все ингредиенты
+
+<b>КБЖУ:</b> 678 ккал | Б: 48 г | Ж: 20 г | У: 58 г""",
+
+            "dinner": """🌙 <b>Ужин — Куриная шаурма с овощами, йогуртовым соусом и орехами</b>
+
+<b>Ингредиенты:</b>
+• Куриное филе — 90 г
+• Лаваш — 35 г
+• Помидор — 40 г
+• Огурец — 40 г
+• Лист салата — 25 г
+• Йогурт натуральный — 15 г
+• Орехи миндаль — 4 г
+• Чеснок, специи — по вкусу
+
+<b>Приготовление:</b>
+1. Нарезать куриное филе, обжарить без масла
+2. Нарезать овощи
+3. Смешать йогурт с чесноком и специями
+4. Завернуть начинку в лаваш, добавить орехи
+5. Обжарить на сухой сковороде
+
+<b>КБЖУ:</b> 311 ккал | Б: 30 г | Ж: 12 г | У: 30 г"""
+        },
+        7: {
+            "breakfast": """🌅 <b>Завтрак — Творожный омлет с сыром, зеленью и помидорами черри</b>
+
+<b>Ингредиенты:</b>
+• Творог 5% - 50 г
+• Яйца — 2 шт
+• Укроп — по вкусу
+• Сыр — 20 г
+• Помидоры черри — по вкусу
+• Соль, перец — по вкусу
+
+<b>Приготовление:</b>
+1. В глубокой тарелке взбить яйца с солью и перцем
+2. Добавить творог и мелко нарезанную зелень, хорошо перемешать
+3. Разогреть антипригарную сковороду, вылить яичную смесь, накрыть крышкой, готовить 5−7 минут
+4. Сыр нарезать тонкими пластинками
+5. Когда омлет схватится, выложить сыр на одну половину и накрыть второй
+6. Переложить на тарелку и подать с помидорами черри
+
+<b>КБЖУ:</b> 304 ккал | Б: 29 г | Ж: 17 г | У: 4 г""",
+
+            "lunch": """🍽 <b>Обед — Боул с киноа и курицей</b>
+
+<b>Ингредиенты:</b>
+• Киноа — 50 г
+• Куриное филе — 130 г
+• Яйцо — 1 шт
+• Консервированная фасоль — 30 г
+• Зелень — по вкусу
+
+<b>Приготовление:</b>
+1. Отварить киноа до готовности
+2. Отварить яйцо в течение 2 минут
+3. Нарезать куриное филе, посолить, поперчить, обжарить на антипригарной сковороде по 5 минут с каждой стороны
+4. Собрать боул: выложить киноа, курицу, добавить консервированную фасоль и зелень
+
+<b>КБЖУ:</b> 443 ккал | Б: 48 г | Ж: 9 г | У: 39 г""",
+
+            "dinner": """🌙 <b>Ужин — Горбуша в духовке с гречкой и овощами</b>
+
+<b>Ингредиенты:</b>
+• Стейк горбуши — 300 г
+• Гречка — 60 г
+• Морковь — 100 г
+• Лук — 50 г
+• Зелень — по вкусу
+• Оливковое масло — 5 г
+• Соль, перец — по вкусу
+
+<b>Приготовление:</b>
+1. Отварить гречку до готовности
+2. Промыть горбушу, удалить лишние части
+3. Нарезать овощи, выложить их в фольгу, сбрызнуть оливковым маслом
+4. Посолить и поперчить горбушу, выложить её на овощную подушку
+5. Завернуть в фольгу, выпекать в духовке при 180 °C в течение 20 минут
+6. Приоткрыть фольгу и запекать ещё 10 минут
+
+<b>КБЖУ:</b> 554 ккал | Б: 67 г | Ж: 14 г | У: 42 г"""
+        },
+        8: {
+            "breakfast": """🌅 <b>Завтрак — Банановые вафли</b>
+
+<b>Ингредиенты:</b>
+• Банан — 1 шт
+• Яйцо — 1 шт
+• Натуральный йогурт — 50 г
+• Рисовая мука — 40 г
+• Овсяный сироп — 1 ч. л.
+• Разрыхлитель — 1/3 ч. л.
+
+<b>Приготовление:</b>
+1. Размять банан вилкой
+2. Добавить яйцо, йогурт, взбить вилкой
+3. Добавить муку, разрыхлитель, перемешать
+4. Вылить тесто на разогретую вафельницу, смазанную маслом
+5. Готовые вафли полить сиропом
+
+<b>КБЖУ:</b> 394 ккал | Б: 14 г | Ж: 8 г | У: 65 г""",
+
+            "lunch": """🍽 <b>Обед — Макароны с куриными котлетами</b>
+
+<b>Ингредиенты:</b>
+• Макароны цельнозерновые — 50 г
+• Куриное филе — 150 г
+• Соль, специи — по вкусу
+• Яйцо — 1 шт
+• Оливковое масло — 5 г
+• Укроп — по вкусу
+
+<b>Приготовление:</b>
+1. Отварить макароны до готовности
+2. Куриное филе мелко нарезать, добавить яйцо, специи, зелень, сформировать котлетки
+3. Разогреть сковороду с маслом, обжарить котлетки по 5 минут с каждой стороны
+4. Накрыть крышкой, готовить ещё 5 минут на медленном огне
+5. Подавать с овощным салатом (любые овощи с оливковым маслом)
+
+<b>КБЖУ:</b> 445 ккал | Б: 46 г | Ж: 11 г | У: 35 г""",
+
+            "dinner": """🌙 <b>Ужин — Говядина с гречкой и овощным салатом</b>
+
+<b>Ингредиенты:</b>
+• Говядина (постная) — 150 г
+• Гречка (сухая) — 60 г
+• Огурец — 50 г
+• Помидор — 50 г
+• Оливковое масло — 10 г
+• Соль, специи — по вкусу
+
+<b>Приготовление:</b>
+1. Отварить гречку до готовности
+2. Обжарить говядину на сковороде с небольшим количеством масла
+3. Нарезать овощи, заправить маслом и специями
+4. Подавать говядину с гречкой и овощным салатом
+
+<b>КБЖУ:</b> 548 ккал | Б: 39 г | Ж: 23 г | У: 46 г"""
+        },
+        9: {
+            "breakfast": """🌅 <b>Завтрак — Яичные буррито</b>
+
+<b>Ингредиенты:</b>
+• Яйца — 2 шт
+• Тортильи — 2 шт
+• Тёртый сыр — 50 г
+• Зелёный лук — по вкусу
+• Помидоры — 50 г
+• Соль, перец — по вкусу
+
+<b>Приготовление:</b>
+1. Взбить яйца, добавить соль и перец
+2. Обжарить яйца на сковороде до готовности
+3. Разложить яйца, сыр, зелёный лук и помидоры по тортильям
+4. Свернуть буррито
+
+<b>КБЖУ:</b> 480 ккал | Б: 30 г | Ж: 27 г | У: 27 г""",
+
+            "lunch": """🍽 <b>Обед — Треска с картофельным пюре и брокколи</b>
+
+<b>Ингредиенты:</b>
+• Филе трески — 150 г
+• Картофель — 200 г
+• Молоко 2,5% - 50 мл
+• Брокколи — 100 г
+• Оливковое масло — 10 г
+• Соль, перец — по вкусу
+
+<b>Приготовление:</b>
+1. Отварить картофель, размять в пюре с молоком и небольшим количеством масла
+2. Запечь треску в духовке при 180 °C с оливковым маслом и специями (15 минут)
+3. Отварить брокколи до мягкости
+4. Подавать треску с пюре и брокколи
+
+<b>КБЖУ:</b> 520 ккал | Б: 40 г | Ж: 15 г | У: 50 г""",
+
+            "dinner": """🌙 <b>Ужин — Паста с креветками</b>
+
+<b>Ингредиенты:</b>
+• Креветки очищенные — 100 г
+• Макароны цельнозерновые — 50 г
+• Сливки 33% - 20 г
+• Сыр Гауда — 20 г
+• Зелень — по вкусу
+• Соль, специи — по вкусу
+
+<b>Приготовление:</b>
+1. Отварить макароны до готовности
+2. Разогреть сковороду, выложить креветки, посолить, добавить специи
+3. Добавить макароны, готовить на среднем огне под крышкой 3 минуты
+4. Влить сливки, натереть сыр, посыпать зеленью, перемешать, оставить настаиваться 1 минуту
+
+<b>КБЖУ:</b> 386 ккал | Б: 30 г | Ж: 13 г | У: 36 г"""
+        },
+        10: {
+            "breakfast": """🌅 <b>Завтрак — Банановые оладьи</b>
+
+<b>Ингредиенты:</b>
+• Спелый банан – 120 г
+• Яйца – 2 шт
+• Овсяная мука – 60 г
+• Разрыхлитель – 1 ч. л.
+• Щепотка соли
+
+<b>Приготовление:</b>
+1. Размять банан в миске, добавить яйца и хорошо перемешать
+2. Добавить овсяную муку, разрыхлитель и соль, перемешать до получения однородного теста
+3. Жарить оладьи на антипригарной сковороде с обеих сторон до золотисто-коричневой корочки
+
+<b>КБЖУ:</b> 483 ккал | Б: 21 г | Ж: 15 г | У: 65 г""",
+
+            "lunch": """🍽 <b>Обед — Курочка с рисом и овощным салатом</b>
+
+<b>Ингредиенты:</b>
+• Рис – 50 г
+• Помидор – 1 шт
+• Огурец – 1 шт
+• Куриное филе – 200 г
+• Оливковое масло – 1 ч. л.
+• Соль, перец – по вкусу
+
+<b>Приготовление:</b>
+1. Промыть рис, залить водой, довести до кипения, варить 5 минут. Затем накрыть крышкой и оставить на 15 минут
+2. Разогреть сковороду с маслом, обжарить куриное филе с двух сторон
+3. Нарезать овощи, посолить, поперчить
+
+<b>КБЖУ:</b> 495 ккал | Б: 51 г | Ж: 8 г | У: 51 г""",
+
+            "dinner": """🌙 <b>Ужин — Салат с лососем и огурцом</b>
+
+<b>Ингредиенты:</b>
+• Лосось слабосолёный – 80 г
+• Огурец – 80 г
+• Авокадо – 50 г
+• Салатные листья – 30 г
+• Лимонный сок – 5 г
+• Оливковое масло – 5 г
+• Соль, перец – по вкусу
+
+<b>Приготовление:</b>
+1. Нарезать лосось и авокадо кубиками
+2. Огурец нарезать соломкой
+3. Смешать все ингредиенты с листьями салата
+4. Заправить лимонным соком и маслом, приправить по вкусу
+
+<b>КБЖУ:</b> 350 ккал | Б: 24 г | Ж: 14 г | У: 10 г"""
+        },
+        11: {
+            "breakfast": """🌅 <b>Завтрак — Хачапури</b>
+
+<b>Ингредиенты:</b>
+• Яйцо – 1 шт
+• Яичный желток – 1 шт
+• Творог 5% – 200 г
+• Рисовая мука – 20 г
+• Сыр – 30 г
+• Соль, специи – по вкусу
+
+<b>Приготовление:</b>
+1. Отжать творог от лишней влаги
+2. Добавить яйцо, муку, соль, перемешать
+3. Сформировать лодочку, сделать проколы вилкой, отправить в разогретую духовку (200°C) на 20 минут
+4. Достать, посыпать тёртым сыром, запекать ещё 5 минут
+5. Добавить желток в центр, запекать ещё 2 минуты
+
+<b>КБЖУ:</b> 540 ккал | Б: 48 г | Ж: 27 г | У: 23 г""",
+
+            "lunch": """🍽 <b>Обед — Сливочная паста с креветками</b>
+
+<b>Ингредиенты:</b>
+• Креветки очищенные – 170 г
+• Макароны – 50 г
+• Сливочное масло – 5 г
+• Сливки 10% – 50 г
+• Сыр моцарелла – 20 г
+• Чеснок – 0,5 зубчика
+• Лук репчатый – 1/4 шт
+• Соль, перец – по вкусу
+
+<b>Приготовление:</b>
+1. Мелко нарезать чеснок и лук, обжарить на сливочном масле 1-2 минуты
+2. Добавить очищенные креветки, готовить 2-3 минуты
+3. Приправить солью и перцем, влить сливки, довести до кипения
+4. Отварить пасту, смешать с соусом, добавить сыр
+
+<b>КБЖУ:</b> 478 ккал | Б: 32 г | Ж: 15 г | У: 50 г""",
+
+            "dinner": """🌙 <b>Ужин — Печёная картошка с жареной курочкой и зелёным луком</b>
+
+<b>Ингредиенты:</b>
+• Куриное филе – 130 г
+• Картофель – 130 г
+• Соль, специи – по вкусу
+• Зелёный лук – по вкусу
+
+<b>Приготовление:</b>
+1. Отварить картофель в мундире (20 минут после закипания)
+2. Нарезать куриное филе, посолить, поперчить, обжарить на сковороде по 5 минут с каждой стороны
+3. Очистить и нарезать картофель на 4 части, посолить
+4. Добавить картофель на сковороду с курицей, жарить под крышкой 3 минуты с каждой стороны
+5. Подавать с овощным салатом
+
+<b>КБЖУ:</b> 278 ккал | Б: 32 г | Ж: 4 г | У: 25 г"""
+        },
+        12: {
+            "breakfast": """🌅 <b>Завтрак — Рисовый блин с творожным сыром</b>
+
+<b>Ингредиенты:</b>
+• Рис (сухой) – 60 г
+• Яйцо – 1 шт
+• Укроп – по вкусу
+• Сметана 30% – 30 г
+• Творожный сыр – 30 г
+
+<b>Приготовление:</b>
+1. Отварить рис, смешать с яйцом, сметаной и мелко нарезанным укропом
+2. Выложить на разогретую сковороду, жарить под крышкой с двух сторон
+3. Сверху выложить творожный сыр
+
+<b>КБЖУ:</b> 465 ккал | Б: 13 г | Ж: 23 г | У: 48 г""",
+
+            "lunch": """🍽 <b>Обед — Стейк говядины с макаронами</b>
+
+<b>Ингредиенты:</b>
+• Макароны цельнозерновые – 50 г
+• Стейк говяжий – 150 г
+• Соль, специи – по вкусу
+• Зелёный лук, зелень – по вкусу
+
+<b>Приготовление:</b>
+1. Отварить макароны до готовности
+2. Стейк посолить, добавить специи, обжарить на сильном огне по 5 минут с каждой стороны
+3. Добавить макароны, накрыть крышкой, оставить на 5 минут
+4. Добавить зелёный лук и свежие овощи по вкусу
+
+<b>КБЖУ:</b> 355 ккал | Б: 34 г | Ж: 8 г | У: 27 г""",
+
+            "dinner": """🌙 <b>Ужин — Куриные ножки в медово-соевом соусе с картошкой на гриле</b>
+
+<b>Ингредиенты:</b>
+• Куриные голени – 150 г
+• Соевый соус – 30 г
+• Мёд – 10 г
+• Чеснок – по вкусу
+• Перец – по вкусу
+• Картофель – 150 г
+
+<b>Приготовление:</b>
+1. Смешать соевый соус, мёд, чеснок, перец
+2. Промыть куриные ножки, окунуть в соус
+3. Нарезать картофель дольками, посолить, добавить специи, выложить на разогретый гриль
+4. Выложить ножки, обжаривать с каждой стороны на сильном огне. Подавать с овощами
+
+<b>КБЖУ:</b> 411 ккал | Б: 30 г | Ж: 14 г | У: 40 г"""
+        },
+        13: {
+            "breakfast": """🌅 <b>Завтрак — Гранола с йогуртом</b>
+
+<b>Ингредиенты:</b>
+• Овсянка – 50 г
+• Грецкие орехи – 15 г
+• Арахис – 15 г
+• Изюм – 10 г
+• Мёд – 10 г
+• Йогурт без добавок – 120 г
+
+<b>Приготовление:</b>
+1. Смешать все ингредиенты (кроме йогурта), выложить на пергамент
+2. Выпекать в духовке при 200°C 10 минут
+3. Остудить, добавить к йогурту
+
+<b>КБЖУ:</b> 504 ккал | Б: 22 г | Ж: 22 г | У: 56 г""",
+
+            "lunch": """🍽 <b>Обед — Филе окуня с рисом</b>
+
+<b>Ингредиенты:</b>
+• Филе окуня – 150 г
+• Рис Басмати – 70 г
+• Соль, специи – по вкусу
+
+<b>Приготовление:</b>
+1. Отварить рис до готовности
+2. Промыть филе окуня, обсушить бумажным полотенцем
+3. Посыпать филе специями и солью
+4. Сложить фольгу в два слоя, выложить филе шкуркой вниз
+5. Завернуть края, запекать при 200°C 20 минут
+6. Развернуть фольгу, запекать ещё 10 минут
+
+<b>КБЖУ:</b> 386 ккал | Б: 32 г | Ж: 5 г | У: 55 г""",
+
+            "dinner": """🌙 <b>Ужин — Отварной картофель с говядиной</b>
+
+<b>Ингредиенты:</b>
+• Говяжья вырезка – 150 г
+• Оливковое масло – 5 г
+• Чеснок – 1 зубчик
+• Соевый соус – 15 г
+• Картофель (мелкий) – 120 г
+• Соль, специи – по вкусу
+
+<b>Приготовление:</b>
+1. Отварить картофель в мундире (20 минут)
+2. Нарезать мясо узкими полосками
+3. Измельчить чеснок
+4. Разогреть сковороду с маслом, выложить говядину, солить, перчить, жарить 10 минут, помешивая
+5. Добавить чеснок, соевый соус, накрыть крышкой, оставить на 5 минут
+6. Подавать с очищенным картофелем и овощным салатом
+
+<b>КБЖУ:</b> 399 ккал | Б: 27 г | Ж: 19 г | У: 24 г"""
+        },
+        14: {
+            "breakfast": """🌅 <b>Завтрак — Сырники</b>
+
+<b>Ингредиенты:</b>
+• Рисовая мука – 40 г
+• Яйцо – 1 шт
+• Творог 2% – 200 г
+• Сахзам – по вкусу
+• Щепотка соды
+• Сливочное масло – 5 г
+
+<b>Приготовление:</b>
+1. Смешать творог с яйцом, постепенно добавить муку, сахзам и соду
+2. Сформировать сырнички, обвалять их в муке
+3. Обжарить с двух сторон под крышкой
+
+<b>КБЖУ:</b> 447 ккал | Б: 44 г | Ж: 12 г | У: 38 г""",
+
+            "lunch": """🍽 <b>Обед — Отварная гречка с куриным фаршем и томатной пастой</b>
+
+<b>Ингредиенты:</b>
+• Гречка (сухая) – 70 г
+• Куриное филе – 150 г
+• Соль, специи – по вкусу
+• Оливковое масло – 5 г
+• Укроп – по вкусу
+• Томатная паста – 10 г
+
+<b>Приготовление:</b>
+1. Отварить гречку до готовности
+2. Куриное филе измельчить в фарш, посолить, поперчить
+3. Разогреть сковороду с маслом, обжарить фарш, добавить немного воды, тушить 10 минут под крышкой
+4. Добавить томатную пасту и отварную гречку, перемешать
+5. Накрыть крышкой, дать постоять 5 минут на слабом огне, посыпать укропом
+
+<b>КБЖУ:</b> 453 ккал | Б: 44 г | Ж: 8 г | У: 51 г""",
+
+            "dinner": """🌙 <b>Ужин — Паста с сыром и грибами</b>
+
+<b>Ингредиенты:</b>
+• Макароны цельнозерновые – 60 г
+• Сливки 33% – 50 г
+• Шампиньоны – 100 г
+• Сыр моцарелла – 30 г
+• Соль, специи – по вкусу
+• Зелень – по вкусу
+
+<b>Приготовление:</b>
+1. Отварить макароны до готовности в подсоленной воде
+2. Грибы нарезать кольцами, обжарить на сухой сковороде на сильном огне пару минут
+3. Добавить к грибам сливки, уменьшить огонь, перемешать
+4. Добавить макароны, натёртый сыр, специи, зелень, перемешать
+
+<b>КБЖУ:</b> 489 ккал | Б: 20 г | Ж: 24 г | У: 48 г"""
+        }
+    },
+
+    1500: {
+        1: {
+            "breakfast": """🌅 <b>Завтрак — Гречневые блинчики на молоке</b>
+
+<b>Ингредиенты:</b>
+• Гречневая мука – 100 г
+• Молоко – 150 мл
+• Вода – 50 мл
+• Яйцо – 2 шт
+• Щепотка соли
+• Сахарозаменитель – по вкусу
+
+<b>Приготовление:</b>
+1. Смешать все ингредиенты до получения однородного теста
+2. Разогреть сковороду и выпекать блинчики до золотистой корочки
+3. Подавать с мёдом, сметаной или свежими фруктами
+
+<b>КБЖУ:</b> 639 ккал | Б: 31 г | Ж: 18,4 г | У: 81 г""",
+
+            "lunch": """🍽 <b>Обед — Стейк форели и печеный картофель</b>
+
+<b>Ингредиенты:</b>
+• Стейк форели – 200 г
+• Картофель – 130 г
+• Оливковое масло – 10 г
+• Лимон (цедра) – ½ шт
+• Чеснок – 2 зубчика
+• Паприка молотая – 1 ч. л.
+• Тмин сушёный – 1 ч. л.
+• Перец красный молотый – на кончике ножа
+• Соль – ⅓ ч. л.
+• Перец чёрный молотый – на кончике ножа
+
+<b>Приготовление:</b>
+1. Отварить картофель до полуготовности (20 минут)
+2. Смешать цедру лимона, специи, чеснок и масло
+3. Замариновать форель на 5 минут
+4. Жарить на среднем огне по 5 минут с каждой стороны
+5. Картофель очистить, нарезать, добавить на сковороду и жарить 5 минут под крышкой
+
+<b>КБЖУ:</b> 419 ккал | Б: 42 г | Ж: 30 г | У: 25 г""",
+
+            "dinner": """🌙 <b>Ужин — Индейка с грибами</b>
+
+<b>Ингредиенты:</b>
+• Шампиньоны – 150 г
+• Филе индейки – 250 г
+• Оливковое масло – 10 г
+• Соль, специи, зелень – по вкусу
+
+<b>Приготовление:</b>
+1. Грибы нарезать кольцами, жарить 2 минуты на сильном огне
+2. Нарезать индейку, посолить, обжарить с грибами по 3 минуты с каждой стороны
+3. Тушить под крышкой 5 минут
+
+<b>КБЖУ:</b> 449 ккал | Б: 48 г | Ж: 16,6 г | У: 0,1 г"""
+        },
+        2: {
+            "breakfast": """🌅 <b>Завтрак — Сырники со сметаной</b>
+
+<b>Ингредиенты:</b>
+• Творог 2% – 200 г
+• Яйцо – 1 шт
+• Рисовая мука – 60 г (50 г + 10 г на обсыпку)
+• Сливочное масло – 10 г
+• Сметана 10% – 20 г
+• Сахзам – по вкусу
+
+<b>Приготовление:</b>
+1. Смешать творог с яйцом, добавить муку и щепотку соды
+2. Сформировать сырники, обвалять в муке, жарить 5 минут с каждой стороны
+3. Подавать со сметаной
+
+<b>КБЖУ:</b> 629 ккал | Б: 48,7 г | Ж: 20 г | У: 56 г""",
+
+            "lunch": """🍽 <b>Обед — Филе окуня с рисом</b>
+
+<b>Ингредиенты:</b>
+• Филе окуня – 150 г
+• Рис Басмати (сухой) – 70 г
+
+<b>Приготовление:</b>
+1. Отварить рис до готовности
+2. Окуня промыть, обсушить, приправить специями и солью
+3. Завернуть в фольгу, запекать 20 минут при 200°C
+4. Развернуть фольгу, выпекать ещё 10 минут
+
+<b>КБЖУ:</b> 386 ккал | Б: 32 г | Ж: 4,9 г | У: 55,7 г""",
+
+            "dinner": """🌙 <b>Ужин — Жареные креветки с овощами</b>
+
+<b>Ингредиенты:</b>
+• Креветки очищенные – 250 г
+• Оливковое масло – 10 г
+• Овощи – 200 г
+• Зелень – по вкусу
+
+<b>Приготовление:</b>
+1. Обжарить креветки 2 минуты на среднем огне
+2. Подавать с овощами и зеленью
+
+<b>КБЖУ:</b> 500 ккал | Б: 82 г | Ж: 13,4 г | У: 10 г"""
+        },
+        3: {
+            "breakfast": """🌅 <b>Завтрак — Греческий йогурт с фруктами и гранолой</b>
+
+<b>Ингредиенты:</b>
+• Греческий йогурт – 180 г
+• Гранола – 60 г
+• Ягоды или фрукты – 100 г
+
+<b>Приготовление:</b>
+1. Добавить нарезанные фрукты в йогурт
+2. Посыпать гранолой
+
+<b>КБЖУ:</b> 441 ккал | Б: 16,7 г | Ж: 21,3 г | У: 43 г""",
+
+            "lunch": """🍽 <b>Обед — Печеная картошка с жареной курицей</b>
+
+<b>Ингредиенты:</b>
+• Куриное филе – 250 г
+• Картофель – 200 г
+• Масло сливочное – 15 г
+• Соль, специи – по вкусу
+• Зеленый лук – по вкусу
+
+<b>Приготовление:</b>
+1. Отварить картофель 20 минут
+2. Нарезать курицу, посолить, обжарить по 5 минут с каждой стороны
+3. Очистить картофель, нарезать, посолить
+4. Добавить к курице, жарить 3 минуты под крышкой, посыпать зеленью
+
+<b>КБЖУ:</b> 539 ккал | Б: 61 г | Ж: 16,2 г | У: 32 г""",
+
+            "dinner": """🌙 <b>Ужин — Говяжьи котлеты с гречкой</b>
+
+<b>Ингредиенты:</b>
+• Говяжий фарш – 150 г
+• Гречка – 60 г
+• Яйцо – 1 шт
+• Петрушка, укроп – по вкусу
+• Оливковое масло – 1 ч. л.
+
+<b>Приготовление:</b>
+1. Отварить гречку до готовности
+2. Смешать фарш с яйцом, специями, сформировать котлеты
+3. Обжарить 10 минут с каждой стороны, тушить 5 минут
+4. Подавать с гречкой и овощами
+
+<b>КБЖУ:</b> 553 ккал | Б: 43 г | Ж: 18 г | У: 50 г"""
+        },
+        4: {
+            "breakfast": """🌅 <b>Завтрак — Творожные блинчики</b>
+
+<b>Ингредиенты:</b>
+• Творог мягкий 0% – 220 г
+• Яйцо – 2 шт
+• Молоко 2,5% – 150 мл
+• Мука рисовая – 50 г
+• Банан – 100 г
+• Сахарозаменитель – по вкусу
+
+<b>Приготовление:</b>
+1. Все ингредиенты перемешать до однородной консистенции
+2. Выпекать на сковороде по 2 минуты с каждой стороны
+3. Подавать с нарезанным бананом
+
+<b>КБЖУ:</b> 665 ккал | Б: 47,3 г | Ж: 16 г | У: 79 г""",
+
+            "lunch": """🍽 <b>Обед — Филе окуня с макаронами</b>
+
+<b>Ингредиенты:</b>
+• Филе морского окуня – 250 г
+• Макароны ТСП – 80 г
+• Соль и специи – по вкусу
+
+<b>Приготовление:</b>
+1. Отварить макароны до готовности
+2. Филе окуня промыть, обсушить, приправить специями и солью
+3. Завернуть в фольгу, запекать 20 минут при 200°C
+4. Развернуть фольгу, выпекать ещё 10 минут
+
+<b>КБЖУ:</b> 532 ккал | Б: 63,2 г | Ж: 2,3 г | У: 55 г""",
+
+            "dinner": """🌙 <b>Ужин — Теплый салат с курицей и овощами</b>
+
+<b>Ингредиенты:</b>
+• Куриное филе – 100 г
+• Морковь – 1 шт
+• Красный перец – 1 шт
+• Желтый перец – 1 шт
+• Красный лук – 1 шт
+• Свежий шпинат – 150 г
+• Оливковое масло – 1 ст. л.
+• Бальзамический уксус – 1 ст. л.
+• Соль и перец – по вкусу
+
+<b>Приготовление:</b>
+1. Нарезать куриное филе, обжарить до золотистой корки
+2. Обжарить нарезанные овощи до мягкости
+3. Смешать курицу с овощами, выложить на шпинат
+4. Полить бальзамическим уксусом и перемешать
+
+<b>КБЖУ:</b> 310 ккал | Б: 28,5 г | Ж: 11 г | У: 20 г"""
+        },
+        5: {
+            "breakfast": """🌅 <b>Завтрак — Тосты с творожным сыром, курочкой и слабосоленой рыбой, яйцом</b>
+
+<b>Ингредиенты:</b>
+• Цельнозерновой хлеб – 80 г
+• Творожный сыр – 40 г
+• Слабосоленая рыба – 40 г
+• Куриное филе – 100 г
+• Яйцо – 3 шт
+
+<b>Приготовление:</b>
+1. Поджарить хлеб в тостере
+2. Куриное филе нарезать, обжарить по 3 минуты с каждой стороны
+3. Намазать один тост творожным сыром, выложить курицу и яйцо. Второй – творожным сыром и рыбой
+
+<b>КБЖУ:</b> 552 ккал | Б: 52,6 г | Ж: 22,8 г | У: 40,6 г""",
+
+            "lunch": """🍽 <b>Обед — Фарш говяжий с рисом и сельдереем</b>
+
+<b>Ингредиенты:</b>
+• Фарш говяжий – 200 г
+• Рис Жасмин – 35 г
+• Сельдерей – 50 г
+• Петрушка, укроп – по вкусу
+
+<b>Приготовление:</b>
+1. Отварить рис до готовности
+2. Обжарить фарш, тщательно перемешивая
+3. Добавить сельдерей и зелень, тушить до готовности
+4. Смешать с рисом
+
+<b>КБЖУ:</b> 437 ккал | Б: 47,8 г | Ж: 14,3 г | У: 26,7 г""",
+
+            "dinner": """🌙 <b>Ужин — Куриные котлеты с овощным гарниром</b>
+
+<b>Ингредиенты для котлет:</b>
+• Куриное филе – 200 г
+• Яйцо – 1 шт
+• Лук – 25 г
+• Чеснок – 1 зубчик
+• Оливковое масло – 7 г
+• Панировочные сухари – 1,5 ст. л.
+• Зелень, соль, специи – по вкусу
+
+<b>Ингредиенты для гарнира:</b>
+• Морковь – 50 г
+• Кабачок – 50 г
+• Красный перец – 60 г
+• Оливковое масло – 1 ст. л.
+• Соль, перец, итальянские травы – по вкусу
+
+<b>Приготовление:</b>
+1. Смешать фарш с луком, чесноком, яйцом, сухарями, специями
+2. Сформировать котлеты, обжарить по 5-7 минут с каждой стороны
+3. Обжарить овощи на оливковом масле
+4. Приправить и подать с котлетами
+
+<b>КБЖУ:</b> 513 ккал | Б: 54 г | Ж: 18,3 г | У: 30 г"""
+        },
+        6: {
+            "breakfast": """🌅 <b>Завтрак — Яичница с сыром, беконом и авокадо</b>
+
+<b>Ингредиенты:</b>
+• Яйцо – 3 шт
+• Белок – 2 шт
+• Авокадо – 40 г
+• Сыр – 30 г
+• Бекон – 20 г
+• Соль, перец, лимонный сок – по вкусу
+
+<b>Приготовление:</b>
+1. Обжарить бекон, добавить яйца и белки, накрыть крышкой, готовить 5 минут
+2. Посолить, поперчить, посыпать тертым сыром
+3. Подавать с нарезанным авокадо, сбрызнув лимонным соком
+
+<b>КБЖУ:</b> 572 ккал | Б: 38,8 г | Ж: 43,8 г | У: 3,6 г""",
+
+            "lunch": """🍽 <b>Обед — Лаваш с сыром и зеленью</b>
+
+<b>Ингредиенты:</b>
+• Лаваш – 80 г
+• Сыр – 50 г
+• Зелень – 40 г
+• Оливковое масло – ½ ст. л.
+• Соль, специи – по вкусу
+
+<b>Приготовление:</b>
+1. Посыпать лаваш сыром и зеленью
+2. Запекать 5-7 минут при 180°C
+3. Полить маслом, посолить, нарезать
+
+<b>КБЖУ:</b> 430 ккал | Б: 19,4 г | Ж: 20,7 г | У: 40,3 г""",
+
+            "dinner": """🌙 <b>Ужин — Макароны с куриным филе</b>
+
+<b>Ингредиенты:</b>
+• Макароны ТСП - 70 гр
+• Куриное филе - 150 гр
+• Грибы шампиньоны - 90 гр
+• Оливковое масло - 10 мл
+• Соль, специи по вкусу
+
+<b>Приготовление:</b>
+1. Макароны отварить до готовности
+2. Куриное филе мелко нарезать, посолить, поперчить и обжарить на разогретой с маслом сковороде с двух сторон
+3. Грибы тщательно вымыть и нарезать кубиками, затем отправить на сковороду к курице
+4. Соединить с макаронами и тщательно перемешать
+
+<b>КБЖУ:</b> 545 ккал | Б: 50 г | Ж: 12,5 г | У: 49,4 г"""
+        },
+        7: {
+            "breakfast": """🌅 <b>Завтрак — Рисовый блин с творожным сыром</b>
+
+<b>Ингредиенты:</b>
+• Рис – 60 г
+• Яйцо – 1 шт
+• Сметана 30% – 40 г
+• Творожный сыр – 40 г
+• Укроп – по вкусу
+
+<b>Приготовление:</b>
+1. Отварить рис, смешать с яйцом, сметаной и мелко нарезанным укропом
+2. Выложить на разогретую сковороду и жарить под крышкой с двух сторон
+3. Сверху выложить творожный сыр
+
+<b>КБЖУ:</b> 505 ккал | Б: 14,2 г | Ж: 23,8 г | У: 50,8 г""",
+
+            "lunch": """🍽 <b>Обед — ПП хачапури</b>
+
+<b>Ингредиенты:</b>
+• Творог 5% – 150 г
+• Яйцо – 1 шт
+• Желток – 1 шт
+• Рисовая мука – 40 г
+• Разрыхлитель – ½ ч. л.
+• Лёгкий сыр – 40 г
+
+<b>Приготовление:</b>
+1. Смешать творог, яйцо, муку и разрыхлитель
+2. Слепить форму-лодочку и отправить в духовку при 180°C на 10 минут
+3. Достать, посыпать тёртым сыром и запекать до его расплавления
+4. Добавить желток и выпекать ещё пару минут
+
+<b>КБЖУ:</b> 634 ккал | Б: 48 г | Ж: 31,1 г | У: 35,8 г""",
+
+            "dinner": """🌙 <b>Ужин — Отварной картофель с говядиной</b>
+
+<b>Ингредиенты:</b>
+• Говяжья вырезка – 150 г
+• Оливковое масло – 5 г
+• Чеснок – 1 зубчик
+• Соевый соус – 15 г
+• Картофель мелкий – 120 г
+• Соль, специи – по вкусу
+
+<b>Приготовление:</b>
+1. Отварить картофель 20 минут
+2. Нарезать мясо узкими полосками
+3. Измельчить чеснок
+4. Обжарить говядину на разогретой сковороде 10 минут, помешивая
+5. Добавить чеснок, соевый соус, накрыть крышкой и тушить 5 минут
+6. Подавать с очищенным картофелем
+
+<b>КБЖУ:</b> 399 ккал | Б: 27,8 г | Ж: 19 г | У: 24,8 г"""
+        },
+        8: {
+            "breakfast": """🌅 <b>Завтрак — Сэндвич с беконом и яйцом</b>
+
+<b>Ингредиенты:</b>
+• Цельнозерновой хлеб – 80 г (2 ломтика)
+• Бекон – 40 г
+• Яйца – 3 шт
+• Помидор – 1 шт
+• Листья салата
+• Оливковое масло – 5 г
+• Соль, перец – по вкусу
+
+<b>Приготовление:</b>
+1. Обжарить бекон до хрустящей корочки
+2. В той же сковороде обжарить яйца
+3. Обжарить хлеб, добавить бекон, яйца, помидор и салат
+4. Посолить и поперчить
+
+<b>КБЖУ:</b> 720 ккал | Б: 36,6 г | Ж: 41,3 г | У: 43,2 г""",
+
+            "lunch": """🍽 <b>Обед — Рис с курицей и овощами в соевом соусе</b>
+
+<b>Ингредиенты:</b>
+• Лук – 70 г
+• Смесь овощей "Мексиканская" – 100 г
+• Куриное филе – 150 г
+• Рис (белый длиннозерный) – 70 г
+• Оливковое масло – 5 г
+• Соевый соус – 30 г
+• Соль – по вкусу
+
+<b>Приготовление:</b>
+1. Обжарить лук и овощи 5-7 минут
+2. Добавить куриное филе, соус, тушить под крышкой 5-7 минут
+3. Добавить рис, залить кипятком, готовить до полной готовности
+
+<b>КБЖУ:</b> 537 ккал | Б: 45,3 г | Ж: 7,5 г | У: 74,9 г""",
+
+            "dinner": """🌙 <b>Ужин — Салат с тунцом</b>
+
+<b>Ингредиенты:</b>
+• Огурцы – 100 г
+• Тунец консервированный – 100 г
+• Яйцо – 1 шт
+• Греческий йогурт – 30 г
+• Соль, специи, петрушка – по вкусу
+
+<b>Приготовление:</b>
+1. Нарезать огурец, размять тунец, смешать с йогуртом
+2. Добавить специи, зелень
+3. Отварить яйцо-пашот или обычное, нарезать, добавить к тунцу
+
+<b>КБЖУ:</b> 254 ккал | Б: 30,3 г | Ж: 12,5 г | У: 4,2 г"""
+        },
+        9: {
+            "breakfast": """🌅 <b>Завтрак — Панкейки с кленовым сиропом</b>
+
+<b>Ингредиенты:</b>
+• Мука – 110 г
+• Яйцо – 2 шт
+• Молоко – 120 мл
+• Растительное масло – 1 ст. л.
+• Сахарозаменитель – по вкусу
+• Разрыхлитель – 1 ч. л.
+• Ванильный экстракт, корица – по желанию
+• Кленовый сироп – для подачи
+
+<b>Приготовление:</b>
+1. Смешать все ингредиенты до однородности
+2. Жарить панкейки на сковороде до золотистой корочки
+3. Подавать с кленовым сиропом
+
+<b>КБЖУ:</b> 765 ккал | Б: 27 г | Ж: 26,6 г | У: 90 г""",
+
+            "lunch": """🍽 <b>Обед — Лосось с макаронами и овощами</b>
+
+<b>Ингредиенты:</b>
+• Стейк лосося – 100 г
+• Макароны ТСП – 35 г
+• Оливковое масло – 5 г
+• Овощная смесь – 50 г
+
+<b>Приготовление:</b>
+1. Отварить макароны
+2. Обжарить лосось, добавить овощи, тушить 5 минут
+
+<b>КБЖУ:</b> 310 ккал | Б: 25 г | Ж: 11 г | У: 30 г""",
+
+            "dinner": """🌙 <b>Ужин — Отварная гречка с куриным фаршем и томатной пастой</b>
+
+<b>Ингредиенты:</b>
+• Гречка (сухая) – 70 г
+• Куриное филе – 150 г
+• Оливковое масло – 5 г
+• Томатная паста – 10 г
+• Укроп – по вкусу
+• Соль, специи – по вкусу
+
+<b>Приготовление:</b>
+1. Отварить гречку
+2. Обжарить куриный фарш 10 минут
+3. Добавить томатную пасту, гречку, тушить 5 минут
+
+<b>КБЖУ:</b> 453 ккал | Б: 44,3 г | Ж: 8,7 г | У: 51,9 г"""
+        },
+        10: {
+            "breakfast": """🌅 <b>Завтрак — Тост с бананом, ореховым маслом и сливочным сыром</b>
+
+<b>Ингредиенты:</b>
+• Хлеб цельнозерновой – 60 г (2 ломтика по 30 г)
+• Банан – 80 г
+• Ореховое масло – 20 г
+• Сливочный сыр – 40 г
+
+<b>Приготовление:</b>
+1. Обжарить тосты на сковороде или в тостере
+2. Распределить сливочный сыр на каждый тост
+3. Уложить нарезанный банан
+4. Полить сверху ореховым маслом
+
+<b>КБЖУ:</b> 475 ккал | Б: 7,5 г | Ж: 30,5 г | У: 42,3 г""",
+
+            "lunch": """🍽 <b>Обед — Филе карпа в духовке с макаронами</b>
+
+<b>Ингредиенты:</b>
+• Макароны ТСП – 50 г
+• Филе карпа – 250 г
+• Оливковое масло – 5 г
+• Соль, перец, специи для рыбы
+
+<b>Приготовление:</b>
+1. Отварить макароны до готовности
+2. Натереть филе карпа маслом и посыпать специями
+3. Положить сверху по веточке укропа и завернуть карпа в фольгу
+4. Запекать рыбу в духовке при 180°C 20-25 минут
+
+<b>КБЖУ:</b> 495 ккал | Б: 46 г | Ж: 14,4 г | У: 35,2 г""",
+
+            "dinner": """🌙 <b>Ужин — Мексиканские фахитас с курицей</b>
+
+<b>Ингредиенты:</b>
+• Куриная грудка – 220 г
+• Красный перец – ½ шт
+• Зеленый перец – ½ шт
+• Луковица – ½ шт
+• Чеснок – 1 зубчик
+• Чили-порошок – 1 ч. л.
+• Кумин – 1 ч. л.
+• Лимонный сок – 10 г
+• Тортилья – 1 шт
+• Оливковое масло – 1 ч. л.
+
+<b>Приготовление:</b>
+1. Обжарить куриное мясо на оливковом масле до золотистости
+2. Добавить лук, перец и чеснок, обжаривать до мягкости
+3. Посыпать чили-порошком, кумином, добавить лимонный сок
+4. Готовить еще несколько минут
+5. Подавать с тортильями
+
+<b>КБЖУ:</b> 547 ккал | Б: 59,8 г | Ж: 1 г | У: 46,4 г"""
+        },
+        11: {
+            "breakfast": """🌅 <b>Завтрак — Яичный рулет с овощами</b>
+
+<b>Ингредиенты:</b>
+• Яйца – 3 шт
+• Морковь – 20 г
+• Перец – 35 г
+• Лук – 15 г
+• Твердый сыр – 25 г
+• Соль и перец – по вкусу
+• Оливковое масло – 5 г
+
+<b>Приготовление:</b>
+1. Разогреть духовку до 180°C
+2. Выложить лук, морковь и перец на противень с маслом, запекать 10-15 минут
+3. Взбить яйца с солью, перцем, добавьте сыр
+4. Налить яичную смесь на овощи, запекать 10-12 минут
+5. Свернуть рулет, нарезать порционно
+
+<b>КБЖУ:</b> 426 ккал | Б: 27 г | Ж: 30 г | У: 5 г""",
+
+            "lunch": """🍽 <b>Обед — Фарш говяжий с рисом, сыром и мексиканской смесью</b>
+
+<b>Ингредиенты:</b>
+• Фарш постный говяжий – 180 г
+• Рис Жасмин – 35 г
+• Мексиканская овощная смесь – 100 г
+• Сыр Гауда – 30 г
+
+<b>Приготовление:</b>
+1. Отварить рис
+2. Обжарить фарш, добавить овощи
+3. Перемешать, жарить 10 минут
+4. Добавить рис, сверху натереть сыр
+
+<b>КБЖУ:</b> 594 ккал | Б: 42 г | Ж: 19 г | У: 43 г""",
+
+            "dinner": """🌙 <b>Ужин — Низкокалорийная пицца с овощами</b>
+
+<b>Ингредиенты:</b>
+• Армянский лаваш – 100 г
+• Томатный соус без сахара – 50 г
+• Помидор – 50 г
+• Болгарский перец – 40 г
+• Оливки – 40 г
+• Творожный сыр – 40 г
+• Моцарелла – 40 г
+• Свежие травы, соль, перец, чесночный порошок
+
+<b>Приготовление:</b>
+1. Разогреть духовку до 200°C
+2. Намазать соус на лаваш
+3. Выложить овощи, творожный сыр и моцареллу
+4. Приправить специями
+5. Запекать 12-15 минут
+
+<b>КБЖУ:</b> 481 ккал | Б: 19,8 г | Ж: 21 г | У: 54 г"""
+        },
+        12: {
+            "breakfast": """🌅 <b>Завтрак — Морковные оладьи с кокосом</b>
+
+<b>Ингредиенты:</b>
+• Морковь – 180 г
+• Яйца – 2 шт
+• Мука – 3 ст. л.
+• Тертый кокос – 2 ст. л.
+• Растительное масло – 5 г
+• Сахарозаменитель – по вкусу
+
+<b>Приготовление:</b>
+1. Смешать морковь, яйца, муку, кокос, сахарозаменитель
+2. Обжаривать на масле до золотистости
+
+<b>КБЖУ:</b> 336,5 ккал | Б: 12,2 г | Ж: 15,5 г | У: 36 г""",
+
+            "lunch": """🍽 <b>Обед — Горбуша в духовке с рисом</b>
+
+<b>Ингредиенты:</b>
+• Стейк горбуши – 250 г
+• Рис Жасмин – 50 г
+• Морковь – 50 г
+• Лук – 25 г
+• Оливковое масло – 15 г
+• Зелень – по вкусу
+
+<b>Приготовление:</b>
+1. Отварить рис
+2. Запекать горбушу с овощами 20 минут в фольге
+3. Развернуть фольгу, запекать еще 10 минут
+
+<b>КБЖУ:</b> 782 ккал | Б: 55 г | Ж: 31,3 г | У: 62 г""",
+
+            "dinner": """🌙 <b>Ужин — Теплый салат с курицей и овощами</b>
+
+<b>Ингредиенты:</b>
+• Куриное филе – 150 г
+• Морковь – ½ шт
+• Перцы – по ½ шт
+• Красный лук – ½ шт
+• Шпинат – 100 г
+• Оливковое масло – 1 ст. л.
+• Бальзамический уксус – 2 ст. л.
+• Соль и перец – по вкусу
+
+<b>Приготовление:</b>
+1. Обжарить курицу и овощи
+2. Выложить на шпинат, заправить уксусом
+
+<b>КБЖУ:</b> 429 ккал | Б: 40,5 г | Ж: 17 г | У: 23 г"""
+        },
+        13: {
+            "breakfast": """🌅 <b>Завтрак — Фриттата с картофелем и сыром</b>
+
+<b>Ингредиенты:</b>
+• Яйца – 3 шт
+• Яичный белок – 1 шт
+• Картофель – 100 г
+• Тертый сыр – 40 г
+• Лук – 30 г
+• Зеленый лук – 10 г
+• Оливковое масло – 5 г
+• Соль, перец – по вкусу
+
+<b>Приготовление:</b>
+1. Отварить картофель и нарезать на кубики
+2. Взбить яйца и белок, добавить соль и перец
+3. Разогреть сковороду, выложить картофель, лук и сыр
+4. Залить яйцами, готовить до золотистой корочки
+
+<b>КБЖУ:</b> 552 ккал | Б: 34 г | Ж: 35 г | У: 19 г""",
+
+            "lunch": """🍽 <b>Обед — Макароны с овощами и говядиной</b>
+
+<b>Ингредиенты:</b>
+• Макароны ТСП – 50 г
+• Говядина (мякоть бедра) – 250 г
+• Морковь – 100 г
+• Лук – 50 г
+• Зелень – по вкусу
+• Соль, специи – по вкусу
+
+<b>Приготовление:</b>
+1. Отварить макароны
+2. Нарезать говядину, посолить, добавить специи
+3. Обжарить лук и морковь, добавить говядину
+4. Тушить 20-25 минут, затем добавить макароны и зелень
+
+<b>КБЖУ:</b> 691 ккал | Б: 54,5 г | Ж: 31,4 г | У: 47 г""",
+
+            "dinner": """🌙 <b>Ужин — Куриное филе с овощной смесью в соевом соусе</b>
+
+<b>Ингредиенты:</b>
+• Овощная смесь – 100 г
+• Куриное филе – 150 г
+• Соевый соус – 10 г
+
+<b>Приготовление:</b>
+1. Тушить овощную смесь 7 минут
+2. Добавить нарезанную курицу, тушить 10 минут
+3. Добавить соевый соус, посыпать зеленью
+
+<b>КБЖУ:</b> 260 ккал | Б: 39 г | Ж: 2,7 г | У: 17,6 г"""
+        },
+        14: {
+            "breakfast": """🌅 <b>Завтрак — Творожные оладьи</b>
+
+<b>Ингредиенты:</b>
+• Творог 5% – 200 г
+• Яйцо – 2 шт
+• Мука – 50 г
+• Сахарозаменитель – по вкусу
+• Разрыхлитель – ½ ч. л.
+• Ванильный экстракт – по желанию
+• Растительное масло – 5 г
+
+<b>Приготовление:</b>
+1. Смешать все ингредиенты
+2. Разогреть сковороду, жарить до золотистой корочки
+
+<b>КБЖУ:</b> 592 ккал | Б: 49 г | Ж: 26 г | У: 38,3 г""",
+
+            "lunch": """🍽 <b>Обед — Отварные куриные ножки с рисом</b>
+
+<b>Ингредиенты:</b>
+• Рис Басмати – 70 г
+• Куриные ножки – 200 г
+• Соль, специи – по вкусу
+
+<b>Приготовление:</b>
+1. Отварить рис
+2. Куриные ножки отварить 20-30 минут
+
+<b>КБЖУ:</b> 541 ккал | Б: 38 г | Ж: 20,4 г | У: 50 г""",
+
+            "dinner": """🌙 <b>Ужин — Теплый салат с кускусом и овощами</b>
+
+<b>Ингредиенты:</b>
+• Кускус отварной – 150 г
+• Красный перец – 80 г
+• Желтый перец – 80 г
+• Огурец – 80 г
+• Помидоры черри – 80 г
+• Красный лук – 30 г
+• Оливковое масло – 10 г
+• Соль, перец – по вкусу
+• Сок лимона – ¼ шт
+• Свежая мята – для украшения
+
+<b>Приготовление:</b>
+1. Приготовить кускус
+2. Смешать нарезанные овощи с кускусом
+3. Полить оливковым маслом, лимонным соком, приправить
+4. Подавать теплым, украсив мятой
+
+<b>КБЖУ:</b> 368 ккал | Б: 9,5 г | Ж: 10,4 г | У: 48,7 г"""
+        }
+    },
+
+    1600: {
+        1: {
+            "breakfast": """🌅 <b>Завтрак — Овсяная каша с протеином и бананом</b>
+
+<b>Ингредиенты:</b>
+• Овсяные хлопья - 50 г
+• Протеин - 40 г
+• Кешью - 30 г
+• Молоко 1,5% - 250 мл
+• Банан - 1 шт
+
+<b>Приготовление:</b>
+1. В хлопья налить половину молока, греть в микроволновке, пока молоко не закипит (3-5 мин)
+2. Вынуть, накрыть крышкой и оставить на 15-20 мин до набухания каши
+3. Добавить оставшиеся ингредиенты и хорошо перемешать
+
+<b>КБЖУ:</b> 745 ккал | Б: 49,9 г | Ж: 27,8 г | У: 79,1 г""",
+
+            "lunch": """🍽 <b>Обед — Куриные шарики в сливочном соусе с овощным салатом</b>
+
+<b>Ингредиенты:</b>
+• Куриное филе - 200 г
+• Сливки 33% - 50 мл
+• Мука - 10 г
+• Помидоры - 50 г
+• Огурцы - 50 г
+• Болгарский перец - 50 г
+• Соль, специи по вкусу
+
+<b>Приготовление:</b>
+1. Куриное филе превратить в фарш, посолить, поперчить
+2. Сформировать небольшие шарики
+3. Обжарить по 3 минуты с каждой стороны
+4. Накрыть крышкой, подлить 50 мл воды и тушить 5 минут
+5. Добавить сливки, муку, перемешать, потушить 3 минуты и дать настояться
+6. Овощи нарезать и подать вместе с шариками
+
+<b>КБЖУ:</b> 446 ккал | Б: 49,8 г | Ж: 19,2 г | У: 15,4 г""",
+
+            "dinner": """🌙 <b>Ужин — Жареные креветки с рисом</b>
+
+<b>Ингредиенты:</b>
+• Креветки очищенные - 250 г
+• Оливковое масло - 10 г
+• Рис (в сухом виде) - 50 г
+• Зелень по вкусу
+
+<b>Приготовление:</b>
+1. Обжарить креветки 2 минуты на среднем огне
+2. Отварить рис до готовности
+3. Подавать рис вместе с креветками, посыпав зеленью
+
+<b>КБЖУ:</b> 412 ккал | Б: 38,3 г | Ж: 12,8 г | У: 39,4 г"""
+        },
+        2: {
+            "breakfast": """🌅 <b>Завтрак — Греческий йогурт с фруктами и гранолой</b>
+
+<b>Ингредиенты:</b>
+• Греческий йогурт - 180 г
+• Гранола - 80 г
+• Ягоды - 150 г
+
+<b>Приготовление:</b>
+1. Добавить ягоды в йогурт
+2. Посыпать сверху гранолой
+
+<b>КБЖУ:</b> 531 ккал | Б: 20,1 г | Ж: 27,4 г | У: 49,7 г""",
+
+            "lunch": """🍽 <b>Обед — Печеная картошка с жареной курицей и зеленым луком</b>
+
+<b>Ингредиенты:</b>
+• Куриное филе - 250 г
+• Картофель - 200 г
+• Масло сливочное - 15 г
+• Зеленый лук - по вкусу
+• Соль, специи - по вкусу
+
+<b>Приготовление:</b>
+1. Отварить картофель в мундире (20 минут после закипания)
+2. Нарезать курицу, посолить, обжарить по 5 минут с каждой стороны
+3. Очистить картофель, нарезать, посолить
+4. Добавить к курице, жарить 3 минуты под крышкой, посыпать зеленью
+
+<b>КБЖУ:</b> 539 ккал | Б: 61,8 г | Ж: 16,8 г | У: 32,3 г""",
+
+            "dinner": """🌙 <b>Ужин — Тилапия на сковороде с овощами</b>
+
+<b>Ингредиенты:</b>
+• Филе тилапии - 400 г
+• Оливковое масло - 15 г
+• Кабачок - 50 г
+• Грибы - 50 г
+• Соль, специи - по вкусу
+
+<b>Приготовление:</b>
+1. Натереть тилапию солью, специями, обжарить по 5 минут с каждой стороны
+2. Овощи нарезать, тушить до готовности
+3. Подавать рыбу с овощами
+
+<b>КБЖУ:</b> 547 ккал | Б: 85,3 г | Ж: 22,7 г | У: 2,8 г"""
+        },
+        3: {
+            "breakfast": """🌅 <b>Завтрак — Творожные блинчики</b>
+
+<b>Ингредиенты:</b>
+• Творог мягкий 0% - 250 г
+• Яйцо - 2 шт
+• Молоко 2,5% - 150 мл
+• Мука рисовая - 45 г
+• Сахарозаменитель - по вкусу
+• Банан - 150 г
+
+<b>Приготовление:</b>
+1. Все ингредиенты перемешать до однородной консистенции
+2. Выпекать на сковороде по 2 минуты с каждой стороны
+3. Подавать с нарезанным бананом
+
+<b>КБЖУ:</b> 712 ккал | Б: 51 г | Ж: 16,5 г | У: 87,4 г""",
+
+            "lunch": """🍽 <b>Обед — Горбуша в духовке с овощами</b>
+
+<b>Ингредиенты:</b>
+• Горбуша - 350 г
+• Сок лимона - ¼ шт
+• Болгарский перец - 50 г
+• Пекинская капуста - 50 г
+• Соль, специи, зелень - по вкусу
+
+<b>Приготовление:</b>
+1. Горбушу сбрызнуть лимонным соком, натереть специями, запечь 20 минут при 200°C
+2. Приоткрыть фольгу, запекать ещё 10 минут
+3. Нарезать овощи, подать с рыбой
+
+<b>КБЖУ:</b> 520 ккал | Б: 73,1 г | Ж: 22,8 г | У: 4,0 г""",
+
+            "dinner": """🌙 <b>Ужин — Индейка с сыром и макаронами</b>
+
+<b>Ингредиенты:</b>
+• Индейка - 150 г
+• Сыр - 30 г
+• Макароны - 50 г
+• Соль, специи - по вкусу
+
+<b>Приготовление:</b>
+1. Нарезать индейку, обжарить на сковороде с солью и специями
+2. Отварить макароны до готовности
+3. Смешать макароны с индейкой, посыпать тертым сыром
+
+<b>КБЖУ:</b> 403 ккал | Б: 41,2 г | Ж: 10,4 г | У: 34,9 г"""
+        },
+        4: {
+            "breakfast": """🌅 <b>Завтрак — Яичница с сыром, беконом и авокадо</b>
+
+<b>Ингредиенты:</b>
+• Яйцо – 3 шт
+• Белок – 2 шт
+• Авокадо – 40 г
+• Сыр – 30 г
+• Бекон – 20 г
+• Соль, перец по вкусу
+• Сок лимона
+• Цельнозерновой хлеб – 2 кусочка
+
+<b>Приготовление:</b>
+1. Обжарить бекон на разогретой сковороде, добавить яйца и белки, накрыть крышкой и оставить на медленном огне на 5 минут
+2. Посолить, поперчить, добавить тертый сыр
+3. Выложить на тарелку, нарезать авокадо кольцами, посолить, сбрызнуть лимонным соком
+4. Подавать с хлебом
+
+<b>КБЖУ:</b> 691,99 ккал | Б: 42,06 г | Ж: 44,68 г | У: 25,49 г""",
+
+            "lunch": """🍽 <b>Обед — Говяжий фарш с сельдереем, зеленым луком и картофелем</b>
+
+<b>Ингредиенты:</b>
+• Фарш говяжий – 120 г
+• Помидоры черри – 30 г
+• Сельдерей – 30 г
+• Зеленый лук – 30 г
+• Картофель – 100 г
+
+<b>Приготовление:</b>
+1. На разогретую сковороду выложить фарш, жарить 10 минут на среднем огне
+2. Накрыть крышкой и тушить до готовности, добавить нарезанные сельдерей, лук, помидоры, перемешать
+3. Подавать с картофелем
+
+<b>КБЖУ:</b> 394,5 ккал | Б: 23,54 г | Ж: 24,46 г | У: 18,95 г""",
+
+            "dinner": """🌙 <b>Ужин — Рис с курицей и овощами в соевом соусе</b>
+
+<b>Ингредиенты:</b>
+• Лук – 70 г
+• Смесь овощей «Мексиканская» – 100 г
+• Куриное филе – 150 г
+• Рис (белый длиннозерный) – 70 г
+• Оливковое масло – 5 г
+• Соевый соус – 30 г
+• Соль по вкусу
+
+<b>Приготовление:</b>
+1. Нарезать лук, обжарить его с овощами (посолить) 5-7 минут
+2. Нарезать куриное филе, добавить к овощам, добавить соус, перемешать, оставить под крышкой на 5-7 минут
+3. Добавить рис, залить кипятком (чтобы он покрыл рис и овощи)
+4. Готовить под крышкой на медленном огне до полной готовности риса
+
+<b>КБЖУ:</b> 537 ккал | Б: 45,3 г | Ж: 7,5 г | У: 74,9 г"""
+        },
+        5: {
+            "breakfast": """🌅 <b>Завтрак — Панкейки с кленовым сиропом</b>
+
+<b>Ингредиенты:</b>
+• Мука – 140 г
+• Яйцо – 2 шт
+• Молоко – 120 мл
+• Растительное масло – 1 ст. л.
+• Сахарозаменитель – по вкусу
+• Разрыхлитель – 1 ч. л.
+• Ванильный экстракт, корица – по желанию
+• Кленовый сироп
+
+<b>Приготовление:</b>
+1. Смешать муку, яйцо, молоко, масло, сахарозаменитель и разрыхлитель до однородной массы
+2. Добавить ванильный экстракт или корицу по желанию
+3. Разогреть сковороду, смазать её маслом
+4. Вылить тесто на сковороду, формируя панкейки. Обжаривать до золотистой корки с обеих сторон
+5. Подавать с кленовым сиропом
+
+<b>КБЖУ:</b> 823,83 ккал | Б: 30,7 г | Ж: 27,98 г | У: 112,76 г""",
+
+            "lunch": """🍽 <b>Обед — Салат с тунцом</b>
+
+<b>Ингредиенты:</b>
+• Огурцы – 100 г
+• Тунец консервированный – 100 г
+• Яйцо – 1 шт
+• Греческий йогурт – 30 г
+• Соль, специи, петрушка
+
+<b>Приготовление:</b>
+1. Огурец порезать кубиками
+2. Тунец размять вилкой, смешать с огурцом, заправить йогуртом, посолить, добавить зелень (по желанию)
+3. Сварить яйцо-пашот, положить к тунцу или просто отварить и измельчить кубиками
+
+<b>КБЖУ:</b> 209 ккал | Б: 29,49 г | Ж: 7,46 г | У: 4,24 г""",
+
+            "dinner": """🌙 <b>Ужин — Лосось с макаронами и овощами</b>
+
+<b>Ингредиенты:</b>
+• Лосось – 200 г
+• Макароны – 60 г
+• Оливковое масло – 5 г
+• Овощная смесь – 80 г
+
+<b>Приготовление:</b>
+1. Отварить макароны до готовности
+2. Вымыть лосось, обсушить, снять чешую
+3. Приправить солью, перцем, смазать маслом, можно сбрызнуть лимонным соком
+4. Выложить на разогретую сковороду, обжарить с каждой стороны по 7 минут
+5. Добавить овощную смесь и тушить ещё 5 минут с небольшим количеством воды
+
+<b>КБЖУ:</b> 574,3 ккал | Б: 48,16 г | Ж: 18,49 г | У: 49,82 г"""
+        },
+        6: {
+            "breakfast": """🌅 <b>Завтрак — Гречневые блинчики на молоке</b>
+
+<b>Ингредиенты:</b>
+• Гречневая мука – 120 г
+• Молоко – 180 мл
+• Вода – 50 мл
+• Яйцо – 2 шт
+• Щепотка соли
+• Сахарозаменитель – по вкусу
+
+<b>Приготовление:</b>
+1. Смешать все ингредиенты до получения однородного теста
+2. Разогреть сковороду и приготовить блинчики на среднем огне до золотистой корочки
+3. Подавать с мёдом, сметаной или свежими фруктами
+
+<b>КБЖУ:</b> 728 ккал | Б: 36,05 г | Ж: 19,91 г | У: 97,85 г""",
+
+            "lunch": """🍽 <b>Обед — Филе карпа в духовке с макаронами</b>
+
+<b>Ингредиенты:</b>
+• Макароны ТСП – 50 г
+• Филе карпа – 250 г
+• Оливковое масло – 5 г
+• Соль, перец, специи – по вкусу
+
+<b>Приготовление:</b>
+1. Отварить макароны до готовности
+2. Натереть филе карпа маслом и посыпать специями
+3. Завернуть в фольгу, сверху положить укроп
+4. Запекать при 180°C в течение 20-25 минут
+
+<b>КБЖУ:</b> 493 ккал | Б: 45,3 г | Ж: 18,79 г | У: 34,85 г""",
+
+            "dinner": """🌙 <b>Ужин — Греческий салат</b>
+
+<b>Ингредиенты:</b>
+• Огурец – 80 г
+• Помидор – 80 г
+• Красный лук – 30 г
+• Оливки без косточек – 80 г
+• Фета – 100 г
+• Оливковое масло – 10 г
+• Лимонный сок – 1 ст. л.
+• Свежая зелень – по вкусу
+• Соль и перец – по вкусу
+
+<b>Приготовление:</b>
+1. Нарезать овощи и оливки, выложить в миску
+2. Смешать масло, лимонный сок, соль и перец
+3. Полить салат заправкой, посыпать зеленью
+
+<b>КБЖУ:</b> 423,5 ккал | Б: 19,12 г | Ж: 34,24 г | У: 8,53 г"""
+        },
+        7: {
+            "breakfast": """🌅 <b>Завтрак — Рисовый блин с творожным сыром</b>
+
+<b>Ингредиенты:</b>
+• Рис – 60 г
+• Яйцо – 1 шт
+• Сметана 30% – 40 г
+• Творожный сыр – 40 г
+• Укроп – по вкусу
+
+<b>Приготовление:</b>
+1. Отварить рис, смешать с яйцом, сметаной и укропом
+2. Обжарить под крышкой с двух сторон
+3. Сверху выложить творожный сыр
+
+<b>КБЖУ:</b> 496,75 ккал | Б: 14,37 г | Ж: 26,42 г | У: 50,17 г""",
+
+            "lunch": """🍽 <b>Обед — Тайский карри с курицей</b>
+
+<b>Ингредиенты:</b>
+• Куриное филе – 200 г
+• Карри-паста – 1 ст. л.
+• Морковь – 65 г
+• Красный перец – 60 г
+• Кабачок – 100 г
+• Луковица – 40 г
+• Кокосовое молоко – 200 мл
+• Оливковое масло – ½ ст. л.
+• Чеснок – 1 зубчик
+• Соль и перец – по вкусу
+• Свежая кинза – для украшения
+
+<b>Приготовление:</b>
+1. Разогреть масло, обжарить лук и чеснок
+2. Добавить курицу и готовить до золотистой корочки
+3. Добавить кокосовое молоко, карри-пасту, перемешать
+4. Выложить овощи, тушить 10-15 минут
+5. Посолить, поперчить, украсить кинзой
+
+<b>КБЖУ:</b> 654,42 ккал | Б: 52,85 г | Ж: 37,58 г | У: 23,03 г""",
+
+            "dinner": """🌙 <b>Ужин — Отбивная индейки на гриле с зеленью и овощами</b>
+
+<b>Ингредиенты:</b>
+• Филе индейки – 300 г
+• Соль, специи – по вкусу
+• Зеленый лук, сельдерей – 200 г
+• Растительное масло – 20 г
+• Огурец – 50 г
+• Помидор – 50 г
+
+<b>Приготовление:</b>
+1. Отбить индейку, приправить специями и солью
+2. Обжарить на гриле по 5 минут с каждой стороны
+3. Добавить нарезанный лук и сельдерей
+4. Подавать с нарезанными овощами
+
+<b>КБЖУ:</b> 473,5 ккал | Б: 60,35 г | Ж: 22,43 г | У: 7,45 г"""
+        },
+        8: {
+            "breakfast": """🌅 <b>Завтрак — Омлет в микроволновке</b>
+
+<b>Ингредиенты:</b>
+• Яйца – 3 шт
+• Молоко 2,5% – 40 мл
+• Сыр 45% – 40 г
+• Красный перец – 30 г
+• Специи – по вкусу
+
+<b>Приготовление:</b>
+1. Натереть сыр на крупной терке
+2. Нарезать перец кубиками
+3. Взбить яйца, добавить молоко и тщательно перемешать
+4. Добавить перец, сыр и специи, снова перемешать
+5. Поставить в микроволновку на 3 минуты
+
+<b>КБЖУ:</b> 287,95 ккал | Б: 22,47 г | Ж: 18,99 г | У: 4,63 г""",
+
+            "lunch": """🍽 <b>Обед — Горбуша в духовке с рисом</b>
+
+<b>Ингредиенты:</b>
+• Стейк горбуши – 250 г
+• Рис Жасмин – 50 г
+• Морковь – 50 г
+• Лук – 25 г
+• Оливковое масло – 15 г
+• Зелень – по вкусу
+
+<b>Приготовление:</b>
+1. Отварить рис до готовности
+2. Промыть горбушу, убрать лишнюю влагу
+3. Нарезать овощи, выложить их в фольгу и сбрызнуть маслом
+4. Выложить горбушу на овощи, посолить, поперчить
+5. Завернуть в фольгу и выпекать 20 минут при 200°C
+6. Приоткрыть фольгу и запекать еще 10 минут
+
+<b>КБЖУ:</b> 682,95 ккал | Б: 55,7 г | Ж: 31,37 г | У: 42,75 г""",
+
+            "dinner": """🌙 <b>Ужин — Курица, запеченная с сыром + овощи</b>
+
+<b>Ингредиенты:</b>
+• Куриное филе – 200 г
+• Апельсин – 1 шт
+• Соевый соус – 40 мл
+• Фета – 120 г
+• Листья салата – 35 г
+• Болгарский перец – 50 г
+• Соль, специи – по вкусу
+
+<b>Приготовление:</b>
+1. Приготовить маринад: смешать соевый соус, соль, специи, 20 мл апельсинового сока
+2. Замариновать курицу в этом соусе на 20-30 минут
+3. Выложить курицу на фольгу, посыпать сыром, запекать при 220°C в течение 20-30 минут
+4. Готовую курицу подать с листьями салата и болгарским перцем
+
+<b>КБЖУ:</b> 653,7 ккал | Б: 71,64 г | Ж: 31,57 г | У: 16,84 г"""
+        },
+        9: {
+            "breakfast": """🌅 <b>Завтрак — Творожные оладьи</b>
+
+<b>Ингредиенты:</b>
+• Творог 5% – 200 г
+• Яйцо – 2 шт
+• Мука – 50 г
+• Сахарозаменитель – по вкусу
+• Разрыхлитель – ½ ч. л.
+• Ванильный экстракт – по желанию
+• Растительное масло – 5 г
+
+<b>Приготовление:</b>
+1. Смешать творог, яйца, муку, сахарозаменитель и разрыхлитель до однородной массы
+2. Добавить ванильный экстракт
+3. Разогреть сковороду, смазать небольшим количеством масла
+4. Жарить оладьи до золотистой корочки с обеих сторон
+
+<b>КБЖУ:</b> 633,4 ккал | Б: 52,97 г | Ж: 27,59 г | У: 42,51 г""",
+
+            "lunch": """🍽 <b>Обед — Отварные куриные ножки с рисом</b>
+
+<b>Ингредиенты:</b>
+• Рис Басмати – 90 г
+• Куриные ножки – 250 г
+• Соль, специи – по вкусу
+
+<b>Приготовление:</b>
+1. Отварить рис до готовности
+2. Куриные ножки промыть, опустить в воду, довести до кипения, подсолить и варить еще 20-30 минут
+
+<b>КБЖУ:</b> 684,8 ккал | Б: 48,39 г | Ж: 25,68 г | У: 64,08 г""",
+
+            "dinner": """🌙 <b>Ужин — Жареные креветки</b>
+
+<b>Ингредиенты:</b>
+• Креветки очищенные – 250 г
+• Оливковое масло – 15 г
+• Соль, перец – по вкусу
+• Зелень – по вкусу
+• Фасоль стручковая – 100 г
+
+<b>Приготовление:</b>
+1. Обжарить креветки на сковороде с маслом 2 минуты на среднем огне
+2. Фасоль обжарить до мягкости
+3. Подавать с зеленью
+
+<b>КБЖУ:</b> 308,7 ккал | Б: 37 г | Ж: 17,67 г | У: 3,6 г"""
+        },
+        10: {
+            "breakfast": """🌅 <b>Завтрак — Фриттата с картофелем и сыром</b>
+
+<b>Ингредиенты:</b>
+• Яйца - 2 шт
+• Яичный белок - 1 шт
+• Картофель - 100 г
+• Тертый сыр - 40 г
+• Лук - 20 г
+• Зеленый лук - 10 г
+• Оливковое масло - 5 г
+• Соль, перец по вкусу
+
+<b>Приготовление:</b>
+1. Отварить картофель и нарезать небольшими кубиками
+2. Взбить яйца и белок, добавить соль и перец
+3. Разогреть сковороду с маслом, выложить картофель, зеленый лук и сыр
+4. Полить яйцами сверху и готовить до золотистой корочки
+5. Подавать горячей или холодной
+
+<b>КБЖУ:</b> 460,22 ккал | Б: 28,57 г | Ж: 29,18 г | У: 19,53 г""",
+
+            "lunch": """🍽 <b>Обед — Рыбные котлеты на пару</b>
+
+<b>Ингредиенты:</b>
+• Филе белой рыбы (треска, палтус) - 250 г
+• Яйцо - 2 шт
+• Манная крупа - 2 ст.л.
+• Морковь - 100 г
+• Луковица - 60 г
+• Соль, перец по вкусу
+
+<b>Приготовление:</b>
+1. Измельчить рыбу, смешать с тертой морковью, луком, яйцом, манной крупой, солью и перцем
+2. Сформировать котлеты и уложить их в пароварку
+3. Готовить 15-20 минут до готовности
+
+<b>КБЖУ:</b> 369,9 ккал | Б: 21,26 г | Ж: 12,59 г | У: 47,61 г""",
+
+            "dinner": """🌙 <b>Ужин — Ленивая лазанья</b>
+
+<b>Ингредиенты:</b>
+• Лук - 35 г
+• Говяжий фарш - 230 г
+• Томатная паста - 30 г
+• Лаваш - 30 г
+• Моцарелла - 30 г
+• Соль, специи по вкусу
+
+<b>Приготовление:</b>
+1. Обжарить лук до золотистого цвета, добавьте фарш, специи, томатную пасту. Тушить 10-15 минут
+2. Разрезать лаваш по форме запекания
+3. На дно выложить лаваш, затем часть фарша, посыпать сыром. Повторить 2-3 раза
+4. Выпекать в разогретой духовке (180°C) 10-15 минут
+
+<b>КБЖУ:</b> 768,05 ккал | Б: 48,81 г | Ж: 51,82 г | У: 23,23 г"""
+        },
+        11: {
+            "breakfast": """🌅 <b>Завтрак — Скрэмбл с рисом и авокадо</b>
+
+<b>Ингредиенты:</b>
+• Рис белый - 40 г
+• Яйца - 3 шт
+• Белок - 1 шт
+• Молоко 2,5% - 50 г
+• Авокадо - 80 г
+• Горошек консервированный - 50 г
+• Оливковое масло - 10 г
+• Соль, специи по вкусу
+
+<b>Приготовление:</b>
+1. Отварить рис
+2. Смешать яйца, белок, молоко, соль и специи, взбить
+3. Обжарить на сковороде, быстро перемешивая 3 минуты
+4. Выложить к рису, добавить нарезанный авокадо и горошек
+
+<b>КБЖУ:</b> 719,67 ккал | Б: 30,99 г | Ж: 45,55 г | У: 44,77 г""",
+
+            "lunch": """🍽 <b>Обед — Тилапия с овощами</b>
+
+<b>Ингредиенты:</b>
+• Филе тилапии - 350 г
+• Морковь - 100 г
+• Лук - 50 г
+• Оливковое масло - 15 г
+
+<b>Приготовление:</b>
+1. Обжарить тилапию по 5-7 минут с каждой стороны
+2. Добавить тертую морковь, нарезанный лук и жарить еще 3 минуты
+
+<b>КБЖУ:</b> 526 ккал | Б: 74,8 г | Ж: 21,02 г | У: 12,1 г""",
+
+            "dinner": """🌙 <b>Ужин — Овощной рататуй</b>
+
+<b>Ингредиенты:</b>
+• Цуккини - 1 шт
+• Баклажан - 1 шт
+• Помидоры - 2 шт
+• Красный перец - 1 шт
+• Луковица - 1 шт
+• Чеснок - 2 зубчика
+• Оливковое масло - 2 ст.л.
+• Сушеный тимьян - 1 ч.л.
+• Соль, перец по вкусу
+
+<b>Приготовление:</b>
+1. Разогреть духовку (200°C)
+2. Нарезать овощи кубиками
+3. Смешать с чесноком, маслом, тимьяном, солью и перцем
+4. Запекать 30-40 минут до мягкости
+
+<b>КБЖУ:</b> 413,89 ккал | Б: 12,64 г | Ж: 21,64 г | У: 43,89 г"""
+        },
+        12: {
+            "breakfast": """🌅 <b>Завтрак — Тост с бананом, ореховым маслом и сливочным сыром</b>
+
+<b>Ингредиенты:</b>
+• Хлеб Цельнозерновой - 60 г (2 ломтика по 30 г)
+• Банан - 80 г
+• Ореховое масло - 20 г
+• Сливочный сыр - 40 г
+
+<b>Приготовление:</b>
+1. Обжарить тосты на сковороде или в тостере
+2. Распределить сливочный сыр на каждый тост
+3. Уложить нарезанный банан
+4. Полить сверху ореховым маслом
+
+<b>КБЖУ:</b> 475,4 ккал | Б: 7,5 г | Ж: 30,56 г | У: 42,22 г""",
+
+            "lunch": """🍽 <b>Обед — Белковый рулет</b>
+
+<b>Ингредиенты:</b>
+• Куриная грудка – 180 г
+• Лук репчатый – 40 г
+• Яйца – 2 шт
+• Йогурт натуральный – 80 г
+• Сыр 35% – 45 г
+• Соль - по вкусу
+
+<b>Приготовление:</b>
+1. Смешать яйца, йогурт, тертый сыр и соль
+2. Распределить массу по силиконовому коврику и отправить в духовку на 10–15 минут при 180°C
+3. Сделать фарш из лука и курицы
+4. Достать основу из духовки, выложить на неё начинку и запекать на 10–15 минут при 180°C
+5. Свернуть рулетик
+
+<b>КБЖУ:</b> 442,9 ккал | Б: 60,45 г | Ж: 17,01 г | У: 10,61 г""",
+
+            "dinner": """🌙 <b>Ужин — Макароны с овощами и говядиной</b>
+
+<b>Ингредиенты:</b>
+• Макароны ТСП - 50 г
+• Мякоть бедра говядины - 250 г
+• Морковь - 100 г
+• Лук - 50 г
+• Зеленый лук, петрушка
+• Соль, специи по вкусу
+
+<b>Приготовление:</b>
+1. Макароны отварить до готовности
+2. Говядину промыть, нарезать на мелкие кубики, посолить и добавить специи
+3. Обжарить мелко нарезанные лук, морковь
+4. Выложить говядину и тушить под крышкой 20-25 минут с небольшим добавлением воды
+5. Добавить зелень, макароны и выключить плиту
+
+<b>КБЖУ:</b> 691,5 ккал | Б: 54,45 г | Ж: 31,65 г | У: 49,95 г"""
+        },
+        13: {
+            "breakfast": """🌅 <b>Завтрак — Яичный рулет с овощами</b>
+
+<b>Ингредиенты:</b>
+• Яйца - 3 шт
+• Морковь - 20 г
+• Перец - 35 г
+• Лук - 15 г
+• Твердый сыр - 35 г
+• Соль и перец по вкусу
+• Оливковое масло - 10 г
+
+<b>Приготовление:</b>
+1. Разогреть духовку до 180°C
+2. Разложить лук, морковь и перец на противне, смазанном оливковым маслом
+3. Выпекать овощи в духовке около 10-15 минут, пока они не станут мягкими
+4. Взбить яйца в миске и добавить соль, перец и натертый сыр, хорошо перемешать
+5. Налить смесь яиц на противень с овощами
+6. Выпекать в духовке около 10-12 минут, пока яйца не застынут
+7. Снять с противня и аккуратно свернуть рулет
+8. Нарезать на порционные кусочки и подавать горячим или холодным
+
+<b>КБЖУ:</b> 492,85 ккал | Б: 30,78 г | Ж: 37,48 г | У: 5,71 г""",
+
+            "lunch": """🍽 <b>Обед — Паста с креветками и чесночным соусом</b>
+
+<b>Ингредиенты:</b>
+• Спагетти - 50 г
+• Креветки очищенные - 300 г
+• Чеснок - 3 зубчика
+• Оливковое масло - 1,5 ст.л.
+• Соль и перец по вкусу
+• Петрушка для украшения
+
+<b>Приготовление:</b>
+1. В большой кастрюле с кипящей подсоленной водой приготовить спагетти до аль-денте согласно инструкции на упаковке
+2. В сковороде разогреть оливковое масло и обжарить измельченный чеснок на среднем огне до золотистого цвета
+3. Добавить креветки в сковороду и обжаривать до их приготовления, примерно 2-3 минуты с каждой стороны
+4. Откинуть воду от спагетти и добавить их в сковороду к креветкам
+5. Перемешать, чтобы паста покрылась соусом
+6. Приправить солью и перцем по вкусу
+7. Подавать порции, украсив свежей петрушкой
+
+<b>КБЖУ:</b> 614,86 ккал | Б: 71,98 г | Ж: 18,58 г | У: 39,34 г""",
+
+            "dinner": """🌙 <b>Ужин — Куриные шарики в сливочном соусе</b>
+
+<b>Ингредиенты:</b>
+• Куриное филе - 240 г
+• Сливки 33% - 50 мл
+• Соль, специи по вкусу
+• Мука - 10 г
+• Огурцы 60 г
+• Перец болгарский 60 г
+• Капуста пекинская 60 г
+
+<b>Приготовление:</b>
+1. Куриное филе превратить в фарш, посолить, поперчить
+2. Руками сформировать небольшие шарики
+3. Обжарить по 3 минуты с каждой стороны
+4. Накрыть крышкой, подлить 50 мл воды и тушить 5 минут
+5. Добавить сливки, муку, перемешать и выключить через 3 минуты, дать настояться
+6. Подавать с овощами
+
+<b>КБЖУ:</b> 494 ккал | Б: 59,44 г | Ж: 19,68 г | У: 15,55 г"""
+        },
+        14: {
+            "breakfast": """🌅 <b>Завтрак — Шакшука</b>
+
+<b>Ингредиенты:</b>
+• Яйца - 4 шт
+• Лук репчатый - 30 г
+• Чеснок - 1 зубчик
+• Помидор - 120 г
+• Масло оливковое - 1 ст.л
+• Специи (кумин/паприка) - по вкусу
+• Соль, перец по вкусу
+
+<b>Приготовление:</b>
+1. Разогреть сковороду с оливковым маслом на среднем огне
+2. Обжарить измельченный лук и чеснок до мягкости
+3. Добавить нарезанные помидоры, кумин, паприку, соль и перец. Тушить 5-7 минут до загустения соуса
+4. Сделать углубления в соусе и аккуратно разбить в них яйца
+5. Накрыть сковороду крышкой и готовить до тех пор, пока белки не застынут, а желтки останутся жидкими
+
+<b>КБЖУ:</b> 479,02 ккал | Б: 29,94 г | Ж: 34,22 г | У: 10,3 г""",
+
+            "lunch": """🍽 <b>Обед — Теплый салат с кускусом и овощами</b>
+
+<b>Ингредиенты:</b>
+• Кускус отварной - 200 г (в готовом виде)
+• Красный перец - 80 г
+• Желтый перец - 80 г
+• Огурец - 80 г
+• Помидоры черри - 80 г
+• Красный лук - 30 г
+• Оливковое масло - 10 г
+• Соль и перец по вкусу
+• Сок 1/4 лимона
+• Свежая мята для украшения
+
+<b>Приготовление:</b>
+1. Приготовить кускус согласно инструкции на упаковке
+2. В большой миске смешать нарезанные перцы, огурец, помидоры и красный лук
+3. Добавить приготовленный кускус в миску с овощами и хорошо перемешать
+4. Полить оливковым маслом и соком лимона, приправить солью и перцем по вкусу
+5. Подавать теплый салат, украсив свежей мятой
+
+<b>КБЖУ:</b> 395,6 ккал | Б: 9,58 г | Ж: 10,39 г | У: 62,51 г""",
+
+            "dinner": """🌙 <b>Ужин — Мексиканские фахитас с курицей</b>
+
+<b>Ингредиенты:</b>
+• Куриная грудка - 250 г
+• Красный перец - 1/2 шт
+• Зеленый перец - 1/2 шт
+• Луковица - 1/2 шт
+• Чеснок - 1 зубчик
+• Чили-порошок - 1 ч.л
+• Кумин - 1 ч.л
+• Лимонный сок - 10 г
+• Тортилья - 2 шт
+
+<b>Приготовление:</b>
+1. Обжарить куриное мясо на антипригарной сковороде до золотистости
+2. Добавить курицу в ту же сковороду, затем лук, перец и чеснок, обжаривать до мягкости
+3. Посыпать чили-порошком и кумином, посолить и поперчить по вкусу, затем добавить сок лимона
+4. Готовить еще несколько минут, чтобы все ингредиенты пропитались ароматами
+5. Подавать с тортильями
+
+<b>КБЖУ:</b> 732,48 ккал | Б: 71,1 г | Ж: 15,05 г | У: 78,2 г"""
+        }
+    },
+
+    1700: {
+        1: {
+            "breakfast": """🌅 <b>Завтрак — Гречневая каша с ягодами</b>
+
+<b>Ингредиенты:</b>
+• Гречневая крупа - 160 г
+• Сливочное масло - 10 г
+• Сахарозаменитель по вкусу
+• Свежие ягоды (можно использовать замороженные) - 200 г
+
+<b>Приготовление:</b>
+1. Отварить гречневую крупу в подслащенной воде до готовности
+2. Подавать кашу в чашке с любимыми ягодами и сливочным маслом
+
+<b>КБЖУ:</b> 652 ккал | Б: 21,6 г | Ж: 17,6 г | У: 114,1 г""",
+
+            "lunch": """🍽 <b>Обед — Макароны с беконом</b>
+
+<b>Ингредиенты:</b>
+• Бекон сырокопченый - 50 г
+• Макароны ТСП - 120 г
+
+<b>Приготовление:</b>
+1. Макароны отварить в подсоленной воде
+2. Обжарить бекон на сухой сковороде и добавить к макаронам
+
+<b>КБЖУ:</b> 516 ккал | Б: 17,3 г | Ж: 23,4 г | У: 83,7 г""",
+
+            "dinner": """🌙 <b>Ужин — Запеченный стейк форели</b>
+
+<b>Ингредиенты:</b>
+• Стейк форели - 200 г
+• Оливковое масло - 10 г
+• Соль, специи по вкусу
+
+<b>Приготовление:</b>
+1. Форель сбрызнуть лимоном, натереть маслом, солью, специями, завернуть в фольгу
+2. Запекать в духовке 30 минут при 200°C
+
+<b>КБЖУ:</b> 425 ккал | Б: 57,6 г | Ж: 21,2 г | У: 0 г"""
+        },
+        2: {
+            "breakfast": """🌅 <b>Завтрак — Овсянка с фруктами и орехами</b>
+
+<b>Ингредиенты:</b>
+• Овсянка - 100 г
+• Молоко 1,5% - 200 мл
+• Банан - 100 г
+• Орехи - 40 г
+• Сахарозаменитель по вкусу
+
+<b>Приготовление:</b>
+1. Сварить овсянку в молоке или воде до готовности
+2. Переложить овсянку в тарелку, добавить нарезанный банан и орехи. Подавать горячим
+
+<b>КБЖУ:</b> 749 ккал | Б: 25 г | Ж: 26 г | У: 108 г""",
+
+            "lunch": """🍽 <b>Обед — Филе окуня с рисом</b>
+
+<b>Ингредиенты:</b>
+• Филе окуня - 250 г
+• Рис Басмати - 70 г
+• Соль, специи по вкусу
+
+<b>Приготовление:</b>
+1. Отварить рис до готовности
+2. Филе окуня промыть и обсушить бумажным полотенцем
+3. Посыпать филе специями для рыбы и солью
+4. Выложить филе шкуркой вниз на фольгу, загнуть края
+5. Выпекать в разогретой до 200°C духовке 20 минут, развернуть фольгу и выпекать еще 10 минут
+
+<b>КБЖУ:</b> 430 ккал | Б: 51 г | Ж: 2,9 г | У: 49,7 г""",
+
+            "dinner": """🌙 <b>Ужин — Говядина с фунчозой</b>
+
+<b>Ингредиенты:</b>
+• Говядина тазобедренная - 150 г
+• Фунчоза - 50 г
+• Красный перец - 70 г
+• Помидор - 50 г
+• Зубчик чеснока - 1 шт
+• Соевый соус - 50 мл
+• Оливковое масло - 1 ч.л.
+• Соль, перец по вкусу
+
+<b>Приготовление:</b>
+1. Мелко нарезать чеснок. Половину добавить в кипяток с фунчозой на 5 мин
+2. Вторую половину чеснока обжарить на сковороде с маслом
+3. Мелко нарезать овощи и добавить к чесноку
+4. Говядину нарезать кубиками, посолить, поперчить, добавить к овощам. Жарить до готовности
+5. Слить воду с фунчозы и добавить к говядине
+
+<b>КБЖУ:</b> 540 ккал | Б: 33 г | Ж: 24 г | У: 51 г"""
+        },
+        3: {
+            "breakfast": """🌅 <b>Завтрак — Фруктовый йогурт с мюсли</b>
+
+<b>Ингредиенты:</b>
+• Греческий йогурт - 180 г
+• Мюсли - 70 г
+• Банан - 100 г
+• Клубника - 100 г
+• Мёд или кленовый сироп - 1 ч.л
+
+<b>Приготовление:</b>
+1. Налить йогурт в чашку или тарелку
+2. Добавить мюсли и нарезанные фрукты и ягоды
+3. Полить медом или кленовым сиропом по вкусу
+
+<b>КБЖУ:</b> 588 ккал | Б: 19,7 г | Ж: 25 г | У: 68,7 г""",
+
+            "lunch": """🍽 <b>Обед — Отварная гречка и жареное филе курицы с овощами</b>
+
+<b>Ингредиенты:</b>
+• Гречка - 90 г
+• Куриное филе - 250 г
+• Овощная смесь - 200 г
+• Соль, специи по вкусу
+
+<b>Приготовление:</b>
+1. Отварить гречку до готовности
+2. Куриное филе вымыть, нарезать на мелкие кусочки, посолить и поперчить
+3. На разогретую сковороду налить 50 мл горячей воды, выложить овощную смесь и тушить под крышкой 5 минут
+4. Добавить куриное филе и жарить по 5 минут с каждой стороны на среднем огне
+5. Подавать со свежими овощами
+
+<b>КБЖУ:</b> 664 ккал | Б: 74,8 г | Ж: 6,5 г | У: 75,8 г""",
+
+            "dinner": """🌙 <b>Ужин — Паста с томатным соусом</b>
+
+<b>Ингредиенты:</b>
+• Спагетти - 70 г
+• Томатного соуса - 200 г
+• Чеснок - 2 зубчика
+• Оливкового масла - 1/2 ст.л.
+• Соль и перец по вкусу
+
+<b>Приготовление:</b>
+1. В кастрюле с кипящей подсоленной водой отварить пасту до готовности
+2. В глубокой сковороде разогреть оливковое масло и обжарить измельченный чеснок до золотистого цвета
+3. Добавить томатный соус, приправить солью и перцем, довести до кипения и готовить 5-7 минут
+4. К готовой пасте добавить готовый томатный соус и перемешать
+
+<b>КБЖУ:</b> 457 ккал | Б: 11,6 г | Ж: 21,4 г | У: 61,4 г"""
+        },
+        4: {
+            "breakfast": """🌅 <b>Завтрак — Тосты с авокадо, помидорами и яйцом пашот</b>
+
+<b>Ингредиенты:</b>
+• Хлеб - 80 г (2 кусочка по 40 г)
+• Авокадо - 150 г
+• Помидор - 1 шт
+• Яйцо - 1 шт
+• Соль и перец по вкусу
+
+<b>Приготовление:</b>
+1. Поджарить тосты из хлеба
+2. Размять авокадо вилкой до состояния пюре, намазать на тосты
+3. Нарезать помидор тонкими ломтиками и выложить на авокадо
+4. Посолить и поперчить по вкусу
+5. Приготовить яйцо пашот и подавать сверху на тост
+
+<b>КБЖУ:</b> 621 ккал | Б: 18 г | Ж: 29 г | У: 51 г""",
+
+            "lunch": """🍽 <b>Обед — Отварной булгур с тилапией</b>
+
+<b>Ингредиенты:</b>
+• Филе тилапии - 250 г
+• Булгур - 100 г
+
+<b>Приготовление:</b>
+1. Отварить булгур до готовности
+2. Тилапию хорошо промыть, посолить, поперчить и выложить на разогретую сковороду с маслом
+3. Обжарить с двух сторон на среднем огне по 5 минут
+4. Накрыть крышкой, уменьшить огонь и оставить на 5 минут
+
+<b>КБЖУ:</b> 626 ккал | Б: 38,7 г | Ж: 10,4 г | У: 40 г""",
+
+            "dinner": """🌙 <b>Ужин — Чилийский красный карри с курицей</b>
+
+<b>Ингредиенты:</b>
+• Куриное филе - 250 г
+• Луковица - 1/2 шт
+• Чеснок - 1 зубчик
+• Красная карри-паста - 1 ст.л.
+• Кокосовое молоко - 200 мл
+• Оливковое масло - 1/2 ст.л.
+• Соль и перец по вкусу
+• Свежая кинза для подачи
+
+<b>Приготовление:</b>
+1. В большой кастрюле разогреть оливковое масло и обжарить лук и чеснок до мягкости
+2. Добавить куриную грудку и обжаривать до золотистости
+3. Добавить карри-пасту и обжаривать еще 1-2 минуты
+4. Постепенно влить кокосовое молоко, посолить и поперчить, довести до кипения, затем уменьшить огонь и тушить под крышкой 20-25 минут
+5. Подавать горячим, посыпав свежей кинзой
+
+<b>КБЖУ:</b> 455 ккал | Б: 54 г | Ж: 22 г | У: 10,1 г"""
+        },
+        5: {
+            "breakfast": """🌅 <b>Завтрак — Омлет с овощами и сыром</b>
+
+<b>Ингредиенты:</b>
+• Яйца - 4 шт
+• Помидоры - 40 г
+• Перец - 30 г
+• Лук - 20 г
+• Тертый сыр - 20 г
+• Соль и перец по вкусу
+
+<b>Приготовление:</b>
+1. Взбить яйца в миске, добавить нарезанные овощи, соль и перец
+2. Разогреть сковороду на среднем огне, вылить смесь яиц
+3. Посыпать тертым сыром сверху и готовить до тех пор, пока омлет не станет упругим
+
+<b>КБЖУ:</b> 326 ккал | Б: 33,7 г | Ж: 30,5 г | У: 6,1 г""",
+
+            "lunch": """🍽 <b>Обед — Макароны с куриными котлетами</b>
+
+<b>Ингредиенты:</b>
+• Макароны ТСП - 100 г
+• Куриное филе - 150 г
+• Яйцо - 1 шт
+• Оливковое масло - 10 г
+• Соль, специи, укроп по вкусу
+
+<b>Приготовление:</b>
+1. Отварить макароны до готовности
+2. Куриное филе очень мелко нарезать, добавить яйцо, специи, мелко нарезанную зелень и сформировать котлетки
+3. На разогретую сковороду с маслом выложить котлетки и обжаривать с каждой стороны по 5 минут
+4. Накрыть крышкой и дать постоять еще 5 минут с каждой стороны на медленном огне
+
+<b>КБЖУ:</b> 684 ккал | Б: 52 г | Ж: 18,8 г | У: 70 г""",
+
+            "dinner": """🌙 <b>Ужин — Филе окуня запеченное с картофелем</b>
+
+<b>Ингредиенты:</b>
+• Филе окуня - 250 г
+• Картофель - 200 г
+• Сыр гауда - 30 г
+• Оливковое масло - 15 г
+• Зелень по вкусу
+
+<b>Приготовление:</b>
+1. Отварить картофель в мундире до полуготовности (10 минут)
+2. Сделать надрез в каждом картофеле, выложить тертый сыр и мелко нарезанную зелень
+3. Завернуть в фольгу и запекать еще 15 минут при 200°C
+4. Филе окуня промыть и обсушить, посыпать специями для рыбы и солью
+5. Выложить филе шкуркой вниз на фольгу, загнуть края
+6. Выпекать в разогретой до 200°C духовке 20 минут, развернуть фольгу и выпекать еще 10 минут
+7. Подавать с овощами
+
+<b>КБЖУ:</b> 598 ккал | Б: 57 г | Ж: 26 г | У: 32 г"""
+        },
+        6: {
+            "breakfast": """🌅 <b>Завтрак — Каша рисовая с курицей и беконом</b>
+
+<b>Ингредиенты:</b>
+• Рис басмати - 120 г
+• Томаты - 150 г
+• Бекон варено-копченый (Окраина) - 50 г
+• Куриное филе - 100 г
+• Зелень по вкусу
+• Соль, перец по вкусу
+
+<b>Приготовление:</b>
+1. Бекон нарезать произвольно и выложить на разогретую сухую сковороду. Обжарить до румяности
+2. Куриное филе нарезать произвольно. Добавить филе вместе с рисом к бекону, обжарить несколько минут
+3. Томаты нарезать произвольно, добавить к рису. Жарить пару минут
+4. Залить водой и варить по инструкции на упаковке
+5. Когда все готово — добавить зелень, посолить, поперчить по вкусу
+
+<b>КБЖУ:</b> 776 ккал | Б: 35 г | Ж: 20 г | У: 62 г""",
+
+            "lunch": """🍽 <b>Обед — ПП хачапури</b>
+
+<b>Ингредиенты:</b>
+• Творог 5% - 100 г
+• Яйцо - 1 шт
+• Желток - 1 шт
+• Рисовая мука - 40 г
+• Разрыхлитель - 1/2 ч.л.
+• Легкий сыр - 40 г
+
+<b>Приготовление:</b>
+1. Творог, яйцо, муку и разрыхлитель смешать вилкой
+2. Слепить форму-лодочку и отправить в разогретую до 180°C духовку на 10 минут
+3. Достать, выложить тертый сыр и снова поставить в духовку до расплавления сыра
+4. Достать, добавить желток и снова поставить в духовку на пару минут
+
+<b>КБЖУ:</b> 512 ккал | Б: 42 г | Ж: 21 г | У: 35,8 г""",
+
+            "dinner": """🌙 <b>Ужин — Отварная гречка с куриным фаршем и томатной пастой</b>
+
+<b>Ингредиенты:</b>
+• Гречка - 60 г
+• Куриное филе - 150 г
+• Оливковое масло - 10 г
+• Томатная паста - 10 г
+• Соль, специи по вкусу
+• Зелень по вкусу
+
+<b>Приготовление:</b>
+1. Отварить гречку до готовности
+2. Куриное филе измельчить в фарш, посолить, поперчить
+3. На разогретую сковороду с маслом выложить фарш и тушить с небольшим добавлением воды 10 минут под крышкой
+4. Добавить томатную пасту и отварную гречку
+5. Накрыть крышкой и дать постоять 5 минут на слабом огне, добавить зелень
+
+<b>КБЖУ:</b> 450 ккал | Б: 42 г | Ж: 13,1 г | У: 36,1 г"""
+        },
+        7: {
+            "breakfast": """🌅 <b>Завтрак — Лаваш с сыром и яйцом</b>
+
+<b>Ингредиенты:</b>
+• Лаваш армянский - 120 г
+• Яйцо - 3 шт
+• Сулугуни - 40 г
+• Соль, специи, зелень
+
+<b>Приготовление:</b>
+1. Вырезать из лаваша два круга по диаметру сковороды
+2. Сыр натереть на крупной терке
+3. На разогретую сковороду выложить первый круг лаваша, вылить на него взбитое яйцо, высыпать половину сыра. Посолить, поперчить, добавить зелень
+4. Накрыть вторым кругом лаваша, перевернуть и высыпать оставшийся сыр
+
+<b>КБЖУ:</b> 658 ккал | Б: 38 г | Ж: 28,4 г | У: 58,7 г""",
+
+            "lunch": """🍽 <b>Обед — Макароны с яйцом и сыром</b>
+
+<b>Ингредиенты:</b>
+• Макароны ТСП - 100 г
+• Яйцо - 2 шт
+• Сыр - 50 г
+
+<b>Приготовление:</b>
+1. Отварить макароны в подсоленной воде
+2. Переложить макароны на разогретую сковороду, добавить яйцо и тертый сыр, готовить 3 минуты под крышкой
+
+<b>КБЖУ:</b> 483 ккал | Б: 36 г | Ж: 27,3 г | У: 70,3 г""",
+
+            "dinner": """🌙 <b>Ужин — Говядина с луком и овощной смесью</b>
+
+<b>Ингредиенты:</b>
+• Вырезка говяжья - 130 г
+• Лук - 50 г
+• Овощная смесь - 100 г
+• Соль, специи по вкусу
+
+<b>Приготовление:</b>
+1. Лук нарезать кольцами и быстро обжарить
+2. Добавить овощную смесь и тушить 10 минут под крышкой
+3. Мелко нарезать говядину, выложить на сковороду и жарить по 7 минут с каждой стороны на среднем огне
+
+<b>КБЖУ:</b> 360 ккал | Б: 27,7 г | Ж: 21 г | У: 15,2 г"""
+        },
+        8: {
+            "breakfast": """🌅 <b>Завтрак — Горячий сэндвич с яйцом</b>
+
+<b>Ингредиенты:</b>
+• Хлеб ц/з - 60 г
+• Яйцо - 3 шт
+• Сливочное масло - 15 г
+• Ветчина из индейки - 50 г
+• Сыр 15% - 15 г
+• Специи - по вкусу
+
+<b>Приготовление:</b>
+1. Взять два кусочка хлеба, из одного вырезать мякиш, сделав в центре "окошко"
+2. На сковороду добавить 3 г сливочного масла, выложить заготовку из хлеба
+3. В "окошко" разбить яйцо, выложить сверху ветчину и сыр, накрыть вторым кусочком хлеба
+4. Сверху хлеб смазать сливочным маслом и перевернуть сэндвич
+
+<b>КБЖУ:</b> 647 ккал | Б: 34 г | Ж: 40 г | У: 33 г""",
+
+            "lunch": """🍽 <b>Обед — Отварной картофель с говядиной</b>
+
+<b>Ингредиенты:</b>
+• Говяжья вырезка - 250 г
+• Оливковое масло - 5 г
+• Чеснок - 1 зубчик
+• Соевый соус - 15 г
+• Картофель мелкий - 160 г
+• Соль, специи по вкусу
+
+<b>Приготовление:</b>
+1. Отварить картофель (20 минут)
+2. Нарезать мясо узкими длинными полосками
+3. Измельчить чеснок
+4. Выложить говядину на разогретую антипригарную сковороду с маслом, посолить, поперчить и жарить на сильном огне примерно 10 минут, постоянно перемешивая
+5. Добавить чеснок, соевый соус, накрыть крышкой и оставить на 5 минут
+6. Подавать с очищенным и подсоленным картофелем
+
+<b>КБЖУ:</b> 625 ккал | Б: 41,8 г | Ж: 29 г | У: 28,8 г""",
+
+            "dinner": """🌙 <b>Ужин — Креветки с чесночным соусом + овощной салат</b>
+
+<b>Ингредиенты:</b>
+• Креветки очищенные - 350 г
+• Чеснок - 4 зубчика
+• Оливковое масло - 2 ст.л.
+• Свежий лимонный сок - 2 ст.л.
+• Свежая петрушка для подачи
+• Соль и перец по вкусу
+• Свежие овощи по вкусу (200 г)
+
+<b>Приготовление:</b>
+1. Разогреть оливковое масло на сковороде на среднем огне, добавить чеснок и обжарить до золотистости
+2. Добавить креветки, посыпать солью и перцем, и обжаривать, пока они не станут розовыми
+3. Полить свежевыжатым лимонным соком и обжаривать еще 1-2 минуты
+4. Посыпать свежей петрушкой и подавать горячими с овощным салатом
+
+<b>КБЖУ:</b> 461 ккал | Б: 69,7 г | Ж: 15,2 г | У: 12,7 г"""
+        },
+        9: {
+            "breakfast": """🌅 <b>Завтрак — Сырники с ягодами</b>
+
+<b>Ингредиенты:</b>
+• Рисовая мука - 2 ст.л
+• Яйцо - 1 шт
+• Творог 2% - 250 г
+• Сливочное масло - 5 г
+• Ягоды - 100 г
+• Подсластитель по вкусу
+• Щепотка соды
+
+<b>Приготовление:</b>
+1. Творог смешать с яйцом, постепенно добавить муку, подсластитель и соду
+2. Слепить сырники и обвалять их в муке
+3. Обжарить с двух сторон под крышкой на медленном огне, предварительно смазав сковороду сливочным маслом
+4. Подавать сырники с ягодами
+
+<b>КБЖУ:</b> 567 ккал | Б: 55,5 г | Ж: 15,2 г | У: 48,1 г""",
+
+            "lunch": """🍽 <b>Обед — Форель с макаронами на сковороде в маринаде</b>
+
+<b>Ингредиенты:</b>
+• Стейк форели - 200 г
+• Макароны ТСП - 60 г
+• Масло оливковое – 10 г
+• Лимон (цедра лимона) - 0,5 шт
+• Чеснок - 2 зубчика
+• Папика молотая - 1 ч. ложка
+• Тмин сушёный - 1 ч. ложка
+• Перец красный молотый - на кончике ножа
+• Соль - 1/3 ч. ложки
+• Перец чёрный молотый - на кончике чайной ложки
+
+<b>Приготовление:</b>
+1. Отварить макароны до готовности
+2. Снять цедру лимона, добавить специи, чеснок и масло
+3. Выложить стейк в маринад и оставить на 5 минут
+4. Выложить рыбу на хорошо разогретую сковороду и жарить по 5 минут с каждой стороны на среднем огне
+
+<b>КБЖУ:</b> 533 ккал | Б: 45,8 г | Ж: 17,6 г | У: 46,2 г""",
+
+            "dinner": """🌙 <b>Ужин — Плов с курицей</b>
+
+<b>Ингредиенты:</b>
+• Лук - 100 г
+• Морковь - 100 г
+• Куриное филе - 160 г
+• Рис (белый длиннозерный) - 80 г
+• Оливковое масло - 10 г
+• Соль, специи по вкусу
+
+<b>Приготовление:</b>
+1. Обжарить лук и морковь
+2. Добавить нарезанное филе
+3. Посолить, добавить специи и тушить под крышкой 5-7 минут
+4. Добавить рис и залить кипятком, тушить 20-25 минут
+
+<b>КБЖУ:</b> 620 ккал | Б: 45 г | Ж: 12,4 г | У: 80 г"""
+        },
+        10: {
+            "breakfast": """🌅 <b>Завтрак — Овсяноблин</b>
+
+<b>Ингредиенты:</b>
+• Овсянка долгой варки - 110 г
+• Яйцо - 2 шт
+• Белок - 1 шт
+• Сахарозаменитель, щепотка соды для пышности, корица (по желанию)
+
+<b>Приготовление:</b>
+1. Овсянку измельчить в муку с помощью кофемолки, добавить сухие ингредиенты
+2. Добавить яйцо и белок, столовую ложку воды, перемешать
+3. Вылить тесто на разогретую сковороду и обжаривать на слабом огне под крышкой с двух сторон
+
+<b>КБЖУ:</b> 587 ккал | Б: 29,3 г | Ж: 19,9 г | У: 77,7 г""",
+
+            "lunch": """🍽 <b>Обед — Тушеные овощи с красной чечевицей</b>
+
+<b>Ингредиенты:</b>
+• Красная чечевица - 150 г
+• Морковь - 2 шт
+• Красный перец - 1 шт
+• Кабачок - 1 шт
+• Луковица - 1 шт
+• Томатная паста - 2 ст.л.
+• Овощной бульон - 1 литр
+• Оливковое масло - 1 ст.л.
+• Соль и перец по вкусу
+
+<b>Приготовление:</b>
+1. Заранее замочить чечевицу в воде и оставить на ночь
+2. В большой кастрюле разогреть оливковое масло и обжарить лук до прозрачности
+3. Добавить морковь, перец и кабачок, тушить около 5 минут
+4. Добавить замоченную чечевицу, томатную пасту и овощной бульон
+5. Довести до кипения, затем уменьшить огонь и тушить около 20-25 минут или пока чечевица не станет мягкой
+6. Приправить солью и перцем по вкусу и подавать
+
+<b>КБЖУ:</b> 510 ккал | Б: 23,4 г | Ж: 8 г | У: 81,1 г""",
+
+            "dinner": """🌙 <b>Ужин — Запеченный картофель с горбушей</b>
+
+<b>Ингредиенты:</b>
+• Стейк горбуши - 200 г
+• Картофель - 200 г
+• Лук - 30 г
+• Морковь - 100 г
+• Оливковое масло - 15 г
+• Специи, соль, зелень
+
+<b>Приготовление:</b>
+1. Горбушу посолить, поперчить, смазать маслом и выложить на овощную подушку из нарезанных овощей, запекать в разогретой до 220°C духовке 20-25 минут
+2. Картофель вымыть и запекать в мундире в микроволновке 10-15 минут на максимальной мощности, разрезать, посолить, добавить масло и запекать еще 10 минут
+
+<b>КБЖУ:</b> 616 ккал | Б: 46 г | Ж: 28,3 г | У: 42,7 г"""
+        },
+        11: {
+            "breakfast": """🌅 <b>Завтрак — Рисовый блин с яблоком</b>
+
+<b>Ингредиенты:</b>
+• Рис (белый длиннозерный) - 100 г
+• Яйцо - 3 шт
+• Яблоко - 50 г
+• Корица, сахзам по вкусу
+
+<b>Приготовление:</b>
+1. Рис отварить до готовности и слегка остудить
+2. Добавить яйца и перемешать
+3. Добавить тертое яблоко и сухие ингредиенты
+4. Жарить с двух сторон до золотистой корочки под крышкой на медленном огне
+
+<b>КБЖУ:</b> 636 ккал | Б: 27,8 г | Ж: 18,6 г | У: 84,6 г""",
+
+            "lunch": """🍽 <b>Обед — Лосось с макаронами и овощами</b>
+
+<b>Ингредиенты:</b>
+• Стейк лосося - 150 г
+• Макароны ТСП - 60 г
+• Оливковое масло - 5 г
+• Овощная смесь - 100 г
+
+<b>Приготовление:</b>
+1. Отварить макароны до готовности
+2. Филе лосося вымыть, обсушить, снять чешую
+3. Посолить, поперчить, смазать оливковым маслом, можно сбрызнуть лимонным соком
+4. Выложить на разогретую сковороду и обжаривать с каждой стороны по 7 минут
+5. Добавить овощную смесь и тушить еще 5 минут с водой
+
+<b>КБЖУ:</b> 514 ккал | Б: 38 г | Ж: 18 г | У: 51 г""",
+
+            "dinner": """🌙 <b>Ужин — Хачапури в духовке</b>
+
+<b>Ингредиенты:</b>
+• Яйцо - 1 шт
+• Яичный желток - 1 шт
+• Творог 2% - 200 г
+• Рисовая мука - 30 г
+• Сыр - 20 г
+• Соль, специи по вкусу
+
+<b>Приготовление:</b>
+1. Творог хорошо отжать от влаги
+2. Добавить к нему яйцо, муку, соль, перемешать
+3. Сформировать лодочку, сделать в ней проколы вилкой и отправить в разогретую на 200°C духовку на 20 минут
+4. Достать, посыпать тертым сыром и отправить в духовку еще на 5 минут
+5. В центр добавить желток и запекать в духовке еще 2 минуты, посыпать солью
+
+<b>КБЖУ:</b> 550 ккал | Б: 53,6 г | Ж: 21,8 г | У: 31 г"""
+        },
+        12: {
+            "breakfast": """🌅 <b>Завтрак — Отварная овсянка и яйца</b>
+
+<b>Ингредиенты:</b>
+• Овсянка - 80 г
+• Яйца - 3 шт
+
+<b>Приготовление:</b>
+1. Отварить овсянку до готовности (10 минут варить и еще 5 держать под крышкой)
+2. Добавить соль/сахзам
+3. Отварить яйца (2-5 минут в зависимости от желаемой консистенции желтка)
+
+<b>КБЖУ:</b> 556 ккал | Б: 30 г | Ж: 23,8 г | У: 56,9 г""",
+
+            "lunch": """🍽 <b>Обед — Куриное филе в сливках с грибами под сырной шапочкой</b>
+
+<b>Ингредиенты:</b>
+• Куриное филе - 150 г
+• Шампиньоны - 120 г
+• Сливки 33% - 40 г
+• Сыра гауда - 40 г
+• Оливковое масло - 15 г
+
+<b>Приготовление:</b>
+1. Грибы вымыть, нарезать кольцами и обжарить на сухой сковороде по 3 минуты
+2. Куриное филе мелко нарезать, выложить на разогретую сковороду с маслом, обжаривать под крышкой 5-7 минут на слабом огне
+3. Добавить сливки, сверху натереть сыр
+4. Выключить огонь и дать настояться 3 минуты
+
+<b>КБЖУ:</b> 558 ккал | Б: 50,8 г | Ж: 36,4 г | У: 2 г""",
+
+            "dinner": """🌙 <b>Ужин — Овощная лепешка с сыром</b>
+
+<b>Ингредиенты:</b>
+• Кабачок - 100 г
+• Морковь - 50 г
+• Сыр - 40 г
+• Яйцо - 1 шт
+• Сметана 20% - 30 г
+• Рисовая мука – 70 г
+• Зелень по вкусу
+
+<b>Приготовление:</b>
+1. Овощи натереть на терке, отжать лишнюю жидкость
+2. Добавить тертый сыр, яйцо и сметану
+3. Добавить рисовую муку и щепотку соды
+4. Все перемешать и выложить на сковороду
+5. Жарить под крышкой на слабом огне
+
+<b>КБЖУ:</b> 593 ккал | Б: 23,4 г | Ж: 22 г | У: 66 г"""
+        },
+        13: {
+            "breakfast": """🌅 <b>Завтрак — Тосты с бананом и арахисовой пастой</b>
+
+<b>Ингредиенты:</b>
+• Хлеб Ц/З - 60 г
+• Арахисовая паста без добавок - 40 г
+• Банан - 100 г
+• Тыквенные семечки - 15 г
+
+<b>Приготовление:</b>
+1. Хлеб поджарить в тостере, смазать арахисовой пастой и выложить банан
+
+<b>КБЖУ:</b> 511 ккал | Б: 16,6 г | Ж: 22 г | У: 58 г""",
+
+            "lunch": """🍽 <b>Обед — Паста с сыром и грибами</b>
+
+<b>Ингредиенты:</b>
+• Макароны ТСП - 100 г
+• Сливки 33% - 50 г
+• Шампиньоны - 150 г
+• Сыр моцарелла - 30 г
+
+<b>Приготовление:</b>
+1. Отварить макароны до готовности в подсоленной воде
+2. Грибы вымыть, нарезать кольцами и обжарить на сухой сковороде на большом огне пару минут
+3. Добавить к грибам сливки, уменьшить огонь и перемешать
+4. Добавить макароны и тертый сыр, специи и зелень
+
+<b>КБЖУ:</b> 675 ккал | Б: 24,4 г | Ж: 31 г | У: 72 г""",
+
+            "dinner": """🌙 <b>Ужин — Стейк форели и печеный картофель</b>
+
+<b>Ингредиенты:</b>
+• Стейк форели - 250 г
+• Картофель - 180 г
+• Масло оливковое – 15 г
+• Лимон (цедра лимона) - 0,5 шт.
+• Чеснок - 2 зубчика
+• Паприка молотая - 1 ч. ложка
+• Тмин сушёный - 1 ч. ложка
+• Перец красный молотый - на кончике ножа
+• Соль - 1/3 ч. ложки
+• Перец чёрный молотый - на кончике чайной ложки
+
+<b>Приготовление:</b>
+1. Картофель в мундире отварить до полуготовности (20 минут)
+2. Снять цедру лимона, добавить специи, чеснок и масло
+3. Выложить стейк в маринад и оставить на 5 минут
+4. Выложить рыбу на хорошо разогретую сковороду и жарить по 5 минут с каждой стороны на среднем огне
+5. Картофель очистить, разделить на 4 части и добавить на сковороду под крышку на 5 минут при слабом огне
+
+<b>КБЖУ:</b> 419 ккал | Б: 53 г | Ж: 30 г | У: 36 г"""
+        },
+        14: {
+            "breakfast": """🌅 <b>Завтрак — Рисовая каша на кокосовом молоке и вареное яйцо</b>
+
+<b>Ингредиенты:</b>
+• Рис - 80 г
+• Кокосовое молоко 1,5% - 100 г
+• Яйцо - 2 шт
+• Голубика - 15 г
+• Тыквенные семечки - 10 г
+• Сахарозаменитель по вкусу
+
+<b>Приготовление:</b>
+1. Сварить рисовую кашу на воде, после закипания добавить молоко и сахзам
+2. Яйцо отварить 2-5 минут
+3. В кашу добавить голубику и тыквенные семечки
+
+<b>КБЖУ:</b> 664 ккал | Б: 26,7 г | Ж: 28,9 г | У: 67,9 г""",
+
+            "lunch": """🍽 <b>Обед — Горбуша в духовке с макаронами</b>
+
+<b>Ингредиенты:</b>
+• Стейк горбуши - 150 г
+• Макароны ТСП - 70 г
+• Морковь - 50 г
+• Лук - 25 г
+• Оливковое масло - 5 г
+• Зелень по вкусу
+
+<b>Приготовление:</b>
+1. Отварить макароны до готовности
+2. Горбушу промыть, убрать лишнее
+3. Нарезать овощи, положить их в фольгу, сбрызнуть маслом
+4. На овощную подушку выложить горбушу (предварительно посолить и поперчить)
+5. Завернуть аккуратно в фольгу и выпекать в духовке 20 минут
+6. Приоткрыть фольгу и выпекать еще 10 минут
+
+<b>КБЖУ:</b> 521 ккал | Б: 39 г | Ж: 15 г | У: 54 г""",
+
+            "dinner": """🌙 <b>Ужин — Говяжьи тефтели в томатном соусе</b>
+
+<b>Ингредиенты:</b>
+• Фарш говяжий - 200 г
+• Рис (белый длиннозерный) - 50 г
+• Томатная паста - 30 г
+• Мука - 10 г
+
+<b>Приготовление:</b>
+1. Отварить рис до полуготовности, дать чуть остыть
+2. Смешать фарш с рисом
+3. Сформировать небольшие тефтельки
+4. Выложить тефтельки на разогретую сковороду и обжарить с каждой стороны по 3 минуты
+5. Долить в сковороду кипяток (чтобы покрыть тефтели наполовину)
+6. Добавить томатную пасту, муку и перемешать
+7. Накрыть крышкой и тушить 20 минут
+
+<b>КБЖУ:</b> 528 ккал | Б: 45 г | Ж: 14 г | У: 52 г"""
+        }
+    },
+
+    1800: {
+        1: {
+            "breakfast": """🌅 <b>Завтрак — Гречневая каша с ягодами</b>
+
+<b>Ингредиенты:</b>
+• Гречневая крупа - 160 г
+• Сливочное масло - 20 г
+• Сахарозаменитель по вкусу
+• Свежие ягоды (можно использовать замороженные) - 250 г
+
+<b>Приготовление:</b>
+1. Отварить гречневую крупу в подслащенной воде до готовности
+2. Подавать кашу с ягодами и сливочным маслом
+
+<b>КБЖУ:</b> 774 ккал | Б: 23,6 г | Ж: 22,4 г | У: 134 г""",
+
+            "lunch": """🍽 <b>Обед — Макароны с беконом</b>
+
+<b>Ингредиенты:</b>
+• Бекон сырокопченый - 50 г
+• Макароны ТСП - 120 г
+
+<b>Приготовление:</b>
+1. Отварить макароны в подсоленной воде
+2. Обжарить бекон на сухой сковороде и добавить к макаронам
+
+<b>КБЖУ:</b> 606 ккал | Б: 21 г | Ж: 21 г | У: 94 г""",
+
+            "dinner": """🌙 <b>Ужин — Запеченный стейк форели</b>
+
+<b>Ингредиенты:</b>
+• Стейк форели - 200 г
+• Оливковое масло - 10 г
+• Соль, специи по вкусу
+• Свежие овощи на свой вкус, заправить оливковым маслом
+
+<b>Приготовление:</b>
+1. Форель сбрызнуть лимоном, натереть маслом, солью, специями, завернуть в фольгу
+2. Запекать в духовке 30 минут при 200°C
+
+<b>КБЖУ:</b> 425 ккал | Б: 57,6 г | Ж: 21,2 г | У: 0 г"""
+        },
+        2: {
+            "breakfast": """🌅 <b>Завтрак — Овсянка с фруктами и орехами</b>
+
+<b>Ингредиенты:</b>
+• Овсянка - 100 г
+• Молоко 1,5% - 200 мл
+• Банан - 100 г
+• Орехи - 40 г
+• Сахарозаменитель по вкусу
+
+<b>Приготовление:</b>
+1. Сварить овсянку в молоке или воде до готовности
+2. Переложить овсянку в тарелку, добавить нарезанный банан и орехи. Подавать горячим
+
+<b>КБЖУ:</b> 749 ккал | Б: 25 г | Ж: 26 г | У: 108 г""",
+
+            "lunch": """🍽 <b>Обед — Филе окуня с рисом</b>
+
+<b>Ингредиенты:</b>
+• Филе окуня - 400 г
+• Рис Басмати - 70 г
+• Соль, специи по вкусу
+
+<b>Приготовление:</b>
+1. Отварить рис до готовности
+2. Филе окуня промыть и обсушить бумажным полотенцем
+3. Посыпать филе специями для рыбы и солью
+4. Выложить филе шкуркой вниз на фольгу, загнуть края
+5. Выпекать в разогретой до 200°C духовке 20 минут, развернуть фольгу и выпекать еще 10 минут
+
+<b>КБЖУ:</b> 553 ккал | Б: 78 г | Ж: 3,9 г | У: 49,7 г""",
+
+            "dinner": """🌙 <b>Ужин — Говядина с фунчозой</b>
+
+<b>Ингредиенты:</b>
+• Говядина тазобедренная - 150 г
+• Фунчоза - 50 г
+• Красный перец - 70 г
+• Помидор - 50 г
+• Зубчик чеснока - 1 шт
+• Соевый соус - 50 мл
+• Оливковое масло - 1 ч.л.
+• Соль, перец по вкусу
+
+<b>Приготовление:</b>
+1. Мелко нарезать чеснок. Половину добавить в кипяток с фунчозой на 5 мин
+2. Вторую половину чеснока обжарить на сковороде с маслом
+3. Мелко нарезать овощи и добавить к чесноку
+4. Говядину нарезать кубиками, посолить, поперчить, добавить к овощам. Жарить до готовности
+5. Слить воду с фунчозы и добавить к говядине
+
+<b>КБЖУ:</b> 540 ккал | Б: 33 г | Ж: 24 г | У: 51 г"""
+        },
+        3: {
+            "breakfast": """🌅 <b>Завтрак — Фруктовый йогурт с мюсли</b>
+
+<b>Ингредиенты:</b>
+• Греческий йогурт - 180 г
+• Мюсли - 70 г
+• Банан - 100 г
+• Клубника - 100 г
+• Мёд или кленовый сироп - 1 ч.л
+
+<b>Приготовление:</b>
+1. Налить йогурт в чашку или тарелку
+2. Добавить мюсли и нарезанные фрукты и ягоды
+3. Полить медом или кленовым сиропом по вкусу
+
+<b>КБЖУ:</b> 588 ккал | Б: 19,7 г | Ж: 25,0 г | У: 68,7 г""",
+
+            "lunch": """🍽 <b>Обед — Отварная гречка и жареное филе курицы с овощами</b>
+
+<b>Ингредиенты:</b>
+• Гречка - 90 г
+• Куриное филе - 200 г
+• Овощная смесь - 100 г
+• Соль, специи по вкусу
+
+<b>Приготовление:</b>
+1. Отварить гречку до готовности
+2. Куриное филе вымыть, нарезать на мелкие кусочки, посолить и поперчить
+3. На разогретую сковороду налить 50 мл горячей воды, выложить овощную смесь и тушить под крышкой 5 минут
+4. Добавить куриное филе и жарить по 5 минут с каждой стороны на среднем огне
+5. Подавать со свежими овощами
+
+<b>КБЖУ:</b> 555 ккал | Б: 33,5 г | Ж: 5,5 г | У: 65,8 г""",
+
+            "dinner": """🌙 <b>Ужин — Паста с томатным соусом</b>
+
+<b>Ингредиенты:</b>
+• Спагетти - 100 г
+• Томатного соуса - 250 г
+• Чеснок - 2 зубчика
+• Оливкового масла - 1 ст.л.
+• Соль и перец по вкусу
+
+<b>Приготовление:</b>
+1. В кастрюле с кипящей подсоленной водой отварить пасту до готовности
+2. В глубокой сковороде разогреть оливковое масло и обжарить измельченный чеснок до золотистого цвета
+3. Добавить томатный соус, приправить солью и перцем, довести до кипения и готовить 5-7 минут
+4. К готовой пасте добавить готовый томатный соус и перемешать
+
+<b>КБЖУ:</b> 660 ккал | Б: 15,6 г | Ж: 30,4 г | У: 85,4 г"""
+        },
+        4: {
+            "breakfast": """🌅 <b>Завтрак — Тосты с авокадо и помидорами</b>
+
+<b>Ингредиенты:</b>
+• Хлеб - 80 г (2 кусочка по 40 г)
+• Авокадо - 150 г
+• Помидор - 1 шт
+• Яйцо - 2 шт
+• Соль и перец по вкусу
+
+<b>Приготовление:</b>
+1. Поджарить тосты из хлеба
+2. Размять авокадо вилкой до состояния пюре, намазать на тосты
+3. Нарезать помидор тонкими ломтиками и выложить на авокадо
+4. Посолить и поперчить по вкусу
+5. Приготовить яйца пашот и подавать сверху на тост
+
+<b>КБЖУ:</b> 719 ккал | Б: 26 г | Ж: 35 г | У: 51 г""",
+
+            "lunch": """🍽 <b>Обед — Отварной булгур с тилапией</b>
+
+<b>Ингредиенты:</b>
+• Филе тилапии - 250 г
+• Булгур - 100 г
+
+<b>Приготовление:</b>
+1. Отварить булгур до готовности
+2. Тилапию хорошо промыть, посолить, поперчить и выложить на разогретую сковороду с маслом
+3. Обжарить с двух сторон на среднем огне по 5 минут
+4. Накрыть крышкой, уменьшить огонь и оставить на 5 минут
+
+<b>КБЖУ:</b> 626 ккал | Б: 38,7 г | Ж: 10,4 г | У: 40 г""",
+
+            "dinner": """🌙 <b>Ужин — Чилийский красный карри с курицей</b>
+
+<b>Ингредиенты:</b>
+• Куриное филе - 250 г
+• Луковица - 1/2 шт
+• Чеснок - 1 зубчик
+• Красная карри-паста - 1 ст.л.
+• Кокосовое молоко - 200 мл
+• Оливковое масло - 1/2 ст.л.
+• Соль и перец по вкусу
+• Свежая кинза для подачи
+
+<b>Приготовление:</b>
+1. В большой кастрюле разогреть оливковое масло и обжарить лук и чеснок до мягкости
+2. Добавить куриную грудку и обжаривать до золотистости
+3. Добавить карри-пасту и обжаривать еще 1-2 минуты
+4. Постепенно влить кокосовое молоко, посолить и поперчить, довести до кипения, затем уменьшить огонь и тушить под крышкой 20-25 минут
+5. Подавать горячим, посыпав свежей кинзой
+
+<b>КБЖУ:</b> 455 ккал | Б: 54 г | Ж: 22 г | У: 10,1 г"""
+        },
+        5: {
+            "breakfast": """🌅 <b>Завтрак — Омлет с овощами и сыром</b>
+
+<b>Ингредиенты:</b>
+• Яйца - 4 шт
+• Помидоры - 40 г
+• Перец - 30 г
+• Лук - 20 г
+• Тертый сыр - 40 г
+• Соль и перец по вкусу
+
+<b>Приготовление:</b>
+1. Взбить яйца в миске, добавить нарезанные овощи, соль и перец
+2. Разогреть сковороду на среднем огне, вылить смесь яиц
+3. Посыпать тертым сыром сверху и готовить до тех пор, пока омлет не станет упругим
+
+<b>КБЖУ:</b> 518 ккал | Б: 38,7 г | Ж: 35,5 г | У: 6,1 г""",
+
+            "lunch": """🍽 <b>Обед — Макароны с куриными котлетами</b>
+
+<b>Ингредиенты:</b>
+• Макароны ТСП - 100 г
+• Куриное филе - 150 г
+• Яйцо - 1 шт
+• Оливковое масло - 10 г
+• Соль, специи, укроп по вкусу
+
+<b>Приготовление:</b>
+1. Отварить макароны до готовности
+2. Куриное филе очень мелко нарезать, добавить яйцо, специи, мелко нарезанную зелень и сформировать котлетки
+3. На разогретую сковороду с маслом выложить котлетки и обжаривать с каждой стороны по 5 минут
+4. Накрыть крышкой и дать постоять еще 5 минут с каждой стороны на медленном огне
+
+<b>КБЖУ:</b> 684 ккал | Б: 52 г | Ж: 18,8 г | У: 70 г""",
+
+            "dinner": """🌙 <b>Ужин — Филе окуня запеченное с картофелем</b>
+
+<b>Ингредиенты:</b>
+• Филе окуня - 250 г
+• Картофель - 200 г
+• Сыр гауда - 30 г
+• Оливковое масло - 15 г
+• Зелень по вкусу
+
+<b>Приготовление:</b>
+1. Отварить картофель в мундире до полуготовности (10 минут)
+2. Сделать надрез в каждом картофеле, выложить тертый сыр и мелко нарезанную зелень
+3. Завернуть в фольгу и запекать еще 15 минут при 200°C
+4. Филе окуня промыть и обсушить, посыпать специями для рыбы и солью
+5. Выложить филе шкуркой вниз на фольгу, загнуть края
+6. Выпекать в разогретой до 200°C духовке 20 минут, развернуть фольгу и выпекать еще 10 минут
+7. Подавать с овощами
+
+<b>КБЖУ:</b> 598 ккал | Б: 57 г | Ж: 26 г | У: 32 г"""
+        },
+        6: {
+            "breakfast": """🌅 <b>Завтрак — Каша рисовая с курицей и беконом</b>
+
+<b>Ингредиенты:</b>
+• Рис басмати - 120 г
+• Томаты - 150 г
+• Бекон варено-копченый (Окраина) - 50 г
+• Куриное филе - 100 г
+• Зелень по вкусу
+• Соль, перец по вкусу
+
+<b>Приготовление:</b>
+1. Бекон нарезать произвольно и выложить на разогретую сухую сковороду. Обжарить до румяности
+2. Куриное филе нарезать произвольно. Добавить филе вместе с рисом к бекону, обжарить несколько минут
+3. Томаты нарезать произвольно, добавить к рису. Жарить пару минут
+4. Залить водой и варить по инструкции на упаковке
+5. Когда все готово — добавить зелень, посолить, поперчить по вкусу
+
+<b>КБЖУ:</b> 776 ккал | Б: 35 г | Ж: 20 г | У: 62 г""",
+
+            "lunch": """🍽 <b>Обед — ПП хачапури</b>
+
+<b>Ингредиенты:</b>
+• Творог 5% - 100 г
+• Яйцо - 1 шт
+• Желток - 1 шт
+• Рисовая мука - 40 г
+• Разрыхлитель - 1/2 ч.л.
+• Легкий сыр - 40 г
+
+<b>Приготовление:</b>
+1. Творог, яйцо, муку и разрыхлитель смешать вилкой
+2. Слепить форму-лодочку и отправить в разогретую до 180°С духовку на 10 минут
+3. Достать, выложить тертый сыр и снова поставить в духовку до расплавления сыра
+4. Достать, добавить желток и снова поставить в духовку на пару минут
+
+<b>КБЖУ:</b> 512 ккал | Б: 42 г | Ж: 21 г | У: 35,8 г""",
+
+            "dinner": """🌙 <b>Ужин — Отварная гречка с куриным фаршем и томатной пастой</b>
+
+<b>Ингредиенты:</b>
+• Гречка - 70 г
+• Куриное филе - 150 г
+• Оливковое масло - 15 г
+• Томатная паста - 15 г
+• Соль, специи по вкусу
+• Зелень по вкусу
+
+<b>Приготовление:</b>
+1. Отварить гречку до готовности
+2. Куриное филе измельчить в фарш, посолить, поперчить
+3. На разогретую сковороду с маслом выложить фарш и тушить с небольшим добавлением воды 10 минут под крышкой
+4. Добавить томатную пасту и отварную гречку
+5. Накрыть крышкой и дать постоять 5 минут на слабом огне, добавить зелень
+
+<b>КБЖУ:</b> 530,8 ккал | Б: 43,8 г | Ж: 19,1 г | У: 46 г"""
+        },
+        7: {
+            "breakfast": """🌅 <b>Завтрак — Лаваш с сыром и яйцом</b>
+
+<b>Ингредиенты:</b>
+• Лаваш армянский - 120 г
+• Яйцо - 3 шт
+• Сулугуни - 60 г
+• Соль, специи, зелень
+
+<b>Приготовление:</b>
+1. Вырезать из лаваша два круга по диаметру сковороды
+2. Сыр натереть на крупной терке
+3. На разогретую сковороду выложить первый круг лаваша, вылить на него взбитое яйцо, высыпать половину сыра. Посолить, поперчить, добавить зелень
+4. Накрыть вторым кругом лаваша, перевернуть и высыпать оставшийся сыр
+
+<b>КБЖУ:</b> 716 ккал | Б: 42,4 г | Ж: 33,6 г | У: 58,3 г""",
+
+            "lunch": """🍽 <b>Обед — Макароны с яйцом и сыром</b>
+
+<b>Ингредиенты:</b>
+• Макароны ТСП - 100 г
+• Яйцо - 2 шт
+• Сыр - 50 г
+
+<b>Приготовление:</b>
+1. Отварить макароны в подсоленной воде
+2. Переложить макароны на разогретую сковороду, добавить яйцо и тертый сыр, готовить 3 минуты под крышкой
+
+<b>КБЖУ:</b> 483 ккал | Б: 36 г | Ж: 27,3 г | У: 70,3 г""",
+
+            "dinner": """🌙 <b>Ужин — Говядина с луком и овощной смесью + салат летний</b>
+
+<b>Ингредиенты:</b>
+• Вырезка говяжья - 130 г
+• Лук - 50 г
+• Овощная смесь - 100 г
+• Оливковое масло - 1 ст. л.
+• Соль, специи по вкусу
+
+<b>Приготовление:</b>
+1. Лук нарезать кольцами и быстро обжарить
+2. Добавить овощную смесь и тушить 10 минут под крышкой
+3. Мелко нарезать говядину, выложить на сковороду и жарить по 7 минут с каждой стороны на среднем огне
+
+<b>Ингредиенты для салата:</b>
+• Огурец свежий- 150 г
+• Редис - 150 г
+• Укроп - 15 г
+• Йогурт натуральный - 100 г
+• Оливковое масло 1 ч.л.
+• Соль, специи по вкусу
+
+<b>Приготовление салата:</b>
+1. Огурцы и редис нарезать колечками, зелень мелко порубить
+2. Заправить овощи йогуртом, маслом, зеленью и специями
+
+<b>КБЖУ говядины:</b> 449,8 ккал | Б: 27,7 г | Ж: 31 г | У: 15,2 г
+<b>КБЖУ салата:</b> 161,7 ккал | Б: 7,56 г | Ж: 7,56 г | У: 16,38 г"""
+        },
+        8: {
+            "breakfast": """🌅 <b>Завтрак — Горячий сэндвич с яйцом</b>
+
+<b>Ингредиенты:</b>
+• Хлеб ц/з - 80 г
+• Яйцо - 3 шт
+• Сливочное масло - 15 г
+• Ветчина из индейки - 70 г
+• Сыр 15% - 15 г
+• Специи - по вкусу
+
+<b>Приготовление:</b>
+1. Взять два кусочка хлеба, из одного вырезать мякиш (сделать в центре окошко)
+2. На сковороду добавить 3 г сливочного масла, выложить заготовку из хлеба
+3. В окошко разбить яйцо, выложить сверху ветчину и сыр, накрыть вторым кусочком хлеба
+4. Сверху хлеб смазать сливочным маслом и перевернуть сэндвич
+
+<b>КБЖУ:</b> 727 ккал | Б: 38 г | Ж: 42 г | У: 43 г""",
+
+            "lunch": """🍽 <b>Обед — Отварной картофель с говядиной</b>
+
+<b>Ингредиенты:</b>
+• Говяжья вырезка - 250 г
+• Оливковое масло - 5 г
+• Чеснок - 1 зубчик
+• Соевый соус - 15 г
+• Картофель мелкий - 160 г
+• Соль, специи по вкусу
+
+<b>Приготовление:</b>
+1. Отварить картофель (20 минут)
+2. Нарезать мясо узкими длинными полосками
+3. Измельчить чеснок
+4. Выложить говядину на разогретую антипригарную сковороду с маслом, посолить, поперчить и жарить на сильном огне примерно 10 минут, постоянно перемешивая
+5. Добавить чеснок, соевый соус, накрыть крышкой и оставить на 5 минут
+6. Подавать с очищенным и подсоленным картофелем
+
+<b>КБЖУ:</b> 625 ккал | Б: 41,8 г | Ж: 29 г | У: 28,8 г""",
+
+            "dinner": """🌙 <b>Ужин — Креветки с чесночным соусом + салат из свежих овощей</b>
+
+<b>Ингредиенты:</b>
+• Креветки очищенные - 350 г
+• Чеснок - 4 зубчика
+• Оливковое масло - 2 ст.л.
+• Свежий лимонный сок - 2 ст.л.
+• Свежая петрушка для подачи
+• Соль и перец по вкусу
+• Свежие овощи на свой вкус
+
+<b>Приготовление:</b>
+1. Разогреть оливковое масло на сковороде на среднем огне, добавить чеснок и обжарить до золотистости
+2. Добавить креветки, посыпать солью и перцем, и обжаривать, пока они не станут розовыми
+3. Полить свежевыжатым лимонным соком и обжаривать еще 1-2 минуты
+4. Посыпать свежей петрушкой и подавать горячими с салатом из свежих овощей
+
+<b>КБЖУ:</b> 461 ккал | Б: 69,7 г | Ж: 15,2 г | У: 12,7 г"""
+        },
+        9: {
+            "breakfast": """🌅 <b>Завтрак — Яичные буррито</b>
+
+<b>Ингредиенты:</b>
+• Яйца - 2 шт
+• Тортилья - 2 шт
+• Сыр - 50 г
+• Помидоры - 50 г
+• Зеленый лук
+• Соль и перец по вкусу
+
+<b>Приготовление:</b>
+1. Взбить яйца в миске, добавить соль и перец по вкусу
+2. Обжарить яйца на сковороде до готовности
+3. Разложить яйца, натертый сыр, зеленый лук и помидоры по тортильям
+4. Свернуть буррито
+
+<b>КБЖУ:</b> 755 ккал | Б: 35 г | Ж: 37 г | У: 65 г""",
+
+            "lunch": """🍽 <b>Обед — Стейк лосося с гречкой</b>
+
+<b>Ингредиенты:</b>
+• Стейк лосося - 250 г
+• Гречка - 70 г
+• Оливковое масло - 15 г
+
+<b>Приготовление:</b>
+1. Отварить гречку до готовности
+2. Филе лосося вымыть, обсушить, снять чешую
+3. Посолить, поперчить, смазать оливковым маслом, можно сбрызнуть лимонным соком
+4. Выложить на разогретую сковороду и обжаривать с каждой стороны по 7 минут
+
+<b>КБЖУ:</b> 708 ккал | Б: 58,5 г | Ж: 33 г | У: 43 г""",
+
+            "dinner": """🌙 <b>Ужин — Фаршированные баклажаны</b>
+
+<b>Ингредиенты:</b>
+• Баклажан - 1 средний
+• Фарш (говядина, свинина или курица) - 100 г
+• Луковица - ½ шт
+• Помидор - 1шт
+• Чеснок - 1 зубчик
+• Оливковое масло - 1 ст.л
+• Соль и перец по вкусу
+
+<b>Приготовление:</b>
+1. Нарезать баклажаны вдоль на половинки
+2. Срезать мякоть и аккуратно вынуть ее, чтобы получить лодочки
+3. Обжарить фарш с луком и чесноком до золотистости
+4. Добавить измельченную мякоть баклажана и помидоры, готовить еще 5 минут
+5. Выложить фаршированные лодочки баклажана на противень, заполнить их фаршем
+6. Посыпать сверху тертым сыром и запекать в предварительно разогретой духовке при 180°C около 20 минут или до готовности
+
+<b>КБЖУ:</b> 385 ккал | Б: 21 г | Ж: 25,4 г | У: 16 г"""
+        },
+        10: {
+            "breakfast": """🌅 <b>Завтрак — Овсяноблин</b>
+
+<b>Ингредиенты:</b>
+• Овсянка долгой варки - 110 г
+• Яйцо - 2 шт
+• Белок - 1 шт
+• Сахарозаменитель, щепотка соды для пышности
+• Корица (по желанию)
+
+<b>Приготовление:</b>
+1. Овсянку измельчить в муку с помощью кофемолки, добавить сухие ингредиенты
+2. Добавить яйцо и белок, столовую ложку воды, перемешать
+3. Вылить тесто на разогретую сковороду и обжаривать на слабом огне под крышкой с двух сторон
+
+<b>КБЖУ:</b> 587 ккал | Б: 29,3 г | Ж: 19,9 г | У: 77,7 г""",
+
+            "lunch": """🍽 <b>Обед — Тушеные овощи с красной чечевицей</b>
+
+<b>Ингредиенты:</b>
+• Красная чечевица - 110 г
+• Морковь - 1 шт
+• Красный перец - 1 шт
+• Кабачок - 1 шт
+• Луковица - ½ шт
+• Томатная паста - 2 ст.л.
+• Овощной бульон - 0,7 литра
+• Оливковое масло - 1 ч.л.
+• Соль и перец по вкусу
+
+<b>Приготовление:</b>
+1. Заранее замочить чечевицу в воде и оставить на ночь
+2. В большой кастрюле разогреть оливковое масло и обжарить лук до прозрачности
+3. Добавить морковь, перец и кабачок, тушить около 5 минут
+4. Добавить замоченную чечевицу, томатную пасту и овощной бульон
+5. Довести до кипения, затем уменьшить огонь и тушить около 20-25 минут или пока чечевица не станет мягкой
+6. Приправить солью и перцем по вкусу и подавать
+
+<b>КБЖУ:</b> 510 ккал | Б: 23,4 г | Ж: 8 г | У: 81,1 г""",
+
+            "dinner": """🌙 <b>Ужин — Запеченный картофель с горбушей</b>
+
+<b>Ингредиенты:</b>
+• Стейк горбуши - 300 г
+• Картофель - 200 г
+• Лук - 30 г
+• Морковь - 100 г
+• Оливковое масло - 20 г
+• Специи, соль, зелень
+
+<b>Приготовление:</b>
+1. Горбушу посолить, поперчить, смазать маслом и выложить на овощную подушку из нарезанных овощей, запекать в разогретой до 220°C духовке 20-25 минут
+2. Картофель вымыть и запекать в мундире в микроволновке 10-15 минут на максимальной мощности, разрезать, посолить, добавить масло и запекать еще 10 минут
+
+<b>КБЖУ:</b> 732 ккал | Б: 57 г | Ж: 37,3 г | У: 42,7 г"""
+        },
+        11: {
+            "breakfast": """🌅 <b>Завтрак — Рисовый блин с яблоком</b>
+
+<b>Ингредиенты:</b>
+• Рис (белый длиннозерный) - 100 г
+• Яйцо - 3 шт
+• Яблоко - 50 г
+• Корица, сахзам по вкусу
+
+<b>Приготовление:</b>
+1. Рис отварить до готовности и слегка остудить
+2. Добавить яйца и перемешать
+3. Добавить тертое яблоко и сухие ингредиенты
+4. Жарить с двух сторон до золотистой корочки под крышкой на медленном огне
+
+<b>КБЖУ:</b> 636 ккал | Б: 27,8 г | Ж: 18,6 г | У: 84,6 г""",
+
+            "lunch": """🍽 <b>Обед — Лосось с макаронами и овощами</b>
+
+<b>Ингредиенты:</b>
+• Стейк лосося - 150 г
+• Макароны ТСП - 60 г
+• Оливковое масло - 5 г
+• Овощная смесь - 100 г
+
+<b>Приготовление:</b>
+1. Отварить макароны до готовности
+2. Филе лосося вымыть, обсушить, снять чешую
+3. Посолить, поперчить, смазать оливковым маслом, можно сбрызнуть лимонным соком
+4. Выложить на разогретую сковороду и обжаривать с каждой стороны по 7 минут
+5. Добавить овощную смесь и тушить еще 5 минут с водой
+
+<b>КБЖУ:</b> 514 ккал | Б: 38 г | Ж: 18 г | У: 51 г""",
+
+            "dinner": """🌙 <b>Ужин — Хачапури в духовке</b>
+
+<b>Ингредиенты:</b>
+• Яйцо - 1 шт
+• Яичный желток - 1 шт
+• Творог 2% - 250 г
+• Рисовая мука - 40 г
+• Сыр - 30 г
+• Соль, специи по вкусу
+
+<b>Приготовление:</b>
+1. Творог хорошо отжать от влаги
+2. Добавить к нему яйцо, муку, соль, перемешать
+3. Сформировать лодочку, сделать в ней проколы вилкой и отправить в разогретую на 200°C духовку на 20 минут
+4. Достать, посыпать тертым сыром и отправить в духовку еще на 5 минут
+5. В центр добавить желток и запекать в духовке еще 2 минуты, посыпать солью
+
+<b>КБЖУ:</b> 671 ккал | Б: 65,6 г | Ж: 25,8 г | У: 41 г"""
+        },
+        12: {
+            "breakfast": """🌅 <b>Завтрак — Отварная овсянка и яйца</b>
+
+<b>Ингредиенты:</b>
+• Овсянка - 80 г
+• Яйца - 3 шт
+
+<b>Приготовление:</b>
+1. Отварить овсянку до готовности (10 минут варить и еще 5 держать под крышкой)
+2. Добавить соль/сахзам
+3. Отварить яйца (2-5 минут в зависимости от желаемой консистенции желтка)
+
+<b>КБЖУ:</b> 556 ккал | Б: 30 г | Ж: 23,8 г | У: 56,9 г""",
+
+            "lunch": """🍽 <b>Обед — Куриное филе в сливках с грибами под сырной шапочкой</b>
+
+<b>Ингредиенты:</b>
+• Куриное филе - 150 г
+• Шампиньоны - 120 г
+• Сливки 33% - 40 г
+• Сыр гауда - 40 г
+• Оливковое масло - 15 г
+
+<b>Приготовление:</b>
+1. Грибы вымыть, нарезать кольцами и обжарить на сухой сковороде по 3 минуты
+2. Куриное филе мелко нарезать, выложить на разогретую сковороду с маслом, обжаривать под крышкой 5-7 минут на слабом огне
+3. Добавить сливки, сверху натереть сыр
+4. Выключить огонь и дать настояться 3 минуты
+
+<b>КБЖУ:</b> 558 ккал | Б: 50,8 г | Ж: 36,4 г | У: 2 г""",
+
+            "dinner": """🌙 <b>Ужин — Овощная лепешка с сыром</b>
+
+<b>Ингредиенты:</b>
+• Кабачок - 100 г
+• Морковь - 50 г
+• Сыр - 40 г
+• Яйцо - 2 шт
+• Сметана 20% - 30 г
+• Рисовая мука – 70 г
+• Зелень по вкусу
+
+<b>Приготовление:</b>
+1. Овощи натереть на терке, отжать лишнюю жидкость
+2. Добавить тертый сыр, яйца и сметану
+3. Добавить рисовую муку и щепотку соды
+4. Все перемешать и выложить на сковороду
+5. Жарить под крышкой на слабом огне
+
+<b>КБЖУ:</b> 697 ккал | Б: 31 г | Ж: 32 г | У: 67 г"""
+        },
+        13: {
+            "breakfast": """🌅 <b>Завтрак — Сырники с ягодами</b>
+
+<b>Ингредиенты:</b>
+• Рисовая мука - 2 ст.л.
+• Яйцо - 1 шт
+• Творог 2% - 250 г
+• Сливочное масло - 5 г
+• Ягоды - 100 г
+• Подсластитель по вкусу
+• Щепотка соды
+
+<b>Приготовление:</b>
+1. Творог смешать с яйцом, постепенно добавить муку, подсластитель и соду
+2. Слепить сырники и обвалять их в муке
+3. Обжарить с двух сторон под крышкой на медленном огне, предварительно смазав сковороду сливочным маслом
+4. Подавать сырники с ягодами
+
+<b>КБЖУ:</b> 567 ккал | Б: 55,5 г | Ж: 15,2 г | У: 48,1 г""",
+
+            "lunch": """🍽 <b>Обед — Форель с макаронами на сковороде в маринаде</b>
+
+<b>Ингредиенты:</b>
+• Стейк форели - 200 г
+• Макароны ТСП - 60 г
+• Масло оливковое - 10 г
+• Лимон (цедра лимона) - 0,5 шт
+• Чеснок - 2 зубчика
+• Паприка молотая - 1 ч. ложка
+• Тмин сушёный - 1 ч. ложка
+• Перец красный молотый - на кончике ножа
+• Соль - 1/3 ч. ложки
+• Перец чёрный молотый - на кончике чайной ложки
+
+<b>Приготовление:</b>
+1. Отварить макароны до готовности
+2. Снять цедру лимона, добавить специи, чеснок и масло
+3. Выложить стейк в маринад и оставить на 5 минут
+4. Выложить рыбу на хорошо разогретую сковороду и жарить по 5 минут с каждой стороны на среднем огне
+
+<b>КБЖУ:</b> 533 ккал | Б: 45,8 г | Ж: 17,6 г | У: 46,2 г""",
+
+            "dinner": """🌙 <b>Ужин — Плов с курицей</b>
+
+<b>Ингредиенты:</b>
+• Лук - 100 г
+• Морковь - 100 г
+• Куриное филе - 200 г
+• Рис (белый длиннозерный) - 80 г
+• Оливковое масло - 15 г
+• Соль, специи по вкусу
+
+<b>Приготовление:</b>
+1. Обжарить лук и морковь
+2. Добавить нарезанное филе
+3. Посолить, добавить специи и тушить под крышкой 5-7 минут
+4. Добавить рис и залить кипятком, тушить 20-25 минут
+
+<b>КБЖУ:</b> 708 ккал | Б: 54 г | Ж: 18,4 г | У: 80 г"""
+        },
+        14: {
+            "breakfast": """🌅 <b>Завтрак — Овсянка с сыром и яйцами</b>
+
+<b>Ингредиенты:</b>
+• Овсянка долгой варки - 90 г
+• Сыр - 50 г
+• Яйца - 3 шт
+
+<b>Приготовление:</b>
+1. Отварить овсянку до готовности
+2. Натереть сыр в овсянку и перемешать
+3. Отварить яйца 2-5 минут
+
+<b>КБЖУ:</b> 769 ккал | Б: 43,5 г | Ж: 39,7 г | У: 63,5 г""",
+
+            "lunch": """🍽 <b>Обед — Картофель с лососем на гриле</b>
+
+<b>Ингредиенты:</b>
+• Стейк лосося - 200 г
+• Картофель - 130 г
+• Специи, соль, зелень
+
+<b>Приготовление:</b>
+1. Очистить картофель и нарезать дольками
+2. Стейк лосося вымыть, посолить и добавить приправы, сбрызнуть лимонным соком
+3. Отправить картофель и лосось на гриль, периодически переворачивая
+
+<b>КБЖУ:</b> 382 ккал | Б: 42 г | Ж: 13,7 г | У: 21 г""",
+
+            "dinner": """🌙 <b>Ужин — Куриный карри с овощами</b>
+
+<b>Ингредиенты:</b>
+• Куриное филе - 250 г
+• Красная карри-паста - 1 ст.л.
+• Крупная морковь - 1 шт
+• Красный перец - 1 шт
+• Луковица - 1 шт
+• Чеснок - 2 зубчика
+• Кокосовое молоко - 400 мл
+• Оливковое масло - 1 ст.л.
+• Соль и перец по вкусу
+• Свежая зелень для подачи
+
+<b>Приготовление:</b>
+1. В большой сковороде разогреть оливковое масло на среднем огне
+2. Обжарить измельченный лук, морковь и перец до мягкости
+3. Добавить куриное филе и обжарить до золотистой корочки
+4. Добавить карри-пасту и обжаривать еще 1-2 минуты
+5. Влить кокосовое молоко и довести до кипения
+6. Готовить на среднем огне 10-15 минут, пока соус не загустеет
+7. Подавать, посыпав свежей зеленью
+
+<b>КБЖУ:</b> 481 ккал | Б: 62 г | Ж: 11,4 г | У: 19 г"""
+        }
+    },
+
+    1900: {
+        1: {
+            "breakfast": """🌅 <b>Завтрак — Гречневые блинчики на молоке</b>
+
+<b>Ингредиенты:</b>
+• Гречневая мука – 120 г
+• Молоко 2,5% - 180 мл
+• Яйцо – 2 шт
+• Вода - 50 мл
+• Мёд - 1 ст.л.
+• Сахарозаменитель, щепотка соли
+
+<b>Приготовление:</b>
+1. Смешать муку, яйца, молоко, воду, соль и сахарозаменитель до однородного теста
+2. Выпекать блинчики на разогретой сковороде до золотистой корочки
+3. Подавать с медом
+
+<b>КБЖУ:</b> 736 ккал | Б: 36 г | Ж: 19,4 г | У: 97 г""",
+
+            "lunch": """🍽 <b>Обед — Паста с креветками</b>
+
+<b>Ингредиенты:</b>
+• Креветки королевские очищенные - 100г
+• Макароны ТСП - 50 г
+• Сливки 33% - 20 г
+• Сыр Гауда - 20 г
+• Зелень, соль, специи
+
+<b>Приготовление:</b>
+1. Отварить макароны до готовности
+2. Обжарить креветки на сковороде с солью и специями
+3. Добавить макароны, тушить под крышкой 3 минуты
+4. Влить сливки, добавить тертый сыр и зелень, перемешать и прогреть еще минуту
+
+<b>КБЖУ:</b> 386 ккал | Б: 30 г | Ж: 13,3 г | У: 36,3 г""",
+
+            "dinner": """🌙 <b>Ужин — Горбуша в духовке с рисом + Салат "Летний"</b>
+
+<b>Ингредиенты для горбуши:</b>
+• Стейк горбуши - 250 г
+• Рис Жасмин - 50 г
+• Морковь - 50 г
+• Лук - 25 г
+• Оливковое масло - 15 г
+• Зелень, соль, перец
+
+<b>Приготовление:</b>
+1. Отварить рис до готовности
+2. Нарезанные овощи выложить на фольгу, сбрызнуть маслом
+3. Сверху выложить посоленную и поперченную горбушу
+4. Запекать в духовке 20 минут в фольге, затем 10 минут без фольги
+
+<b>КБЖУ горбуши:</b> 685 ккал | Б: 55,5 г | Ж: 31,5 г | У: 45,4 г
+
+<b>Ингредиенты для салата:</b>
+• Огурец – 150 г
+• Редис – 150 г
+• Йогурт натуральный – 100 г
+• Укроп – 15 г
+• Оливковое масло – 1 ч. л.
+• Соль, специи
+
+<b>Приготовление салата:</b>
+1. Огурцы и редис нарезать, зелень порубить
+2. Заправить йогуртом, маслом, зеленью и специями
+
+<b>КБЖУ салата:</b> 161 ккал | Б: 7 г | Ж: 7 г | У: 16 г"""
+        },
+        2: {
+            "breakfast": """🌅 <b>Завтрак — Блинчики с творогом</b>
+
+<b>Ингредиенты:</b>
+• Мука — 60 г
+• Молоко — 150 мл
+• Яйцо — 1 шт
+• Творог — 100 г
+• Сметана — 30 г
+
+<b>Приготовление:</b>
+1. Приготовить тесто, испечь блинчики
+2. Начинить творогом
+3. Подавать со сметаной
+
+<b>КБЖУ:</b> 450 ккал | Б: 22 г | Ж: 16 г | У: 52 г""",
+
+            "lunch": """🍽 <b>Обед — Шашлык из свинины с овощами</b>
+
+<b>Ингредиенты:</b>
+• Свинина нежирная — 150 г
+• Болгарский перец — 100 г
+• Лук — 80 г
+• Помидоры — 100 г
+
+<b>Приготовление:</b>
+1. Мясо замариновать, нанизать на шампуры
+2. Чередовать с овощами
+3. Запечь в духовке или на гриле
+
+<b>КБЖУ:</b> 480 ккал | Б: 36 г | Ж: 28 г | У: 16 г""",
+
+            "dinner": """🌙 <b>Ужин — Рыбные котлеты с салатом</b>
+
+<b>Ингредиенты:</b>
+• Филе трески — 150 г
+• Лук — 30 г
+• Яйцо — 1/2 шт
+• Салатный микс — 100 г
+
+<b>Приготовление:</b>
+1. Рыбу измельчить с луком
+2. Добавить яйцо, сформировать котлеты
+3. Запечь, подавать с салатом
+
+<b>КБЖУ:</b> 220 ккал | Б: 32 г | Ж: 6 г | У: 8 г"""
+        },
+        3: {
+            "breakfast": """🌅 <b>Завтрак — Греческий йогурт с фруктами и гранолой</b>
+
+<b>Ингредиенты:</b>
+• Греческий йогурт - 180 г
+• Гранола - 90 г
+• Ягоды - 100 г
+• Груша - 1 шт
+
+<b>Приготовление:</b>
+1. К греческому йогурту добавить нарезанные фрукты (ягоды, кусочки груши)
+2. Посыпать сверху гранолой
+
+<b>КБЖУ:</b> 594 ккал | Б: 25,25 г | Ж: 14,1 г | У: 90,6 г""",
+
+            "lunch": """🍽 <b>Обед — Печеная картошка с жареной курочкой и зеленым луком</b>
+
+<b>Ингредиенты:</b>
+• Куриное филе - 250 г
+• Картофель - 200 г
+• Масло сливочное - 40 г
+• Соль, специи по вкусу
+• Зеленый лук по вкусу
+
+<b>Приготовление:</b>
+1. Отварить картофель в мундире (20 минут после закипания)
+2. Филе мелко нарезать, посолить, поперчить и обжарить на хорошо разогретой сковороде по 5 минут с каждой стороны
+3. Картофель очистить, нарезать каждую на 4 части, посолить
+4. Отправить картофель на сковороду с курочкой и жарить под крышкой еще 3 минуты с каждой стороны
+5. Добавить сливочное масло и зелень
+
+<b>КБЖУ:</b> 716 ккал | Б: 62 г | Ж: 36 г | У: 32 г""",
+
+            "dinner": """🌙 <b>Ужин — Тилапия на сковороде с овощами</b>
+
+<b>Ингредиенты:</b>
+• Филе тилапии - 400 г
+• Оливковое масло - 20 г
+• Соль, специи по вкусу
+• Помидор - 1 шт
+• Огурец - 1 шт
+• Зелень любая по вкусу
+
+<b>Приготовление:</b>
+1. Филе тилапии натереть солью, специями и обжарить на разогретой сковороде по 5 минут с каждой стороны
+2. Подавать со свежими овощами и зеленью
+
+<b>КБЖУ:</b> 628 ккал | Б: 83,3 г | Ж: 27,3 г | У: 15,7 г"""
+        },
+        4: {
+            "breakfast": """🌅 <b>Завтрак — Творожные блинчики</b>
+
+<b>Ингредиенты:</b>
+• Творог мягкий 0% - 250 г
+• Яйцо - 2 шт
+• Молоко 2,5% - 150 мл
+• Мука рисовая - 45 г
+• Банан - 150 г
+• Сахарозаменитель - по вкусу
+
+<b>Приготовление:</b>
+1. Смешать творог, яйца, молоко, муку и сахарозаменитель до однородной массы
+2. Выпекать на сковороде по 2 минуты с каждой стороны
+3. Подавать с нарезанным бананом
+
+<b>КБЖУ:</b> 651 ккал | Б: 46,6 г | Ж: 13,5 г | У: 87 г""",
+
+            "lunch": """🍽 <b>Обед — Филе окуня с макаронами</b>
+
+<b>Ингредиенты:</b>
+• Филе морского окуня - 250 г
+• Макароны ТСП - 80 г
+• Помидор - 1 шт
+• Огурец - 1 шт
+• Зелень, соль, специи
+
+<b>Приготовление:</b>
+1. Отварить макароны до готовности
+2. Рыбу посолить, поперчить, выложить на фольгу шкуркой вниз
+3. Запекать при 200°C 20 минут под фольгой и еще 10 минут без нее
+4. Подавать со свежими овощами и зеленью
+
+<b>КБЖУ:</b> 529 ккал | Б: 49,6 г | Ж: 6,1 г | У: 72 г""",
+
+            "dinner": """🌙 <b>Ужин — Печень говяжья с рисом</b>
+
+<b>Ингредиенты:</b>
+• Печень говяжья - 200 г
+• Рис - 100 г
+• Помидор - 1 шт
+• Огурец - 1 шт
+• Сметана 10% - 20 г
+• Оливковое масло - 1 ч.л.
+• Соль, перец
+
+<b>Приготовление:</b>
+1. Печень нарезать кубиками, обжарить на масле 5 минут под крышкой
+2. Посолить, поперчить и готовить еще 3 минуты
+3. Рис отварить в подсоленной воде
+4. Овощи нарезать и заправить сметаной
+
+<b>КБЖУ:</b> 756 ккал | Б: 51 г | Ж: 17,8 г | У: 98,2 г"""
+        },
+        5: {
+            "breakfast": """🌅 <b>Завтрак — Тосты с сыром, курицей и рыбой</b>
+
+<b>Ингредиенты:</b>
+• Хлеб ЦЗ - 80 г
+• Творожный сыр - 40 г
+• Куриное филе - 130 г
+• Лосось слабосоленый - 50 г
+• Яйцо - 3 шт
+
+<b>Приготовление:</b>
+1. Поджарить хлеб
+2. Обжарить курицу
+3. Отварить и нарезать яйца
+4. Собрать тосты с разными начинками
+
+<b>КБЖУ:</b> 698 ккал | Б: 63,2 г | Ж: 30,7 г | У: 38,8 г""",
+
+            "lunch": """🍽 <b>Обед — Паста с томатным соусом</b>
+
+<b>Ингредиенты:</b>
+• Филе индейки - 200 г
+• Макароны ТСП - 60 г
+• Томатная паста - 60 г
+• Сыр моцарелла - 40 г
+• Масло сливочное - 5 г
+• Чеснок, соль, перец
+
+<b>Приготовление:</b>
+1. Отварить макароны
+2. Обжарить индейку, добавить пасту и тушить
+3. Добавить сыр, смешать с пастой
+
+<b>КБЖУ:</b> 633 ккал | Б: 69,4 г | Ж: 14,4 г | У: 55,1 г""",
+
+            "dinner": """🌙 <b>Ужин — Жареные креветки с рисом</b>
+
+<b>Ингредиенты:</b>
+• Креветки - 300 г
+• Рис - 50 г
+• Оливковое масло - 15 г
+• Зелень, специи
+
+<b>Приготовление:</b>
+1. Обжарить креветки по 2 минуты с каждой стороны
+2. Отварить рис
+3. Подавать вместе с зеленью
+
+<b>КБЖУ:</b> 601 ккал | Б: 66 г | Ж: 18,3 г | У: 42 г"""
+        },
+        6: {
+            "breakfast": """🌅 <b>Завтрак — Яичница с беконом и авокадо</b>
+
+<b>Ингредиенты:</b>
+• Яйцо - 3 шт
+• Белок - 2 шт
+• Бекон - 40 г
+• Сыр гауда - 40 г
+• Авокадо - 40 г
+• Хлеб ц/з - 100 г
+• Соль, перец, лимонный сок
+
+<b>Приготовление:</b>
+1. Обжарить бекон, добавить яйца
+2. Готовить под крышкой 5 минут
+3. Добавить сыр
+4. Подавать с тостами и авокадо
+
+<b>КБЖУ:</b> 751 ккал | Б: 51,75 г | Ж: 49,3 г | У: 24 г""",
+
+            "lunch": """🍽 <b>Обед — Теплый салат с киноа</b>
+
+<b>Ингредиенты:</b>
+• Куриное филе - 150 г
+• Киноа - 75 г
+• Болгарский перец, огурец, морковь
+• Оливковое масло - 1 ст.л.
+• Соевый соус - 2 ст.л.
+• Лимонный сок
+
+<b>Приготовление:</b>
+1. Отварить киноа, обжарить курицу
+2. Смешать овощи, киноа и курицу
+3. Заправить соусом
+
+<b>КБЖУ:</b> 677 ккал | Б: 48,3 г | Ж: 20,5 г | У: 79,7 г""",
+
+            "dinner": """🌙 <b>Ужин — Рыбный чаудер</b>
+
+<b>Ингредиенты:</b>
+• Филе белой рыбы - 150 г
+• Картофель - 1 шт
+• Лук, сельдерей
+• Сливки 10% - 60 мл
+• Бульон - 300 мл
+• Оливковое масло - 3 ч.л.
+• Соль, перец, зелень
+
+<b>Приготовление:</b>
+1. Обжарить лук и сельдерей
+2. Добавить картофель, бульон, варить
+3. Добавить рыбу, варить 10-15 минут
+4. Влить сливки, приправить
+
+<b>КБЖУ:</b> 454 ккал | Б: 35,7 г | Ж: 23 г | У: 26 Г"""
+        },
+        7: {
+            "breakfast": """🌅 <b>Завтрак — Рисовый блин с сыром</b>
+
+<b>Ингредиенты:</b>
+• Рис - 60 г
+• Яйцо - 2 шт
+• Творожный сыр - 60 г
+• Сметана 10% - 50 г
+• Укроп
+
+<b>Приготовление:</b>
+1. Отварить рис, смешать с яйцами, сметаной и укропом
+2. Обжарить с двух сторон
+3. Смазать творожным сыром
+
+<b>КБЖУ:</b> 527 ккал | Б: 19,7 г | Ж: 27,2 г | У: 48,4 г""",
+
+            "lunch": """🍽 <b>Обед — Тыквенный крем-суп</b>
+
+<b>Ингредиенты:</b>
+• Тыква - 500 г
+• Картофель - 1 шт
+• Лук, чеснок
+• Сливки 33% - 50 мл
+• Бульон - 300 мл
+• Оливковое масло - 1 ст.л.
+• Хлеб Ц/з - 60 г
+
+<b>Приготовление:</b>
+1. Обжарить лук, чеснок, тыкву и картофель
+2. Добавить бульон, варить до мягкости
+3. Добавить сливки, взбить
+4. Подавать с хлебом
+
+<b>КБЖУ:</b> 645 ккал | Б: 13,4 г | Ж: 31,7 г | У: 86,2 г""",
+
+            "dinner": """🌙 <b>Ужин — Омлет с макаронами</b>
+
+<b>Ингредиенты:</b>
+• Яйца - 4 шт
+• Макароны ц/з - 70 г
+• Сыр - 60 г
+• Молоко 2,5% - 50 мл
+• Болгарский перец - 30 г
+• Специи
+
+<b>Приготовление:</b>
+1. Отварить макароны
+2. Смешать яйца, молоко, сыр, перец и специи
+3. Готовить в микроволновке 3 минуты
+4. Подавать с макаронами
+
+<b>КБЖУ:</b> 742 ккал | Б: 48,6 г | Ж: 35,9 г | У: 52,4 г"""
+        },
+        8: {
+            "breakfast": """🌅 <b>Завтрак — Сэндвич с беконом и яйцом</b>
+
+<b>Ингредиенты:</b>
+• Хлеб цельнозерновой - 100 г
+• Бекон - 60 г
+• Яйца - 3 шт
+• Помидор - 1 шт
+• Листья салата
+• Оливковое масло - 5 г
+
+<b>Приготовление:</b>
+1. Обжарить бекон до хрустящей корочки
+2. На той же сковороде приготовить яйца и подрумянить хлеб
+3. Собрать сэндвич, посолив и поперчив по вкусу
+
+<b>КБЖУ:</b> 807 ккал | Б: 45,7 г | Ж: 45,2 г | У: 52,3 г""",
+
+            "lunch": """🍽 <b>Обед — Рис с курицей и овощами</b>
+
+<b>Ингредиенты:</b>
+• Куриное филе - 150 г
+• Рис - 80 г
+• Лук - 70 г
+• Овощная смесь «Мексиканская» - 100 г
+• Соевый соус - 30 г
+• Оливковое масло - 10 г
+
+<b>Приготовление:</b>
+1. Обжарить лук с овощами 5-7 минут
+2. Добавить курицу и соевый соус, тушить 5-7 минут
+3. Всыпать рис, залить кипятком и готовить до готовности крупы
+
+<b>КБЖУ:</b> 646 ккал | Б: 45,9г | Ж: 12,8 г | У: 84,4 г""",
+
+            "dinner": """🌙 <b>Ужин — Салат с тунцом</b>
+
+<b>Ингредиенты:</b>
+• Тунец консервированный - 150 г
+• Огурцы - 150 г
+• Яйцо - 2 шт
+• Йогурт греческий - 100 г
+• Хлебцы ц/з - 3 шт
+• Соль, специи, зелень
+
+<b>Приготовление:</b>
+1. Огурец и яйца нарезать кубиками
+2. Смешать с размятым тунцом, заправить йогуртом
+3. Подавать с хлебцами
+
+<b>КБЖУ:</b> 483 ккал | Б: 62,6 г | Ж: 12,7 г | У: 28,6 г"""
+        },
+        9: {
+            "breakfast": """🌅 <b>Завтрак — Панкейки с кленовым сиропом</b>
+
+<b>Ингредиенты:</b>
+• Мука - 140 г
+• Яйцо - 2 шт
+• Молоко 2,5% - 120 мл
+• Растительное масло - 1 ст. л.
+• Разрыхлитель - 1 ч. л.
+• Кленовый сироп - 20 г
+• Сахарозаменитель, ваниль
+
+<b>Приготовление:</b>
+1. Смешать все ингредиенты для теста до однородности
+2. Обжарить панкейки на сковороде с двух сторон
+3. Подавать с кленовым сиропом
+
+<b>КБЖУ:</b> 835 ккал | Б: 29 г | Ж: 26,9 г | У: 118 г""",
+
+            "lunch": """🍽 <b>Обед — Лосось с макаронами и овощами</b>
+
+<b>Ингредиенты:</b>
+• Стейк лосося - 200 г
+• Макароны ТСП - 35 г
+• Овощная смесь - 50 г
+• Оливковое масло - 5 г
+• Соль, перец, лимонный сок
+
+<b>Приготовление:</b>
+1. Отварить макароны
+2. Лосося приправить и обжарить по 7 минут с каждой стороны
+3. Добавить овощи, тушить 5 минут
+
+<b>КБЖУ:</b> 590 ккал | Б: 49,2 г | Ж: 31 г | У: 29 г""",
+
+            "dinner": """🌙 <b>Ужин — Тефтели из индейки с макаронами</b>
+
+<b>Ингредиенты:</b>
+• Фарш из индейки - 150 г
+• Рис - 15 г
+• Макароны ц/з - 50 г
+• Лук - 55 г, морковь - 70 г, помидор - 130 г
+• Чеснок, оливковое масло - 5 г
+• Соль, специи, зелень
+
+<b>Приготовление:</b>
+1. Рис смешать с фаршем и специями, сформировать тефтели
+2. Обжарить лук, морковь и чеснок, добавить тефтели и помидоры
+3. Залить водой и тушить 10-15 минут
+4. Подавать с отварными макаронами
+
+<b>КБЖУ:</b> 568 ккал | Б: 35,5 г | Ж: 18,6 г | У: 64,5 Г"""
+        },
+        10: {
+            "breakfast": """🌅 <b>Завтрак — Тост с бананом и ореховой пастой</b>
+
+<b>Ингредиенты:</b>
+• Хлеб цельнозерновой - 60 г
+• Банан - 80 г
+• Арахисовая паста - 20 г
+• Сливочный сыр - 40 г
+
+<b>Приготовление:</b>
+1. Поджарить хлеб
+2. Намазать сыр, выложить банан, полить ореховой пастой
+
+<b>КБЖУ:</b> 467 ккал | Б: 13 г | Ж: 25,3 г | У: 48,6 г""",
+
+            "lunch": """🍽 <b>Обед — Филе карпа в духовке с рисом</b>
+
+<b>Ингредиенты:</b>
+• Филе карпа - 350 г
+• Рис - 50 г
+• Оливковое масло - 15 г
+• Соль, перец, укроп
+
+<b>Приготовление:</b>
+1. Отварить рис
+2. Рыбу натереть маслом и специями, завернуть в фольгу с укропом
+3. Запекать при 180°C 20-25 минут
+
+<b>КБЖУ:</b> 695 ккал | Б: 61 г | Ж: 34,4 г | У: 35,2 г""",
+
+            "dinner": """🌙 <b>Ужин — Кус-кус с курицей и овощами</b>
+
+<b>Ингредиенты:</b>
+• Куриные бедра - 150 г
+• Кус-кус - 90 г
+• Лук - 35 г, морковь - 70 г, перец - 0,5 шт
+• Чеснок, оливковое масло - 1 ч.л.
+• Вода - 200 мл
+
+<b>Приготовление:</b>
+1. Обжарить лук, курицу и овощи
+2. Добавить воду, тушить 10 минут
+3. Добавить кус-кус, тушить под крышкой 15 минут
+
+<b>КБЖУ:</b> 786 ккал | Б: 48,8 г | Ж: 28,3 г | У: 81 г"""
+        },
+        11: {
+            "breakfast": """🌅 <b>Завтрак — Яичный рулет с овощами</b>
+
+<b>Ингредиенты:</b>
+• Яйца - 3 шт
+• Хлеб - 90 г
+• Морковь - 20 г, перец - 35 г, лук - 15 г
+• Твердый сыр - 35 г
+• Оливковое масло - 10 г
+
+<b>Приготовление:</b>
+1. Запечь овощи в духовке 10-15 минут
+2. Залить взбитыми яйцами с сыром, запекать 10-12 минут
+3. Свернуть рулетом, подавать с хлебом
+
+<b>КБЖУ:</b> 609 ккал | Б: 31 г | Ж: 40 г | У: 40 г""",
+
+            "lunch": """🍽 <b>Обед — Рыба с рисом и салатом</b>
+
+<b>Ингредиенты:</b>
+• Минтай - 200 г
+• Рис - 60 г
+• Помидор, огурец
+• Растительное масло - 0,5 ст. л.
+
+<b>Приготовление:</b>
+1. Отварить рис
+2. Обжарить рыбу с двух сторон
+3. Нарезать овощи для салата
+
+<b>КБЖУ:</b> 487 ккал | Б: 41 г | Ж: 9,3 г | У: 41 г""",
+
+            "dinner": """🌙 <b>Ужин — Пицца с овощами</b>
+
+<b>Ингредиенты:</b>
+• Лаваш - 150 г
+• Томатная паста - 100 г
+• Помидор - 50 г, перец - 40 г, оливки - 40 г
+• Творожный сыр - 50 г, моцарелла - 60 г
+• Специи, зелень
+
+<b>Приготовление:</b>
+1. На лаваш нанести пасту, выложить начинку
+2. Запекать при 200°C 12-15 минут
+
+<b>КБЖУ:</b> 882 ккал | Б: 39 Г | Ж: 31,5 Г | У: 112,5 Г"""
+        },
+        12: {
+            "breakfast": """🌅 <b>Завтрак — Морковные оладьи с шоколадом</b>
+
+<b>Ингредиенты:</b>
+• Морковь - 90 г
+• Яйцо - 1 шт
+• Мука - 20 г, кокос - 40 г
+• Растительное масло - 2 г
+• Тёмный шоколад - 30 г
+• Сахарозаменитель
+
+<b>Приготовление:</b>
+1. Смешать все ингредиенты для теста
+2. Обжарить оладьи на сковороде
+3. Подавать с шоколадом
+
+<b>КБЖУ:</b> 485 ккал | Б: 11,3 г | Ж: 86,2 г | У: 46,1 г""",
+
+            "lunch": """🍽 <b>Обед — Горбуша в духовке с рисом</b>
+
+<b>Ингредиенты:</b>
+• Стейк горбуши - 250 г
+• Рис Жасмин - 70 г
+• Морковь - 50 г, лук - 25 г
+• Оливковое масло - 15 г
+• Зелень, соль, перец
+
+<b>Приготовление:</b>
+1. Отварить рис
+2. Овощи и рыбу завернуть в фольгу
+3. Запекать 20 минут + 10 минут без фольги
+
+<b>КБЖУ:</b> 753 ккал | Б: 57 г | Ж: 31,6 г | У: 60 г""",
+
+            "dinner": """🌙 <b>Ужин — Теплый салат с курицей и макаронами</b>
+
+<b>Ингредиенты:</b>
+• Куриное филе - 200 г
+• Макароны - 60 г
+• Морковь, перцы, лук, шпинат - 150 г
+• Оливковое масло - 1,5 ст.л.
+• Бальзамический уксус - 2 ст.л.
+
+<b>Приготовление:</b>
+1. Обжарить курицу и овощи
+2. Отварить макароны
+3. Смешать все со шпинатом, заправить уксусом
+
+<b>КБЖУ:</b> 732 ккал | Б: 61 г | Ж: 25 г | У: 65 г"""
+        },
+        13: {
+            "breakfast": """🌅 <b>Завтрак — Фриттата с картофелем и сыром</b>
+
+<b>Ингредиенты:</b>
+• Яйца - 3 шт, белок - 1 шт
+• Картофель - 100 г
+• Сыр - 40 г
+• Лук - 20 г, зеленый лук - 10 г
+• Оливковое масло - 5 г
+
+<b>Приготовление:</b>
+1. Отварить и нарезать картофель
+2. Обжарить картофель с луком
+3. Залить яйцами, посыпать сыром, готовить до застывания
+
+<b>КБЖУ:</b> 481 ккал | Б: 32,5 г | Ж: 29 г | У: 21,2 г""",
+
+            "lunch": """🍽 <b>Обед — Тайское карри с курицей</b>
+
+<b>Ингредиенты:</b>
+• Куриное филе - 250 г
+• Макароны ц/з - 50 г
+• Морковь - 65 г, перец - 60 г, кабачок - 100 г, лук - 40 г
+• Кокосовое молоко - 150 мл
+• Карри-паста - 10 г
+• Чеснок, масло, кинза
+
+<b>Приготовление:</b>
+1. Обжарить лук, чеснок и курицу
+2. Добавить молоко, пасту и овощи, тушить 10-15 минут
+3. Подавать с макаронами и кинзой
+
+<b>КБЖУ:</b> 922 ккал | Б: 77,8 г | Ж: 37,5 г | У: 59 г""",
+
+            "dinner": """🌙 <b>Ужин — Греческий салат</b>
+
+<b>Ингредиенты:</b>
+• Огурец - 80 г, помидор - 80 г
+• Красный лук - 30 г, оливки - 80 г
+• Сыр фета - 100 г
+• Оливковое масло - 10 г, лимонный сок
+• Зелень, соль, перец
+
+<b>Приготовление:</b>
+1. Нарезать овощи и сыр
+2. Смешать с заправкой из масла и лимонного сока
+3. Посыпать зеленью
+
+<b>КБЖУ:</b> 530 ккал | Б: 16 г | Ж: 45 г | У: 12 г"""
+        },
+        14: {
+            "breakfast": """🌅 <b>Завтрак — Творожные оладьи</b>
+
+<b>Ингредиенты:</b>
+• Творог 5% - 250 г
+• Яйцо - 2 шт
+• Мука - 50 г
+• Растительное масло - 15 г
+• Разрыхлитель, сахарозаменитель, ваниль
+
+<b>Приготовление:</b>
+1. Смешать все ингредиенты для теста
+2. Обжарить оладьи на сковороде с двух сторон
+
+<b>КБЖУ:</b> 752 ккал | Б: 57 г | Ж: 38 г | У: 38,3 г""",
+
+            "lunch": """🍽 <b>Обед — Фунчоза с говядиной и овощами</b>
+
+<b>Ингредиенты:</b>
+• Говядина - 100 г
+• Фунчоза - 60 г
+• Кабачок - 140 г, морковь - 100 г, перец - 1 шт, лук - 0,5 шт
+• Соевый соус - 4 ст.л., мед - 10 г, кунжут - 10 г
+• Лимонный сок
+
+<b>Приготовление:</b>
+1. Обжарить овощи и говядину
+2. Добавить соус и мед, тушить 3-5 минут
+3. Смешать с заваренной фунчозой, посыпать кунжутом
+
+<b>КБЖУ:</b> 698 ккал | Б: 38,2 г | Ж: 30,5 г | У: 71,8 г""",
+
+            "dinner": """🌙 <b>Ужин — Куриные ножки с рисом</b>
+
+<b>Ингредиенты:</b>
+• Куриные ножки - 200 г
+• Рис Басмати - 50 г
+• Соль, специи
+
+<b>Приготовление:</b>
+1. Отварить рис
+2. Отварить куриные ножки 20-30 минут до готовности
+
+<b>КБЖУ:</b> 496 ккал | Б: 42,3 г | Ж: 17,6 г | У: 38,2 г"""
+        }
+    },
+
+    2000: {
+        1: {
+            "breakfast": """🌅 <b>Завтрак — Шакшука</b>
+
+<b>Ингредиенты:</b>
+• Яйца - 4 шт
+• Помидор - 120 г
+• Лук репчатый - 30 г
+• Чеснок - 1 зубчик
+• Хлеб ц/з - 100 г
+• Масло оливковое - 1 ст. л.
+• Специи, соль, перец
+
+<b>Приготовление:</b>
+1. Обжарить лук и чеснок до мягкости
+2. Добавить помидоры и специи, тушить 5-7 минут
+3. Сделать углубления, влить яйца
+4. Готовить под крышкой до готовности белков
+
+<b>КБЖУ:</b> 745 ккал | Б: 39 г | Ж: 34 г | У: 60,7 г""",
+
+            "lunch": """🍽 <b>Обед — Теплый салат с кускусом</b>
+
+<b>Ингредиенты:</b>
+• Кускус отварной - 250 г
+• Красный и желтый перец - по 80 г
+• Огурец - 80 г, помидоры черри - 80 г
+• Красный лук - 30 г
+• Оливковое масло - 20 г
+• Лимонный сок, мята, соль, перец
+
+<b>Приготовление:</b>
+1. Приготовить кускус по инструкции
+2. Смешать с нарезанными овощами
+3. Заправить маслом и лимонным соком
+
+<b>КБЖУ:</b> 580 ккал | Б: 13,5 г | Ж: 20,4 г | У: 69,7 г""",
+
+            "dinner": """🌙 <b>Ужин — Курица, запеченная с сыром</b>
+
+<b>Ингредиенты:</b>
+• Куриное филе - 300 г
+• Сыр фета - 150 г
+• Апельсин - 1 шт
+• Соевый соус - 40 мл
+• Листья салата - 35 г
+• Соль, специи
+
+<b>Приготовление:</b>
+1. Замариновать курицу в смеси соевого соуса и апельсинового сока
+2. Запекать с сыром 20-30 минут при 220°C
+3. Подавать на листьях салата
+
+<b>КБЖУ:</b> 837,2 ккал | Б: 99,2 г | Ж: 40 г | У: 14,2 г"""
+        },
+        2: {
+            "breakfast": """🌅 <b>Завтрак — Рисовый блин с творожным сыром и курицей</b>
+
+<b>Ингредиенты:</b>
+• Рис (белый длиннозерный) - 60 г
+• Яйцо - 2 шт
+• Яичный белок - 1 шт
+• Сметана 20% - 30 г
+• Корица, сахзам по вкусу
+• Творожный сыр - 60 г
+• Куриное филе - 200 г
+• Зелень, укроп по вкусу
+
+<b>Приготовление:</b>
+1. Рис отвариваем, смешиваем с яйцами, белками и сметаной, мелконарезанным укропом, перемешиваем
+2. Выкладываем на хорошо разогретую сковороду и жарим под крышкой с двух сторон
+3. Сверху выкладываем творожный сыр
+4. Курочку мелко режем, обжариваем 3-5 минут на сковороде, добавляем сверху на блинчик
+
+<b>КБЖУ:</b> 800 ккал | Б: 71,2 г | Ж: 32,8 г | У: 50,9 г""",
+
+            "lunch": """🍽 <b>Обед — Белковый рулет</b>
+
+<b>Ингредиенты:</b>
+• Куриная грудка - 180 г
+• Хлеб ц/з - 100 г
+• Лук репчатый - 40 г
+• Яйца - 2 шт
+• Йогурт натуральный - 80 г
+• Сыр 35% - 45 г
+• Соль - по вкусу
+
+<b>Приготовление:</b>
+1. Смешайте яйца, йогурт, тертый сыр и соль
+2. Распределите массу по силиконовому коврику и отправьте в духовку на 10-15 минут при 180°C
+3. Измельчите лук и курицу, сделайте фарш
+4. Достаем основу из духовки, выкладываем на неё начинку и ставим запекаться на 10-15 минут при 180°C
+5. Сворачиваем рулетик
+
+<b>КБЖУ:</b> 868 ккал | Б: 86,3 г | Ж: 34 г | У: 56 г""",
+
+            "dinner": """🌙 <b>Ужин — Брюссельская капуста с сыром</b>
+
+<b>Ингредиенты:</b>
+• Брюссельская капуста - 300 г
+• Пармезан - 30 г
+• Чеддер - 30 г
+• Лук - 70 г
+• Чеснок - 1 зубчик
+• Масло сливочное - 10 г
+• Молоко 1,5% - 110 мл
+• Соль, специи
+
+<b>Приготовление:</b>
+1. Лук порежьте, обжарьте с чесноком на сливочном масле, добавьте молоко и пусть покипит до загустения
+2. Добавьте сыр, подержите на медленном огне, пока сыр не расплавится
+3. В форму для запеканки высыпьте капусту, залейте полученной смесью и запекайте в разогретой до 200°C духовке 20-30 минут
+
+<b>КБЖУ:</b> 526 ккал | Б: 35,6 г | Ж: 27,9 г | У: 37,7 г"""
+        },
+        3: {
+            "breakfast": """🌅 <b>Завтрак — Скрэмбл с рисом и авокадо</b>
+
+<b>Ингредиенты:</b>
+• Рис белый - 40 г
+• Яйца - 4 шт
+• Соль, специи по вкусу
+• Молоко 2,5% - 50 г
+• Авокадо - 80 г
+• Горошек консервированный - 50 г
+• Оливковое масло - 20 г
+• Хлеб ц/з - 100 г
+
+<b>Приготовление:</b>
+1. Отвариваем рис до готовности
+2. Смешиваем яйца с молоком, взбиваем вилкой, солим и перчим
+3. Выливаем на разогретую сковороду с маслом и перемешиваем в течение трех минут
+4. Выкладываем к рису
+5. Авокадо режем кольцами и выкладываем на рис, добавляем горошек
+
+<b>КБЖУ:</b> 1107,7 ккал | Б: 41,9 г | Ж:65,5 г | У: 84,5г""",
+
+            "lunch": """🍽 <b>Обед — Тилапия с овощами</b>
+
+<b>Ингредиенты:</b>
+• Филе тилапии - 350 г
+• Морковь - 100 г
+• Лук - 50 г
+• Масло оливковое - 15 г
+• Овощи - 200 г
+• Соль, специи по вкусу
+
+<b>Приготовление:</b>
+1. На разогретую сковороду выкладываем тилапию и обжариваем 5-7 минут с каждой стороны
+2. Добавляем тертую морковь и нарезанный лук, жарим еще 3 минуты
+3. Подавать со свежими овощами
+
+<b>КБЖУ:</b> 588,2 ккал | Б: 79,8 г | Ж: 21,2 г | У: 22,1 г""",
+
+            "dinner": """🌙 <b>Ужин — Овощной рататуй</b>
+
+<b>Ингредиенты:</b>
+• Цуккини - 1 шт (крупный)
+• Баклажан - 1 шт
+• Помидоры - 2 шт (крупные)
+• Красный перец - 1 шт
+• Луковица - 1 шт
+• Чеснок - 2 зубчика
+• Оливковое масло - 2 ст. л.
+• Сушенный тимьян - 1 ч. л.
+• Соль и перец по вкусу
+
+<b>Приготовление:</b>
+1. Разогрейте духовку до 200°C
+2. Нарежьте овощи на небольшие кубики
+3. В большой форме для запекания смешайте все нарезанные овощи и чеснок
+4. Полейте оливковым маслом и посыпьте тимьяном, солью и перцем. Хорошо перемешайте
+5. Запекайте в духовке около 30-40 минут, пока овощи не станут мягкими и золотистыми
+6. Подавайте как гарнир или самостоятельное блюдо
+
+<b>КБЖУ:</b> 414 ккал | Б: 12,6 г | Ж: 21,6 г | У: 43,9 г"""
+        },
+        4: {
+            "breakfast": """🌅 <b>Завтрак — Рис с яичницей с сыром, беконом и зеленью</b>
+
+<b>Ингредиенты:</b>
+• Рис белый - 60 г
+• Яйца - 4 шт
+• Сыр - 35 г
+• Бекон - 30 г
+• Оливковое масло - 15 г
+• Зелень по вкусу
+• Соль, специи по вкусу
+
+<b>Приготовление:</b>
+1. Рис отвариваем до готовности
+2. Яйца разбиваем на разогретую сковороду с маслом, кладем белки, жарим 3 минуты под крышкой, добавляем соль и специи
+3. Посыпаем тертым сыром и зеленью
+4. Добавляем бекон
+
+<b>КБЖУ:</b> 963 ккал | Б: 47,3 г | Ж: 63,2 г | У: 49 г""",
+
+            "lunch": """🍽 <b>Обед — Куриные шарики в сливочном соусе с рисом</b>
+
+<b>Ингредиенты:</b>
+• Куриное филе - 200 г
+• Сливки 33% - 40 мл
+• Соль, специи по вкусу
+• Мука - 10 г
+• Рис - 70 г (сухой вес)
+
+<b>Приготовление:</b>
+1. Куриное филе превращаем в фарш, солим, перчим
+2. Руками формируем небольшие шарики
+3. Обжариваем по 3 минуты с каждой стороны
+4. Накрываем крышкой, подливаем 50 мл воды и тушим 5 минут
+5. Добавляем сливки, муку, перемешиваем и выключаем через 3 минуты, даем настояться
+
+<b>КБЖУ:</b> 623,8 ккал | Б: 52,7 г | Ж: 16,2 г | У: 64,3 г""",
+
+            "dinner": """🌙 <b>Ужин — Салат из фарша</b>
+
+<b>Ингредиенты:</b>
+• Постный фарш из говядины - 150 г
+• Перепелиные яйца - 6 шт
+• Авокадо - 100 г
+• Руккола - 100 г
+• Помидоры черри - 100 г
+• Огурцы - 100 г
+• Соль, перец по вкусу
+
+<b>Приготовление:</b>
+1. Фарш солим, перчим и жарим до полной готовности на антипригарной сковороде
+2. Смешиваем с авокадо, порезанными кубиками огурцом, черри, рукколой и яйцами
+
+<b>КБЖУ:</b> 557 ккал | Б: 41,7 г | Ж: 38,2 г | У: 18,8 г"""
+        },
+        5: {
+            "breakfast": """🌅 <b>Завтрак — Гранола с йогуртом</b>
+
+<b>Ингредиенты:</b>
+• Овсянка - 70 г
+• Грецкие орехи - 30 г
+• Арахис - 20 г
+• Изюм - 10 г
+• Мед - 10 г
+• Греческий йогурт - 100 г
+
+<b>Приготовление:</b>
+1. Соедините все элементы (кроме йогурта), перемешайте и разложите на пергаменте
+2. Выпекайте в духовке при 200°C на 10 минут
+3. Остудите и добавьте к йогурту
+
+<b>КБЖУ:</b> 702,1 ккал | Б: 23,5 г | Ж: 36,9 г | У: 70,8 г""",
+
+            "lunch": """🍽 <b>Обед — Мексиканские фахитас с курицей</b>
+
+<b>Ингредиенты:</b>
+• Куриная грудка - 150 г
+• Красный перец - 1/2 шт
+• Зеленый перец - 1/2 шт
+• Луковица - 1/2 шт
+• Чеснок - 1 зубчик
+• Чили-порошок - 1 ч. л.
+• Кумин - 1 ч. д.
+• Лимонный сок - 10 г
+• Тортилья - 2 шт
+
+<b>Приготовление:</b>
+1. Обжарьте куриное мясо на антипригарной сковороде до золотистости
+2. Добавьте курицу в ту же сковороду, затем лук, перец и чеснок, обжаривайте до мягкости
+3. Посыпьте чили-порошком и кумином, посолите и поперчите, затем добавьте сок лимона
+4. Готовьте еще несколько минут, чтобы все ингредиенты пропитались ароматами
+5. Подавайте с тортильями
+
+<b>КБЖУ:</b> 619 ккал | Б: 47,5 г | Ж: 13,1 г | У: 77,8 г""",
+
+            "dinner": """🌙 <b>Ужин — Рыбные котлеты на пару с запеченым картофелем</b>
+
+<b>Ингредиенты:</b>
+• Филе трески - 250 г
+• Яйцо - 2 шт
+• Манная крупа - 2 ст. л.
+• Морковь - 100 г
+• Луковица - 60 г
+• Соль и перец по вкусу
+• Картофель 250 г
+• Оливковое масло 1 ст. л
+
+<b>Приготовление:</b>
+1. Рыбное филе измельчите в кубики и перемешайте с тертой морковью, мелко нарезанным луком, яйцом, манной крупой, солью и перцем
+2. Сформируйте котлеты и уложите их в пароварку
+3. Тушите котлеты около 15-20 минут до готовности
+4. Картофель посолить, по желанию добавить любимые специи, перемешать с оливковым маслом, запекать до готовности
+
+<b>КБЖУ:</b> 871,7 ккал | Б: 70,5 г | Ж: 25,3 г | У: 87,9 г"""
+        },
+        6: {
+            "breakfast": """🌅 <b>Завтрак — Рисовый блин с сыром</b>
+
+<b>Ингредиенты:</b>
+• Рис (белый длиннозерный) - 60 г
+• Яйцо - 2 шт
+• Яичный белок - 2 шт
+• Сыр Гауда - 40 г
+• Авокадо - 40 г
+• Соль, перец по вкусу
+
+<b>Приготовление:</b>
+1. Рис варим до состояния готовности и слегка остужаем
+2. Добавляем яйцо и белки, перемешиваем, трем сыр на терке, добавляем и перемешиваем
+3. Жарим с двух сторон до золотистой корочки под крышкой на медленном огне
+4. Авокадо мнем вилкой, перчим, солим и выкладываем на блинчик
+
+<b>КБЖУ:</b> 626,5 ккал | Б: 33,9 г | Ж: 31,2 г | У: 51,3 г""",
+
+            "lunch": """🍽 <b>Обед — Паста с креветками и чесночным соусом</b>
+
+<b>Ингредиенты:</b>
+• Спагетти - 70 г
+• Креветки очищенные - 300 г
+• Чеснок - 3 зубчика
+• Оливковое масло - 2 ст. л.
+• Соль и перец по вкусу
+• Петрушка для украшения
+
+<b>Приготовление:</b>
+1. В большой кастрюле с кипящей подсоленной водой приготовьте спагетти до аль-денте согласно инструкции на упаковке
+2. В сковороде разогрейте оливковое масло и обжарьте измельченный чеснок на среднем огне до золотистого цвета
+3. Добавьте креветки в сковороду и обжаривайте до их приготовления, примерно 2-3 минуты с каждой стороны
+4. Откиньте воду от спагетти и добавьте их в сковороду к креветкам
+5. Перемешайте, чтобы паста покрылась соусом
+6. Приправьте солью и перцем по вкусу
+7. Подавайте порции, украсив свежей петрушкой
+
+<b>КБЖУ:</b> 728,6 ккал | Б: 74 г | Ж: 23,8 г | У: 53,6 г""",
+
+            "dinner": """🌙 <b>Ужин — Теплый салат с курицей, овощами и рисом</b>
+
+<b>Ингредиенты:</b>
+• Куриное филе - 200 г
+• Морковь - 1/2 шт
+• Красный перец - 1/2 шт
+• Желтый перец - 1/2 шт
+• Рис - 70 г (сухой вес)
+• Красный лук - 1/2 шт
+• Свежий шпинат - 150 г
+• Оливковое масло - 2 ст. л.
+• Бальзамический уксус - 2 ст. л.
+• Соль и перец по вкусу
+
+<b>Приготовление:</b>
+1. Нарежьте куриное филе на небольшие кусочки и обжарьте на оливковом масле на сковороде до золотистой корки. Приправьте солью и перцем по вкусу
+2. В другой сковороде обжарьте нарезанные морковь, перцы и лук на оливковом масле до мягкости
+3. Добавьте обжаренные овощи к куриному филе, перемешайте
+4. Положите шпинат в большую миску. Добавьте на него смесь с курицей и овощами
+5. Полейте салат бальзамическим уксусом и еще раз перемешайте перед подачей
+
+<b>КБЖУ:</b> 780,8 ккал | Б: 58,5 г | Ж: 23,3 г | У: 79,8 г"""
+        },
+        7: {
+            "breakfast": """🌅 <b>Завтрак — Овсяноблин с голубикой, бананом и арахисовой пастой</b>
+
+<b>Ингредиенты:</b>
+• Овсянка - 50 г
+• Яйцо - 3 шт
+• Кефир 2,5% - 30 г
+• Банан - 1 шт
+• Голубика - 14 г
+• Корица, сахзам, сода на кончике ножа
+• Арахисовая паста - 5 г
+
+<b>Приготовление:</b>
+1. Превращаем овсянку в муку с помощью кофемолки или блендера, добавляем сухие ингредиенты
+2. Пюрируем банан и голубику, добавляем яйца и кефир
+3. Все перемешиваем и добавляем овсяную муку
+4. Перемешиваем и отправляем на хорошо разогретую сковороду
+5. Выпекаем под крышкой на слабом огне с двух сторон
+6. Смазываем верх арахисовой пастой
+
+<b>КБЖУ:</b> 597,7 ккал | Б: 30,6 г | Ж: 25 г | У: 63,2 г""",
+
+            "lunch": """🍽 <b>Обед — Куриные котлеты с овощным гарниром и рисом</b>
+
+<b>Ингредиенты для котлет:</b>
+• Куриное филе - 200 г
+• Яйцо - 1 шт
+• Лук - 50 г
+• Чеснок - 1 зубчик
+• Рис - 40 г (сухой вес)
+• Оливковое масло - 7 г
+• Зелень по вкусу
+• Соль, специи по вкусу
+• Панировочные сухари - 3 ст. л.
+
+<b>Ингредиенты для гарнира:</b>
+• Морковь - 100 г
+• Кабачок - 100 г
+• Красный перец - 120 г
+• Оливковое масло - 1 ст. л.
+• Соль, перец, смесь итальянских трав - по вкусу
+
+<b>Приготовление:</b>
+1. В большой миске смешайте куриный фарш, нарезанный лук, измельченный чеснок, яйцо, панировочные сухари, соль и перец
+2. Сформируйте из смеси котлеты
+3. В сковороде разогрейте оливковое масло на среднем огне
+4. Обжарьте котлеты по 5-7 минут с каждой стороны до золотистой корочки
+5. Параллельно приготовьте овощной гарнир: на разогретой сковороде с оливковым маслом обжарьте морковь, кабачок и перец до мягкости
+6. Приправьте овощи солью, перцем и смесью итальянских трав
+7. Подавайте котлеты с овощным гарниром
+
+<b>КБЖУ:</b> 870,4 ккал | Б: 64,7 г | Ж: 27 | У: 91,1 г""",
+
+            "dinner": """🌙 <b>Ужин — Ленивая лазанья</b>
+
+<b>Ингредиенты:</b>
+• Лук - 35 г
+• Говяжий фарш - 200 г
+• Томатная паста - 20 г
+• Лаваш - 30 г
+• Моцарелла - 40 г
+• Соль, специи
+
+<b>Приготовление:</b>
+1. На сковороде обжарьте до золотистого цвета мелко нарезанный лук. Добавьте и обжарьте фарш, затем специи и томатную пасту. Хорошо перемешайте и держите на огне, помешивая 10-15 минут
+2. Лаваш разрезать на листы по форме для запекания. На дно выкладываем лист лаваша, затем часть фарша, посыпаем натертым сыром
+3. Повторите эту процедуру 2-3 раза. Сверху обильно посыпать сыром и выпекать в разогретой духовке при 180°C 10-15 минут
+
+<b>КБЖУ:</b> 708 ккал | Б: 45,3 г | Ж: 47,6 г | У: 21,7 г"""
+        },
+        8: {
+            "breakfast": """🌅 <b>Завтрак — Сырные вафли с авокадо</b>
+
+<b>Ингредиенты:</b>
+• Овсянка - 50 г
+• Яйцо - 2 шт
+• Сыр - 40 г
+• Авокадо - 40 г
+• Сливочное масло - 10 г
+• Соль и специи по вкусу
+• Щепотка соды
+
+<b>Приготовление:</b>
+1. Овсянку превращаем в муку с помощью кофемолки или блендера
+2. Добавляем соль, специи, соду
+3. Добавляем яйцо, столовую ложку воды
+4. Натираем сыр на терке, добавляем в тесто и перемешиваем
+5. Выпекаем в разогретой вафельнице (смазываем ее маслом) до золотой корочки
+6. Мякоть авокадо мнем вилкой, добавляем соль, специи и выкладываем на вафли
+
+<b>КБЖУ:</b> 660 ккал | Б: 30,4 г | Ж: 43,6 г | У: 38 г""",
+
+            "lunch": """🍽 <b>Обед — ПП хачапури</b>
+
+<b>Ингредиенты:</b>
+• Творог 5% - 180 г
+• Яйцо - 1 шт
+• Желток - 1 шт
+• Рисовая мука - 60 г
+• Разрыхлитель - 1/2 ч. л.
+• Сыр - 40 г
+
+<b>Приготовление:</b>
+1. Творог, яйцо, муку и разрыхлитель смешиваем вилкой
+2. Лепим форму-лодочку и отправляем в разогретую до 180°C духовку на 10 минут
+3. Достаем, кладем тертый сыр и снова в духовку до того, как расплавится сыр
+4. Достаем, добавляем желток и снова в духовку на пару минут
+
+<b>КБЖУ:</b> 745,1 ккал | Б: 55,3 г | Ж: 33,4 г | У: 53,8 г""",
+
+            "dinner": """🌙 <b>Ужин — Креветки с чесночным соусом и рисом</b>
+
+<b>Ингредиенты:</b>
+• Креветки очищенные - 350 г
+• Чеснок - 1 зубчик
+• Оливковое масло - 2 ст. л.
+• Свежий лимонный сок - 2 ст. л.
+• Свежая петрушка для подачи
+• Рис - 70 г
+• Соль и перец по вкусу
+
+<b>Приготовление:</b>
+1. Разогрейте оливковое масло на сковороде на среднем огне, добавьте чеснок и обжарьте его до золотистости
+2. Добавьте креветки на сковороду, посыпьте солью и перцем, и обжаривайте их, пока они не станут розовыми и не приобретут форму буквы "С"
+3. Полейте свежевыжатым лимонным соком и обжаривайте еще 1-2 минуты
+4. Посыпьте свежей петрушкой и подавайте горячим
+5. Рис отварить до готовности
+
+<b>КБЖУ:</b> 772 ккал | Б: 82,3 г | Ж: 24 г | У: 57,6 г"""
+        },
+        9: {
+            "breakfast": """🌅 <b>Завтрак — Сэндвич с беконом и яйцом</b>
+
+<b>Ингредиенты:</b>
+• Хлеб ц/з - 80 г (2 ломтика по 40 г)
+• Бекон - 40 г
+• Яйца - 3 шт
+• Помидор - 1 шт
+• Листья салата
+• Оливковое масло - 5 г
+• Соль и перец по вкусу
+
+<b>Приготовление:</b>
+1. Обжарьте бекон на сковороде до хрустящего состояния, затем отложите его
+2. В той же сковороде обжарьте яйца до желаемой степени прожарки
+3. Обжарьте ломтики хлеба на той же сковороде с добавлением небольшого количества масла
+4. Соберите сэндвич: положите лист салата, на него помидоры, затем бекон и яйца
+5. Посолите и поперчите по вкусу
+
+<b>КБЖУ:</b> 700,5 ккал | Б: 36,4 г | Ж: 44,4 г | У: 36,1 г""",
+
+            "lunch": """🍽 <b>Обед — Макароны с овощами и говядиной</b>
+
+<b>Ингредиенты:</b>
+• Макароны ТСП - 80 г
+• Мякоть бедра говядины - 250 г
+• Морковь - 100 г
+• Лук - 50 г
+• Оливковое масло - 15 г
+• Зеленый лук, петрушка
+• Соль, специи по вкусу
+
+<b>Приготовление:</b>
+1. Макароны отвариваем до готовности
+2. Говядину промываем, режем на мелкие кубики, солим и добавляем специи
+3. Обжариваем мелко нарезанные лук, морковь
+4. Выкладываем говядину и тушим под крышкой 20-25 минут с небольшим добавлением воды
+5. Добавляем зелень, макароны и выключаем плиту
+
+<b>КБЖУ:</b> 790 ккал | Б: 60 г | Ж: 29,4 г | У: 70,4 г""",
+
+            "dinner": """🌙 <b>Ужин — Стейк из лосося с грейпфрутовым соусом и овощами</b>
+
+<b>Ингредиенты:</b>
+• Филе лосося - 300 г
+• Сок и цедра 1 грейпфрута
+• Соевый соус - 3 ст. л.
+• Мед - 1,5 ст. л.
+• Чеснок - 1 зубчик
+• Соль и перец по вкусу
+• Свежие овощи (огурцы, помидоры, зелень) - 250 г
+
+<b>Приготовление:</b>
+1. Смешайте сок и цедру грейпфрута, соевый соус, мед и чеснок в миске
+2. Разрежьте филе на 2 части. Посолите и поперчите филе лосося
+3. Обмажьте стейки получившимся соусом и дайте им пропитаться минимум на 15-20 минут
+4. Разогрейте сковороду и обжарьте стейки до желаемой степени прожарки
+5. Подавайте с свежими овощами
+
+<b>КБЖУ:</b> 689 ккал | Б: 70,5 г | Ж: 19,2 г | У: 55,2 г"""
+        },
+        10: {
+            "breakfast": """🌅 <b>Завтрак — Творог со сметаной, орехами</b>
+
+<b>Ингредиенты:</b>
+• Творог 2% - 250 г
+• Сметана 20% - 40 г
+• Кешью - 50 г
+• Протеин - 45 г
+• Банан - 1 шт
+
+<b>Приготовление:</b>
+1. Банан нарежьте на кусочки
+2. Смешайте все ингредиенты
+
+<b>КБЖУ:</b> 904,5 ккал | Б: 90 г | Ж: 37,4г | У: 53,1 г""",
+
+            "lunch": """🍽 <b>Обед — Киноа с авокадо</b>
+
+<b>Ингредиенты:</b>
+• Киноа - 60 г (в сухом виде)
+• Авокадо - 60 г
+• Яйца - 3 шт
+• Соль, специи по вкусу
+
+<b>Приготовление:</b>
+1. Отварите киноа в подсоленной воде. Отварите яйца
+2. Добавьте мякоть авокадо, посолите, добавьте специи и перемешайте с киноа
+3. Сверху разрежьте яйца на две части
+
+<b>КБЖУ:</b> 607 ккал | Б: 30,6 г | Ж: 33,6 г | У: 39 г""",
+
+            "dinner": """🌙 <b>Ужин — Отбивная индейки на гриле с зеленым луком и сельдереем + салат</b>
+
+<b>Ингредиенты для основного блюда:</b>
+• Филе индейки - 350 г
+• Соль, специи по вкусу
+• Зеленый лук, сельдерей - 200 г
+• Растительное масло - 20 г
+
+<b>Приготовление основного блюда:</b>
+1. Отбиваем филе молоточком с двух сторон, добавляем специи, соль и жарим на гриле по 5 минут с каждой стороны
+2. В конце добавляем нарезанный лук и сельдерей
+
+<b>Ингредиенты для салата:</b>
+• Огурец свежий- 150 гр
+• Редис - 150 гр
+• Укроп - 15 гр
+• Йогурт натуральный - 100 гр
+• Оливковое масло- 1 ч.л.
+• Соль, специи по вкусу
+
+<b>Приготовление салата:</b>
+1. Огурцы и редис нарезаем колечками, зелень рубим мелко
+2. Заправляем овощи йогуртом, маслом, зеленью и специями
+
+<b>КБЖУ основного:</b> 498 ккал | Б: 69 г | Ж: 22,6 г | У: 4,2
+<b>КБЖУ салата:</b> 161,7 ккал | Б: 7,56 г | Ж: 7,56 | У: 16,38"""
+        },
+        11: {
+            "breakfast": """🌅 <b>Завтрак — Творожные печенья с курагой и миндалем</b>
+
+<b>Ингредиенты:</b>
+• Творог 5% - 250 г
+• Яйцо - 1 шт
+• Мука - 2 ст. л.
+• Курага - 20 г
+• Миндаль - 20 г
+
+<b>Приготовление:</b>
+1. В миске смешайте творог, яйцо и муку до получения однородной массы
+2. Добавьте нарезанную курагу и измельченный миндаль, хорошо перемешайте
+3. Сформируйте из теста небольшие печенья и выложите их на противень, смазанный маслом или покрытый пергаментом
+4. Выпекайте в разогретой до 180°C духовке около 15-20 минут, пока печенья не станут золотистыми
+
+<b>КБЖУ:</b> 731,8 ккал | Б: 59,3 г | Ж: 30,7 г | У: 55,8 г""",
+
+            "lunch": """🍽 <b>Обед — Картофель с куриным филе и овощным салатом</b>
+
+<b>Ингредиенты:</b>
+• Картофель - 200 г
+• Куриное филе - 150 г
+• Грибы шампиньоны - 90 г
+• Оливковое масло - 20 мл
+• Соль, специи по вкусу
+• Свежие овощи (огурцы, помидоры, зелень)
+
+<b>Приготовление:</b>
+1. Картофель отвариваем до готовности
+2. Куриное филе мелко нарезаем, солим, перчим и обжариваем на разогретой с маслом сковороде с двух сторон
+3. Грибы тщательно моем и режем кубиками, затем отправляем на сковороду к курице
+4. Подавать с вареным картофелем и свежими овощами
+
+<b>КБЖУ:</b> 535 ккал | Б: 41,1 г | Ж: 22,4 г | У: 43,1 г""",
+
+            "dinner": """🌙 <b>Ужин — Жареные мидии в сливках с рисом</b>
+
+<b>Ингредиенты:</b>
+• Мидии очищенные замороженные - 350 г
+• Сливки 33% - 50 мл
+• Оливковое масло - 20 г
+• Рис - 50 г (сухой вес)
+• Овощи свежие - 200 г
+
+<b>Приготовление:</b>
+1. Мидии обжариваем на сковороде с маслом на среднем огне, добавляем сливки, тушим на медленном огне, посыпаем зеленью
+2. Подавать со своими овощами и отварным рисом
+
+<b>КБЖУ:</b> 864 ккал | Б: 70 г | Ж: 42,6 г | У: 51 г"""
+        },
+        12: {
+            "breakfast": """🌅 <b>Завтрак — Творожная запеканка с ягодами</b>
+
+<b>Ингредиенты:</b>
+• Творог 2% - 300 г
+• Яйца - 2 шт
+• Сахарозаменитель по вкусу
+• Мука - 2 ст. л.
+• Свежие ягоды (клубника, малина, черника) - 100 г
+
+<b>Приготовление:</b>
+1. Разогрейте духовку до 180°C
+2. В миске смешайте творог, яйца, сахарозаменитель и муку до однородности
+3. Выложите смесь в форму для запекания. Равномерно распределите свежие ягоды сверху
+4. Запекайте в предварительно разогретой духовке около 30-40 минут или до золотистой корки
+
+<b>КБЖУ:</b> 690,7 ккал | Б: 73,5 г | Ж: 19 г | У: 55,6 г""",
+
+            "lunch": """🍽 <b>Обед — Теплый салат с картофелем и беконом</b>
+
+<b>Ингредиенты:</b>
+• Картофель - 250 г
+• Бекон - 75 г
+• Красный лук - 1 шт
+• Оливковое масло - 1 ст. л.
+• Яблочного уксуса - 2 ст. л.
+• Соль и перец по вкусу
+• Свежая зелень для украшения (петрушка, укроп)
+
+<b>Приготовление:</b>
+1. Разогрейте духовку до 200°C
+2. На противне смешайте нарезанный картофель, бекон и красный лук. Полейте оливковым маслом, посолите и поперчите по вкусу
+3. Выпекайте в духовке около 30-35 минут, периодически помешивая, пока картофель не станет золотистым и хрустящим
+4. Переложите готовый картофельный микс в большую миску. Полейте яблочным уксусом и аккуратно перемешайте
+5. Подавайте горячим, посыпав свежей зеленью перед подачей
+
+<b>КБЖУ:</b> 701 ккал | Б: 23,6 г | Ж: 44,7 г | У: 51,5 г""",
+
+            "dinner": """🌙 <b>Ужин — Индейка с грибами и макаронами</b>
+
+<b>Ингредиенты:</b>
+• Шампиньоны - 150 г
+• Филе индейки - 250 г
+• Оливковое масло - 20 г
+• Соль, специи, зелень
+• Макароны ТСП - 50 г (сухой вес)
+• Сыр - 50 г
+
+<b>Приготовление:</b>
+1. Грибы моем, режем кольцами и жарим на сильном огне 2 минуты
+2. Индейку мелко режем, солим, жарим на сковороде с грибами по 3 минуты с каждой стороны, 5 минут тушим под крышкой
+3. Макароны отварить до готовности
+4. Подавать индейку с грибами с макаронами и сыром
+
+<b>КБЖУ:</b> 792,1 ккал | Б: 73,4 г | Ж:38,7 г | У: 36,9 г"""
+        },
+        13: {
+            "breakfast": """🌅 <b>Завтрак — Творожные оладьи</b>
+
+<b>Ингредиенты:</b>
+• Творог 5% - 100 г
+• Яйца - 1 шт
+• Мука - 30 г
+• Сахарозаменитель по вкусу
+• Разрыхлитель - 1/2 ч.л
+• Ванильный экстракт - по желанию
+• Оливковое масло - 1 ст.л
+• Мед - 20 г
+
+<b>Приготовление:</b>
+1. Смешайте творог, яйца, муку, сахарозаменитель и разрыхлитель в миске до однородной массы
+2. Добавьте ванильный экстракт по вкусу
+3. Разогрейте сковороду с небольшим количеством масла
+4. Вылейте тесто на сковороду, формируя оладьи
+5. Обжаривайте до золотистой корочки с обеих сторон, полейте медом
+
+<b>КБЖУ:</b> 435,4 ккал | Б: 27 г | Ж: 21,3 г | У: 33,5 г""",
+
+            "lunch": """🍽 <b>Обед — Куриные блинчики с овощами</b>
+
+<b>Ингредиенты:</b>
+• Яйца - 2 шт
+• Молоко - 130 мл
+• Мука - 130 г
+• Куриная грудка - 170 г
+• Морковь - 1 шт
+• Лук - 1/2 шт
+• Оливковое масло - 5 г
+• Соль и перец по вкусу
+
+<b>Приготовление:</b>
+1. Взбейте яйца в миске, добавьте молоко и муку, хорошо перемешайте
+2. Добавьте нарезанную курицу, морковь и лук в тесто, перемешайте
+3. Разогрейте сковороду с маслом на среднем огне
+4. Вылейте тесто на сковороду, формируя блинчики
+5. Обжаривайте до золотистой корки с обеих сторон
+
+<b>КБЖУ:</b> 972,8 ккал | Б: 71,4 г | Ж: 26,1 г | У: 113,7 г""",
+
+            "dinner": """🌙 <b>Ужин — Рыба в фольге с травами</b>
+
+<b>Ингредиенты:</b>
+• Филе палтуса - 400 г
+• Лимон - 1 шт
+• Овощи - 180 г
+• Оливковое масло - 25 г
+• Свежие травы (укроп, петрушка, базилик)
+• Соль и перец по вкусу
+
+<b>Приготовление:</b>
+1. Разогрейте духовку до 180°C
+2. Подготовьте два кусочка фольги
+3. Положите по филе рыбы на каждый лист фольги. Положите на рыбу ломтики лимона и посыпьте свежими травами, солью и перцем
+4. Закройте фольгу, чтобы образовать пакетик, и запекайте в духовке около 15-20 минут или до готовности рыбы
+5. Подавать с овощами, заправленными маслом
+
+<b>КБЖУ:</b> 709 ккал | Б: 81,3 г | Ж: 37,3 г | У: 13 г"""
+        },
+        14: {
+            "breakfast": """🌅 <b>Завтрак — Сырники со сметаной</b>
+
+<b>Ингредиенты:</b>
+• Творог 2% - 200 г
+• Яйцо - 1 шт
+• Протеин - 30 г
+• Рисовая мука - 30 г (20 г + 10 г на обсыпку)
+• Сливочное масло - 10 г
+• Сметана 10% - 20 г
+• Сахзам
+
+<b>Приготовление:</b>
+1. Смешиваем творог с яйцом, постепенно добавляем муку, протеин и щепотку соды
+2. Формируем сырники, обваливаем их в муке и жарим на разогретой сковороде с маслом с двух сторон под крышкой по 5 минут
+3. Подаем со сметаной
+
+<b>КБЖУ:</b> 617,5 ккал | Б: 68,1 г | Ж: 22,4 г | У: 35,2 г""",
+
+            "lunch": """🍽 <b>Обед — Лаваш с сыром и зеленью</b>
+
+<b>Ингредиенты:</b>
+• Лаваш армянский - 150 г
+• Сыр - 50 г
+• Курица - 150 г
+• Соль, специи - по вкусу
+• Зелень (руккола, шпинат, укроп, петрушка) - 40 г
+• Оливковое масло - 1 ст. л.
+
+<b>Приготовление:</b>
+1. Нагрейте духовку до 180°C
+2. Положите лаваш на противень и равномерно посыпьте натертым сыром
+3. Посыпьте свежую измельченную зелень поверх сыра
+4. Поставьте лаваш в духовку на 5-7 минут, пока сыр не расплавится и края лаваша не станут золотистыми
+5. Достаньте лаваш из духовки, полейте его оливковым маслом и приправьте солью и перцем
+6. Нарежьте лаваш на порции и подавайте горячим
+
+<b>КБЖУ:</b> 924,7 ккал | Б: 48,9 г | Ж: 47,4 г | У: 73,6 г""",
+
+            "dinner": """🌙 <b>Ужин — Теплый салат с картофелем и оливками</b>
+
+<b>Ингредиенты:</b>
+• Картофель мелкий - 300 г
+• Зеленые оливки - 130 г
+• Оливковое масло - 2 ст. л.
+• Белый винный уксус - 1 ст. л.
+• Чеснок - 1 зубчик
+• Соль и перец по вкусу
+• Свежая зелень для украшения (укроп, петрушка)
+
+<b>Приготовление:</b>
+1. Нарежьте картофель пополам и отварите в подсоленной воде до мягкости
+2. В большой миске смешайте отваренные картофели с зелеными оливками
+3. В маленькой миске смешайте оливковое масло, винный уксус и измельченный чеснок. Приправьте солью и перцем по вкусу
+4. Полейте соусом картофельный салат и аккуратно перемешайте
+5. Подавайте горячим, посыпав свежей зеленью перед подачей
+
+<b>КБЖУ:</b> 564,9 ккал | Б: 7,3 г | Ж: 35 г | У: 58,6 г"""
+        }
+    }
+}
+
+
+# ==================== FMD ПРОТОКОЛ (5 дней) ====================
+# FMD_RECIPES[день] = {"info": ..., "breakfast": ..., "lunch": ..., "dinner": ...}
+
+FMD_RECIPES = {
+    1: {
+        "breakfast": """🌅 <b>Завтрак — Овсянка с фундуком и ягодами</b>
+
+<b>КБЖУ:</b> 410 ккал | Б: 9,9 г | Ж: 25,5 г | У: 37,9 г
+
+<b>Ингредиенты:</b>
+• Овсяные хлопья — 40 г
+• Фундук — 25 г
+• Ягоды — 50 г
+• Кокосовое молоко — 40 мл
+
+<b>Приготовление:</b>
+1. Овсяные хлопья отвариваем на воде
+2. В конце за 2 минуты до готовности добавляем кокосовое молоко
+3. Доводим до готовности
+4. Добавляем ягоды и орехи
+
+<i>💡 К завтраку из напитков зеленый чай. Можно добавить имбирь и лимон. Также 1 чашку кофе</i>""",
+
+        "lunch": """🍽 <b>Обед — Чечевичный суп с овощами</b>
+
+<b>КБЖУ:</b> 259 ккал | Б: 14,8 г | Ж: 5,7 г | У: 40,2 г
+
+<b>Ингредиенты:</b>
+• Чечевица — 40 г
+• Морковь — 100 г
+• Сельдерей — 100 г
+• Лук — 50 г
+• Оливковое масло — 1 ч.л.
+• Шпинат или рукола — горсть
+
+<b>Приготовление:</b>
+1. Морковь, сельдерей и лук обжариваем на масле
+2. Чечевицу заливаем водой 1:3 и варим 15 минут
+3. Добавляем к чечевице овощи, стакан воды и варим вместе ещё 15 минут
+4. Добавляем специи (карри, копчёная паприка)
+5. Солим и измельчаем всё в блендере
+6. Шпинат или руколу добавляем в качестве салата""",
+
+        "dinner": """🌙 <b>Ужин — Запечённая цветная капуста со специями</b>
+
+<b>КБЖУ:</b> 201 ккал | Б: 8 г | Ж: 13,6 г | У: 16,1 г
+
+<b>Ингредиенты:</b>
+• Цветная капуста — 200 г
+• Оливковое масло — 1 ч.л.
+• Соус песто — 1 ч.л.
+• Фисташки — 15 г
+• Карри/куркума, соль
+
+<b>Приготовление:</b>
+1. Капусту нарезаем на небольшие соцветия
+2. Сбрызгиваем маслом, посыпаем специями, солим
+3. Выкладываем на коврик для выпечки
+4. При 180°C готовим 35 минут
+5. К готовой капусте добавляем чайную ложку песто и фисташки""",
+
+        "info": """📋 <b>ДЕНЬ 1 — FMD Протокол</b>
+
+<b>Общая калорийность:</b> ~870 ккал
+
+<b>Рекомендации на день:</b>
+• Поливитамины, Омега 3 ПНЖК
+• Чай без сахара (до 3-4 чашек в день)
+• Повышенное количество воды
+
+⚠️ <b>ВАЖНО:</b> С осторожностью при гипертонической болезни и заболеваниях почек!
+
+💡 <i>Можно перекусывать овощами или увеличивать количество зелени при необходимости</i>"""
+    },
+
+    2: {
+        "breakfast": """🌅 <b>Завтрак — Смузи из шпината с чиа</b>
+
+<b>КБЖУ:</b> 239 ккал | Б: 6,7 г | Ж: 17,7 г | У: 18,8 г
+
+<b>Ингредиенты:</b>
+• Шпинат — 100 г
+• Яблоко — 100 г
+• Семена чиа — 1 ч.л.
+• Кокосовое молоко — 70 мл
+• Вода — 100 мл
+
+<b>Приготовление:</b>
+1. Все ингредиенты измельчить в блендере
+2. Дать постоять 5-10 минут, чтобы семена чиа набухли""",
+
+        "lunch": """🍽 <b>Обед — Тыквенный крем-суп + салат из огурцов</b>
+
+<b>КБЖУ:</b> 260 ккал | Б: 6,4 г | Ж: 14,9 г | У: 29,8 г
+
+<b>Ингредиенты для супа:</b>
+• Тыква — 200 г
+• Морковь — 100 г
+• Кокосовое молоко — 50 мл
+• Карри, куркума, соль
+
+<b>Приготовление супа:</b>
+1. Тыкву и морковь нарезаем небольшими кусочками
+2. Заливаем водой и отвариваем
+3. Готовые овощи измельчаем, добавляем специи
+4. Добавляем кокосовое молоко
+
+<b>Салат из огурцов и кунжута:</b>
+• Огурцы — 150 г
+• Кунжут — 1 ч.л.
+• Лимонный сок""",
+
+        "dinner": """🌙 <b>Ужин — Грибы на гриле с морковным хумусом</b>
+
+<b>КБЖУ:</b> 272 ккал | Б: 12,3 г | Ж: 7,4 г | У: 31,1 г
+
+<b>Ингредиенты:</b>
+• Шампиньоны — 100 г
+• Оливковое масло — 1 ч.л.
+• Готовый нут — 100 г
+• Морковь — 100 г
+• Чеснок
+
+<b>Приготовление грибов:</b>
+1. Сбрызгиваем шампиньоны маслом
+2. Солим и запекаем до румяной корочки
+
+<b>Морковный хумус:</b>
+1. Морковь запекаем или отвариваем
+2. Измельчаем всё (нут + морковь + чеснок) в блендере
+3. Едим с шампиньонами""",
+
+        "info": """📋 <b>ДЕНЬ 2 — FMD Протокол</b>
+
+<b>Общая калорийность:</b> ~771 ккал
+
+<b>Рекомендации на день:</b>
+• Поливитамины, Омега 3 ПНЖК
+• Чай без сахара (до 3-4 чашек в день)
+• Повышенное количество воды
+
+⚠️ <b>ВАЖНО:</b> С осторожностью при гипертонической болезни и заболеваниях почек!
+
+💡 <i>Можно перекусывать овощами или увеличивать количество зелени при необходимости</i>"""
+    },
+
+    3: {
+        "breakfast": """🌅 <b>Завтрак — Тосты с гречневыми хлебцами и авокадо</b>
+
+<b>КБЖУ:</b> 180 ккал | Б: 4,8 г | Ж: 9,9 г | У: 21 г
+
+<b>Ингредиенты:</b>
+• Гречневые хлебцы — 3 шт
+• Авокадо — 60 г
+• Щепотка соли
+
+<b>Приготовление:</b>
+1. На хлебцы сверху выкладываем нарезанное авокадо
+2. Солим по вкусу""",
+
+        "lunch": """🍽 <b>Обед — Салат из киноа и овощей</b>
+
+<b>КБЖУ:</b> 259 ккал | Б: 9 г | Ж: 8,4 г | У: 40,7 г
+
+<b>Ингредиенты:</b>
+• Киноа — 50 г
+• Помидоры — 100 г
+• Огурцы — 150 г
+• Оливковое масло или соус песто — 1 ч.л.
+
+<b>Приготовление:</b>
+1. Киноа отвариваем
+2. Огурец чистим и нарезаем кубиками
+3. Нарезаем помидор
+4. Добавляем овощи к киноа
+5. Солим по вкусу и заправляем соусом песто или маслом""",
+
+        "dinner": """🌙 <b>Ужин — Кабачковые спагетти с песто</b>
+
+<b>КБЖУ:</b> 268 ккал | Б: 6,7 г | Ж: 20,3 г | У: 18,6 г
+
+<b>Ингредиенты:</b>
+• Кабачок — 300 г
+• Соус песто — 15 г
+• Фисташки — 20 г
+• Соль
+
+<b>Приготовление:</b>
+1. Кабачок нарезаем тонкими слайсами при помощи овощечистки
+2. На сковороде обжариваем 7-10 минут
+3. Солим, добавляем песто
+4. Сверху посыпаем орешками""",
+
+        "info": """📋 <b>ДЕНЬ 3 — FMD Протокол</b>
+
+<b>Общая калорийность:</b> ~707 ккал
+
+<b>Рекомендации на день:</b>
+• Поливитамины, Омега 3 ПНЖК
+• Чай без сахара (до 3-4 чашек в день)
+• Повышенное количество воды
+
+⚠️ <b>ВАЖНО:</b> С осторожностью при гипертонической болезни и заболеваниях почек!
+
+💡 <i>Можно перекусывать овощами или увеличивать количество зелени при необходимости</i>"""
+    },
+
+    4: {
+        "breakfast": """🌅 <b>Завтрак — Каша из киноа с корицей и яблоком</b>
+
+<b>КБЖУ:</b> 263 ккал | Б: 6,6 г | Ж: 12,4 г | У: 30,6 г
+
+<b>Ингредиенты:</b>
+• Киноа — 40 г
+• Корица
+• Кокосовое молоко — 50 мл
+• Яблоко — 40 г
+• Ягоды — 20 г
+
+<b>Приготовление:</b>
+1. Киноа отвариваем на воде
+2. В конце добавляем кокосовое молоко и яблоко
+3. Варим ещё пару минут
+4. Добавляем корицу и ягоды""",
+
+        "lunch": """🍽 <b>Обед — Икра из баклажана с салатом из морской капусты</b>
+
+<b>КБЖУ:</b> 280 ккал | Б: 8 г | Ж: 20,1 г | У: 16,9 г
+
+<b>Ингредиенты:</b>
+• Баклажан — 200 г
+• Оливковое масло — 1 ч.л.
+• Фундук — 20 г
+• Чеснок
+• Зелень
+• Соль
+• Морская капуста — 100 г
+
+<b>Приготовление:</b>
+1. Баклажан режем пополам, солим и сбрызгиваем маслом
+2. Отправляем в духовку на 35 минут при 180°C
+3. Готовый баклажан очищаем от шкурки и измельчаем в блендере
+4. Добавляем раздробленный фундук
+5. Едим с морской капустой""",
+
+        "dinner": """🌙 <b>Ужин — Тушёные овощи с соевым соусом</b>
+
+<b>КБЖУ:</b> 166 ккал | Б: 8,1 г | Ж: 7,5 г | У: 21 г
+
+<b>Ингредиенты:</b>
+• Кабачки — 200 г
+• Цветная капуста — 200 г
+• Оливковое масло — 1 ч.л.
+• Кунжут — 5 г
+• Соевый соус — 20 мл
+• Соль, перец
+
+<b>Приготовление:</b>
+1. Овощи нарезать
+2. Сбрызнуть маслом, добавить специи и кунжут
+3. Запечь или обжарить с соевым соусом""",
+
+        "info": """📋 <b>ДЕНЬ 4 — FMD Протокол</b>
+
+<b>Общая калорийность:</b> ~709 ккал
+
+<b>Рекомендации на день:</b>
+• Поливитамины, Омега 3 ПНЖК
+• Чай без сахара (до 3-4 чашек в день)
+• Повышенное количество воды
+
+⚠️ <b>ВАЖНО:</b> С осторожностью при гипертонической болезни и заболеваниях почек!
+
+💡 <i>Можно перекусывать овощами или увеличивать количество зелени при необходимости</i>"""
+    },
+
+    5: {
+        "breakfast": """🌅 <b>Завтрак — Смузи из сельдерея и яблока</b>
+
+<b>КБЖУ:</b> ~100 ккал
+
+<b>Ингредиенты:</b>
+• Сельдерей — пару стеблей
+• Яблоко — 100 г
+• Семена чиа — 1 ч.л.
+
+<b>Приготовление:</b>
+1. Измельчаем всё в блендере
+2. Добавляем воды
+3. В смузи кладём ложку семян и даём постоять 5 минут""",
+
+        "lunch": """🍽 <b>Обед — Суп-пюре из брокколи + салат из свёклы</b>
+
+<b>КБЖУ:</b> 311 ккал | Б: 12 г | Ж: 19,2 г | У: 29,4 г
+
+<b>Ингредиенты для супа:</b>
+• Брокколи — 200 г
+• Кокосовое молоко — 50 мл
+• Фисташки — 20 г
+
+<b>Приготовление супа:</b>
+1. Брокколи отвариваем
+2. Добавляем кокосовое молоко, соль
+3. Пюрируем
+4. Добавляем орехи
+
+<b>Салат из свёклы:</b>
+• Свёкла отварная — 100 г
+• Соль""",
+
+        "dinner": """🌙 <b>Ужин — Запечённые перцы с салатом из киноа</b>
+
+<b>КБЖУ:</b> 350 ккал | Б: 9,4 г | Ж: 17,2 г | У: 41,9 г
+
+<b>Ингредиенты:</b>
+• Киноа — 40 г
+• Перцы — 200 г
+• Соус песто или орехи — 20 г
+• Оливковое масло — 1 ч.л.
+• Половина огурца и половина помидора
+• Соль, перец
+
+<b>Приготовление:</b>
+1. Перец очистить от семечек, посолить и сбрызнуть маслом
+2. Запечь в духовке при 180°C 25 минут
+3. Киноа отварить, нарезать овощи и смешать
+4. Заправить соусом песто или добавить орехи""",
+
+        "info": """📋 <b>ДЕНЬ 5 — FMD Протокол</b>
+
+<b>Общая калорийность:</b> ~761 ккал
+
+<b>Рекомендации на день:</b>
+• Поливитамины, Омега 3 ПНЖК
+• Чай без сахара (до 3-4 чашек в день)
+• Повышенное количество воды
+
+⚠️ <b>ВАЖНО:</b> С осторожностью при гипертонической болезни и заболеваниях почек!
+
+💡 <i>Можно перекусывать овощами или увеличивать количество зелени при необходимости</i>
+
+🎉 <b>Поздравляем! Вы завершили 5-дневный FMD протокол!</b>"""
+    }
+}
+
+
+# ==================== СУШКА (14 дней, ~1500 ккал) ====================
+# DRY_RECIPES[день] = {"info": ..., "breakfast": ..., "snack": ..., "lunch": ..., "dinner": ...}
+
+DRY_RECIPES = {
+    1: {
+        "breakfast": """🌅 <b>Завтрак — Омлет с сыром и рыбой</b>
+
+<b>Ингредиенты:</b>
+• 1 целое яйцо + 3 белка
+• Зеленый лук или шпинат
+• Сыр лёгкий — 30 г
+• Слабосоленая рыба — 40 г
+• Хлеб ржаной — 60 г
+
+<b>Приготовление:</b>
+1. Взбить яйца с зеленью
+2. Готовить омлет на антипригарной сковороде
+3. На готовый омлет выложить сыр и рыбу
+4. Подавать с хлебом""",
+
+        "snack": """🍎 <b>Перекус</b>
+
+• Банан — 100 г
+• Киви — 100 г
+• Кешью — 40 г""",
+
+        "lunch": """🍽 <b>Обед — Овощи запечённые с мясом</b>
+
+<b>Ингредиенты:</b>
+• Куриное филе или говядина — 140 г
+• Овощи (баклажаны, помидоры, перец, лук, чеснок) — 300 г
+• Растительное масло — 1 ч.л.
+• Любая крупа — 60 г (в сухом виде)
+
+<b>Приготовление:</b>
+1. Овощи и мясо нарезать
+2. Запекать в духовке в пакете/фольге при 180° 50 минут
+   или тушить на сковороде до готовности
+3. Отдельно отварить крупу""",
+
+        "dinner": """🌙 <b>Ужин — Творог с овощами</b>
+
+• Мягкий творог 5% — 170 г
+• Зелень по вкусу
+• Свежие овощи — 300 г
+• Специи
+
+Всё смешать, добавить специи по вкусу.""",
+
+        "info": """📋 <b>ДЕНЬ 1 — Сушка</b>
+
+<b>КБЖУ на день:</b> 1481 ккал | Б: 108,2 г | Ж: 53,6 г | У: 151,8 г
+
+💡 <i>В течение дня можно пить чай, кофе без сахара и молока. 
+Если используете сахарозаменитель — пейте только после еды.</i>"""
+    },
+
+    2: {
+        "breakfast": """🌅 <b>Завтрак — Ленивое хачапури</b>
+
+<b>Ингредиенты:</b>
+• Творог 2% — 180 г
+• Яйцо — 1 шт
+• Сыр — 30 г
+• Мука — 30 г
+• Разрыхлитель — 2 г
+• Зелень + специи
+
+<b>Приготовление:</b>
+1. Сыр натереть на тёрке
+2. Всё перемешать
+3. Жарить на разогретой сухой антипригарной сковороде с 2 сторон""",
+
+        "snack": """🍎 <b>Перекусы</b>
+
+Перекус 1: Банан — 100 г
+Перекус 2: Кешью — 40 г""",
+
+        "lunch": """🍽 <b>Обед — Шаурма домашняя</b>
+
+<b>Ингредиенты:</b>
+• Лаваш — 120 г
+• Куриное филе — 100 г
+• Пекинская капуста — 50 г
+• Помидоры — 50 г
+• Огурцы — 50 г
+• Сметана 10% — 15 г
+• Горчица — 5 г
+• Специи
+
+<b>Приготовление:</b>
+1. Филе отварить или обжарить на сухой сковороде, порезать
+2. Лаваш смазать смесью сметаны, горчицы и специй
+3. Выложить курицу и нарезанные овощи
+4. Свернуть в рулет, подсушить на сковороде""",
+
+        "dinner": """🌙 <b>Ужин — Рыба с салатом</b>
+
+• Белая рыба — 160 г
+• Лук — 50 г
+
+<b>Салат:</b>
+• Огурец — 50 г
+• Болгарский перец — 50 г
+• Зелень
+• Оливковое масло — 10 г""",
+
+        "info": """📋 <b>ДЕНЬ 2 — Сушка</b>
+
+<b>КБЖУ на день:</b> 1499 ккал | Б: 119,7 г | Ж: 53 г | У: 140,8 г"""
+    },
+
+    3: {
+        "breakfast": """🌅 <b>Завтрак — Овсяные оладьи с сыром</b>
+
+<b>Ингредиенты:</b>
+• Овсяные хлопья — 60 г
+• Яйцо — 1 шт
+• Ряженка 2,5% — 60 мл
+• Сыр — 30 г
+
+<b>Приготовление:</b>
+1. Всё смешать в блендере
+2. Готовить на сухой антипригарной сковороде""",
+
+        "snack": """🍎 <b>Перекус</b>
+
+• Кешью — 40 г
+• Чернослив — 30 г
+• Апельсин — 200 г""",
+
+        "lunch": """🍽 <b>Обед — Курица по-французски</b>
+
+<b>Ингредиенты:</b>
+• Куриное филе — 120 г
+• Картофель — 200 г
+• Лук — 50 г
+• Сыр — 20 г
+• Сметана 10% — 20 г
+• Горчица — 10 г
+• Специи
+
+<b>Приготовление:</b>
+1. Филе порезать, отбить, выложить на противень, посолить
+2. Смешать сметану с горчицей
+3. Лук полукольцами выложить на филе, смазать соусом
+4. Картофель тонкими кружочками сверху, смазать соусом
+5. Посыпать тёртым сыром
+6. Запекать при 180° ~50 минут до румяной корочки""",
+
+        "dinner": """🌙 <b>Ужин — Кальмар с салатом</b>
+
+• Кальмар — 200 г (отварить)
+
+<b>Салат:</b>
+• Свежая морковь — 50 г
+• Огурец — 50 г
+• Капуста — 50 г
+• Зелень
+• Оливковое масло — 5 г""",
+
+        "info": """📋 <b>ДЕНЬ 3 — Сушка</b>
+
+<b>КБЖУ на день:</b> 1487 ккал | Б: 101,3 г | Ж: 55 г | У: 141,1 г"""
+    },
+
+    4: {
+        "breakfast": """🌅 <b>Завтрак — Шоколадный овсяноблин</b>
+
+<b>Ингредиенты:</b>
+• Овсяные хлопья — 60 г
+• Яйцо — 1 шт
+• Вода — 20-30 мл
+• Какао — 10 г
+• Сахарозаменитель
+
+<b>Начинка:</b>
+• Сыр — 20 г
+• Банан — 50 г
+
+<b>Приготовление:</b>
+1. Всё взбить в блендере
+2. Готовить на сухой сковороде с двух сторон под крышкой
+3. Добавить начинку""",
+
+        "snack": """🍎 <b>Перекусы</b>
+
+Перекус 1: Курага — 30 г + Кефир 1% — 250 мл
+Перекус 2: Апельсин — 100 г""",
+
+        "lunch": """🍽 <b>Обед — Куриные бедра с крупой</b>
+
+<b>Ингредиенты:</b>
+• Куриные бедра — 220 г
+• Морковь — 50 г
+• Лук — 50 г
+• Специи
+• Любая крупа — 50 г (в сухом виде)
+
+<b>Салат:</b>
+• Свежая морковь — 100 г
+• Сметана 10% — 20 г
+• Чеснок — ½ дольки
+
+<b>Приготовление:</b>
+1. Бедра, лук, морковь нарезать и тушить до готовности
+2. Разделить на 2 части (одну на ужин)
+3. Отварить крупу""",
+
+        "dinner": """🌙 <b>Ужин — Куриные бедра с овощами</b>
+
+• 2-я часть куриных бедер (с обеда)
+• Помидор
+• Огурец""",
+
+        "info": """📋 <b>ДЕНЬ 4 — Сушка</b>
+
+<b>КБЖУ на день:</b> 1500 ккал | Б: 95,4 г | Ж: 54,1 г | У: 153,6 г"""
+    },
+
+    5: {
+        "breakfast": """🌅 <b>Завтрак — Сырники со сметаной</b>
+
+<b>Ингредиенты:</b>
+• Творог 2% — 180 г
+• Желток — 1 шт
+• Мука — 30 г + немного для обвалки
+• Сметана 10% — 30 г
+• Сахарозаменитель
+
+<b>Приготовление:</b>
+1. Смешать творог, желток, муку, подсластитель
+2. Слепить сырники
+3. Жарить на сухой сковороде на небольшом огне под крышкой
+4. Подавать со сметаной""",
+
+        "snack": """🍎 <b>Перекусы</b>
+
+Перекус 1: Шоколад — 30 г + Курага — 30 г
+Перекус 2: Кешью — 25 г + Кефир 2,5% — 200 мл""",
+
+        "lunch": """🍽 <b>Обед — Гречка с шампиньонами</b>
+
+<b>Ингредиенты:</b>
+• Гречка — 60 г (в сухом виде)
+• Шампиньоны свежие — 100 г
+• Лук — 50 г
+• Сметана 10% — 50 г
+• Специи
+
+<b>Приготовление:</b>
+1. Грибы и лук нарезать
+2. Тушить на небольшом огне со сметаной ~15 минут
+3. Гречку отварить и перемешать с грибами""",
+
+        "dinner": """🌙 <b>Ужин — Курица с перцем</b>
+
+<b>Ингредиенты:</b>
+• Куриное филе — 120 г
+• Болгарский перец — 150 г
+• Растительное масло — 1 ч.л.
+• Специи
+
+<b>Приготовление:</b>
+Обжарить филе и перец на сковороде с маслом, добавить специи.""",
+
+        "info": """📋 <b>ДЕНЬ 5 — Сушка</b>
+
+<b>КБЖУ на день:</b> 1521 ккал | Б: 117,5 г | Ж: 58,4 г | У: 136 г"""
+    },
+
+    6: {
+        "breakfast": """🌅 <b>Завтрак — Хлеб с яйцами и рыбой</b>
+
+• Хлеб — 80 г
+• Яйца — 2 шт
+• Слабосоленая рыба — 50 г
+• Огурцы — 100 г""",
+
+        "snack": """🍎 <b>Перекус</b>
+
+• Орехи — 20 г
+• Шоколад — 10 г
+• Кефир 1% — 250 мл""",
+
+        "lunch": """🍽 <b>Обед — Куриные бедра с макаронами</b>
+
+<b>Ингредиенты:</b>
+• Куриные бедра — 200 г
+• Морковь — 100 г
+• Лук — 100 г
+• Томатная паста — 5 г
+• Макароны из твердых сортов — 60 г
+
+<b>Приготовление:</b>
+1. Лук, морковь и бедра нарезать, тушить до готовности
+2. В конце добавить томатную пасту
+3. Отварить макароны
+4. Половину бедер оставить на ужин""",
+
+        "dinner": """🌙 <b>Ужин — Куриные бедра с овощами</b>
+
+• 2-я половина бедер (с обеда)
+• Помидор
+• Огурец
+• Зелень""",
+
+        "info": """📋 <b>ДЕНЬ 6 — Сушка</b>
+
+<b>КБЖУ на день:</b> 1476 ккал | Б: 97,7 г | Ж: 58,5 г | У: 143,5 г
+
+💡 <i>Совет: добавьте физическую активность! 8-13 тыс. шагов — хорошая отправная точка. Это поможет контролировать аппетит.</i>"""
+    },
+
+    7: {
+        "breakfast": """🌅 <b>Завтрак — Яблочные оладьи</b>
+
+<b>Ингредиенты:</b>
+• Яблоки — 300 г
+• Яйцо — 1 шт
+• Овсяная мука — 40 г
+• Корица + сахарозаменитель
+• Сметана 10% — 1 ст.л.
+
+<b>Приготовление:</b>
+1. Яблоки очистить, натереть на крупной тёрке
+2. Добавить остальные ингредиенты, перемешать
+3. Жарить оладьи на медленном огне 3-5 мин с каждой стороны""",
+
+        "snack": """🍎 <b>Перекус — Мусс ягодный</b>
+
+• Орехи — 40 г
+• Ягоды — 100 г
+• Мягкий творог 5% — 150 г
+
+Взбить всё в блендере, добавить сахарозаменитель по желанию.""",
+
+        "lunch": """🍽 <b>Обед — Куриные котлеты с рисом</b>
+
+<b>Котлеты (на 6 шт):</b>
+• Куриное филе — 400 г
+• Кабачок — 150 г (натереть)
+• Цельнозерновая мука — 30 г
+• Сметана 10% — 25 г
+• Яйцо — 1 шт
+• Специи
+
+<b>Гарнир:</b>
+• Рис — 40 г (в сухом виде)
+
+<b>Салат:</b>
+• Морковь — 100 г + Сметана 10% — 1 ст.л. + Чеснок
+
+<b>Приготовление:</b>
+1. Филе измельчить в фарш, добавить всё остальное
+2. Сформировать 6 котлет
+3. Жарить на антипригарной сковороде под крышкой
+4. На обед — 2 котлеты с рисом и салатом""",
+
+        "dinner": """🌙 <b>Ужин — Куриные котлеты с овощами</b>
+
+• 2 куриные котлеты (с обеда)
+• Тушеная овощная смесь — 200 г""",
+
+        "info": """📋 <b>ДЕНЬ 7 — Сушка</b>
+
+<b>КБЖУ на день:</b> 1507 ккал | Б: 110,6 г | Ж: 48,5 г | У: 157,8 г"""
+    },
+
+    8: {
+        "breakfast": """🌅 <b>Завтрак — Кукурузная каша</b>
+
+• Кукурузная крупа — 60 г
+• Курага — 20 г
+• Сливочное масло — 20 г""",
+
+        "snack": """🍎 <b>Перекус</b>
+
+• Орехи — 40 г
+• Шоколад — 10 г
+• Кефир 1% — 200 мл""",
+
+        "lunch": """🍽 <b>Обед — Куриные котлеты с макаронами</b>
+
+• 2 куриные котлеты (с 7-го дня)
+• Макароны — 60 г (в сухом виде)
+
+<b>Салат:</b>
+• Помидор + Огурец + Оливковое масло 1 ч.л. + Специи""",
+
+        "dinner": """🌙 <b>Ужин — Рыба с брокколи</b>
+
+• Белая нежирная рыба — 200 г
+• Брокколи — 200 г
+
+<b>Приготовление:</b>
+Запечь или потушить рыбу вместе с брокколи. Сбрызнуть лимоном.""",
+
+        "info": """📋 <b>ДЕНЬ 8 — Сушка</b>
+
+<b>КБЖУ на день:</b> 1492 ккал | Б: 102,3 г | Ж: 55,6 г | У: 152,4 г
+
+💡 <i>Совет: к любому приёму пищи можно добавлять приправы и зелень — на калорийность это не влияет.</i>"""
+    },
+
+    9: {
+        "breakfast": """🌅 <b>Завтрак — Яичница в лаваше</b>
+
+• Тонкий лаваш — 25 г
+• Яйца — 2 шт
+• Помидоры — 40 г
+• Сыр — 25 г""",
+
+        "snack": """🍎 <b>Перекусы</b>
+
+<b>Смузи:</b>
+• Кефир 1% или растительное молоко — 100 мл
+• Банан — 100 г
+• Замороженная клубника — 100 г
+• Какао — 1 ст.л.
+• Сахарозаменитель
+
+Перекус 2: Кешью — 30 г""",
+
+        "lunch": """🍽 <b>Обед — Индейка в сметанном соусе</b>
+
+<b>Ингредиенты:</b>
+• Индейка — 280 г
+• Морковь — 100 г
+• Лук — 100 г
+• Сметана 10% — 2 ст.л.
+• Гречка — 60 г
+
+<b>Салат:</b>
+• Морковь — 100 г + Капуста — 100 г + Масло — 2 ч.л.
+
+<b>Приготовление:</b>
+1. Лук, морковь, индейку нарезать и тушить
+2. В конце добавить сметану и специи
+3. Разделить на 2 части (одну на ужин)""",
+
+        "dinner": """🌙 <b>Ужин — Индейка с брокколи</b>
+
+• 2-я часть индейки в сметанном соусе
+• Брокколи — 200 г""",
+
+        "info": """📋 <b>ДЕНЬ 9 — Сушка</b>
+
+<b>КБЖУ на день:</b> 1517 ккал | Б: 104,6 г | Ж: 58 г | У: 161,8 г
+
+💡 <i>Совет: после прохождения программы можно начать её сначала. Если вес уменьшился на 10-20%, калорийность нужно пересчитать.</i>"""
+    },
+
+    10: {
+        "breakfast": """🌅 <b>Завтрак — Овсяная каша с бананом</b>
+
+• Овсяные хлопья долгой варки — 60 г
+• Банан — 100 г
+• Кешью — 40 г
+
+Сварить кашу на воде, добавить банан и орехи.""",
+
+        "snack": """🍎 <b>Перекусы</b>
+
+Перекус 1: Шоколад — 20 г
+Перекус 2: Кефир 1% — 200 мл""",
+
+        "lunch": """🍽 <b>Обед — Рыба с овощами</b>
+
+<b>Ингредиенты:</b>
+• Белая рыба — 120 г
+• Морковь — 50 г
+• Лук — 50 г
+• Помидоры — 100 г
+• Растительное масло — 1 ч.л.
+• Специи
+• Макароны из твёрдых сортов — 60 г
+
+<b>Приготовление:</b>
+1. Овощи нарезать, добавить масло, тушить
+2. В конце добавить рыбу, довести до готовности
+3. Отварить макароны""",
+
+        "dinner": """🌙 <b>Ужин — Салат с курицей</b>
+
+<b>Ингредиенты:</b>
+• Куриное филе — 140 г (отварить)
+• Яйцо — 1 шт (отварить)
+• Сыр Фета — 25 г
+• Огурец — 100 г
+• Йогурт для заправки — 20 г
+• Специи
+
+Нарезать все ингредиенты, смешать в салат.""",
+
+        "info": """📋 <b>ДЕНЬ 10 — Сушка</b>
+
+<b>КБЖУ на день:</b> 1475 ккал | Б: 105,6 г | Ж: 53,3 г | У: 144 г
+
+💡 <i>Совет о воде: норма индивидуальна и зависит от активности, времени года, веса. Пейте по жажде, не мучайте себя 2 литрами.</i>"""
+    },
+
+    11: {
+        "breakfast": """🌅 <b>Завтрак — Яичница с помидорами</b>
+
+• Яйца — 2 шт
+• Помидоры — 100 г
+• Хлеб — 50 г
+• Огурцы — 100 г
+
+Приготовить яичницу с помидорами, подать с хлебом и огурцами.""",
+
+        "snack": """🍎 <b>Перекусы</b>
+
+Перекус 1: Кешью — 40 г
+Перекус 2: Апельсин — 120 г + Шоколад — 20 г""",
+
+        "lunch": """🍽 <b>Обед — Печень с рисом</b>
+
+<b>Ингредиенты:</b>
+• Печень — 150 г
+• Лук — 100 г
+• Морковь — 100 г
+• Рис — 50 г
+• Огурец — 100 г
+
+<b>Приготовление:</b>
+1. Лук нарезать, морковь натереть или нарезать
+2. Тушить на сковороде на небольшом огне
+3. Печень нарезать кусочками, добавить к овощам
+4. Соль, перец по вкусу, тушить под крышкой до готовности
+5. Отварить рис, нарезать огурец""",
+
+        "dinner": """🌙 <b>Ужин — Треска с овощами</b>
+
+<b>Ингредиенты:</b>
+• Треска — 250 г
+• Помидоры — 100 г
+• Перец болгарский — 100 г
+• Морковь — 100 г
+• Растительное масло — 5 г
+
+<b>Приготовление:</b>
+1. Овощи нарезать, смазать сковороду маслом, тушить до полуготовности
+2. Треску нарезать, добавить к овощам
+3. Посолить, поперчить, тушить до готовности""",
+
+        "info": """📋 <b>ДЕНЬ 11 — Сушка</b>
+
+<b>КБЖУ на день:</b> 1477 ккал | Б: 102,8 г | Ж: 55,8 г | У: 139,8 г"""
+    },
+
+    12: {
+        "breakfast": """🌅 <b>Завтрак — Рисовый блинчик с начинкой</b>
+
+<b>Ингредиенты:</b>
+• Яйцо — 1 шт
+• Рисовая мука — 40 г
+• Мягкий творог 0% — 70 г
+• Разрыхлитель — 1 г
+
+<b>Начинка:</b>
+• Сыр — 20 г
+• Банан — 100 г
+
+<b>Приготовление:</b>
+Смешать все ингредиенты, готовить блинчик на антипригарной сковороде. Добавить начинку.""",
+
+        "snack": """🍎 <b>Перекус</b>
+
+• Орехи кешью — 40 г
+• Яблоки — 120 г""",
+
+        "lunch": """🍽 <b>Обед — Курица с грибами</b>
+
+<b>Ингредиенты:</b>
+• Куриное филе — 100 г
+• Шампиньоны — 100 г
+• Сметана — 2 ст.л.
+• Соль, перец
+• Гречка — 50 г
+• Огурцы — 100 г
+
+<b>Приготовление:</b>
+1. Филе и грибы нарезать, тушить до полуготовности
+2. За 5 минут до готовности добавить сметану и специи
+3. Отварить гречку""",
+
+        "dinner": """🌙 <b>Ужин — Курица с морковным салатом</b>
+
+• Куриное филе — 140 г (обжарить на антипригарной сковороде)
+
+<b>Салат:</b>
+• Морковь — 200 г
+• Сметана — 2 ст.л.
+• Чеснок
+• Хлеб — 40 г""",
+
+        "info": """📋 <b>ДЕНЬ 12 — Сушка</b>
+
+<b>КБЖУ на день:</b> 1477 ккал | Б: 101,8 г | Ж: 49,2 г | У: 158 г"""
+    },
+
+    13: {
+        "breakfast": """🌅 <b>Завтрак — Ленивая овсянка</b>
+
+<b>Ингредиенты:</b>
+• Овсяная крупа (геркулес) — 60 г
+• Вишня — 100 г
+• Ряженка 3,2% — 200 мл
+• Сахарозаменитель
+
+<b>Приготовление:</b>
+1. С вечера смешать овсянку с ряженкой и сахарозаменителем
+2. Оставить в холодильнике на ночь
+3. Утром добавить вишню""",
+
+        "snack": """🍎 <b>Перекус</b>
+
+• Шоколад — 30 г""",
+
+        "lunch": """🍽 <b>Обед — Куриные бедра с крупой</b>
+
+• Куриные бедра (без кожи и костей) — 150 г
+• Любая крупа — 60 г
+• Квашеная капуста — 150 г
+
+Бедра нарезать, посолить, поперчить. Отварить крупу. Подавать с капустой.""",
+
+        "dinner": """🌙 <b>Ужин — Тунец с овощами</b>
+
+• Консервированный тунец — 180 г 
+  (можно заменить на нежирную тушёную рыбу или морепродукты)
+• Хлеб — 60 г
+• Огурец или квашеная капуста — 150 г
+• Помидоры — 100 г""",
+
+        "info": """📋 <b>ДЕНЬ 13 — Сушка</b>
+
+<b>КБЖУ на день:</b> 1473 ккал | Б: 106,3 г | Ж: 48,5 г | У: 148,7 г"""
+    },
+
+    14: {
+        "breakfast": """🌅 <b>Завтрак — Сырники со сметаной</b>
+
+<b>Ингредиенты:</b>
+• Творог 2% — 160 г
+• Желток — 1 шт
+• Мука — 30 г + для обвалки
+• Сметана 10% — 30 г
+• Сахарозаменитель
+
+Смешать все ингредиенты, готовить на антипригарной сковороде. Подавать со сметаной.""",
+
+        "snack": """🍎 <b>Перекус</b>
+
+• Ряженка 3,2% — 250 мл
+• Банан — 100 г
+• Шоколад — 20 г""",
+
+        "lunch": """🍽 <b>Обед — Гречка с яйцами</b>
+
+• Яйца — 2 шт
+• Гречка — 60 г
+• Капуста — 150 г
+
+Гречку отварить и залить яйцом. Подавать с капустой.""",
+
+        "dinner": """🌙 <b>Ужин — Салат с курицей</b>
+
+<b>Салат:</b>
+• Помидоры — 140 г
+• Огурцы — 150 г
+• Оливки или маслины — 100 г
+• Растительное масло — 1 ч.л.
+• Специи
+
++ Куриное филе — 150 г (отварить или потушить)""",
+
+        "info": """📋 <b>ДЕНЬ 14 — Сушка</b>
+
+<b>КБЖУ на день:</b> 1501 ккал | Б: 109,5 г | Ж: 61,5 г | У: 131,3 г
+
+🎉 <b>Поздравляем! Вы завершили 14-дневную программу Сушки!</b>
+
+💡 <i>Для продолжения результата можно начать программу заново или пересчитать калорийность, если вес изменился.</i>"""
+    }
+}
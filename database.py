@@ -1,12 +1,331 @@
+import asyncio
+import bisect
+import gzip
 import logging
+import os
+import shutil
+import sqlite3
+import sys
+import time
 import aiosqlite
-from datetime import datetime, timedelta
-from typing import Optional, List, Dict
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timedelta, timezone
+from enum import IntFlag
+from typing import Optional, List, Dict, Iterable, Set, Tuple, AsyncIterator
+
+from backends import Backend, create_backend
 
 DATABASE_NAME = 'bot_database.db'
+# Строка подключения: sqlite:///путь или postgresql://... (см. backends).
+# None — файл SQLite DATABASE_NAME
+DATABASE_URL: Optional[str] = None
+DATABASE_POOL_SIZE = 4  # Количество постоянных соединений в пуле
+READ_POOL_SIZE = 2      # Соединения только для чтения (отчёты и списки админки)
 logger = logging.getLogger(__name__)
 
 
+# ==================== Connection Pool ====================
+
+_backend: Optional[Backend] = None
+_pool_closed = False  # close_pool() уже вызван: соединения больше не выдаются
+
+
+def database_url() -> str:
+    """Строка подключения к текущей базе"""
+    return DATABASE_URL or f'sqlite:///{DATABASE_NAME}'
+
+
+async def init_pool(size: int = DATABASE_POOL_SIZE) -> Backend:
+    """
+    Подключиться к базе и открыть пул соединений (один раз при старте бота
+    или скрипта). Скрипт, открывший пул, должен закрыть его через close_pool():
+    потоки aiosqlite не фоновые и не дадут процессу завершиться.
+    """
+    global _backend, _pool_closed
+    _pool_closed = False
+    if _backend is None:
+        backend = create_backend(database_url(), size, READ_POOL_SIZE)
+        await backend.open()
+        # Пока открывали соединения, пул мог создать кто-то другой
+        if _backend is None:
+            _backend = backend
+        else:
+            await backend.close()
+    return _backend
+
+
+async def close_pool():
+    """
+    Закрыть пулы соединений (вызывается при остановке бота, после остановки
+    scheduler). После этого connection() выдаёт ошибку, а не открывает пул заново.
+    """
+    global _backend, _pool_closed
+    _pool_closed = True
+    if _backend is not None:
+        backend, _backend = _backend, None
+        await backend.close()
+
+
+def _open_backend() -> Backend:
+    """Текущий бэкенд; пул должен быть открыт через init_pool() и ещё не закрыт"""
+    if _backend is None:
+        if _pool_closed:
+            raise RuntimeError("Database pool is closed")
+        raise RuntimeError("Database pool is not open, call init_pool() first")
+    return _backend
+
+
+@asynccontextmanager
+async def connection():
+    """Получить соединение из пула (пул открывает init_pool())"""
+    backend = _open_backend()
+    async with backend.acquire() as db:
+        yield _instrument(db)
+
+
+@asynccontextmanager
+async def read_connection():
+    """
+    Соединение только для чтения с открытой читающей транзакцией.
+
+    Все запросы внутри блока видят один снимок базы, поэтому цифры
+    отчёта согласованы между собой, а запись бота в это время не ждёт.
+    """
+    backend = _open_backend()
+    async with backend.acquire_read() as db:
+        yield _instrument(db)
+
+
+def _is_sqlite() -> bool:
+    """Текущая база — SQLite (для запросов, которые пишутся по-разному)"""
+    return _backend is None or _backend.dialect == 'sqlite'
+
+
+# ==================== Query Stats ====================
+
+QUERY_STATS_ENABLED = True   # Считать время и строки запросов по функциям модуля
+SLOW_QUERY_MS = 200          # Запросы дольше этого пишутся в лог database.slow
+# Верхние границы корзин гистограммы задержек, мс; последняя корзина — всё, что дольше
+QUERY_HISTOGRAM_BOUNDS_MS = (1, 5, 10, 50, 100, 500, 1000)
+SLOW_QUERY_SQL_LIMIT = 500   # Сколько символов SQL попадает в лог
+
+_slow_logger = logging.getLogger(f'{__name__}.slow')
+
+
+class QueryStats:
+    """
+    Счётчики запросов одной функции модуля: вызовы, ошибки, медленные
+    запросы, строки, суммарное и максимальное время и гистограмма задержек.
+    """
+
+    __slots__ = ('calls', 'errors', 'slow', 'rows', 'total_ms', 'max_ms', 'histogram')
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.slow = 0
+        self.rows = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.histogram = [0] * (len(QUERY_HISTOGRAM_BOUNDS_MS) + 1)
+
+    def record(self, elapsed_ms: float, rows: int, error: bool = False):
+        self.calls += 1
+        self.errors += error
+        self.slow += elapsed_ms >= SLOW_QUERY_MS
+        self.rows += rows
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.histogram[bisect.bisect_left(QUERY_HISTOGRAM_BOUNDS_MS, elapsed_ms)] += 1
+
+    def as_dict(self) -> Dict:
+        labels = [f'≤{bound}' for bound in QUERY_HISTOGRAM_BOUNDS_MS]
+        labels.append(f'>{QUERY_HISTOGRAM_BOUNDS_MS[-1]}')
+        return {
+            'calls': self.calls,
+            'errors': self.errors,
+            'slow': self.slow,
+            'rows': self.rows,
+            'total_ms': round(self.total_ms, 1),
+            'avg_ms': round(self.total_ms / self.calls, 2) if self.calls else 0.0,
+            'max_ms': round(self.max_ms, 1),
+            'histogram': dict(zip(labels, self.histogram)),
+        }
+
+
+_query_stats: Dict[str, QueryStats] = {}
+
+
+def _params_shape(parameters) -> str:
+    """Типы параметров без значений: в лог не должны попадать личные данные"""
+    if parameters is None:
+        return '()'
+    if isinstance(parameters, dict):
+        return '{' + ', '.join(f'{key}: {type(value).__name__}'
+                               for key, value in parameters.items()) + '}'
+    types = [type(value).__name__ for value in parameters]
+    if len(types) > 10 and len(set(types)) == 1:
+        # Длинные списки id из IN (...) сворачиваем
+        return f'({len(types)} × {types[0]})'
+    return '(' + ', '.join(types) + ')'
+
+
+def _record_query(function: str, sql: str, parameters, started: float,
+                  rows: int, error: bool = False):
+    """Учесть выполненный запрос и записать его в лог, если он медленный"""
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    stats = _query_stats.get(function)
+    if stats is None:
+        stats = _query_stats[function] = QueryStats()
+    stats.record(elapsed_ms, rows, error)
+    if elapsed_ms >= SLOW_QUERY_MS:
+        statement = ' '.join(sql.split())
+        if len(statement) > SLOW_QUERY_SQL_LIMIT:
+            statement = statement[:SLOW_QUERY_SQL_LIMIT] + '…'
+        _slow_logger.warning(
+            f"Slow query in {function}: {elapsed_ms:.1f} ms, {rows} rows, "
+            f"params {parameters}: {statement}")
+
+
+class _CountingCursor:
+    """Курсор, который считает выбранные через него строки"""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self.rows = 0
+
+    async def fetchone(self):
+        row = await self._cursor.fetchone()
+        if row is not None:
+            self.rows += 1
+        return row
+
+    async def fetchall(self):
+        rows = await self._cursor.fetchall()
+        self.rows += len(rows)
+        return rows
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        async for row in self._cursor:
+            self.rows += 1
+            yield row
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class _TimedQuery:
+    """
+    Результат execute(), который можно и await-ить, и открыть через async with.
+
+    await: время выполнения и rowcount (запись). async with: время до закрытия
+    курсора и число строк, выбранных внутри блока (чтение).
+    """
+
+    def __init__(self, query, function: str, sql: str, parameters):
+        self._query = query
+        self._function = function
+        self._sql = sql
+        self._parameters = parameters
+        self._started = 0.0
+        self._cursor: Optional[_CountingCursor] = None
+
+    def __await__(self):
+        return self._execute().__await__()
+
+    async def _execute(self):
+        started = time.perf_counter()
+        try:
+            cursor = await self._query
+        except Exception:
+            _record_query(self._function, self._sql, _params_shape(self._parameters),
+                          started, 0, error=True)
+            raise
+        _record_query(self._function, self._sql, _params_shape(self._parameters),
+                      started, max(cursor.rowcount, 0))
+        return cursor
+
+    async def __aenter__(self):
+        self._started = time.perf_counter()
+        try:
+            cursor = await self._query.__aenter__()
+        except Exception:
+            _record_query(self._function, self._sql, _params_shape(self._parameters),
+                          self._started, 0, error=True)
+            raise
+        self._cursor = _CountingCursor(cursor)
+        return self._cursor
+
+    async def __aexit__(self, exc_type, exc, tb):
+        try:
+            return await self._query.__aexit__(exc_type, exc, tb)
+        finally:
+            _record_query(self._function, self._sql, _params_shape(self._parameters),
+                          self._started, self._cursor.rows)
+
+
+class _InstrumentedConnection:
+    """
+    Соединение, которое учитывает каждый execute/executemany в _query_stats.
+
+    Запрос относится к функции модуля, которая его выполнила (по кадру
+    вызова), поэтому статистика получается по get_stats, add_user и т. д.
+    Остальные атрибуты (commit, rollback, in_transaction) — как у соединения.
+    """
+
+    def __init__(self, db):
+        self._db = db
+
+    def execute(self, sql: str, parameters=None) -> _TimedQuery:
+        function = sys._getframe(1).f_code.co_name
+        query = self._db.execute(sql) if parameters is None else self._db.execute(sql, parameters)
+        return _TimedQuery(query, function, sql, parameters)
+
+    async def executemany(self, sql: str, seq_of_parameters):
+        function = sys._getframe(1).f_code.co_name
+        if isinstance(seq_of_parameters, (list, tuple)):
+            rows = len(seq_of_parameters)
+            shape = f'{rows} × {_params_shape(seq_of_parameters[0]) if rows else "()"}'
+        else:
+            rows, shape = 0, 'iterable'
+        started = time.perf_counter()
+        try:
+            result = await self._db.executemany(sql, seq_of_parameters)
+        except Exception:
+            _record_query(function, sql, shape, started, 0, error=True)
+            raise
+        _record_query(function, sql, shape, started, rows)
+        return result
+
+    def __getattr__(self, name):
+        return getattr(self._db, name)
+
+
+def _instrument(db):
+    """Обернуть соединение из пула, если учёт запросов включён"""
+    return _InstrumentedConnection(db) if QUERY_STATS_ENABLED else db
+
+
+def get_query_stats(limit: Optional[int] = None) -> List[Dict]:
+    """
+    Статистика запросов по функциям модуля, самые затратные по суммарному
+    времени — первыми (для логов и команды /dbstats в админке).
+    """
+    items = sorted(_query_stats.items(), key=lambda item: item[1].total_ms, reverse=True)
+    if limit is not None:
+        items = items[:limit]
+    return [{'function': function, **stats.as_dict()} for function, stats in items]
+
+
+def reset_query_stats():
+    """Обнулить статистику запросов"""
+    _query_stats.clear()
+
+
 # ==================== Event Types ====================
 class EventType:
     """Типы событий для аналитики"""
@@ -20,276 +339,1001 @@ class EventType:
     RATION_VIEWED = 'ration_viewed'           # Просмотрел рацион
 
 
-async def init_db():
-    """Инициализация базы данных"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        await db.execute('''
-            CREATE TABLE IF NOT EXISTS users (
-                user_id INTEGER PRIMARY KEY,
-                username TEXT,
-                first_name TEXT,
-                has_paid INTEGER DEFAULT 0,
-                has_paid_fmd INTEGER DEFAULT 0,
-                has_paid_bundle INTEGER DEFAULT 0,
-                payment_request_date TEXT,
-                fmd_payment_request_date TEXT,
-                bundle_payment_request_date TEXT,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
+class Entitlement(IntFlag):
+    """Доступы пользователя к продуктам (битовая маска users.entitlements)"""
+    NONE = 0
+    MAIN = 1      # Рационы питания (has_paid)
+    FMD = 2       # FMD протокол (has_paid_fmd)
+    BUNDLE = 4    # Комплект Рационы + FMD (has_paid_bundle)
+    DRY = 8       # Сушка (has_paid_dry)
 
-        # Миграция: добавляем поля для FMD если их нет
-        try:
-            await db.execute('ALTER TABLE users ADD COLUMN has_paid_fmd INTEGER DEFAULT 0')
-        except:
-            pass  # Колонка уже существует
-        try:
-            await db.execute('ALTER TABLE users ADD COLUMN fmd_payment_request_date TEXT')
-        except:
-            pass  # Колонка уже существует
-        try:
-            await db.execute('ALTER TABLE users ADD COLUMN has_paid_bundle INTEGER DEFAULT 0')
-        except:
-            pass  # Колонка уже существует
-        try:
-            await db.execute('ALTER TABLE users ADD COLUMN bundle_payment_request_date TEXT')
-        except:
-            pass  # Колонка уже существует
-        # Миграция: добавляем поля для Сушки если их нет
-        try:
-            await db.execute('ALTER TABLE users ADD COLUMN has_paid_dry INTEGER DEFAULT 0')
-        except:
-            pass  # Колонка уже существует
-        try:
-            await db.execute('ALTER TABLE users ADD COLUMN dry_payment_request_date TEXT')
-        except:
-            pass  # Колонка уже существует
-        await db.execute('''
-            CREATE TABLE IF NOT EXISTS payment_requests (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id INTEGER NOT NULL,
-                status TEXT CHECK(status IN ('pending', 'approved', 'rejected')) DEFAULT 'pending',
-                admin_message_id INTEGER,
-                product_type TEXT DEFAULT 'main',
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY(user_id) REFERENCES users(user_id)
-            )
-        ''')
 
-        # Миграция: добавляем product_type если его нет
-        try:
-            await db.execute("ALTER TABLE payment_requests ADD COLUMN product_type TEXT DEFAULT 'main'")
-        except:
-            pass  # Колонка уже существует
-        # Таблица для хранения рецептов (редактируемых через админку)
-        await db.execute('''
-            CREATE TABLE IF NOT EXISTS recipes (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                calories INTEGER NOT NULL,
-                day INTEGER NOT NULL,
-                meal_type TEXT CHECK(meal_type IN ('breakfast', 'lunch', 'dinner')) NOT NULL,
-                content TEXT NOT NULL,
-                updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                updated_by TEXT,
-                UNIQUE(calories, day, meal_type)
-            )
-        ''')
-        # Таблица для результатов калькулятора калорий
-        await db.execute('''
-            CREATE TABLE IF NOT EXISTS calculator_results (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id INTEGER NOT NULL,
-                gender TEXT,
-                age INTEGER,
-                height REAL,
-                weight REAL,
-                steps INTEGER,
-                cardio INTEGER,
-                strength INTEGER,
-                goal TEXT,
-                hormones TEXT,
-                level TEXT,
-                calories REAL,
-                protein INTEGER,
-                fats INTEGER,
-                carbs REAL,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY(user_id) REFERENCES users(user_id)
-            )
-        ''')
+# ==================== User Cache ====================
 
-        # ==================== Таблица событий для аналитики ====================
-        await db.execute('''
-            CREATE TABLE IF NOT EXISTS user_events (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id INTEGER NOT NULL,
-                event_type TEXT NOT NULL,
-                metadata TEXT,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY(user_id) REFERENCES users(user_id)
-            )
-        ''')
+USER_CACHE_SIZE = 10000         # Сколько пользователей держать в памяти
+USER_CACHE_TTL_SECONDS = 300    # Страховка от изменений в обход этого модуля и CacheSync
 
-        # ==================== Таблица follow-up сообщений ====================
-        await db.execute('''
-            CREATE TABLE IF NOT EXISTS followup_messages (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id INTEGER NOT NULL,
-                message_type TEXT NOT NULL,
-                scheduled_at TEXT NOT NULL,
-                sent_at TEXT,
-                status TEXT CHECK(status IN ('pending', 'sent', 'cancelled', 'failed')) DEFAULT 'pending',
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY(user_id) REFERENCES users(user_id)
-            )
-        ''')
 
-        # Индекс для быстрого поиска событий по типу
-        await db.execute('''
-            CREATE INDEX IF NOT EXISTS idx_user_events_type 
-            ON user_events(event_type, created_at)
-        ''')
+class UserCache:
+    """
+    Ограниченный LRU-кэш редко меняющихся данных пользователя: доступов
+    к продуктам и факта прохождения калькулятора.
 
-        # Индекс для follow-up сообщений
-        await db.execute('''
-            CREATE INDEX IF NOT EXISTS idx_followup_pending 
-            ON followup_messages(status, scheduled_at)
-        ''')
+    Записи сбрасываются синхронно функциями, которые эти данные меняют
+    (set_*_payment_status, reset_user_payment, save_calculator_result),
+    а изменения из других процессов бота — целиком через CacheSync.
+    """
 
-        # ==================== Таблица рассылок ====================
-        await db.execute('''
-            CREATE TABLE IF NOT EXISTS broadcasts (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                content TEXT NOT NULL,
-                audience TEXT NOT NULL CHECK(audience IN ('all', 'start_only', 'rejected', 'no_screenshot')),
-                scheduled_at TEXT NOT NULL,
-                status TEXT CHECK(status IN ('pending', 'sending', 'sent', 'cancelled')) DEFAULT 'pending',
-                created_by INTEGER NOT NULL,
-                created_by_username TEXT,
-                sent_count INTEGER DEFAULT 0,
-                failed_count INTEGER DEFAULT 0,
-                media_type TEXT CHECK(media_type IN ('photo', 'video', NULL)),
-                media_file_id TEXT,
-                buttons TEXT,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                sent_at TEXT
-            )
-        ''')
+    def __init__(self, maxsize: int = USER_CACHE_SIZE, ttl: float = USER_CACHE_TTL_SECONDS):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+        # Растёт при каждом сбросе: значение, прочитанное из БД до сброса,
+        # уже может быть устаревшим и в кэш не попадает
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: int, field: str):
+        """Значение из кэша или None"""
+        entry = self._entries.get(user_id)
+        if entry is not None and field in entry and entry['expires_at'] > time.monotonic():
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return entry[field]
+        self.misses += 1
+        return None
+
+    def put(self, user_id: int, field: str, value, generation: int):
+        """Сохранить значение, прочитанное из БД при данном generation"""
+        if generation != self.generation:
+            return
+        now = time.monotonic()
+        entry = self._entries.get(user_id)
+        if entry is None or entry['expires_at'] <= now:
+            entry = {'expires_at': now + self.ttl}
+            self._entries[user_id] = entry
+        entry[field] = value
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: Optional[int] = None):
+        """Сбросить пользователя (или весь кэш, если user_id не указан)"""
+        self.generation += 1
+        if user_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(user_id, None)
 
-        # Миграция: добавляем поля для медиа и кнопок если их нет
-        try:
-            await db.execute('ALTER TABLE broadcasts ADD COLUMN media_type TEXT')
-        except:
-            pass
-        try:
-            await db.execute('ALTER TABLE broadcasts ADD COLUMN media_file_id TEXT')
-        except:
-            pass
-        try:
-            await db.execute('ALTER TABLE broadcasts ADD COLUMN buttons TEXT')
-        except:
-            pass
+    def stats(self) -> Dict:
+        total = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total, 3) if total else 0.0,
+        }
 
-        # Индекс для поиска pending рассылок
-        await db.execute('''
-            CREATE INDEX IF NOT EXISTS idx_broadcasts_pending 
-            ON broadcasts(status, scheduled_at)
-        ''')
 
-        # ==================== Таблица шаблонов рассылок ====================
-        await db.execute('''
-            CREATE TABLE IF NOT EXISTS broadcast_templates (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT,
-                content TEXT NOT NULL,
-                created_by INTEGER NOT NULL,
-                created_by_username TEXT,
-                media_type TEXT CHECK(media_type IN ('photo', 'video', NULL)),
-                media_file_id TEXT,
-                buttons TEXT,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
+_user_cache = UserCache()
 
-        # Миграция: добавляем поля для медиа и кнопок если их нет
-        try:
-            await db.execute('ALTER TABLE broadcast_templates ADD COLUMN media_type TEXT')
-        except:
-            pass
-        try:
-            await db.execute('ALTER TABLE broadcast_templates ADD COLUMN media_file_id TEXT')
-        except:
-            pass
-        try:
-            await db.execute('ALTER TABLE broadcast_templates ADD COLUMN buttons TEXT')
-        except:
-            pass
 
-        # ==================== Таблица автоматических рассылок ====================
-        await db.execute('''
-            CREATE TABLE IF NOT EXISTS auto_broadcasts (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                trigger_type TEXT NOT NULL CHECK(trigger_type IN ('only_start', 'no_payment', 'rejected', 'no_screenshot')),
-                content TEXT NOT NULL,
-                delay_hours INTEGER NOT NULL DEFAULT 24,
-                is_active INTEGER DEFAULT 1,
-                created_by INTEGER NOT NULL,
-                created_by_username TEXT,
-                sent_count INTEGER DEFAULT 0,
-                media_type TEXT CHECK(media_type IN ('photo', 'video', NULL)),
-                media_file_id TEXT,
-                buttons TEXT,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP
-            )
+def get_user_cache_stats() -> Dict:
+    """Счётчики кэша пользователей (для логов и админки)"""
+    return _user_cache.stats()
+
+
+# ==================== Timestamps ====================
+
+# Метки времени хранятся текстом в двух форматах: CURRENT_TIMESTAMP
+# ('YYYY-MM-DD HH:MM:SS', UTC) и datetime.now().isoformat() (местное время
+# с 'T'). Строки разных форматов нельзя сравнивать между собой, поэтому
+# выборки за период идут по соседним INTEGER-колонкам с секундами Unix.
+# Таблица -> [(колонка секунд, текстовая колонка)]
+EPOCH_COLUMNS = {
+    'users': [('created_ts', 'created_at'), ('payment_request_ts', 'payment_request_date')],
+    'payment_requests': [('created_ts', 'created_at')],
+    'calculator_results': [('created_ts', 'created_at')],
+    'user_events': [('created_ts', 'created_at')],
+    'followup_messages': [
+        ('scheduled_ts', 'scheduled_at'), ('sent_ts', 'sent_at'), ('created_ts', 'created_at'),
+    ],
+    'broadcasts': [('scheduled_ts', 'scheduled_at')],
+    'auto_broadcast_sent': [('sent_ts', 'sent_at')],
+    'chain_user_state': [('next_message_ts', 'next_message_at')],
+    'chain_message_history': [('sent_ts', 'sent_at')],
+}
+EPOCH_BACKFILL_BATCH_SIZE = 2000  # Строк на одну транзакцию дозаполнения
+
+
+def _epoch(moment: datetime) -> int:
+    """Секунды Unix для времени бота (datetime без tzinfo — местное время)"""
+    return int(moment.timestamp())
+
+
+def _parse_epoch(value: Optional[str]) -> Optional[int]:
+    """
+    Секунды Unix для текстовой метки из базы; None, если её нет или она не разбирается.
+
+    Формат с пробелом — CURRENT_TIMESTAMP SQLite (UTC), с 'T' — isoformat()
+    местного времени бота.
+    """
+    try:
+        moment = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+    if moment.tzinfo is None and value[10:11] == ' ':
+        moment = moment.replace(tzinfo=timezone.utc)
+    return _epoch(moment)
+
+
+def _utc_offset_at(ts: int) -> int:
+    """Смещение местного времени бота от UTC в секундах в момент ts"""
+    return int(datetime.fromtimestamp(ts, timezone.utc).astimezone().utcoffset().total_seconds())
+
+
+def _utc_offsets(from_ts: int, to_ts: int) -> List[Tuple[int, int]]:
+    """
+    Смещения местного времени от UTC на отрезке [from_ts, to_ts):
+    [(с какой секунды Unix, смещение)] по возрастанию. Смена смещения
+    (переход на летнее время и обратно) ищется с шагом в сутки, её точная
+    секунда — делением пополам.
+    """
+    offsets = [(from_ts, _utc_offset_at(from_ts))]
+    checked = from_ts
+    while checked < to_ts - 1:
+        probe = min(checked + 86400, to_ts - 1)
+        if _utc_offset_at(probe) == offsets[-1][1]:
+            checked = probe
+            continue
+        low, high = checked, probe
+        while high - low > 1:
+            middle = (low + high) // 2
+            if _utc_offset_at(middle) == offsets[-1][1]:
+                low = middle
+            else:
+                high = middle
+        offsets.append((high, _utc_offset_at(high)))
+        checked = high
+    return offsets
+
+
+def _local_day_sql(column: str, offsets: List[Tuple[int, int]]) -> str:
+    """
+    SQL-выражение: номер местного дня (дней от 1970-01-01) для секунд Unix
+    в column. Смещение берётся на момент самой строки (offsets — из
+    _utc_offsets), так что строки рядом со сменой летнего времени не
+    попадают в соседний день.
+    """
+    if len(offsets) == 1:
+        return f'({column} + {offsets[0][1]}) / 86400'
+    branches = ' '.join(
+        f'WHEN {column} < {start} THEN {offset}'
+        for (start, _), (_, offset) in zip(offsets[1:], offsets)
+    )
+    return f'({column} + CASE {branches} ELSE {offsets[-1][1]} END) / 86400'
+
+
+# ==================== Schema Migrations ====================
+
+# Колонки, добавленные в таблицы после их появления. В базах, созданных
+# старыми версиями бота, их может не быть — базовая миграция их досоздаёт.
+_LEGACY_COLUMNS = {
+    'users': [
+        ('has_paid_fmd', 'INTEGER DEFAULT 0'),
+        ('fmd_payment_request_date', 'TEXT'),
+        ('has_paid_bundle', 'INTEGER DEFAULT 0'),
+        ('bundle_payment_request_date', 'TEXT'),
+        ('has_paid_dry', 'INTEGER DEFAULT 0'),
+        ('dry_payment_request_date', 'TEXT'),
+    ],
+    'payment_requests': [
+        ('product_type', "TEXT DEFAULT 'main'"),
+    ],
+    'broadcasts': [
+        ('media_type', 'TEXT'),
+        ('media_file_id', 'TEXT'),
+        ('buttons', 'TEXT'),
+    ],
+    'broadcast_templates': [
+        ('media_type', 'TEXT'),
+        ('media_file_id', 'TEXT'),
+        ('buttons', 'TEXT'),
+    ],
+    'auto_broadcasts': [
+        ('media_type', 'TEXT'),
+        ('media_file_id', 'TEXT'),
+        ('buttons', 'TEXT'),
+    ],
+}
+
+
+async def _add_missing_columns(db: aiosqlite.Connection, table: str, columns: List[tuple]):
+    """Добавить в таблицу колонки, которых в ней ещё нет"""
+    async with db.execute(f'PRAGMA table_info({table})') as cursor:
+        existing = {row['name'] for row in await cursor.fetchall()}
+    for name, definition in columns:
+        if name not in existing:
+            await db.execute(f'ALTER TABLE {table} ADD COLUMN {name} {definition}')
+
+
+async def _migration_001_base_schema(db: aiosqlite.Connection):
+    """Базовая схема: все таблицы бота и цепочек рассылок"""
+    await db.execute('''
+        CREATE TABLE IF NOT EXISTS users (
+            user_id INTEGER PRIMARY KEY,
+            username TEXT,
+            first_name TEXT,
+            has_paid INTEGER DEFAULT 0,
+            has_paid_fmd INTEGER DEFAULT 0,
+            has_paid_bundle INTEGER DEFAULT 0,
+            payment_request_date TEXT,
+            fmd_payment_request_date TEXT,
+            bundle_payment_request_date TEXT,
+            has_paid_dry INTEGER DEFAULT 0,
+            dry_payment_request_date TEXT,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    await db.execute('''
+        CREATE TABLE IF NOT EXISTS payment_requests (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            status TEXT CHECK(status IN ('pending', 'approved', 'rejected')) DEFAULT 'pending',
+            admin_message_id INTEGER,
+            product_type TEXT DEFAULT 'main',
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY(user_id) REFERENCES users(user_id)
+        )
+    ''')
+
+    # Таблица для хранения рецептов (редактируемых через админку)
+    await db.execute('''
+        CREATE TABLE IF NOT EXISTS recipes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            calories INTEGER NOT NULL,
+            day INTEGER NOT NULL,
+            meal_type TEXT CHECK(meal_type IN ('breakfast', 'lunch', 'dinner')) NOT NULL,
+            content TEXT NOT NULL,
+            updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            updated_by TEXT,
+            UNIQUE(calories, day, meal_type)
+        )
+    ''')
+    # Таблица для результатов калькулятора калорий
+    await db.execute('''
+        CREATE TABLE IF NOT EXISTS calculator_results (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            gender TEXT,
+            age INTEGER,
+            height REAL,
+            weight REAL,
+            steps INTEGER,
+            cardio INTEGER,
+            strength INTEGER,
+            goal TEXT,
+            hormones TEXT,
+            level TEXT,
+            calories REAL,
+            protein INTEGER,
+            fats INTEGER,
+            carbs REAL,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY(user_id) REFERENCES users(user_id)
+        )
+    ''')
+
+    # ==================== Таблица событий для аналитики ====================
+    await db.execute('''
+        CREATE TABLE IF NOT EXISTS user_events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            event_type TEXT NOT NULL,
+            metadata TEXT,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY(user_id) REFERENCES users(user_id)
+        )
+    ''')
+
+    # ==================== Таблица follow-up сообщений ====================
+    await db.execute('''
+        CREATE TABLE IF NOT EXISTS followup_messages (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            message_type TEXT NOT NULL,
+            scheduled_at TEXT NOT NULL,
+            sent_at TEXT,
+            status TEXT CHECK(status IN ('pending', 'sent', 'cancelled', 'failed')) DEFAULT 'pending',
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY(user_id) REFERENCES users(user_id)
+        )
+    ''')
+
+    # Индекс для быстрого поиска событий по типу
+    await db.execute('''
+        CREATE INDEX IF NOT EXISTS idx_user_events_type 
+        ON user_events(event_type, created_at)
+    ''')
+
+    # Индекс для follow-up сообщений
+    await db.execute('''
+        CREATE INDEX IF NOT EXISTS idx_followup_pending 
+        ON followup_messages(status, scheduled_at)
+    ''')
+
+    # ==================== Таблица рассылок ====================
+    await db.execute('''
+        CREATE TABLE IF NOT EXISTS broadcasts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            content TEXT NOT NULL,
+            audience TEXT NOT NULL CHECK(audience IN ('all', 'start_only', 'rejected', 'no_screenshot')),
+            scheduled_at TEXT NOT NULL,
+            status TEXT CHECK(status IN ('pending', 'sending', 'sent', 'cancelled')) DEFAULT 'pending',
+            created_by INTEGER NOT NULL,
+            created_by_username TEXT,
+            sent_count INTEGER DEFAULT 0,
+            failed_count INTEGER DEFAULT 0,
+            media_type TEXT CHECK(media_type IN ('photo', 'video', NULL)),
+            media_file_id TEXT,
+            buttons TEXT,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            sent_at TEXT
+        )
+    ''')
+
+    # Индекс для поиска pending рассылок
+    await db.execute('''
+        CREATE INDEX IF NOT EXISTS idx_broadcasts_pending 
+        ON broadcasts(status, scheduled_at)
+    ''')
+
+    # ==================== Таблица шаблонов рассылок ====================
+    await db.execute('''
+        CREATE TABLE IF NOT EXISTS broadcast_templates (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT,
+            content TEXT NOT NULL,
+            created_by INTEGER NOT NULL,
+            created_by_username TEXT,
+            media_type TEXT CHECK(media_type IN ('photo', 'video', NULL)),
+            media_file_id TEXT,
+            buttons TEXT,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    # ==================== Таблица автоматических рассылок ====================
+    await db.execute('''
+        CREATE TABLE IF NOT EXISTS auto_broadcasts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            trigger_type TEXT NOT NULL CHECK(trigger_type IN ('only_start', 'no_payment', 'rejected', 'no_screenshot')),
+            content TEXT NOT NULL,
+            delay_hours INTEGER NOT NULL DEFAULT 24,
+            is_active INTEGER DEFAULT 1,
+            created_by INTEGER NOT NULL,
+            created_by_username TEXT,
+            sent_count INTEGER DEFAULT 0,
+            media_type TEXT CHECK(media_type IN ('photo', 'video', NULL)),
+            media_file_id TEXT,
+            buttons TEXT,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    # Таблица для отслеживания уже отправленных авто-рассылок
+    await db.execute('''
+        CREATE TABLE IF NOT EXISTS auto_broadcast_sent (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            auto_broadcast_id INTEGER NOT NULL,
+            user_id INTEGER NOT NULL,
+            sent_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(auto_broadcast_id, user_id),
+            FOREIGN KEY(auto_broadcast_id) REFERENCES auto_broadcasts(id),
+            FOREIGN KEY(user_id) REFERENCES users(user_id)
+        )
+    ''')
+
+    # Таблица цепочек рассылок (воронок)
+    await db.execute('''
+        CREATE TABLE IF NOT EXISTS broadcast_chains (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            description TEXT,
+            trigger_type TEXT NOT NULL CHECK(trigger_type IN ('manual', 'subscription_end', 'payment_approved', 'custom')),
+            is_active INTEGER DEFAULT 1,
+            created_by INTEGER NOT NULL,
+            created_by_username TEXT,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    # Таблица шагов цепочки
+    await db.execute('''
+        CREATE TABLE IF NOT EXISTS chain_steps (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            chain_id INTEGER NOT NULL,
+            step_order INTEGER NOT NULL,
+            content TEXT NOT NULL,
+            media_type TEXT CHECK(media_type IN ('photo', 'video', NULL)),
+            media_file_id TEXT,
+            delay_hours INTEGER DEFAULT 0,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY(chain_id) REFERENCES broadcast_chains(id) ON DELETE CASCADE,
+            UNIQUE(chain_id, step_order)
+        )
+    ''')
+
+    # Таблица кнопок шага (с действиями)
+    await db.execute('''
+        CREATE TABLE IF NOT EXISTS chain_step_buttons (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            step_id INTEGER NOT NULL,
+            button_text TEXT NOT NULL,
+            button_order INTEGER NOT NULL,
+            action_type TEXT NOT NULL CHECK(action_type IN ('next_step', 'goto_step', 'url', 'command', 'stop_chain', 'payment_main', 'payment_fmd', 'payment_bundle')),
+            action_value TEXT,
+            next_step_id INTEGER,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY(step_id) REFERENCES chain_steps(id) ON DELETE CASCADE,
+            FOREIGN KEY(next_step_id) REFERENCES chain_steps(id) ON DELETE SET NULL
+        )
+    ''')
+
+    # Таблица состояния пользователя в цепочке
+    await db.execute('''
+        CREATE TABLE IF NOT EXISTS chain_user_state (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            chain_id INTEGER NOT NULL,
+            current_step_id INTEGER NOT NULL,
+            status TEXT CHECK(status IN ('active', 'completed', 'stopped')) DEFAULT 'active',
+            started_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            last_action_at TEXT,
+            next_message_at TEXT,
+            FOREIGN KEY(user_id) REFERENCES users(user_id),
+            FOREIGN KEY(chain_id) REFERENCES broadcast_chains(id) ON DELETE CASCADE,
+            FOREIGN KEY(current_step_id) REFERENCES chain_steps(id),
+            UNIQUE(user_id, chain_id)
+        )
+    ''')
+
+    # Таблица истории отправок цепочки
+    await db.execute('''
+        CREATE TABLE IF NOT EXISTS chain_message_history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            chain_id INTEGER NOT NULL,
+            step_id INTEGER NOT NULL,
+            button_clicked TEXT,
+            sent_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY(user_id) REFERENCES users(user_id),
+            FOREIGN KEY(chain_id) REFERENCES broadcast_chains(id) ON DELETE CASCADE,
+            FOREIGN KEY(step_id) REFERENCES chain_steps(id) ON DELETE CASCADE
+        )
+    ''')
+
+    # Индексы
+    await db.execute('''
+        CREATE INDEX IF NOT EXISTS idx_chain_user_state_active 
+        ON chain_user_state(status, next_message_at)
+    ''')
+
+    await db.execute('''
+        CREATE INDEX IF NOT EXISTS idx_chain_steps_order 
+        ON chain_steps(chain_id, step_order)
+    ''')
+
+    for table, columns in _LEGACY_COLUMNS.items():
+        await _add_missing_columns(db, table, columns)
+
+
+async def _migration_002_daily_rollups(db: aiosqlite.Connection):
+    """Дневные агрегаты отчётов"""
+    await db.execute('''
+        CREATE TABLE IF NOT EXISTS daily_rollups (
+            day TEXT NOT NULL,
+            product TEXT NOT NULL,
+            new_users INTEGER DEFAULT 0,
+            starts INTEGER DEFAULT 0,
+            payment_clicks INTEGER DEFAULT 0,
+            screenshots INTEGER DEFAULT 0,
+            approvals INTEGER DEFAULT 0,
+            rejections INTEGER DEFAULT 0,
+            followups_sent INTEGER DEFAULT 0,
+            calculator_completions INTEGER DEFAULT 0,
+            PRIMARY KEY (day, product)
+        )
+    ''')
+
+    # Служебные значения фоновых задач (high-watermark агрегатов и т.п.)
+    await db.execute('''
+        CREATE TABLE IF NOT EXISTS rollup_state (
+            name TEXT PRIMARY KEY,
+            value TEXT
+        )
+    ''')
+
+
+async def _migration_003_hot_path_indexes(db: aiosqlite.Connection):
+    """Индексы для точечных проверок по пользователю и выборок по времени"""
+    # Есть ли у пользователя событие типа X; покрывает и GROUP BY user_id в отчётах
+    await db.execute('''
+        CREATE INDEX IF NOT EXISTS idx_user_events_user_type
+        ON user_events(user_id, event_type, created_at)
+    ''')
+
+    # has_pending_request и статусы оплат пользователя
+    await db.execute('''
+        CREATE INDEX IF NOT EXISTS idx_payment_requests_user
+        ON payment_requests(user_id, status, product_type)
+    ''')
+
+    # Списки заявок по статусу (pending/rejected) в порядке создания
+    await db.execute('''
+        CREATE INDEX IF NOT EXISTS idx_payment_requests_status
+        ON payment_requests(status, created_at)
+    ''')
+
+    # Новые пользователи за период, аудитории "зарегистрировался N часов назад"
+    await db.execute('''
+        CREATE INDEX IF NOT EXISTS idx_users_created_at
+        ON users(created_at)
+    ''')
+
+    # Оплатившие пользователи в порядке оплаты (частичный — только has_paid = 1)
+    await db.execute('''
+        CREATE INDEX IF NOT EXISTS idx_users_paid
+        ON users(payment_request_date) WHERE has_paid = 1
+    ''')
+
+    # Результаты калькулятора пользователя и новые результаты для агрегатов
+    await db.execute('''
+        CREATE INDEX IF NOT EXISTS idx_calculator_results_user
+        ON calculator_results(user_id, created_at)
+    ''')
+    await db.execute('''
+        CREATE INDEX IF NOT EXISTS idx_calculator_results_created
+        ON calculator_results(created_at)
+    ''')
+
+    # Был ли пользователю follow-up данного типа
+    await db.execute('''
+        CREATE INDEX IF NOT EXISTS idx_followup_user_type
+        ON followup_messages(user_id, message_type, status)
+    ''')
+
+    # Отправленные follow-up по времени отправки (частичный — только 'sent')
+    await db.execute('''
+        CREATE INDEX IF NOT EXISTS idx_followup_sent
+        ON followup_messages(sent_at) WHERE status = 'sent'
+    ''')
+
+    # Статистика цепочки: участники по статусам
+    await db.execute('''
+        CREATE INDEX IF NOT EXISTS idx_chain_user_state_chain
+        ON chain_user_state(chain_id, status)
+    ''')
+
+    # Кнопки шага и история отправок цепочки
+    await db.execute('''
+        CREATE INDEX IF NOT EXISTS idx_chain_step_buttons_step
+        ON chain_step_buttons(step_id, button_order)
+    ''')
+    await db.execute('''
+        CREATE INDEX IF NOT EXISTS idx_chain_message_history_chain
+        ON chain_message_history(chain_id)
+    ''')
+
+    # Пробы auto_broadcast_sent по (auto_broadcast_id, user_id) обслуживает
+    # индекс ограничения UNIQUE, отдельный не нужен
+
+
+async def _migration_004_entitlements(db: aiosqlite.Connection):
+    """Битовая маска доступов users.entitlements (см. Entitlement)"""
+    # Виртуальная колонка: флаги has_paid_* остаются единственным источником
+    # правды, маска всегда с ними согласована и читается одним запросом
+    await db.execute('''
+        ALTER TABLE users ADD COLUMN entitlements INTEGER GENERATED ALWAYS AS (
+            (IFNULL(has_paid, 0) != 0)
+            | ((IFNULL(has_paid_fmd, 0) != 0) << 1)
+            | ((IFNULL(has_paid_bundle, 0) != 0) << 2)
+            | ((IFNULL(has_paid_dry, 0) != 0) << 3)
+        ) VIRTUAL
+    ''')
+
+
+async def _migration_005_user_list_indexes(db: aiosqlite.Connection):
+    """Частичные индексы для постраничных списков оплативших"""
+    # Порядок (created_at, user_id) как у get_users_page: user_id — rowid,
+    # он неявно входит в каждый индекс таблицы users
+    for column in ('has_paid', 'has_paid_fmd', 'has_paid_bundle', 'has_paid_dry'):
+        await db.execute(f'''
+            CREATE INDEX IF NOT EXISTS idx_users_created_{column}
+            ON users(created_at) WHERE {column} = 1
         ''')
 
-        # Миграция: добавляем поля для медиа и кнопок если их нет
-        try:
-            await db.execute('ALTER TABLE auto_broadcasts ADD COLUMN media_type TEXT')
-        except:
-            pass
-        try:
-            await db.execute('ALTER TABLE auto_broadcasts ADD COLUMN media_file_id TEXT')
-        except:
-            pass
+
+async def _migration_006_users_fts(db: aiosqlite.Connection):
+    """Полнотекстовый индекс (trigram) по username и first_name"""
+    # External content: текст хранится только в users, индекс — в users_fts
+    await db.execute('''
+        CREATE VIRTUAL TABLE IF NOT EXISTS users_fts USING fts5(
+            username, first_name,
+            content='users', content_rowid='user_id',
+            tokenize='trigram'
+        )
+    ''')
+
+    await db.execute('''
+        CREATE TRIGGER IF NOT EXISTS users_fts_insert AFTER INSERT ON users BEGIN
+            INSERT INTO users_fts (rowid, username, first_name)
+            VALUES (new.user_id, new.username, new.first_name);
+        END
+    ''')
+    await db.execute('''
+        CREATE TRIGGER IF NOT EXISTS users_fts_delete AFTER DELETE ON users BEGIN
+            INSERT INTO users_fts (users_fts, rowid, username, first_name)
+            VALUES ('delete', old.user_id, old.username, old.first_name);
+        END
+    ''')
+    # add_user перезаписывает имя на каждый /start — индекс трогаем только при изменении
+    await db.execute('''
+        CREATE TRIGGER IF NOT EXISTS users_fts_update AFTER UPDATE OF username, first_name ON users
+        WHEN old.username IS NOT new.username OR old.first_name IS NOT new.first_name
+        BEGIN
+            INSERT INTO users_fts (users_fts, rowid, username, first_name)
+            VALUES ('delete', old.user_id, old.username, old.first_name);
+            INSERT INTO users_fts (rowid, username, first_name)
+            VALUES (new.user_id, new.username, new.first_name);
+        END
+    ''')
+
+    await db.execute("INSERT INTO users_fts (users_fts) VALUES ('rebuild')")
+
+    # Точное совпадение username (без учёта регистра) поднимается в начало выдачи
+    await db.execute(
+        'CREATE INDEX IF NOT EXISTS idx_users_username_nocase ON users(username COLLATE NOCASE)'
+    )
+
+
+async def _migration_007_retention(db: aiosqlite.Connection):
+    """Счётчики сообщений цепочек, вынесенных в архив"""
+    await db.execute('''
+        CREATE TABLE IF NOT EXISTS chain_message_totals (
+            chain_id INTEGER PRIMARY KEY,
+            archived_messages INTEGER NOT NULL DEFAULT 0
+        )
+    ''')
+
+
+async def _migration_008_epoch_timestamps(db: aiosqlite.Connection):
+    """Колонки времени в секундах Unix (см. EPOCH_COLUMNS) и индексы выборок за период"""
+    # Старые строки заполняет backfill_timestamps() пачками уже после миграции
+    for table, columns in EPOCH_COLUMNS.items():
+        await _add_missing_columns(db, table, [(column, 'INTEGER') for column, _ in columns])
+
+    # Индексы по тексту, нужные только для фильтра по времени, заменяются
+    # индексами по секундам; по тексту остаются те, что держат сортировку списков
+    for index in (
+        'idx_followup_pending',
+        'idx_followup_sent',
+        'idx_broadcasts_pending',
+        'idx_chain_user_state_active',
+        'idx_calculator_results_created',
+        'idx_user_events_type',
+        'idx_user_events_user_type',
+    ):
+        await db.execute(f'DROP INDEX IF EXISTS {index}')
+
+    # Новые пользователи и оплаты за период, аудитории "N часов назад"
+    await db.execute('''
+        CREATE INDEX IF NOT EXISTS idx_users_created_ts
+        ON users(created_ts)
+    ''')
+    await db.execute('''
+        CREATE INDEX IF NOT EXISTS idx_users_paid_ts
+        ON users(payment_request_ts) WHERE has_paid = 1
+    ''')
+
+    # События типа X за период (воронки, daily_rollups, follow-up)
+    await db.execute('''
+        CREATE INDEX IF NOT EXISTS idx_user_events_type_ts
+        ON user_events(event_type, created_ts)
+    ''')
+    # Было ли у пользователя событие типа X раньше порога (аудитории авто-рассылок).
+    # Без created_ts в этом индексе планировщик выбирает idx_user_events_type_ts
+    # и на каждого пользователя перебирает все события типа
+    await db.execute('''
+        CREATE INDEX IF NOT EXISTS idx_user_events_user_type_ts
+        ON user_events(user_id, event_type, created_ts)
+    ''')
+
+    # Результаты калькулятора за период (daily_rollups)
+    await db.execute('''
+        CREATE INDEX IF NOT EXISTS idx_calculator_results_created_ts
+        ON calculator_results(created_ts)
+    ''')
+
+    # Follow-up, которые пора отправить, и отправленные за период
+    await db.execute('''
+        CREATE INDEX IF NOT EXISTS idx_followup_pending_ts
+        ON followup_messages(status, scheduled_ts)
+    ''')
+    await db.execute('''
+        CREATE INDEX IF NOT EXISTS idx_followup_sent_ts
+        ON followup_messages(sent_ts) WHERE status = 'sent'
+    ''')
+
+    # Рассылки и сообщения цепочек, которые пора отправить
+    await db.execute('''
+        CREATE INDEX IF NOT EXISTS idx_broadcasts_pending_ts
+        ON broadcasts(status, scheduled_ts)
+    ''')
+    await db.execute('''
+        CREATE INDEX IF NOT EXISTS idx_chain_user_state_active_ts
+        ON chain_user_state(status, next_message_ts)
+    ''')
+
+    # payment_requests, auto_broadcast_sent и chain_message_history по времени
+    # фильтруют только аудитории (внутри EXISTS по user_id) и run_retention()
+    # (окнами по id) — отдельный индекс по секундам им не нужен
+
+
+async def _migration_009_user_funnel(db: aiosqlite.Connection):
+    """Состояние воронки по пользователям (user_funnel) и индекс заявок за период"""
+    # Таблицу удаляет миграция 010: отчёты считаются по daily_rollups
+    await db.execute('''
+        CREATE TABLE IF NOT EXISTS user_funnel (
+            user_id INTEGER PRIMARY KEY,
+            last_start_ts INTEGER,
+            last_click_ts INTEGER,
+            last_screenshot_ts INTEGER,
+            last_calc_started_ts INTEGER,
+            last_calculator_ts INTEGER,
+            first_followup_ts INTEGER,
+            followups_sent INTEGER NOT NULL DEFAULT 0
+        )
+    ''')
+
+    # Заявки за неделю (недельный отчёт); ожидающие проверки читаются
+    # по idx_payment_requests_status из миграции 003
+    await db.execute('''
+        CREATE INDEX IF NOT EXISTS idx_payment_requests_created_ts
+        ON payment_requests(created_ts)
+    ''')
+
+
+async def _migration_010_rollup_first_steps(db: aiosqlite.Connection):
+    """daily_rollups считает первые шаги пользователей; user_funnel больше не нужна"""
+    # Агрегаты — производные данные: таблица создаётся заново в новом виде,
+    # refresh_daily_rollups() при первом запуске строит её по всей истории
+    await db.execute('DROP TABLE IF EXISTS daily_rollups')
+    await db.execute('''
+        CREATE TABLE daily_rollups (
+            day TEXT NOT NULL,
+            product TEXT NOT NULL,
+            new_users INTEGER NOT NULL DEFAULT 0,
+            started_users INTEGER NOT NULL DEFAULT 0,
+            clicked_users INTEGER NOT NULL DEFAULT 0,
+            screenshot_users INTEGER NOT NULL DEFAULT 0,
+            clicked_screenshot_users INTEGER NOT NULL DEFAULT 0,
+            engaged_users INTEGER NOT NULL DEFAULT 0,
+            paid_users INTEGER NOT NULL DEFAULT 0,
+            calculator_users INTEGER NOT NULL DEFAULT 0,
+            approvals INTEGER NOT NULL DEFAULT 0,
+            rejections INTEGER NOT NULL DEFAULT 0,
+            followups_sent INTEGER NOT NULL DEFAULT 0,
+            followups_only_start INTEGER NOT NULL DEFAULT 0,
+            followups_clicked_payment INTEGER NOT NULL DEFAULT 0,
+            followup_users INTEGER NOT NULL DEFAULT 0,
+            followup_paid_users INTEGER NOT NULL DEFAULT 0,
+            paid_after_followup_users INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (day, product)
+        )
+    ''')
+    await db.execute('''
+        DELETE FROM rollup_state
+        WHERE name IN ('daily_rollups_refreshed_at', 'user_funnel_backfill')
+    ''')
+
+    # Отчёты читают daily_rollups, а не состояние каждого пользователя
+    await db.execute('DROP TABLE IF EXISTS user_funnel')
+
+    # Follow-up пользователя для агрегатов: первый отправленный и был ли он до оплаты
+    await db.execute('''
+        CREATE INDEX IF NOT EXISTS idx_followup_user_sent_ts
+        ON followup_messages(user_id, sent_ts) WHERE status = 'sent'
+    ''')
+
+
+async def _migration_011_user_search_prefix(db: aiosqlite.Connection):
+    """Индекс начала имени: короткие запросы поиска пользователей"""
+    # Начало username ищется по idx_users_username_nocase (миграция 6)
+    await db.execute(
+        'CREATE INDEX IF NOT EXISTS idx_users_first_name_nocase ON users(first_name COLLATE NOCASE)'
+    )
+
+
+async def _migration_012_cache_generations(db: aiosqlite.Connection):
+    """Счётчики изменений закэшированных данных для других процессов бота (CacheSync)"""
+    await db.execute('''
+        CREATE TABLE IF NOT EXISTS cache_generations (
+            name TEXT PRIMARY KEY,
+            generation INTEGER NOT NULL DEFAULT 0
+        )
+    ''')
+    await db.execute('''
+        INSERT INTO cache_generations (name) VALUES ('users'), ('recipes')
+        ON CONFLICT(name) DO NOTHING
+    ''')
+
+
+# Номер миграции -> функция. Номера только растут, применённые миграции
+# не меняются: новое изменение схемы — новая запись в конце списка.
+MIGRATIONS = [
+    (1, _migration_001_base_schema),
+    (2, _migration_002_daily_rollups),
+    (3, _migration_003_hot_path_indexes),
+    (4, _migration_004_entitlements),
+    (5, _migration_005_user_list_indexes),
+    (6, _migration_006_users_fts),
+    (7, _migration_007_retention),
+    (8, _migration_008_epoch_timestamps),
+    (9, _migration_009_user_funnel),
+    (10, _migration_010_rollup_first_steps),
+    (11, _migration_011_user_search_prefix),
+    (12, _migration_012_cache_generations),
+]
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def _migrations() -> List[tuple]:
+    """Миграции текущего бэкенда: у PostgreSQL свой набор с теми же номерами"""
+    if _backend.dialect == 'postgresql':
+        from backends.postgres import MIGRATIONS as POSTGRES_MIGRATIONS
+        return POSTGRES_MIGRATIONS
+    return MIGRATIONS
+
+
+async def init_db() -> List[int]:
+    """
+    Инициализация базы данных: применить недостающие миграции.
+
+    Версия схемы хранится в самой базе (PRAGMA user_version в SQLite,
+    таблица schema_version в PostgreSQL). Все недостающие миграции
+    выполняются в одной транзакции вместе с обновлением версии, при ошибке
+    транзакция откатывается и исключение пробрасывается дальше.
+    После миграций дозаполняются колонки секунд Unix у старых строк
+    (backfill_timestamps). Если схема актуальна и дозаполнять нечего,
+    выполняются только чтение версии и одна проверка в rollup_state.
+    Возвращает номера применённых миграций.
+    """
+    applied = await _apply_migrations()
+    await backfill_timestamps()
+    return applied
+
+
+async def _apply_migrations() -> List[int]:
+    """Применить недостающие миграции одной транзакцией (см. init_db)"""
+    backend = _open_backend()
+    async with connection() as db:
+        version = await backend.get_schema_version(db)
+        if version >= SCHEMA_VERSION:
+            return []
+
+        # Параллельный запуск (второй процесс бота) дождётся нас и увидит новую версию
+        await backend.begin_migration(db)
         try:
-            await db.execute('ALTER TABLE auto_broadcasts ADD COLUMN buttons TEXT')
-        except:
-            pass
+            version = await backend.get_schema_version(db)
+
+            applied = []
+            for number, migration in _migrations():
+                if number <= version:
+                    continue
+                await migration(db)
+                applied.append(number)
+
+            if applied:
+                await backend.set_schema_version(db, applied[-1])
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            logger.error(f"Schema migration failed at version {version}")
+            raise
+
+    if applied:
+        logger.info(
+            f"Schema migrated from version {version} to {applied[-1]}: "
+            f"applied {applied}")
+    return applied
+
+
+async def backfill_timestamps() -> int:
+    """
+    Заполнить колонки EPOCH_COLUMNS у строк, записанных до миграции 008.
+
+    Таблицы проходятся окнами по первичному ключу, каждое окно — отдельная
+    короткая транзакция, так что бот и другие процессы пишут между окнами.
+    Последний обработанный ключ хранится в rollup_state: прерванное
+    заполнение продолжается с того же места. Новые строки получают секунды
+    при записи, поэтому после окончания заполнение больше не запускается.
+    Возвращает количество обработанных строк.
+    """
+    async with connection() as db:
+        async with db.execute(
+            "SELECT name, value FROM rollup_state WHERE name LIKE 'epoch_backfill%'"
+        ) as cursor:
+            progress = {row['name']: row['value'] for row in await cursor.fetchall()}
+        if progress.get('epoch_backfill') == 'done':
+            return 0
+
+        total = 0
+        started = time.perf_counter()
+        for table, columns in EPOCH_COLUMNS.items():
+            key = 'user_id' if table == 'users' else 'id'
+            state_name = f'epoch_backfill:{table}'
+            last_key = int(progress.get(state_name) or 0)
+            text_columns = ', '.join(text for _, text in columns)
+            assignments = ', '.join(f'{ts} = COALESCE({ts}, ?)' for ts, _ in columns)
+
+            while True:
+                async with db.execute(f'''
+                    SELECT {key}, {text_columns} FROM {table}
+                    WHERE {key} > ?
+                    ORDER BY {key}
+                    LIMIT ?
+                ''', (last_key, EPOCH_BACKFILL_BATCH_SIZE)) as cursor:
+                    rows = await cursor.fetchall()
+                if not rows:
+                    break
+
+                last_key = rows[-1][0]
+                await db.executemany(
+                    f'UPDATE {table} SET {assignments} WHERE {key} = ?',
+                    [
+                        (*(_parse_epoch(row[i + 1]) for i in range(len(columns))), row[0])
+                        for row in rows
+                    ]
+                )
+                await db.execute('''
+                    INSERT INTO rollup_state (name, value) VALUES (?, ?)
+                    ON CONFLICT(name) DO UPDATE SET value = excluded.value
+                ''', (state_name, str(last_key)))
+                await db.commit()
+                total += len(rows)
 
-        # Таблица для отслеживания уже отправленных авто-рассылок
         await db.execute('''
-            CREATE TABLE IF NOT EXISTS auto_broadcast_sent (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                auto_broadcast_id INTEGER NOT NULL,
-                user_id INTEGER NOT NULL,
-                sent_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(auto_broadcast_id, user_id),
-                FOREIGN KEY(auto_broadcast_id) REFERENCES auto_broadcasts(id),
-                FOREIGN KEY(user_id) REFERENCES users(user_id)
-            )
+            INSERT INTO rollup_state (name, value) VALUES ('epoch_backfill', 'done')
+            ON CONFLICT(name) DO UPDATE SET value = excluded.value
         ''')
-
         await db.commit()
 
+    if total:
+        logger.info(
+            f"Backfilled epoch timestamps for {total} rows "
+            f"in {(time.perf_counter() - started) * 1000:.0f} ms")
+    return total
+
 
 async def add_user(user_id: int, username: Optional[str], first_name: Optional[str]):
     """Добавить пользователя в БД (или обновить если существует)"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
+    async with connection() as db:
         await db.execute('''
-            INSERT INTO users (user_id, username, first_name)
-            VALUES (?, ?, ?)
+            INSERT INTO users (user_id, username, first_name, created_ts)
+            VALUES (?, ?, ?, ?)
             ON CONFLICT(user_id) DO UPDATE SET
                 username = excluded.username,
                 first_name = excluded.first_name
-        ''', (user_id, username, first_name))
+        ''', (user_id, username, first_name, int(time.time())))
         await db.commit()
 
 
 async def get_user(user_id: int) -> Optional[dict]:
     """Получить информацию о пользователе"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        db.row_factory = aiosqlite.Row
+    async with connection() as db:
         async with db.execute(
             'SELECT * FROM users WHERE user_id = ?', (user_id,)
         ) as cursor:
@@ -297,54 +1341,63 @@ async def get_user(user_id: int) -> Optional[dict]:
             return dict(row) if row else None
 
 
-async def check_payment_status(user_id: int) -> bool:
-    """Проверить статус оплаты пользователя (основной рацион)"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
+async def get_entitlements(user_id: int) -> Entitlement:
+    """Все доступы пользователя одним запросом (с кэшем в памяти)"""
+    entitlements = _user_cache.get(user_id, 'entitlements')
+    if entitlements is not None:
+        return entitlements
+
+    generation = _user_cache.generation
+    async with connection() as db:
         async with db.execute(
-            'SELECT has_paid FROM users WHERE user_id = ?', (user_id,)
+            'SELECT entitlements FROM users WHERE user_id = ?', (user_id,)
         ) as cursor:
             row = await cursor.fetchone()
-            return bool(row[0]) if row else False
+            entitlements = Entitlement(row[0]) if row else Entitlement.NONE
+
+    _user_cache.put(user_id, 'entitlements', entitlements, generation)
+    return entitlements
+
+
+async def check_payment_status(user_id: int) -> bool:
+    """Проверить статус оплаты пользователя (основной рацион)"""
+    return Entitlement.MAIN in await get_entitlements(user_id)
 
 
 async def set_payment_status(user_id: int, status: bool):
     """Установить статус оплаты пользователя (основной рацион)"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
+    async with connection() as db:
         await db.execute(
             'UPDATE users SET has_paid = ? WHERE user_id = ?',
             (1 if status else 0, user_id)
         )
+        generation = await _bump_cache_generation(db, 'users')
         await db.commit()
+    _user_cache.invalidate(user_id)
+    _cache_sync.seen('users', generation)
 
 
 async def check_fmd_payment_status(user_id: int) -> bool:
     """Проверить статус оплаты FMD протокола"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        async with db.execute(
-            'SELECT has_paid_fmd FROM users WHERE user_id = ?', (user_id,)
-        ) as cursor:
-            row = await cursor.fetchone()
-            return bool(row[0]) if row else False
+    return Entitlement.FMD in await get_entitlements(user_id)
 
 
 async def set_fmd_payment_status(user_id: int, status: bool):
     """Установить статус оплаты FMD протокола"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
+    async with connection() as db:
         await db.execute(
             'UPDATE users SET has_paid_fmd = ? WHERE user_id = ?',
             (1 if status else 0, user_id)
         )
+        generation = await _bump_cache_generation(db, 'users')
         await db.commit()
+    _user_cache.invalidate(user_id)
+    _cache_sync.seen('users', generation)
 
 
 async def check_bundle_payment_status(user_id: int) -> bool:
     """Проверить статус оплаты комплекта (Рационы + FMD)"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        async with db.execute(
-            'SELECT has_paid_bundle FROM users WHERE user_id = ?', (user_id,)
-        ) as cursor:
-            row = await cursor.fetchone()
-            return bool(row[0]) if row else False
+    return Entitlement.BUNDLE in await get_entitlements(user_id)
 
 
 async def set_bundle_payment_status(user_id: int, status: bool):
@@ -352,7 +1405,7 @@ async def set_bundle_payment_status(user_id: int, status: bool):
 
     При активации комплекта также активирует доступ к основным рационам и FMD
     """
-    async with aiosqlite.connect(DATABASE_NAME) as db:
+    async with connection() as db:
         if status:
             # При оплате комплекта даём доступ ко всем продуктам
             await db.execute(
@@ -364,27 +1417,28 @@ async def set_bundle_payment_status(user_id: int, status: bool):
                 'UPDATE users SET has_paid_bundle = 0 WHERE user_id = ?',
                 (user_id,)
             )
+        generation = await _bump_cache_generation(db, 'users')
         await db.commit()
+    _user_cache.invalidate(user_id)
+    _cache_sync.seen('users', generation)
 
 
 async def check_dry_payment_status(user_id: int) -> bool:
     """Проверить статус оплаты Сушки"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        async with db.execute(
-            'SELECT has_paid_dry FROM users WHERE user_id = ?', (user_id,)
-        ) as cursor:
-            row = await cursor.fetchone()
-            return bool(row[0]) if row else False
+    return Entitlement.DRY in await get_entitlements(user_id)
 
 
 async def set_dry_payment_status(user_id: int, status: bool):
     """Установить статус оплаты Сушки"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
+    async with connection() as db:
         await db.execute(
             'UPDATE users SET has_paid_dry = ? WHERE user_id = ?',
             (1 if status else 0, user_id)
         )
+        generation = await _bump_cache_generation(db, 'users')
         await db.commit()
+    _user_cache.invalidate(user_id)
+    _cache_sync.seen('users', generation)
 
 
 async def create_payment_request(user_id: int, admin_message_id: int, product_type: str = 'main') -> int:
@@ -392,41 +1446,43 @@ async def create_payment_request(user_id: int, admin_message_id: int, product_ty
 
     product_type: 'main' - основной рацион, 'fmd' - FMD протокол, 'bundle' - комплект, 'dry' - Сушка
     """
-    async with aiosqlite.connect(DATABASE_NAME) as db:
+    now = datetime.now()
+    async with connection() as db:
         # Обновляем дату запроса у пользователя
         if product_type == 'fmd':
             await db.execute(
                 'UPDATE users SET fmd_payment_request_date = ? WHERE user_id = ?',
-                (datetime.now().isoformat(), user_id)
+                (now.isoformat(), user_id)
             )
         elif product_type == 'bundle':
             await db.execute(
                 'UPDATE users SET bundle_payment_request_date = ? WHERE user_id = ?',
-                (datetime.now().isoformat(), user_id)
+                (now.isoformat(), user_id)
             )
         elif product_type == 'dry':
             await db.execute(
                 'UPDATE users SET dry_payment_request_date = ? WHERE user_id = ?',
-                (datetime.now().isoformat(), user_id)
+                (now.isoformat(), user_id)
             )
         else:
             await db.execute(
-                'UPDATE users SET payment_request_date = ? WHERE user_id = ?',
-                (datetime.now().isoformat(), user_id)
+                'UPDATE users SET payment_request_date = ?, payment_request_ts = ? WHERE user_id = ?',
+                (now.isoformat(), _epoch(now), user_id)
             )
         # Создаём запрос
-        cursor = await db.execute('''
-            INSERT INTO payment_requests (user_id, admin_message_id, status, product_type)
-            VALUES (?, ?, 'pending', ?)
-        ''', (user_id, admin_message_id, product_type))
+        async with db.execute('''
+            INSERT INTO payment_requests (user_id, admin_message_id, status, product_type, created_ts)
+            VALUES (?, ?, 'pending', ?, ?)
+            RETURNING id
+        ''', (user_id, admin_message_id, product_type, _epoch(now))) as cursor:
+            request_id = (await cursor.fetchone())[0]
         await db.commit()
-        return cursor.lastrowid
+        return request_id
 
 
 async def get_payment_request(request_id: int) -> Optional[dict]:
     """Получить информацию о запросе на оплату"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        db.row_factory = aiosqlite.Row
+    async with connection() as db:
         async with db.execute(
             'SELECT * FROM payment_requests WHERE id = ?', (request_id,)
         ) as cursor:
@@ -436,7 +1492,7 @@ async def get_payment_request(request_id: int) -> Optional[dict]:
 
 async def update_payment_request(request_id: int, status: str):
     """Обновить статус запроса на оплату"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
+    async with connection() as db:
         await db.execute(
             'UPDATE payment_requests SET status = ? WHERE id = ?',
             (status, request_id)
@@ -449,7 +1505,7 @@ async def has_pending_request(user_id: int, product_type: str = None) -> bool:
 
     product_type: None - любой продукт, 'main' - основной рацион, 'fmd' - FMD протокол
     """
-    async with aiosqlite.connect(DATABASE_NAME) as db:
+    async with connection() as db:
         if product_type:
             async with db.execute(
                 "SELECT COUNT(*) FROM payment_requests WHERE user_id = ? AND status = 'pending' AND product_type = ?",
@@ -468,20 +1524,167 @@ async def has_pending_request(user_id: int, product_type: str = None) -> bool:
 
 # ==================== Recipes ====================
 
+RECIPE_TEXT_CACHE_TTL_SECONDS = 300  # Страховка: правки других процессов сбрасывает CacheSync
+RECIPE_OVERRIDES_TTL_SECONDS = 300   # Как часто перечитывать правки из таблицы recipes
+
+
+class RecipeTextCache:
+    """
+    Готовые тексты дней: (программа, калории, день) -> текст сообщения.
+
+    Заполняется при первом просмотре дня (data.recipes собирает текст
+    из базы рецептов и правок админов; у FMD и Сушки вместо калорий 0).
+    Правки есть только у рационов: save_recipe, delete_recipe и
+    load_recipe_overrides (правку сохранил другой процесс, см. CacheSync) сбрасывают ровно
+    изменённые дни. Записей не больше, чем дней во всех программах,
+    так что ограничение размера не нужно.
+    """
+
+    def __init__(self, ttl: float = RECIPE_TEXT_CACHE_TTL_SECONDS):
+        self.ttl = ttl
+        self._texts: Dict[Tuple[str, int, int], Tuple[str, float]] = {}
+        # Растёт при каждом сбросе: текст, собранный до сброса, не сохраняется
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, program: str, calories: int, day: int) -> Optional[str]:
+        entry = self._texts.get((program, calories, day))
+        if entry is None or entry[1] <= time.monotonic():
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[0]
+
+    def put(self, program: str, calories: int, day: int, text: str, generation: int):
+        if generation == self.generation:
+            self._texts[(program, calories, day)] = (text, time.monotonic() + self.ttl)
+
+    def invalidate(self, calories: Optional[int] = None, day: Optional[int] = None):
+        """Сбросить день рациона (или весь кэш, если день не указан)"""
+        self.generation += 1
+        if calories is None:
+            self._texts.clear()
+        else:
+            self._texts.pop(('rations', calories, day), None)
+
+    def stats(self) -> Dict:
+        total = self.hits + self.misses
+        return {
+            'size': len(self._texts),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total, 3) if total else 0.0,
+        }
+
+
+_recipe_text_cache = RecipeTextCache()
+
+
+def get_cached_recipe_text(program: str, calories: int, day: int) -> Tuple[Optional[str], int]:
+    """
+    Готовый текст дня из кэша и текущее поколение кэша.
+
+    Если текста нет, вызывающий собирает его и отдаёт в cache_recipe_text()
+    вместе с этим поколением.
+    """
+    generation = _recipe_text_cache.generation
+    return _recipe_text_cache.get(program, calories, day), generation
+
+
+def cache_recipe_text(program: str, calories: int, day: int, text: str, generation: int):
+    """Сохранить собранный текст дня (если с момента чтения ничего не менялось)"""
+    _recipe_text_cache.put(program, calories, day, text, generation)
+
+
+def get_recipe_text_cache_stats() -> Dict:
+    """Счётчики кэша текстов дней (для логов и админки)"""
+    return _recipe_text_cache.stats()
+
+
+class RecipeOverrides:
+    """
+    Все правки админов из таблицы recipes: (калории, день, приём пищи) -> текст.
+
+    Правок не больше нескольких сотен, поэтому они целиком загружаются
+    при старте бота, а save_recipe и delete_recipe меняют их на месте.
+    Правки других процессов бота подгружает CacheSync, а раз в
+    RECIPE_OVERRIDES_TTL_SECONDS набор в любом случае перечитывается.
+    """
+
+    def __init__(self, ttl: float = RECIPE_OVERRIDES_TTL_SECONDS):
+        self.ttl = ttl
+        self._content: Optional[Dict[Tuple[int, int, str], str]] = None
+        self._expires_at = 0.0
+        # Растёт при каждой правке: набор, прочитанный до неё, не подставляется
+        self.generation = 0
+
+    def fresh(self) -> Optional[Dict[Tuple[int, int, str], str]]:
+        """Загруженный набор или None, если его ещё нет или пора перечитать"""
+        if self._content is not None and self._expires_at > time.monotonic():
+            return self._content
+        return None
+
+    def replace(
+        self, content: Dict[Tuple[int, int, str], str], generation: int
+    ) -> Optional[Set[Tuple[int, int]]]:
+        """
+        Подставить перечитанный набор. Возвращает дни (калории, день), правки
+        которых изменились с прошлого набора (например, их сохранил другой
+        процесс), или None, если набор устарел ещё при чтении.
+        """
+        if generation != self.generation:
+            return None
+        previous = self._content or {}
+        self._content = content
+        self._expires_at = time.monotonic() + self.ttl
+        return {
+            key[:2] for key in previous.keys() | content.keys()
+            if previous.get(key) != content.get(key)
+        }
+
+    def set(self, key: Tuple[int, int, str], content: str):
+        self.generation += 1
+        if self._content is not None:
+            self._content[key] = content
+
+    def discard(self, key: Tuple[int, int, str]):
+        self.generation += 1
+        if self._content is not None:
+            self._content.pop(key, None)
+
+
+_recipe_overrides = RecipeOverrides()
+
+
+async def load_recipe_overrides() -> Dict[Tuple[int, int, str], str]:
+    """Загрузить все правки рецептов в память (при старте бота и по истечении срока)"""
+    while True:
+        generation = _recipe_overrides.generation
+        async with connection() as db:
+            async with db.execute('SELECT calories, day, meal_type, content FROM recipes') as cursor:
+                rows = await cursor.fetchall()
+        content = {(row[0], row[1], row[2]): row[3] for row in rows}
+        # Если за время чтения админ сохранил правку — читаем заново
+        changed_days = _recipe_overrides.replace(content, generation)
+        if changed_days is not None:
+            # Тексты дней, собранные по прежним правкам, больше не подходят
+            for calories, day in changed_days:
+                _recipe_text_cache.invalidate(calories, day)
+            return content
+
+
 async def get_recipe(calories: int, day: int, meal_type: str) -> Optional[str]:
-    """Получить рецепт из БД"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        async with db.execute(
-            'SELECT content FROM recipes WHERE calories = ? AND day = ? AND meal_type = ?',
-            (calories, day, meal_type)
-        ) as cursor:
-            row = await cursor.fetchone()
-            return row[0] if row else None
+    """Правка админа для приёма пищи (None — используется исходный текст)"""
+    overrides = _recipe_overrides.fresh()
+    if overrides is None:
+        overrides = await load_recipe_overrides()
+    return overrides.get((calories, day, meal_type))
 
 
 async def save_recipe(calories: int, day: int, meal_type: str, content: str, updated_by: str):
     """Сохранить или обновить рецепт в БД"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
+    async with connection() as db:
         await db.execute('''
             INSERT INTO recipes (calories, day, meal_type, content, updated_at, updated_by)
             VALUES (?, ?, ?, ?, ?, ?)
@@ -490,13 +1693,16 @@ async def save_recipe(calories: int, day: int, meal_type: str, content: str, upd
                 updated_at = excluded.updated_at,
                 updated_by = excluded.updated_by
         ''', (calories, day, meal_type, content, datetime.now().isoformat(), updated_by))
+        generation = await _bump_cache_generation(db, 'recipes')
         await db.commit()
+    _recipe_overrides.set((calories, day, meal_type), content)
+    _recipe_text_cache.invalidate(calories, day)
+    _cache_sync.seen('recipes', generation)
 
 
 async def get_all_custom_recipes() -> list:
     """Получить все кастомные рецепты из БД"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        db.row_factory = aiosqlite.Row
+    async with connection() as db:
         async with db.execute(
             'SELECT * FROM recipes ORDER BY calories, day, meal_type'
         ) as cursor:
@@ -506,13 +1712,117 @@ async def get_all_custom_recipes() -> list:
 
 async def delete_recipe(calories: int, day: int, meal_type: str) -> bool:
     """Удалить кастомный рецепт (вернётся к дефолтному)"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
+    async with connection() as db:
         cursor = await db.execute(
             'DELETE FROM recipes WHERE calories = ? AND day = ? AND meal_type = ?',
             (calories, day, meal_type)
         )
+        deleted = cursor.rowcount > 0
+        generation = await _bump_cache_generation(db, 'recipes')
         await db.commit()
-        return cursor.rowcount > 0
+    _recipe_overrides.discard((calories, day, meal_type))
+    _recipe_text_cache.invalidate(calories, day)
+    _cache_sync.seen('recipes', generation)
+    return deleted
+
+
+# ==================== Cache Sync ====================
+
+CACHE_SYNC_INTERVAL_SECONDS = 5  # Как быстро изменения из другого процесса сбрасывают кэши
+
+
+class CacheSync:
+    """
+    Сброс кэшей этого процесса по изменениям, сделанным другими процессами
+    бота с той же базой (несколько экземпляров на PostgreSQL, отдельный
+    процесс фоновых задач).
+
+    Функции, меняющие закэшированные данные, в той же транзакции
+    увеличивают счётчик в таблице cache_generations: 'users' — доступы и
+    калькулятор (UserCache), 'recipes' — правки рецептов (RecipeOverrides,
+    RecipeTextCache). Фоновая задача раз в CACHE_SYNC_INTERVAL_SECONDS
+    читает счётчики и, если их увеличил кто-то другой, сбрасывает кэш
+    пользователей целиком или перечитывает правки рецептов. Свои изменения
+    процесс сбрасывает сразу и точечно, по ним полного сброса нет.
+    """
+
+    def __init__(self, interval: float = CACHE_SYNC_INTERVAL_SECONDS):
+        self.interval = interval
+        self.generations: Dict[str, int] = {}
+        self.resets = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def seen(self, name: str, generation: int):
+        """Счётчик, увеличенный этим процессом: полный сброс по нему не нужен"""
+        if self.generations.get(name) == generation - 1:
+            self.generations[name] = generation
+
+    async def check(self):
+        """Сравнить счётчики с базой и сбросить кэши, изменённые другими процессами"""
+        async with connection() as db:
+            async with db.execute('SELECT name, generation FROM cache_generations') as cursor:
+                current = {row[0]: row[1] for row in await cursor.fetchall()}
+        # Первая проверка только запоминает счётчики: кэши ещё пустые
+        if self.generations:
+            if current.get('users') != self.generations.get('users'):
+                _user_cache.invalidate()
+                self.resets += 1
+            if current.get('recipes') != self.generations.get('recipes'):
+                # Тексты изменившихся дней сбрасывает сама загрузка
+                await load_recipe_overrides()
+                self.resets += 1
+        self.generations = current
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self):
+        await self.check()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.check()
+            except Exception as e:
+                # Кэши всё равно устаревают по своим TTL
+                logger.warning(f"Cache sync failed: {e}")
+
+
+_cache_sync = CacheSync()
+
+
+async def _bump_cache_generation(db, name: str) -> int:
+    """Увеличить счётчик кэша name в текущей транзакции; после commit — в _cache_sync.seen()"""
+    async with db.execute(
+        'UPDATE cache_generations SET generation = generation + 1 WHERE name = ? RETURNING generation',
+        (name,)
+    ) as cursor:
+        row = await cursor.fetchone()
+    return row[0] if row else 0
+
+
+async def start_cache_sync() -> CacheSync:
+    """Запомнить счётчики и запустить сверку кэшей (при старте бота, до загрузки правок рецептов)"""
+    if not _cache_sync.running:
+        await _cache_sync.start()
+    return _cache_sync
+
+
+async def stop_cache_sync():
+    """Остановить сверку кэшей (при остановке бота)"""
+    await _cache_sync.stop()
 
 
 # ==================== Calculator Results ====================
@@ -535,24 +1845,27 @@ async def save_calculator_result(
     carbs: float
 ):
     """Сохранить результаты калькулятора калорий"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
+    now = datetime.now()
+    async with connection() as db:
         await db.execute('''
             INSERT INTO calculator_results 
             (user_id, gender, age, height, weight, steps, cardio, strength, 
-             goal, hormones, level, calories, protein, fats, carbs, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+             goal, hormones, level, calories, protein, fats, carbs, created_at, created_ts)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         ''', (
             user_id, gender, age, height, weight, steps, cardio, strength,
             goal, hormones, level, calories, protein, fats, carbs,
-            datetime.now().isoformat()
+            now.isoformat(), _epoch(now)
         ))
+        generation = await _bump_cache_generation(db, 'users')
         await db.commit()
+    _user_cache.invalidate(user_id)
+    _cache_sync.seen('users', generation)
 
 
 async def get_last_calculator_result(user_id: int) -> Optional[dict]:
     """Получить последний результат калькулятора для пользователя"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        db.row_factory = aiosqlite.Row
+    async with connection() as db:
         async with db.execute(
             'SELECT * FROM calculator_results WHERE user_id = ? ORDER BY created_at DESC LIMIT 1',
             (user_id,)
@@ -562,171 +1875,192 @@ async def get_last_calculator_result(user_id: int) -> Optional[dict]:
 
 
 async def has_calculator_result(user_id: int) -> bool:
-    """Проверить, проходил ли пользователь калькулятор"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
+    """Проверить, проходил ли пользователь калькулятор (с кэшем в памяти)"""
+    has_result = _user_cache.get(user_id, 'has_calculator_result')
+    if has_result is not None:
+        return has_result
+
+    generation = _user_cache.generation
+    async with connection() as db:
         async with db.execute(
-            'SELECT COUNT(*) FROM calculator_results WHERE user_id = ?',
+            'SELECT EXISTS(SELECT 1 FROM calculator_results WHERE user_id = ?)',
             (user_id,)
         ) as cursor:
             row = await cursor.fetchone()
-            return row[0] > 0 if row else False
+            has_result = bool(row[0])
+
+    _user_cache.put(user_id, 'has_calculator_result', has_result, generation)
+    return has_result
 
 
 # ==================== User Events (Analytics) ====================
 
-async def log_event(user_id: int, event_type: str, metadata: str = None):
-    """Записать событие пользователя для аналитики (не критично - ошибки не ломают бота)"""
-    try:
-        async with aiosqlite.connect(DATABASE_NAME) as db:
-            await db.execute('''
-                INSERT INTO user_events (user_id, event_type, metadata, created_at)
-                VALUES (?, ?, ?, ?)
-            ''', (user_id, event_type, metadata, datetime.now().isoformat()))
-            await db.commit()
-    except Exception as e:
-        # Логирование не критично - не ломаем работу бота
-        logger.warning(
-            f"Failed to log event {event_type} for user {user_id}: {e}")
+EVENT_QUEUE_MAXSIZE = 10000      # Сколько событий может ждать записи в памяти
+EVENT_BATCH_SIZE = 200           # Записываем пачкой, как только набралось столько событий
+EVENT_FLUSH_INTERVAL_MS = 500    # ...или раз в столько миллисекунд
 
+_INSERT_EVENT_SQL = '''
+    INSERT INTO user_events (user_id, event_type, metadata, created_at, created_ts)
+    VALUES (?, ?, ?, ?, ?)
+'''
 
-async def get_stats() -> Dict:
-    """Получить расширенную статистику для админки"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        stats = {}
 
-        # 1. Всего пользователей
-        async with db.execute('SELECT COUNT(*) FROM users') as cursor:
-            row = await cursor.fetchone()
-            stats['total_users'] = row[0] if row else 0
+async def _write_events(rows: List[tuple]):
+    """Записать пачку событий одной транзакцией"""
+    async with connection() as db:
+        await db.executemany(_INSERT_EVENT_SQL, rows)
+        await db.commit()
 
-        # 2. Оплатившие пользователи
-        async with db.execute('SELECT COUNT(*) FROM users WHERE has_paid = 1') as cursor:
-            row = await cursor.fetchone()
-            stats['paid_users'] = row[0] if row else 0
 
-        # 3. Пользователи с pending запросом
-        async with db.execute(
-            "SELECT COUNT(DISTINCT user_id) FROM payment_requests WHERE status = 'pending'"
-        ) as cursor:
-            row = await cursor.fetchone()
-            stats['pending_payments'] = row[0] if row else 0
+class EventBuffer:
+    """
+    Буфер событий аналитики с отложенной пакетной записью.
 
-        # 4. Сколько нажали /start
-        async with db.execute(
-            "SELECT COUNT(DISTINCT user_id) FROM user_events WHERE event_type = ?",
-            (EventType.START_COMMAND,)
-        ) as cursor:
-            row = await cursor.fetchone()
-            stats['started_users'] = row[0] if row else 0
+    log_event только кладёт событие в очередь, а фоновая задача записывает
+    накопленное через executemany одной транзакцией — один fsync на пачку
+    вместо одного на каждое событие. Если очередь переполнена, событие
+    отбрасывается (аналитика не должна тормозить бота).
+    """
 
-        # 5. Сколько нажали "Я оплатил(а)"
-        async with db.execute(
-            "SELECT COUNT(DISTINCT user_id) FROM user_events WHERE event_type = ?",
-            (EventType.PAYMENT_BUTTON_CLICKED,)
-        ) as cursor:
-            row = await cursor.fetchone()
-            stats['clicked_payment_btn'] = row[0] if row else 0
+    def __init__(
+        self,
+        maxsize: int = EVENT_QUEUE_MAXSIZE,
+        batch_size: int = EVENT_BATCH_SIZE,
+        flush_interval_ms: int = EVENT_FLUSH_INTERVAL_MS
+    ):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+        # Счётчики
+        self.flushed = 0   # Записано в БД
+        self.dropped = 0   # Отброшено из-за переполнения очереди
+        self.failed = 0    # Потеряно из-за ошибок записи
+        self.batches = 0   # Сколько пачек записано
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._stopping
+
+    def start(self):
+        """Запустить фоновую запись"""
+        self._stopping = False
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Остановить фоновую запись, дописав всё, что осталось в очереди"""
+        if self._task is None:
+            return
+        self._stopping = True
+        await self._task
+        self._task = None
+
+    def put(self, row: tuple) -> bool:
+        """Положить событие в очередь (без ожидания)"""
+        try:
+            self._queue.put_nowait(row)
+            return True
+        except asyncio.QueueFull:
+            self.dropped += 1
+            if self.dropped % 1000 == 1:
+                logger.warning(
+                    f"Event buffer is full, dropped {self.dropped} events so far")
+            return False
 
-        # 6. Сколько прислали скриншот
-        async with db.execute(
-            "SELECT COUNT(DISTINCT user_id) FROM user_events WHERE event_type = ?",
-            (EventType.SCREENSHOT_SENT,)
-        ) as cursor:
-            row = await cursor.fetchone()
-            stats['sent_screenshot'] = row[0] if row else 0
+    def stats(self) -> Dict:
+        """Текущие счётчики буфера"""
+        return {
+            'queued': self._queue.qsize(),
+            'flushed': self.flushed,
+            'dropped': self.dropped,
+            'failed': self.failed,
+            'batches': self.batches,
+        }
+
+    async def _run(self):
+        while not (self._stopping and self._queue.empty()):
+            batch = await self._collect()
+            if batch:
+                await self._flush(batch)
+
+    async def _collect(self) -> List[tuple]:
+        """Набрать пачку: до batch_size событий или до истечения flush_interval"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.flush_interval
+        batch = []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            if self._stopping:
+                break
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _flush(self, batch: List[tuple]):
+        try:
+            await _write_events(batch)
+            self.flushed += len(batch)
+            self.batches += 1
+        except Exception as e:
+            # Логирование не критично - не ломаем работу бота
+            self.failed += len(batch)
+            logger.warning(f"Failed to flush {len(batch)} events: {e}")
 
-        # 7. Пользователи, которые ТОЛЬКО нажали /start (ничего больше не делали)
-        async with db.execute('''
-            SELECT COUNT(*) FROM users u
-            WHERE u.has_paid = 0
-            AND NOT EXISTS (
-                SELECT 1 FROM user_events e 
-                WHERE e.user_id = u.user_id 
-                AND e.event_type IN (?, ?, ?)
-            )
-        ''', (EventType.PAYMENT_BUTTON_CLICKED, EventType.SCREENSHOT_SENT, EventType.CALCULATOR_STARTED)) as cursor:
-            row = await cursor.fetchone()
-            stats['only_start'] = row[0] if row else 0
 
-        # 8. Пользователи, которые нажали "Я оплатил(а)" но НЕ прислали скрин
-        async with db.execute('''
-            SELECT COUNT(DISTINCT e1.user_id) FROM user_events e1
-            WHERE e1.event_type = ?
-            AND NOT EXISTS (
-                SELECT 1 FROM user_events e2
-                WHERE e2.user_id = e1.user_id
-                AND e2.event_type = ?
-            )
-        ''', (EventType.PAYMENT_BUTTON_CLICKED, EventType.SCREENSHOT_SENT)) as cursor:
-            row = await cursor.fetchone()
-            stats['clicked_but_no_screenshot'] = row[0] if row else 0
+_event_buffer: Optional[EventBuffer] = None
 
-        # 9. Статистика за последние 7 дней
-        week_ago = (datetime.now() - timedelta(days=7)).isoformat()
-        async with db.execute(
-            'SELECT COUNT(*) FROM users WHERE created_at >= ?', (week_ago,)
-        ) as cursor:
-            row = await cursor.fetchone()
-            stats['new_users_7d'] = row[0] if row else 0
 
-        async with db.execute('''
-            SELECT COUNT(*) FROM users 
-            WHERE has_paid = 1 AND payment_request_date >= ?
-        ''', (week_ago,)) as cursor:
-            row = await cursor.fetchone()
-            stats['paid_7d'] = row[0] if row else 0
+def start_event_buffer() -> EventBuffer:
+    """Запустить буфер событий (вызывается при старте бота)"""
+    global _event_buffer
+    if _event_buffer is None or not _event_buffer.running:
+        _event_buffer = EventBuffer()
+        _event_buffer.start()
+    return _event_buffer
 
-        # ==================== Follow-up статистика ====================
 
-        # 10. Всего отправлено follow-up сообщений
-        async with db.execute(
-            "SELECT COUNT(*) FROM followup_messages WHERE status = 'sent'"
-        ) as cursor:
-            row = await cursor.fetchone()
-            stats['followup_sent'] = row[0] if row else 0
+async def stop_event_buffer():
+    """Дописать накопленные события и остановить буфер (при остановке бота)"""
+    if _event_buffer is not None:
+        await _event_buffer.stop()
 
-        # 11. Уникальных пользователей получили follow-up
-        async with db.execute(
-            "SELECT COUNT(DISTINCT user_id) FROM followup_messages WHERE status = 'sent'"
-        ) as cursor:
-            row = await cursor.fetchone()
-            stats['followup_users'] = row[0] if row else 0
 
-        # 12. Оплатили ПОСЛЕ получения follow-up
-        # (пользователь получил follow-up и потом оплатил)
-        async with db.execute('''
-            SELECT COUNT(DISTINCT f.user_id) 
-            FROM followup_messages f
-            JOIN users u ON f.user_id = u.user_id
-            WHERE f.status = 'sent'
-            AND u.has_paid = 1
-            AND u.payment_request_date > f.sent_at
-        ''') as cursor:
-            row = await cursor.fetchone()
-            stats['paid_after_followup'] = row[0] if row else 0
+def get_event_buffer_stats() -> Dict:
+    """Счётчики буфера событий (записано, отброшено, ошибки, в очереди)"""
+    if _event_buffer is None:
+        return {'queued': 0, 'flushed': 0, 'dropped': 0, 'failed': 0, 'batches': 0}
+    return _event_buffer.stats()
 
-        # 13. Проигнорировали follow-up (получили, но не оплатили)
-        async with db.execute('''
-            SELECT COUNT(DISTINCT f.user_id) 
-            FROM followup_messages f
-            JOIN users u ON f.user_id = u.user_id
-            WHERE f.status = 'sent'
-            AND u.has_paid = 0
-        ''') as cursor:
-            row = await cursor.fetchone()
-            stats['ignored_followup'] = row[0] if row else 0
 
-        # 14. Статистика по типам follow-up
-        async with db.execute('''
-            SELECT message_type, COUNT(*) as cnt
-            FROM followup_messages 
-            WHERE status = 'sent'
-            GROUP BY message_type
-        ''') as cursor:
-            rows = await cursor.fetchall()
-            stats['followup_by_type'] = {row[0]: row[1] for row in rows}
+async def log_event(user_id: int, event_type: str, metadata: str = None):
+    """Записать событие пользователя для аналитики (не критично - ошибки не ломают бота)
 
-        return stats
+    Если буфер событий запущен, событие пишется в БД фоновой пачкой,
+    иначе — сразу (скрипты, бенчмарки).
+    """
+    now = datetime.now()
+    row = (user_id, event_type, metadata, now.isoformat(), _epoch(now))
+    if _event_buffer is not None and _event_buffer.running:
+        _event_buffer.put(row)
+        return
+
+    try:
+        await _write_events([row])
+    except Exception as e:
+        # Логирование не критично - не ломаем работу бота
+        logger.warning(
+            f"Failed to log event {event_type} for user {user_id}: {e}")
 
 
 async def get_users_for_followup(followup_type: str) -> List[Dict]:
@@ -737,17 +2071,15 @@ async def get_users_for_followup(followup_type: str) -> List[Dict]:
     - 'only_start': нажали /start более 24ч назад и ничего не делали
     - 'clicked_payment': нажали "Я оплатил(а)" более 2ч назад, но не прислали скрин
     """
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        db.row_factory = aiosqlite.Row
-
+    async with connection() as db:
         if followup_type == 'only_start':
             # Пользователи, которые нажали /start 24+ часов назад и ничего не делали
-            cutoff = (datetime.now() - timedelta(hours=24)).isoformat()
+            cutoff = _epoch(datetime.now() - timedelta(hours=24))
             async with db.execute('''
                 SELECT u.user_id, u.username, u.first_name, u.created_at
                 FROM users u
                 WHERE u.has_paid = 0
-                AND u.created_at <= ?
+                AND u.created_ts <= ?
                 AND NOT EXISTS (
                     SELECT 1 FROM user_events e 
                     WHERE e.user_id = u.user_id 
@@ -765,14 +2097,14 @@ async def get_users_for_followup(followup_type: str) -> List[Dict]:
 
         elif followup_type == 'clicked_payment':
             # Пользователи, которые нажали "Я оплатил(а)" 2+ часа назад, но не прислали скрин
-            cutoff = (datetime.now() - timedelta(hours=2)).isoformat()
+            cutoff = _epoch(datetime.now() - timedelta(hours=2))
             async with db.execute('''
                 SELECT DISTINCT u.user_id, u.username, u.first_name, e.created_at as event_at
                 FROM users u
                 JOIN user_events e ON u.user_id = e.user_id
                 WHERE u.has_paid = 0
                 AND e.event_type = ?
-                AND e.created_at <= ?
+                AND e.created_ts <= ?
                 AND NOT EXISTS (
                     SELECT 1 FROM user_events e2
                     WHERE e2.user_id = u.user_id
@@ -793,44 +2125,47 @@ async def get_users_for_followup(followup_type: str) -> List[Dict]:
 
 async def schedule_followup(user_id: int, message_type: str, scheduled_at: datetime):
     """Запланировать follow-up сообщение"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
+    now = datetime.now()
+    async with connection() as db:
         await db.execute('''
-            INSERT INTO followup_messages (user_id, message_type, scheduled_at, status, created_at)
-            VALUES (?, ?, ?, 'pending', ?)
-        ''', (user_id, message_type, scheduled_at.isoformat(), datetime.now().isoformat()))
+            INSERT INTO followup_messages (
+                user_id, message_type, scheduled_at, scheduled_ts, status, created_at, created_ts
+            )
+            VALUES (?, ?, ?, ?, 'pending', ?, ?)
+        ''', (user_id, message_type, scheduled_at.isoformat(), _epoch(scheduled_at),
+              now.isoformat(), _epoch(now)))
         await db.commit()
 
 
 async def get_pending_followups() -> List[Dict]:
     """Получить все pending follow-up сообщения, которые пора отправить"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        db.row_factory = aiosqlite.Row
-        now = datetime.now().isoformat()
+    async with connection() as db:
         async with db.execute('''
             SELECT f.*, u.username, u.first_name, u.has_paid
             FROM followup_messages f
             JOIN users u ON f.user_id = u.user_id
             WHERE f.status = 'pending'
-            AND f.scheduled_at <= ?
-        ''', (now,)) as cursor:
+            AND f.scheduled_ts <= ?
+        ''', (int(time.time()),)) as cursor:
             rows = await cursor.fetchall()
             return [dict(row) for row in rows]
 
 
 async def mark_followup_sent(followup_id: int, status: str = 'sent'):
     """Отметить follow-up как отправленный или неудачный"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
+    now = datetime.now()
+    async with connection() as db:
         await db.execute('''
             UPDATE followup_messages 
-            SET status = ?, sent_at = ?
+            SET status = ?, sent_at = ?, sent_ts = ?
             WHERE id = ?
-        ''', (status, datetime.now().isoformat(), followup_id))
+        ''', (status, now.isoformat(), _epoch(now), followup_id))
         await db.commit()
 
 
 async def cancel_user_followups(user_id: int):
     """Отменить все pending follow-up для пользователя (например, после оплаты)"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
+    async with connection() as db:
         await db.execute('''
             UPDATE followup_messages 
             SET status = 'cancelled'
@@ -839,180 +2174,652 @@ async def cancel_user_followups(user_id: int):
         await db.commit()
 
 
-async def get_weekly_report() -> Dict:
+# ==================== Daily Rollups ====================
+
+# Отчёты (get_stats, get_weekly_report) читают только daily_rollups и «хвост» —
+# строки, записанные после последнего пересчёта (_rollup_rows от водяного
+# знака до текущего момента). Стоимость отчёта зависит от числа дней
+# истории, а не от числа пользователей и событий.
+#
+# Каждая колонка складывается по дням без двойного счёта:
+# - new_users, approvals, rejections, followups_* — строки за день;
+# - started_users, clicked_users, screenshot_users, paid_users (одобренная
+#   оплата любого продукта), calculator_users, followup_users — пользователи,
+#   впервые сделавшие шаг в этот день. Первое событие типа определяется по id,
+#   как в правилах архивации (_RETENTION_RULES), и всегда остаётся в основной базе;
+# - engaged_users — первое из событий «нажал оплату», «прислал скриншот»,
+#   «начал калькулятор», «оплата одобрена»: пользователь сделал что-то кроме /start;
+# - clicked_screenshot_users, followup_paid_users — у пользователя появился
+#   второй шаг пары (нажал оплату и прислал скриншот; получил follow-up и
+#   оплатил — в любом порядке);
+# - paid_after_followup_users — первая оплата позже первого follow-up.
+# Срезы «сейчас» получаются вычитанием: «только /start» — new_users минус
+# engaged_users, «нажали оплату без скриншота» — clicked_users минус
+# clicked_screenshot_users, «проигнорировали follow-up» — followup_users
+# минус followup_paid_users.
+ROLLUP_COLUMNS = (
+    'new_users', 'started_users', 'clicked_users', 'screenshot_users',
+    'clicked_screenshot_users', 'engaged_users', 'paid_users', 'calculator_users',
+    'approvals', 'rejections', 'followups_sent', 'followups_only_start',
+    'followups_clicked_payment', 'followup_users', 'followup_paid_users',
+    'paid_after_followup_users',
+)
+_ROLLUP_COLUMNS_SQL = ', '.join(ROLLUP_COLUMNS)
+_ROLLUP_PLACEHOLDERS_SQL = ', '.join('?' * (len(ROLLUP_COLUMNS) + 2))
+_ROLLUP_SUMS_SQL = ', '.join(f'SUM({column}) AS {column}' for column in ROLLUP_COLUMNS)
+
+# Сколько дней до водяного знака пересчитывается заново: события пишутся
+# пачками с задержкой
+ROLLUP_OVERLAP_DAYS = 1
+# Водяной знак отстаёт от текущего момента: строка, записанная с опозданием
+# меньше этого (буфер событий, отправка follow-up), попадает в хвост отчёта
+ROLLUP_LAG_SECONDS = 60
+ROLLUP_REFRESH_INTERVAL_MINUTES = 10
+
+# Продукт из metadata вида "approved_by:1,product:fmd"
+_ROLLUP_PRODUCT_SQL = '''
+    CASE
+        WHEN instr(metadata, 'product:') > 0
+            THEN substr(metadata, instr(metadata, 'product:') + 8)
+        ELSE 'main'
+    END
+'''
+
+# Первое событие шага у пользователя (по id) -> колонка daily_rollups
+_FIRST_STEP_COLUMNS = {
+    EventType.START_COMMAND: 'started_users',
+    EventType.PAYMENT_BUTTON_CLICKED: 'clicked_users',
+    EventType.SCREENSHOT_SENT: 'screenshot_users',
+    EventType.PAYMENT_APPROVED: 'paid_users',
+}
+
+
+async def _rollup_rows(db, from_ts: int, to_ts: int) -> Dict[Tuple[str, str], Dict[str, int]]:
     """
-    Получить детальный недельный отчёт для модераторов.
-    Включает статистику за последние 7 дней.
+    Агрегаты daily_rollups по строкам с секундами Unix в [from_ts, to_ts):
+    (день 'YYYY-MM-DD', продукт) -> {колонка: значение}. День — местный день
+    бота на момент самой строки. Показатели пользователей (и follow-up)
+    пишутся с продуктом 'all', одобрения и отказы — с продуктом заявки.
     """
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        report = {}
-        week_ago = (datetime.now() - timedelta(days=7)).isoformat()
-
-        # === ОБЩАЯ СТАТИСТИКА ===
-
-        # Всего пользователей
-        async with db.execute('SELECT COUNT(*) FROM users') as cursor:
-            row = await cursor.fetchone()
-            report['total_users'] = row[0] if row else 0
+    offsets = _utc_offsets(from_ts, to_ts)
+    params = {
+        'from_ts': from_ts,
+        'to_ts': to_ts,
+        'start': EventType.START_COMMAND,
+        'clicked': EventType.PAYMENT_BUTTON_CLICKED,
+        'screenshot': EventType.SCREENSHOT_SENT,
+        'calc_started': EventType.CALCULATOR_STARTED,
+        'approved': EventType.PAYMENT_APPROVED,
+        'rejected': EventType.PAYMENT_REJECTED,
+    }
+    rollups: Dict[Tuple[str, str], Dict[str, int]] = {}
+
+    def add(day: int, product: str, column: str, value: int):
+        if value:
+            key = ((date(1970, 1, 1) + timedelta(days=day)).isoformat(), product)
+            values = rollups.setdefault(key, {})
+            values[column] = values.get(column, 0) + value
+
+    async with db.execute(f'''
+        SELECT {_local_day_sql('created_ts', offsets)} AS day, COUNT(*)
+        FROM users
+        WHERE created_ts >= :from_ts AND created_ts < :to_ts
+        GROUP BY day
+    ''', params) as cursor:
+        for day, count in await cursor.fetchall():
+            add(day, 'all', 'new_users', count)
+
+    # Первые события шагов; для нажатия оплаты и скриншота — был ли уже
+    # второй из них, для оплаты — был ли до неё follow-up
+    async with db.execute(f'''
+        SELECT {_local_day_sql('e.created_ts', offsets)} AS day, e.event_type, COUNT(*),
+               COUNT(CASE WHEN e.event_type IN (:clicked, :screenshot) AND EXISTS (
+                   SELECT 1 FROM user_events o
+                   WHERE o.user_id = e.user_id
+                   AND o.event_type IN (:clicked, :screenshot)
+                   AND o.event_type <> e.event_type
+                   AND o.id < e.id
+               ) THEN 1 END),
+               COUNT(CASE WHEN e.event_type = :approved AND EXISTS (
+                   SELECT 1 FROM followup_messages f
+                   WHERE f.user_id = e.user_id AND f.status = 'sent' AND f.sent_ts <= e.created_ts
+               ) THEN 1 END),
+               COUNT(CASE WHEN e.event_type = :approved AND EXISTS (
+                   SELECT 1 FROM followup_messages f
+                   WHERE f.user_id = e.user_id AND f.status = 'sent' AND f.sent_ts < e.created_ts
+               ) THEN 1 END)
+        FROM user_events e
+        WHERE e.event_type IN (:start, :clicked, :screenshot, :approved)
+        AND e.created_ts >= :from_ts AND e.created_ts < :to_ts
+        AND NOT EXISTS (
+            SELECT 1 FROM user_events p
+            WHERE p.user_id = e.user_id AND p.event_type = e.event_type AND p.id < e.id
+        )
+        GROUP BY day, e.event_type
+    ''', params) as cursor:
+        for day, event_type, users, second_of_pair, after_followup, paid_after_followup in (
+            await cursor.fetchall()
+        ):
+            add(day, 'all', _FIRST_STEP_COLUMNS[event_type], users)
+            add(day, 'all', 'clicked_screenshot_users', second_of_pair)
+            add(day, 'all', 'followup_paid_users', after_followup)
+            add(day, 'all', 'paid_after_followup_users', paid_after_followup)
+
+    async with db.execute(f'''
+        SELECT {_local_day_sql('e.created_ts', offsets)} AS day, COUNT(*)
+        FROM user_events e
+        WHERE e.event_type IN (:clicked, :screenshot, :calc_started, :approved)
+        AND e.created_ts >= :from_ts AND e.created_ts < :to_ts
+        AND NOT EXISTS (
+            SELECT 1 FROM user_events p
+            WHERE p.user_id = e.user_id
+            AND p.event_type IN (:clicked, :screenshot, :calc_started, :approved)
+            AND p.id < e.id
+        )
+        GROUP BY day
+    ''', params) as cursor:
+        for day, count in await cursor.fetchall():
+            add(day, 'all', 'engaged_users', count)
+
+    async with db.execute(f'''
+        SELECT {_local_day_sql('created_ts', offsets)} AS day, {_ROLLUP_PRODUCT_SQL} AS product,
+               COUNT(CASE WHEN event_type = :approved THEN 1 END),
+               COUNT(CASE WHEN event_type = :rejected THEN 1 END)
+        FROM user_events
+        WHERE event_type IN (:approved, :rejected)
+        AND created_ts >= :from_ts AND created_ts < :to_ts
+        GROUP BY day, product
+    ''', params) as cursor:
+        for day, product, approvals, rejections in await cursor.fetchall():
+            add(day, product, 'approvals', approvals)
+            add(day, product, 'rejections', rejections)
+
+    # Первый follow-up пользователя — самый ранний отправленный (при равном
+    # времени — с меньшим id); «оплатил до него» — одобрение раньше отправки
+    async with db.execute(f'''
+        SELECT {_local_day_sql('f.sent_ts', offsets)} AS day, COUNT(*),
+               COUNT(CASE WHEN f.message_type = 'only_start' THEN 1 END),
+               COUNT(CASE WHEN f.message_type = 'clicked_payment' THEN 1 END),
+               COUNT(CASE WHEN f.is_first = 1 THEN 1 END),
+               COUNT(CASE WHEN f.is_first = 1 AND EXISTS (
+                   SELECT 1 FROM user_events e
+                   WHERE e.user_id = f.user_id AND e.event_type = :approved
+                   AND e.created_ts < f.sent_ts
+               ) THEN 1 END)
+        FROM (
+            SELECT f.user_id, f.message_type, f.sent_ts,
+                   CASE WHEN NOT EXISTS (
+                       SELECT 1 FROM followup_messages g
+                       WHERE g.user_id = f.user_id AND g.status = 'sent'
+                       AND (g.sent_ts < f.sent_ts OR (g.sent_ts = f.sent_ts AND g.id < f.id))
+                   ) THEN 1 ELSE 0 END AS is_first
+            FROM followup_messages f
+            WHERE f.status = 'sent' AND f.sent_ts >= :from_ts AND f.sent_ts < :to_ts
+        ) AS f
+        GROUP BY day
+    ''', params) as cursor:
+        for day, sent, only_start, clicked_payment, users, paid_before in await cursor.fetchall():
+            add(day, 'all', 'followups_sent', sent)
+            add(day, 'all', 'followups_only_start', only_start)
+            add(day, 'all', 'followups_clicked_payment', clicked_payment)
+            add(day, 'all', 'followup_users', users)
+            add(day, 'all', 'followup_paid_users', paid_before)
+
+    async with db.execute(f'''
+        SELECT {_local_day_sql('c.created_ts', offsets)} AS day, COUNT(*)
+        FROM calculator_results c
+        WHERE c.created_ts >= :from_ts AND c.created_ts < :to_ts
+        AND NOT EXISTS (
+            SELECT 1 FROM calculator_results p WHERE p.user_id = c.user_id AND p.id < c.id
+        )
+        GROUP BY day
+    ''', params) as cursor:
+        for day, count in await cursor.fetchall():
+            add(day, 'all', 'calculator_users', count)
 
-        # Всего оплативших
-        async with db.execute('SELECT COUNT(*) FROM users WHERE has_paid = 1') as cursor:
-            row = await cursor.fetchone()
-            report['total_paid'] = row[0] if row else 0
+    return rollups
 
-        # === СТАТИСТИКА ЗА НЕДЕЛЮ ===
 
-        # Новых пользователей за неделю
+async def refresh_daily_rollups() -> int:
+    """
+    Дозаполнить daily_rollups новыми данными.
+
+    Пересчитываются только дни начиная с водяного знака (секунды Unix, по
+    которую посчитан прошлый раз; отстаёт от текущего момента на
+    ROLLUP_LAG_SECONDS) минус ROLLUP_OVERLAP_DAYS, поэтому
+    стоимость не зависит от размера истории. При первом запуске агрегаты
+    строятся по всей истории.
+    Возвращает количество записанных строк.
+    """
+    to_ts = int(time.time()) - ROLLUP_LAG_SECONDS
+    async with connection() as db:
         async with db.execute(
-            'SELECT COUNT(*) FROM users WHERE created_at >= ?', (week_ago,)
+            "SELECT value FROM rollup_state WHERE name = 'daily_rollups_watermark'"
         ) as cursor:
             row = await cursor.fetchone()
-            report['new_users_week'] = row[0] if row else 0
 
-        # Оплатили за неделю
-        async with db.execute('''
-            SELECT COUNT(*) FROM users 
-            WHERE has_paid = 1 AND payment_request_date >= ?
-        ''', (week_ago,)) as cursor:
-            row = await cursor.fetchone()
-            report['paid_week'] = row[0] if row else 0
+        if row:
+            start = datetime.fromtimestamp(int(row[0])) - timedelta(days=ROLLUP_OVERLAP_DAYS)
+            start = start.replace(hour=0, minute=0, second=0, microsecond=0)
+            from_day, from_ts = start.strftime('%Y-%m-%d'), _epoch(start)
+        else:
+            from_day, from_ts = '', 0
+
+        rollups = await _rollup_rows(db, from_ts, to_ts)
+        await db.execute('DELETE FROM daily_rollups WHERE day >= ?', (from_day,))
+        await db.executemany(f'''
+            INSERT INTO daily_rollups (day, product, {_ROLLUP_COLUMNS_SQL})
+            VALUES ({_ROLLUP_PLACEHOLDERS_SQL})
+        ''', [
+            (day, product, *(values.get(column, 0) for column in ROLLUP_COLUMNS))
+            for (day, product), values in rollups.items()
+        ])
+        await db.execute('''
+            INSERT INTO rollup_state (name, value)
+            VALUES ('daily_rollups_watermark', ?)
+            ON CONFLICT(name) DO UPDATE SET value = excluded.value
+        ''', (str(to_ts),))
+        await db.commit()
 
-        # Всего запросов на оплату за неделю
-        async with db.execute(
-            "SELECT COUNT(*) FROM payment_requests WHERE created_at >= ?", (week_ago,)
-        ) as cursor:
-            row = await cursor.fetchone()
-            report['payment_requests_week'] = row[0] if row else 0
+    return len(rollups)
 
-        # Одобрено за неделю
-        async with db.execute(
-            "SELECT COUNT(*) FROM payment_requests WHERE status = 'approved' AND created_at >= ?",
-            (week_ago,)
-        ) as cursor:
-            row = await cursor.fetchone()
-            report['approved_week'] = row[0] if row else 0
 
-        # Отклонено за неделю
-        async with db.execute(
-            "SELECT COUNT(*) FROM payment_requests WHERE status = 'rejected' AND created_at >= ?",
-            (week_ago,)
-        ) as cursor:
-            row = await cursor.fetchone()
-            report['rejected_week'] = row[0] if row else 0
+async def _rollup_report(db, week_start: str) -> Tuple[Dict[str, int], Dict[str, Dict[str, int]]]:
+    """
+    Суммы daily_rollups вместе с хвостом после водяного знака:
+    (суммы за всё время, {день: суммы за день} для дней с week_start).
 
-        # Ожидают проверки (всего)
-        async with db.execute(
-            "SELECT COUNT(*) FROM payment_requests WHERE status = 'pending'"
-        ) as cursor:
-            row = await cursor.fetchone()
-            report['pending_now'] = row[0] if row else 0
+    Водяной знак и суммы читаются одним запросом, чтобы пересчёт между
+    ними не посчитал хвост дважды. Пока агрегатов нет (пересчёта ещё не
+    было), хвост — вся история.
+    """
+    async with db.execute(f'''
+        SELECT s.value AS watermark, r.*
+        FROM rollup_state s
+        LEFT JOIN (
+            SELECT CASE WHEN day >= :week_start THEN day ELSE '' END AS day, {_ROLLUP_SUMS_SQL}
+            FROM daily_rollups
+            GROUP BY CASE WHEN day >= :week_start THEN day ELSE '' END
+        ) AS r ON 1 = 1
+        WHERE s.name = 'daily_rollups_watermark'
+    ''', {'week_start': week_start}) as cursor:
+        rows = await cursor.fetchall()
+
+    totals = dict.fromkeys(ROLLUP_COLUMNS, 0)
+    days: Dict[str, Dict[str, int]] = {}
+
+    def add(day: str, values: Dict[str, int]):
+        for column in ROLLUP_COLUMNS:
+            value = values.get(column) or 0
+            totals[column] += value
+            if day >= week_start:
+                by_day = days.setdefault(day, dict.fromkeys(ROLLUP_COLUMNS, 0))
+                by_day[column] += value
+
+    for row in rows:
+        if row['day'] is not None:
+            add(row['day'], {column: row[column] for column in ROLLUP_COLUMNS})
+    watermark = int(rows[0]['watermark']) if rows else 0
+    tail = await _rollup_rows(db, watermark, int(time.time()) + 1)
+    for (day, _), values in tail.items():
+        add(day, values)
+    return totals, days
+
+
+async def _pending_payment_users(db) -> int:
+    """Пользователи с заявками на проверке (по индексу статуса заявок)"""
+    async with db.execute(
+        "SELECT COUNT(DISTINCT user_id) FROM payment_requests WHERE status = 'pending'"
+    ) as cursor:
+        return (await cursor.fetchone())[0]
+
+
+def _week_start() -> str:
+    """Первый день отчётной недели: сегодня и шесть дней до него"""
+    return (date.today() - timedelta(days=6)).isoformat()
+
+
+def _sum_days(days: Dict[str, Dict[str, int]]) -> Dict[str, int]:
+    return {column: sum(values[column] for values in days.values()) for column in ROLLUP_COLUMNS}
 
-        # === ВОРОНКА ЗА НЕДЕЛЮ ===
 
-        # Нажали /start за неделю
-        async with db.execute(
-            "SELECT COUNT(DISTINCT user_id) FROM user_events WHERE event_type = ? AND created_at >= ?",
-            (EventType.START_COMMAND, week_ago)
-        ) as cursor:
-            row = await cursor.fetchone()
-            report['started_week'] = row[0] if row else 0
+async def get_stats() -> Dict:
+    """Получить расширенную статистику для админки
 
-        # Нажали "Я оплатила" за неделю
-        async with db.execute(
-            "SELECT COUNT(DISTINCT user_id) FROM user_events WHERE event_type = ? AND created_at >= ?",
-            (EventType.PAYMENT_BUTTON_CLICKED, week_ago)
-        ) as cursor:
-            row = await cursor.fetchone()
-            report['clicked_payment_week'] = row[0] if row else 0
+    Показатели — суммы daily_rollups и хвоста после последнего пересчёта
+    (см. раздел Daily Rollups): «оплатили» — пользователи с одобренной
+    оплатой любого продукта, «за 7 дней» — сегодня и шесть дней до него.
+    """
+    async with read_connection() as db:
+        totals, days = await _rollup_report(db, _week_start())
+        pending = await _pending_payment_users(db)
+    week = _sum_days(days)
+
+    return {
+        'total_users': totals['new_users'],
+        'paid_users': totals['paid_users'],
+        'pending_payments': pending,
+        'new_users_7d': week['new_users'],
+        'paid_7d': week['paid_users'],
+        'started_users': totals['started_users'],
+        'clicked_payment_btn': totals['clicked_users'],
+        'sent_screenshot': totals['screenshot_users'],
+        'only_start': max(totals['new_users'] - totals['engaged_users'], 0),
+        'clicked_but_no_screenshot': totals['clicked_users'] - totals['clicked_screenshot_users'],
+        'followup_sent': totals['followups_sent'],
+        'followup_users': totals['followup_users'],
+        'paid_after_followup': totals['paid_after_followup_users'],
+        'ignored_followup': totals['followup_users'] - totals['followup_paid_users'],
+        'followup_by_type': {
+            'only_start': totals['followups_only_start'],
+            'clicked_payment': totals['followups_clicked_payment'],
+        },
+    }
 
-        # Прислали скриншот за неделю
-        async with db.execute(
-            "SELECT COUNT(DISTINCT user_id) FROM user_events WHERE event_type = ? AND created_at >= ?",
-            (EventType.SCREENSHOT_SENT, week_ago)
-        ) as cursor:
-            row = await cursor.fetchone()
-            report['screenshot_week'] = row[0] if row else 0
 
-        # === FOLLOW-UP СТАТИСТИКА ЗА НЕДЕЛЮ ===
+async def get_weekly_report() -> Dict:
+    """
+    Получить детальный недельный отчёт для модераторов.
+    Включает статистику за последние 7 дней (сегодня и шесть дней до него).
 
-        # Отправлено follow-up за неделю
+    Показатели — суммы daily_rollups и хвоста после последнего пересчёта.
+    Воронка за неделю — пользователи, впервые сделавшие шаг на этой неделе;
+    одобрения и отказы — решения по заявкам, принятые на этой неделе.
+    """
+    async with read_connection() as db:
+        totals, days = await _rollup_report(db, _week_start())
         async with db.execute(
-            "SELECT COUNT(*) FROM followup_messages WHERE status = 'sent' AND sent_at >= ?",
-            (week_ago,)
+            "SELECT COUNT(*) FROM payment_requests WHERE status = 'pending'"
         ) as cursor:
-            row = await cursor.fetchone()
-            report['followup_sent_week'] = row[0] if row else 0
+            pending = (await cursor.fetchone())[0]
+    week = _sum_days(days)
+
+    report = {
+        'total_users': totals['new_users'],
+        'total_paid': totals['paid_users'],
+        'new_users_week': week['new_users'],
+        'paid_week': week['paid_users'],
+        'approved_week': week['approvals'],
+        'rejected_week': week['rejections'],
+        'pending_now': pending,
+        'started_week': week['started_users'],
+        'clicked_payment_week': week['clicked_users'],
+        'screenshot_week': week['screenshot_users'],
+        'calculator_completed_week': week['calculator_users'],
+        'followup_sent_week': week['followups_sent'],
+        'paid_after_followup_week': week['paid_after_followup_users'],
+        'only_start_total': max(totals['new_users'] - totals['engaged_users'], 0),
+        'clicked_no_screenshot_total': totals['clicked_users'] - totals['clicked_screenshot_users'],
+    }
+
+    # === ТОП ДНЕЙ НЕДЕЛИ ПО ОПЛАТАМ ===
+    weekdays = ['Пн', 'Вт', 'Ср', 'Чт', 'Пт', 'Сб', 'Вс']
+    by_weekday = {}
+    for day, values in days.items():
+        if values['paid_users']:
+            weekday = weekdays[date.fromisoformat(day).weekday()]
+            by_weekday[weekday] = by_weekday.get(weekday, 0) + values['paid_users']
+    report['payments_by_weekday'] = dict(
+        sorted(by_weekday.items(), key=lambda item: item[1], reverse=True)
+    )
+
+    return report
+
+
+# ==================== Retention ====================
+
+# Сколько дней сырые строки живут в основной базе (None — не архивировать)
+RETENTION_DAYS = {
+    'user_events': 180,
+    'followup_messages': 180,
+    'chain_message_history': 180,
+}
+RETENTION_BATCH_SIZE = 1000           # Строк на одну транзакцию переноса
+RETENTION_BATCH_PAUSE_SECONDS = 0.05  # Пауза между транзакциями: даём писать боту
+RETENTION_VACUUM_STEP_PAGES = 2000    # Страниц за один шаг incremental_vacuum
+ARCHIVE_DATABASE_NAME = None          # SQLite; None — рядом с основной: <имя>_archive.db
+
+# Таблица -> (колонка секунд Unix, условие "строку t можно убрать из основной базы").
+# Условия сохраняют всё, на что опираются запросы бота:
+# - user_events: первое событие каждого типа у пользователя (аудитории,
+#   первые шаги в daily_rollups); дневные количества уже лежат в daily_rollups;
+# - followup_messages: отменённые и неудачные; отправленных не больше одного
+#   на пользователя и тип (по ним get_users_for_followup не шлёт повтор),
+#   и на них же считается get_stats;
+# - chain_message_history: всё, количество переносится в chain_message_totals.
+# auto_broadcast_sent не архивируется: отметки действующих авто-рассылок
+# защищают от повторной отправки, а отметки удалённой рассылки удаляются
+# вместе с ней (delete_auto_broadcast).
+_RETENTION_RULES = {
+    'user_events': ('created_ts', '''
+        EXISTS (
+            SELECT 1 FROM user_events f
+            WHERE f.user_id = t.user_id
+            AND f.event_type = t.event_type
+            AND f.id < t.id
+        )
+    '''),
+    'followup_messages': ('created_ts', "t.status IN ('cancelled', 'failed')"),
+    'chain_message_history': ('sent_ts', '1 = 1'),
+}
 
-        # Оплатили после follow-up за неделю
-        async with db.execute('''
-            SELECT COUNT(DISTINCT f.user_id) 
-            FROM followup_messages f
-            JOIN users u ON f.user_id = u.user_id
-            WHERE f.status = 'sent'
-            AND f.sent_at >= ?
-            AND u.has_paid = 1
-            AND u.payment_request_date > f.sent_at
-        ''', (week_ago,)) as cursor:
-            row = await cursor.fetchone()
-            report['paid_after_followup_week'] = row[0] if row else 0
+_retention_stats: Dict = {}
 
-        # === КАЛЬКУЛЯТОР ЗА НЕДЕЛЮ ===
 
-        # Прошли калькулятор за неделю
-        async with db.execute(
-            "SELECT COUNT(DISTINCT user_id) FROM calculator_results WHERE created_at >= ?",
-            (week_ago,)
-        ) as cursor:
-            row = await cursor.fetchone()
-            report['calculator_completed_week'] = row[0] if row else 0
+def _archive_database_name() -> str:
+    return ARCHIVE_DATABASE_NAME or f'{os.path.splitext(_backend.database)[0]}_archive.db'
 
-        # === ПОТЕРЯННЫЕ КЛИЕНТЫ ===
 
-        # Только /start (ничего не делали) — всего
-        async with db.execute('''
-            SELECT COUNT(*) FROM users u
-            WHERE u.has_paid = 0
-            AND NOT EXISTS (
-                SELECT 1 FROM user_events e 
-                WHERE e.user_id = u.user_id 
-                AND e.event_type IN (?, ?, ?)
-            )
-        ''', (EventType.PAYMENT_BUTTON_CLICKED, EventType.SCREENSHOT_SENT, EventType.CALCULATOR_STARTED)) as cursor:
-            row = await cursor.fetchone()
-            report['only_start_total'] = row[0] if row else 0
+def _main_schema() -> str:
+    """Схема основных таблиц: архив лежит рядом, в схеме archive"""
+    return 'main' if _is_sqlite() else 'public'
 
-        # Нажали оплату, но без скрина — всего
-        async with db.execute('''
-            SELECT COUNT(DISTINCT e1.user_id) FROM user_events e1
-            WHERE e1.event_type = ?
-            AND NOT EXISTS (
-                SELECT 1 FROM user_events e2
-                WHERE e2.user_id = e1.user_id
-                AND e2.event_type = ?
-            )
-        ''', (EventType.PAYMENT_BUTTON_CLICKED, EventType.SCREENSHOT_SENT)) as cursor:
-            row = await cursor.fetchone()
-            report['clicked_no_screenshot_total'] = row[0] if row else 0
 
-        # === ТОП ДНЕЙ НЕДЕЛИ ПО ОПЛАТАМ ===
+async def _add_archive_columns_postgres(db, table: str):
+    """Досоздать в archive.table колонки, которых там ещё нет (PostgreSQL)"""
+    async with db.execute('''
+        SELECT column_name, data_type FROM information_schema.columns
+        WHERE table_schema = 'public' AND table_name = ?
+        AND column_name NOT IN (
+            SELECT column_name FROM information_schema.columns
+            WHERE table_schema = 'archive' AND table_name = ?
+        )
+        ORDER BY ordinal_position
+    ''', (table, table)) as cursor:
+        missing = await cursor.fetchall()
+    for row in missing:
+        await db.execute(f'ALTER TABLE archive.{table} ADD COLUMN {row[0]} {row[1]}')
+
 
-        async with db.execute('''
-            SELECT strftime('%w', payment_request_date) as weekday, COUNT(*) as cnt
-            FROM users 
-            WHERE has_paid = 1 AND payment_request_date >= ?
-            GROUP BY weekday
-            ORDER BY cnt DESC
-        ''', (week_ago,)) as cursor:
+async def _ensure_archive_table(db, table: str):
+    """
+    Таблица архива с теми же колонками (id — ключ, повторный перенос игнорируется).
+
+    Колонки, добавленные в основную таблицу после создания архива
+    (например, секунды Unix из миграции 008), досоздаются и в архиве.
+    """
+    if not _is_sqlite():
+        await db.execute(
+            f'CREATE TABLE IF NOT EXISTS archive.{table} (LIKE public.{table} INCLUDING INDEXES)'
+        )
+        await _add_archive_columns_postgres(db, table)
+        return
+    async with db.execute(f'PRAGMA main.table_info({table})') as cursor:
+        main_columns = await cursor.fetchall()
+    columns = [
+        f"{row['name']} INTEGER PRIMARY KEY" if row['pk'] else f"{row['name']} {row['type']}"
+        for row in main_columns
+    ]
+    await db.execute(f'CREATE TABLE IF NOT EXISTS archive.{table} ({", ".join(columns)})')
+    async with db.execute(f'PRAGMA archive.table_info({table})') as cursor:
+        existing = {row['name'] for row in await cursor.fetchall()}
+    for row in main_columns:
+        if row['name'] not in existing:
+            await db.execute(f"ALTER TABLE archive.{table} ADD COLUMN {row['name']} {row['type']}")
+
+
+async def _archive_table(db, table: str, cutoff: int) -> Dict[str, int]:
+    """
+    Перенести в архив строки table старше cutoff, подходящие под правило
+
+    Таблица проходится окнами по первичному ключу. Каждое окно —
+    отдельная короткая транзакция (копия в архив + удаление), между
+    окнами — пауза. Строки добавляются в конец таблицы, поэтому проход
+    заканчивается на первом окне без устаревших строк.
+    """
+    time_column, removable = _RETENTION_RULES[table]
+    result = {'archived': 0, 'batches': 0}
+    await _ensure_archive_table(db, table)
+
+    last_id = 0
+    while True:
+        async with db.execute(f'''
+            SELECT t.id, t.{time_column} < ? AS expired,
+                   t.{time_column} < ? AND ({removable}) AS removable
+            FROM {table} t
+            WHERE t.id > ?
+            ORDER BY t.id
+            LIMIT ?
+        ''', (cutoff, cutoff, last_id, RETENTION_BATCH_SIZE)) as cursor:
             rows = await cursor.fetchall()
-            weekdays_map = {
-                '0': 'Вс', '1': 'Пн', '2': 'Вт', '3': 'Ср',
-                '4': 'Чт', '5': 'Пт', '6': 'Сб'
-            }
-            report['payments_by_weekday'] = {
-                weekdays_map.get(row[0], row[0]): row[1] for row in rows
-            }
 
-        return report
+        if not rows or not any(row['expired'] for row in rows):
+            break
+        last_id = rows[-1]['id']
+        ids = [row['id'] for row in rows if row['removable']]
+        if not ids:
+            continue
+
+        placeholders = ', '.join('?' * len(ids))
+        schema = _main_schema()
+        await db.execute('BEGIN IMMEDIATE')
+        try:
+            if table == 'chain_message_history':
+                await db.execute(f'''
+                    INSERT INTO chain_message_totals (chain_id, archived_messages)
+                    SELECT chain_id, COUNT(*) FROM chain_message_history
+                    WHERE id IN ({placeholders})
+                    GROUP BY chain_id
+                    ON CONFLICT(chain_id) DO UPDATE SET
+                        archived_messages = chain_message_totals.archived_messages + excluded.archived_messages
+                ''', ids)
+            await db.execute(f'''
+                INSERT INTO archive.{table} SELECT * FROM {schema}.{table}
+                WHERE id IN ({placeholders})
+                ON CONFLICT DO NOTHING
+            ''', ids)
+            cursor = await db.execute(f'DELETE FROM {schema}.{table} WHERE id IN ({placeholders})', ids)
+            result['archived'] += cursor.rowcount
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+
+        result['batches'] += 1
+        await asyncio.sleep(RETENTION_BATCH_PAUSE_SECONDS)
+
+    return result
+
+
+async def _incremental_vacuum(db: aiosqlite.Connection) -> int:
+    """Вернуть ОС свободные страницы шагами; возвращает число освобождённых страниц"""
+    async with db.execute('PRAGMA auto_vacuum') as cursor:
+        mode = (await cursor.fetchone())[0]
+    async with db.execute('PRAGMA freelist_count') as cursor:
+        free_pages = (await cursor.fetchone())[0]
+    if mode != 2:
+        if free_pages:
+            logger.info(
+                f"Retention: {free_pages} free pages stay in the file "
+                f"(auto_vacuum is not INCREMENTAL, see enable_incremental_vacuum)")
+        return 0
+
+    vacuumed = 0
+    while free_pages:
+        # Прагма освобождает по странице на шаг: выбираем результат до конца
+        async with db.execute(f'PRAGMA incremental_vacuum({RETENTION_VACUUM_STEP_PAGES})') as cursor:
+            await cursor.fetchall()
+        async with db.execute('PRAGMA freelist_count') as cursor:
+            left = (await cursor.fetchone())[0]
+        vacuumed += free_pages - left
+        if left >= free_pages:
+            break
+        free_pages = left
+        await asyncio.sleep(RETENTION_BATCH_PAUSE_SECONDS)
+    return vacuumed
+
+
+async def run_retention(days: Optional[Dict[str, Optional[int]]] = None) -> Dict:
+    """
+    Архивация старых строк журнальных таблиц.
+
+    Перед переносом дозаполняются daily_rollups, а граница не заходит
+    в дни, которые refresh_daily_rollups() ещё пересчитывает. Строки
+    копируются в архив (в SQLite — отдельный файл через ATTACH,
+    в PostgreSQL — схема archive) и удаляются из основной базы пачками
+    по RETENTION_BATCH_SIZE, после чего SQLite возвращает свободные страницы
+    через incremental_vacuum (в PostgreSQL место освобождает autovacuum).
+    Возвращает метрики прогона (они же доступны через get_retention_stats()).
+    """
+    days = {**RETENTION_DAYS, **(days or {})}
+    started = time.perf_counter()
+    await refresh_daily_rollups()
+    rollup_floor = datetime.now() - timedelta(days=ROLLUP_OVERLAP_DAYS + 1)
+
+    stats = {'started_at': datetime.now().isoformat(), 'tables': {}, 'vacuumed_pages': 0}
+    async with connection() as db:
+        if _is_sqlite():
+            await db.execute('ATTACH DATABASE ? AS archive', (_archive_database_name(),))
+        try:
+            for table, keep_days in days.items():
+                if keep_days is None or table not in _RETENTION_RULES:
+                    continue
+                cutoff = min(datetime.now() - timedelta(days=keep_days), rollup_floor)
+                cutoff = cutoff.replace(hour=0, minute=0, second=0, microsecond=0)
+                table_started = time.perf_counter()
+                result = await _archive_table(db, table, _epoch(cutoff))
+                result['duration_ms'] = round((time.perf_counter() - table_started) * 1000)
+                stats['tables'][table] = result
+
+            if _is_sqlite() and any(result['archived'] for result in stats['tables'].values()):
+                stats['vacuumed_pages'] = await _incremental_vacuum(db)
+        finally:
+            if _is_sqlite():
+                await db.execute('DETACH DATABASE archive')
+
+    stats['archived'] = sum(result['archived'] for result in stats['tables'].values())
+    stats['duration_ms'] = round((time.perf_counter() - started) * 1000)
+    _retention_stats.clear()
+    _retention_stats.update(stats)
+    return stats
+
+
+def get_retention_stats() -> Dict:
+    """Метрики последнего прогона run_retention() (пусто, если ещё не запускался)"""
+    return dict(_retention_stats)
+
+
+async def enable_incremental_vacuum() -> bool:
+    """
+    Перевести существующую базу на auto_vacuum=INCREMENTAL.
+
+    Требует полного VACUUM (перезапись всего файла с блокировкой записи),
+    поэтому выполняется вручную один раз в тихое время: командой /vacuum
+    в админке. Базы, созданные этим модулем с нуля, уже в этом режиме.
+    Только для SQLite. Возвращает True, если база переведена, и False,
+    если она уже в этом режиме или это не SQLite.
+    """
+    if not _is_sqlite():
+        return False
+    async with connection() as db:
+        async with db.execute('PRAGMA auto_vacuum') as cursor:
+            # 2 — INCREMENTAL
+            if (await cursor.fetchone())[0] == 2:
+                return False
+        await db.execute('PRAGMA auto_vacuum = INCREMENTAL')
+        await db.execute('VACUUM')
+        logger.info("Database switched to auto_vacuum=INCREMENTAL")
+        return True
 
 
 async def get_users_by_status(status_type: str) -> List[Dict]:
@@ -1027,9 +2834,7 @@ async def get_users_by_status(status_type: str) -> List[Dict]:
     - 'clicked_no_screenshot': нажали оплату, но не прислали скрин
     - 'all_users': все пользователи
     """
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        db.row_factory = aiosqlite.Row
-
+    async with read_connection() as db:
         if status_type == 'paid':
             # Оплатившие пользователи
             async with db.execute('''
@@ -1044,11 +2849,12 @@ async def get_users_by_status(status_type: str) -> List[Dict]:
         elif status_type == 'pending':
             # Пользователи с pending запросами на оплату
             async with db.execute('''
-                SELECT DISTINCT u.user_id, u.username, u.first_name, u.has_paid, u.created_at
+                SELECT u.user_id, u.username, u.first_name, u.has_paid, u.created_at
                 FROM users u
                 JOIN payment_requests pr ON u.user_id = pr.user_id
                 WHERE pr.status = 'pending'
-                ORDER BY pr.created_at DESC
+                GROUP BY u.user_id
+                ORDER BY MAX(pr.created_at) DESC
             ''') as cursor:
                 rows = await cursor.fetchall()
                 return [dict(row) for row in rows]
@@ -1110,7 +2916,148 @@ async def get_users_by_status(status_type: str) -> List[Dict]:
                 rows = await cursor.fetchall()
                 return [dict(row) for row in rows]
 
-        return []
+        return []
+
+
+# ==================== Backup ====================
+
+BACKUP_DIR = None                 # None — папка backups рядом с базой
+BACKUP_KEEP = 7                   # Сколько последних снимков хранить
+BACKUP_PAGES_PER_STEP = 256       # Страниц за один шаг копирования
+BACKUP_BUSY_SLEEP_SECONDS = 0.05  # Пауза перед повтором шага, если файл занят
+BACKUP_COMPRESS = True            # Сжимать снимок gzip
+
+_backup_stats: Dict = {}
+_backup_lock = asyncio.Lock()
+
+
+def _backup_dir() -> str:
+    return BACKUP_DIR or os.path.join(os.path.dirname(os.path.abspath(_backend.database)), 'backups')
+
+
+def _backup_prefix() -> str:
+    return f'{os.path.splitext(os.path.basename(_backend.database))[0]}-'
+
+
+def _finish_backup_file(target: sqlite3.Connection, partial: str, path: str) -> Tuple[str, str]:
+    """
+    Довести скопированный файл до готового снимка (в потоке, не в цикле событий).
+
+    Снимок переводится из WAL в обычный журнал, чтобы он был одним
+    самодостаточным файлом, проверяется quick_check и, если включено,
+    сжимается gzip. Готовый файл появляется под итоговым именем
+    только целиком. Возвращает (путь снимка, результат quick_check).
+    """
+    try:
+        target.execute('PRAGMA journal_mode = DELETE')
+        check = target.execute('PRAGMA quick_check').fetchone()[0]
+    finally:
+        target.close()
+
+    if not BACKUP_COMPRESS:
+        os.replace(partial, path)
+        return path, check
+
+    path += '.gz'
+    with open(partial, 'rb') as source, gzip.open(f'{path}.part', 'wb', compresslevel=6) as packed:
+        shutil.copyfileobj(source, packed, 1024 * 1024)
+    os.replace(f'{path}.part', path)
+    os.remove(partial)
+    return path, check
+
+
+def _rotate_backups(directory: str, prefix: str) -> int:
+    """Удалить снимки сверх BACKUP_KEEP самых свежих; возвращает число удалённых"""
+    snapshots = sorted(
+        name for name in os.listdir(directory)
+        if name.startswith(prefix) and name.endswith(('.db', '.db.gz'))
+    )
+    stale = snapshots[:-BACKUP_KEEP] if BACKUP_KEEP > 0 else []
+    for name in stale:
+        os.remove(os.path.join(directory, name))
+    return len(stale)
+
+
+async def run_backup() -> Dict:
+    """
+    Горячий снимок базы без остановки бота (только SQLite).
+
+    Копирует файл через backup API SQLite по BACKUP_PAGES_PER_STEP страниц
+    за шаг на отдельном соединении в его собственном потоке: цикл событий
+    не ждёт копирования, а пул соединений бота не занят. Перед копированием
+    соединение открывает читающую транзакцию — в WAL все шаги читают один
+    снимок, поэтому запись бота между шагами не перезапускает копирование
+    и сама его не ждёт. Готовый снимок кладётся в BACKUP_DIR с отметкой
+    времени в имени, старые удаляются (хранятся BACKUP_KEEP последних).
+    Возвращает метрики (они же доступны через get_backup_stats());
+    в PostgreSQL — пустой словарь, там снимки делает pg_dump.
+    """
+    if not _is_sqlite():
+        return {}
+
+    async with _backup_lock:
+        started = time.perf_counter()
+        started_at = datetime.now()
+        directory = _backup_dir()
+        prefix = _backup_prefix()
+        await asyncio.to_thread(os.makedirs, directory, exist_ok=True)
+        path = os.path.join(directory, f"{prefix}{started_at.strftime('%Y%m%d-%H%M%S')}.db")
+        partial = f'{path}.part'
+
+        progress = {'steps': 0, 'pages': 0}
+
+        def on_progress(status: int, remaining: int, total: int):
+            progress['steps'] += 1
+            progress['pages'] = total
+
+        source = await aiosqlite.connect(_backend.database)
+        target = sqlite3.connect(partial, check_same_thread=False)
+        try:
+            await source.execute('BEGIN')
+            async with source.execute('SELECT COUNT(*) FROM sqlite_master') as cursor:
+                await cursor.fetchone()
+            await source.backup(
+                target,
+                pages=BACKUP_PAGES_PER_STEP,
+                progress=on_progress,
+                sleep=BACKUP_BUSY_SLEEP_SECONDS,
+            )
+        except Exception:
+            target.close()
+            await asyncio.to_thread(os.remove, partial)
+            raise
+        finally:
+            await source.close()
+        copy_ms = round((time.perf_counter() - started) * 1000)
+
+        path, check = await asyncio.to_thread(_finish_backup_file, target, partial, path)
+        if check == 'ok':
+            removed = await asyncio.to_thread(_rotate_backups, directory, prefix)
+        else:
+            # Испорченный снимок не должен вытеснять исправные
+            logger.error(f"Backup {path}: quick_check failed: {check}")
+            removed = 0
+
+        stats = {
+            'started_at': started_at.isoformat(),
+            'path': path,
+            'size_bytes': os.path.getsize(path),
+            'pages': progress['pages'],
+            'steps': progress['steps'],
+            'compressed': BACKUP_COMPRESS,
+            'quick_check': check,
+            'removed': removed,
+            'copy_ms': copy_ms,
+            'duration_ms': round((time.perf_counter() - started) * 1000),
+        }
+        _backup_stats.clear()
+        _backup_stats.update(stats)
+        return stats
+
+
+def get_backup_stats() -> Dict:
+    """Метрики последнего снимка run_backup() (пусто, если ещё не запускался)"""
+    return dict(_backup_stats)
 
 
 # ==================== Broadcast Management ====================
@@ -1126,19 +3073,20 @@ async def create_broadcast(
     buttons: str = None
 ) -> int:
     """Создать новую рассылку, вернуть ID"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        cursor = await db.execute('''
-            INSERT INTO broadcasts (content, audience, scheduled_at, created_by, created_by_username, status, media_type, media_file_id, buttons, created_at)
-            VALUES (?, ?, ?, ?, ?, 'pending', ?, ?, ?, ?)
-        ''', (content, audience, scheduled_at.isoformat(), created_by, created_by_username, media_type, media_file_id, buttons, datetime.now().isoformat()))
+    async with connection() as db:
+        async with db.execute('''
+            INSERT INTO broadcasts (content, audience, scheduled_at, scheduled_ts, created_by, created_by_username, status, media_type, media_file_id, buttons, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, 'pending', ?, ?, ?, ?)
+            RETURNING id
+        ''', (content, audience, scheduled_at.isoformat(), _epoch(scheduled_at), created_by, created_by_username, media_type, media_file_id, buttons, datetime.now().isoformat())) as cursor:
+            broadcast_id = (await cursor.fetchone())[0]
         await db.commit()
-        return cursor.lastrowid
+        return broadcast_id
 
 
 async def get_broadcast(broadcast_id: int) -> Optional[Dict]:
     """Получить информацию о рассылке"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        db.row_factory = aiosqlite.Row
+    async with connection() as db:
         async with db.execute(
             'SELECT * FROM broadcasts WHERE id = ?', (broadcast_id,)
         ) as cursor:
@@ -1148,27 +3096,24 @@ async def get_broadcast(broadcast_id: int) -> Optional[Dict]:
 
 async def get_pending_broadcasts() -> List[Dict]:
     """Получить все pending рассылки, которые пора отправить"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        db.row_factory = aiosqlite.Row
-        now = datetime.now().isoformat()
+    async with connection() as db:
         async with db.execute('''
             SELECT * FROM broadcasts
             WHERE status = 'pending'
-            AND scheduled_at <= ?
-            ORDER BY scheduled_at ASC
-        ''', (now,)) as cursor:
+            AND scheduled_ts <= ?
+            ORDER BY scheduled_ts ASC
+        ''', (int(time.time()),)) as cursor:
             rows = await cursor.fetchall()
             return [dict(row) for row in rows]
 
 
 async def get_scheduled_broadcasts() -> List[Dict]:
     """Получить все запланированные рассылки для отображения в админке"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        db.row_factory = aiosqlite.Row
+    async with connection() as db:
         async with db.execute('''
             SELECT * FROM broadcasts
             WHERE status = 'pending'
-            ORDER BY scheduled_at ASC
+            ORDER BY scheduled_ts ASC
         ''') as cursor:
             rows = await cursor.fetchall()
             return [dict(row) for row in rows]
@@ -1176,7 +3121,7 @@ async def get_scheduled_broadcasts() -> List[Dict]:
 
 async def update_broadcast_status(broadcast_id: int, status: str, sent_count: int = 0, failed_count: int = 0):
     """Обновить статус рассылки"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
+    async with connection() as db:
         if status == 'sent':
             await db.execute('''
                 UPDATE broadcasts 
@@ -1194,7 +3139,7 @@ async def update_broadcast_status(broadcast_id: int, status: str, sent_count: in
 
 async def cancel_broadcast(broadcast_id: int) -> bool:
     """Отменить рассылку (только если pending)"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
+    async with connection() as db:
         cursor = await db.execute('''
             UPDATE broadcasts 
             SET status = 'cancelled'
@@ -1204,79 +3149,222 @@ async def cancel_broadcast(broadcast_id: int) -> bool:
         return cursor.rowcount > 0
 
 
-async def get_broadcast_audience_users(audience: str) -> List[Dict]:
-    """
-    Получить пользователей для рассылки по типу аудитории
+# ==================== Audience Streaming ====================
+
+AUDIENCE_BATCH_SIZE = 500  # Сколько user_id читать из базы за один запрос
+
+# Аудитории рассылок и цепочек: условие на users u и его параметры.
+# Дубликаты исключены по построению: JOIN заменены на EXISTS
+_AUDIENCE_CONDITIONS = {
+    # Все пользователи
+    'all': ('1 = 1', ()),
+    # Только нажали /start (ничего не делали)
+    'start_only': (
+        '''u.has_paid = 0
+        AND NOT EXISTS (
+            SELECT 1 FROM user_events e
+            WHERE e.user_id = u.user_id
+            AND e.event_type IN (?, ?, ?)
+        )''',
+        (EventType.PAYMENT_BUTTON_CLICKED, EventType.SCREENSHOT_SENT, EventType.CALCULATOR_STARTED)
+    ),
+    # С отклонёнными заявками (и не оплатившие после)
+    'rejected': (
+        '''u.has_paid = 0
+        AND EXISTS (
+            SELECT 1 FROM payment_requests pr
+            WHERE pr.user_id = u.user_id AND pr.status = 'rejected'
+        )''',
+        ()
+    ),
+    # Нажали "Я оплатил(а)", но не прислали скрин
+    'no_screenshot': (
+        '''u.has_paid = 0
+        AND EXISTS (
+            SELECT 1 FROM user_events e
+            WHERE e.user_id = u.user_id AND e.event_type = ?
+        )
+        AND NOT EXISTS (
+            SELECT 1 FROM user_events e2
+            WHERE e2.user_id = u.user_id AND e2.event_type = ?
+        )''',
+        (EventType.PAYMENT_BUTTON_CLICKED, EventType.SCREENSHOT_SENT)
+    ),
+    # Оплатившие рационы
+    'paid': ('u.has_paid = 1', ()),
+    # Не оплатившие: только /start или нажали оплату без скрина
+    'not_paid': (
+        '''(
+            u.has_paid = 0
+            AND NOT EXISTS (
+                SELECT 1 FROM user_events e
+                WHERE e.user_id = u.user_id
+                AND e.event_type IN (?, ?, ?)
+            )
+        ) OR (
+            EXISTS (
+                SELECT 1 FROM user_events e
+                WHERE e.user_id = u.user_id AND e.event_type = ?
+            )
+            AND NOT EXISTS (
+                SELECT 1 FROM user_events e2
+                WHERE e2.user_id = u.user_id AND e2.event_type = ?
+            )
+        )''',
+        (EventType.PAYMENT_BUTTON_CLICKED, EventType.SCREENSHOT_SENT, EventType.CALCULATOR_STARTED,
+         EventType.PAYMENT_BUTTON_CLICKED, EventType.SCREENSHOT_SENT)
+    ),
+}
+
+# Триггеры авто-рассылок. Первый параметр условия — порог времени (delay_hours назад)
+_AUTO_BROADCAST_CONDITIONS = {
+    # Только нажали /start и больше ничего не делали
+    'only_start': (
+        '''u.created_ts <= ?
+        AND u.has_paid = 0
+        AND NOT EXISTS (
+            SELECT 1 FROM user_events e
+            WHERE e.user_id = u.user_id
+            AND e.event_type IN (?, ?, ?)
+        )''',
+        (EventType.PAYMENT_BUTTON_CLICKED, EventType.SCREENSHOT_SENT, EventType.CALCULATOR_STARTED)
+    ),
+    # Нажали оплатить, но не оплатили
+    'no_payment': (
+        '''EXISTS (
+            SELECT 1 FROM user_events e
+            WHERE e.user_id = u.user_id
+            AND e.created_ts <= ? AND e.event_type = ?
+        )
+        AND u.has_paid = 0''',
+        (EventType.PAYMENT_BUTTON_CLICKED,)
+    ),
+    # Отклонённая оплата
+    'rejected': (
+        '''EXISTS (
+            SELECT 1 FROM payment_requests pr
+            WHERE pr.user_id = u.user_id
+            AND pr.created_ts <= ? AND pr.status = 'rejected'
+        )
+        AND u.has_paid = 0''',
+        ()
+    ),
+    # Нажали "Я оплатил(а)", но не прислали скрин
+    'no_screenshot': (
+        '''EXISTS (
+            SELECT 1 FROM user_events e
+            WHERE e.user_id = u.user_id
+            AND e.created_ts <= ? AND e.event_type = ?
+        )
+        AND u.has_paid = 0
+        AND NOT EXISTS (
+            SELECT 1 FROM user_events e2
+            WHERE e2.user_id = u.user_id AND e2.event_type = ?
+        )''',
+        (EventType.PAYMENT_BUTTON_CLICKED, EventType.SCREENSHOT_SENT)
+    ),
+}
 
-    audience:
-    - 'all': все пользователи
-    - 'start_only': только нажали /start (ничего не делали)
-    - 'rejected': с отклонёнными заявками
-    - 'no_screenshot': нажали оплату, но не прислали скрин
-    """
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        db.row_factory = aiosqlite.Row
 
-        if audience == 'all':
-            # Все пользователи
-            async with db.execute('''
-                SELECT user_id, username, first_name
-                FROM users
-            ''') as cursor:
-                rows = await cursor.fetchall()
-                return [dict(row) for row in rows]
+async def _iter_user_id_batches(condition: str, params: tuple, batch_size: int) -> AsyncIterator[List[int]]:
+    """
+    user_id пользователей, подходящих под условие, пачками по batch_size
 
-        elif audience == 'start_only':
-            # Пользователи, которые только нажали /start (ничего не делали)
-            async with db.execute('''
-                SELECT u.user_id, u.username, u.first_name
+    Каждая пачка — отдельный короткий запрос по первичному ключу
+    (user_id > последнего выданного), соединение возвращается в пул до yield:
+    пока вызывающий код рассылает пачку, база не держит ни соединение,
+    ни читающую транзакцию.
+    """
+    last_user_id = 0
+    while True:
+        async with connection() as db:
+            async with db.execute(f'''
+                SELECT u.user_id
                 FROM users u
-                WHERE u.has_paid = 0
-                AND NOT EXISTS (
-                    SELECT 1 FROM user_events e 
-                    WHERE e.user_id = u.user_id 
-                    AND e.event_type IN (?, ?, ?)
-                )
-            ''', (EventType.PAYMENT_BUTTON_CLICKED, EventType.SCREENSHOT_SENT, EventType.CALCULATOR_STARTED)) as cursor:
-                rows = await cursor.fetchall()
-                return [dict(row) for row in rows]
+                WHERE u.user_id > ?
+                AND ({condition})
+                ORDER BY u.user_id
+                LIMIT ?
+            ''', (last_user_id, *params, batch_size)) as cursor:
+                user_ids = [row[0] for row in await cursor.fetchall()]
+
+        if not user_ids:
+            return
+        yield user_ids
+        if len(user_ids) < batch_size:
+            return
+        last_user_id = user_ids[-1]
+
+
+async def iter_audience_user_ids(audience: str, batch_size: int = AUDIENCE_BATCH_SIZE) -> AsyncIterator[List[int]]:
+    """
+    user_id аудитории рассылки или цепочки пачками по batch_size
 
-        elif audience == 'rejected':
-            # Пользователи с отклонёнными запросами (и не оплатившие после)
-            async with db.execute('''
-                SELECT DISTINCT u.user_id, u.username, u.first_name
-                FROM users u
-                JOIN payment_requests pr ON u.user_id = pr.user_id
-                WHERE pr.status = 'rejected'
-                AND u.has_paid = 0
-            ''') as cursor:
-                rows = await cursor.fetchall()
-                return [dict(row) for row in rows]
+    audience: 'all', 'start_only', 'rejected', 'no_screenshot', 'paid', 'not_paid'.
+    Для неизвестной аудитории ничего не выдаёт.
+    """
+    if audience not in _AUDIENCE_CONDITIONS:
+        return
+    condition, params = _AUDIENCE_CONDITIONS[audience]
+    async for user_ids in _iter_user_id_batches(condition, params, batch_size):
+        yield user_ids
+
+
+def _auto_broadcast_condition(auto_id: int, trigger_type: str, delay_hours: int) -> Optional[Tuple[str, tuple]]:
+    """Условие на users u для авто-рассылки: триггер без уже получивших её"""
+    if trigger_type not in _AUTO_BROADCAST_CONDITIONS:
+        return None
+    condition, params = _AUTO_BROADCAST_CONDITIONS[trigger_type]
+    threshold = _epoch(datetime.now() - timedelta(hours=delay_hours))
+    condition = f'''{condition}
+        AND NOT EXISTS (
+            SELECT 1 FROM auto_broadcast_sent s
+            WHERE s.auto_broadcast_id = ? AND s.user_id = u.user_id
+        )'''
+    return condition, (threshold, *params, auto_id)
+
+
+async def iter_auto_broadcast_eligible_user_ids(
+    auto_id: int,
+    trigger_type: str,
+    delay_hours: int,
+    batch_size: int = AUDIENCE_BATCH_SIZE
+) -> AsyncIterator[List[int]]:
+    """
+    user_id пользователей, которым пора отправить авто-рассылку, пачками
 
-        elif audience == 'no_screenshot':
-            # Пользователи, которые нажали "Я оплатил(а)" но не прислали скрин
-            async with db.execute('''
-                SELECT DISTINCT u.user_id, u.username, u.first_name
-                FROM users u
-                JOIN user_events e ON u.user_id = e.user_id
-                WHERE e.event_type = ?
-                AND u.has_paid = 0
-                AND NOT EXISTS (
-                    SELECT 1 FROM user_events e2
-                    WHERE e2.user_id = u.user_id
-                    AND e2.event_type = ?
-                )
-            ''', (EventType.PAYMENT_BUTTON_CLICKED, EventType.SCREENSHOT_SENT)) as cursor:
-                rows = await cursor.fetchall()
-                return [dict(row) for row in rows]
+    Пользователи, которым рассылка auto_id уже отправлена
+    (auto_broadcast_sent), исключаются в самом запросе.
 
-        return []
+    trigger_type:
+    - 'only_start': только нажали /start, прошло delay_hours часов
+    - 'no_payment': нажали оплатить, но не оплатили, прошло delay_hours часов
+    - 'rejected': отклонённая оплата, прошло delay_hours часов
+    - 'no_screenshot': нажали оплатить без скрина, прошло delay_hours часов
+    """
+    auto_condition = _auto_broadcast_condition(auto_id, trigger_type, delay_hours)
+    if auto_condition is None:
+        return
+    condition, params = auto_condition
+    async for user_ids in _iter_user_id_batches(condition, params, batch_size):
+        yield user_ids
+
+
+async def count_audience(audience: str) -> int:
+    """Количество пользователей в аудитории рассылки или цепочки"""
+    if audience not in _AUDIENCE_CONDITIONS:
+        return 0
+    condition, params = _AUDIENCE_CONDITIONS[audience]
+    async with connection() as db:
+        async with db.execute(f'''
+            SELECT COUNT(*) FROM users u WHERE {condition}
+        ''', params) as cursor:
+            return (await cursor.fetchone())[0]
 
 
 async def get_broadcast_audience_count(audience: str) -> int:
     """Получить количество пользователей для аудитории рассылки"""
-    users = await get_broadcast_audience_users(audience)
-    return len(users)
+    return await count_audience(audience)
 
 
 # ==================== Template Management ====================
@@ -1291,20 +3379,20 @@ async def create_template(
     buttons: str = None
 ) -> int:
     """Создать шаблон рассылки"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        cursor = await db.execute('''
+    async with connection() as db:
+        async with db.execute('''
             INSERT INTO broadcast_templates (name, content, created_by, created_by_username, media_type, media_file_id, buttons)
             VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (name, content, created_by, created_by_username, media_type, media_file_id, buttons))
+            RETURNING id
+        ''', (name, content, created_by, created_by_username, media_type, media_file_id, buttons)) as cursor:
+            template_id = (await cursor.fetchone())[0]
         await db.commit()
-        return cursor.lastrowid
+        return template_id
 
 
 async def get_templates(created_by: int = None) -> List[Dict]:
     """Получить все шаблоны (или только конкретного пользователя)"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        db.row_factory = aiosqlite.Row
-
+    async with connection() as db:
         if created_by:
             async with db.execute('''
                 SELECT * FROM broadcast_templates 
@@ -1324,8 +3412,7 @@ async def get_templates(created_by: int = None) -> List[Dict]:
 
 async def get_template(template_id: int) -> Optional[Dict]:
     """Получить конкретный шаблон"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        db.row_factory = aiosqlite.Row
+    async with connection() as db:
         async with db.execute('''
             SELECT * FROM broadcast_templates WHERE id = ?
         ''', (template_id,)) as cursor:
@@ -1335,7 +3422,7 @@ async def get_template(template_id: int) -> Optional[Dict]:
 
 async def delete_template(template_id: int) -> bool:
     """Удалить шаблон"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
+    async with connection() as db:
         cursor = await db.execute('''
             DELETE FROM broadcast_templates WHERE id = ?
         ''', (template_id,))
@@ -1356,20 +3443,20 @@ async def create_auto_broadcast(
     buttons: str = None
 ) -> int:
     """Создать автоматическую рассылку"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        cursor = await db.execute('''
+    async with connection() as db:
+        async with db.execute('''
             INSERT INTO auto_broadcasts (trigger_type, content, delay_hours, created_by, created_by_username, media_type, media_file_id, buttons)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (trigger_type, content, delay_hours, created_by, created_by_username, media_type, media_file_id, buttons))
+            RETURNING id
+        ''', (trigger_type, content, delay_hours, created_by, created_by_username, media_type, media_file_id, buttons)) as cursor:
+            auto_id = (await cursor.fetchone())[0]
         await db.commit()
-        return cursor.lastrowid
+        return auto_id
 
 
 async def get_auto_broadcasts(active_only: bool = False) -> List[Dict]:
     """Получить все автоматические рассылки"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        db.row_factory = aiosqlite.Row
-
+    async with connection() as db:
         if active_only:
             async with db.execute('''
                 SELECT * FROM auto_broadcasts 
@@ -1389,8 +3476,7 @@ async def get_auto_broadcasts(active_only: bool = False) -> List[Dict]:
 
 async def get_auto_broadcast(auto_id: int) -> Optional[Dict]:
     """Получить конкретную автоматическую рассылку"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        db.row_factory = aiosqlite.Row
+    async with connection() as db:
         async with db.execute('''
             SELECT * FROM auto_broadcasts WHERE id = ?
         ''', (auto_id,)) as cursor:
@@ -1400,7 +3486,7 @@ async def get_auto_broadcast(auto_id: int) -> Optional[Dict]:
 
 async def toggle_auto_broadcast(auto_id: int) -> bool:
     """Переключить активность автоматической рассылки"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
+    async with connection() as db:
         # Получаем текущее состояние
         async with db.execute('''
             SELECT is_active FROM auto_broadcasts WHERE id = ?
@@ -1420,7 +3506,7 @@ async def toggle_auto_broadcast(auto_id: int) -> bool:
 
 async def delete_auto_broadcast(auto_id: int) -> bool:
     """Удалить автоматическую рассылку"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
+    async with connection() as db:
         # Сначала удаляем записи об отправках
         await db.execute('''
             DELETE FROM auto_broadcast_sent WHERE auto_broadcast_id = ?
@@ -1433,215 +3519,43 @@ async def delete_auto_broadcast(auto_id: int) -> bool:
         return cursor.rowcount > 0
 
 
-async def increment_auto_broadcast_sent(auto_id: int) -> None:
-    """Увеличить счётчик отправок автоматической рассылки"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        await db.execute('''
-            UPDATE auto_broadcasts SET sent_count = sent_count + 1 WHERE id = ?
-        ''', (auto_id,))
-        await db.commit()
-
-
-async def mark_auto_broadcast_sent(auto_id: int, user_id: int) -> bool:
-    """Отметить, что автоматическая рассылка отправлена пользователю"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        try:
-            await db.execute('''
-                INSERT INTO auto_broadcast_sent (auto_broadcast_id, user_id)
-                VALUES (?, ?)
-            ''', (auto_id, user_id))
-            await db.commit()
-            return True
-        except aiosqlite.IntegrityError:
-            # Уже отправлено этому пользователю
-            return False
-
-
-async def is_auto_broadcast_sent(auto_id: int, user_id: int) -> bool:
-    """Проверить, была ли авто-рассылка уже отправлена пользователю"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        async with db.execute('''
-            SELECT 1 FROM auto_broadcast_sent 
-            WHERE auto_broadcast_id = ? AND user_id = ?
-        ''', (auto_id, user_id)) as cursor:
-            return await cursor.fetchone() is not None
-
-
-async def get_auto_broadcast_eligible_users(trigger_type: str, delay_hours: int) -> List[Dict]:
+async def mark_auto_broadcast_sent_many(auto_id: int, user_ids: Iterable[int]) -> int:
     """
-    Получить пользователей, подходящих для автоматической рассылки
+    Отметить отправку авто-рассылки пачке пользователей
 
-    trigger_type:
-    - 'only_start': только нажали /start, прошло delay_hours часов
-    - 'no_payment': нажали оплатить, но не оплатили, прошло delay_hours часов
-    - 'rejected': отклонённая оплата, прошло delay_hours часов
-    - 'no_screenshot': нажали оплатить без скрина, прошло delay_hours часов
+    Отметки и счётчик sent_count обновляются одной транзакцией;
+    уже отмеченные пользователи пропускаются и в счётчик не входят.
+    Возвращает количество новых отметок.
     """
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        db.row_factory = aiosqlite.Row
-
-        threshold_time = datetime.now() - timedelta(hours=delay_hours)
-        threshold_str = threshold_time.strftime('%Y-%m-%d %H:%M:%S')
-
-        if trigger_type == 'only_start':
-            # Пользователи, которые только нажали /start и больше ничего не делали
-            async with db.execute('''
-                SELECT u.user_id, u.username, u.first_name
-                FROM users u
-                WHERE u.has_paid = 0
-                AND u.created_at <= ?
-                AND NOT EXISTS (
-                    SELECT 1 FROM user_events e 
-                    WHERE e.user_id = u.user_id 
-                    AND e.event_type IN (?, ?, ?)
-                )
-            ''', (threshold_str, EventType.PAYMENT_BUTTON_CLICKED, EventType.SCREENSHOT_SENT, EventType.CALCULATOR_STARTED)) as cursor:
-                rows = await cursor.fetchall()
-                return [dict(row) for row in rows]
-
-        elif trigger_type == 'no_payment':
-            # Пользователи, которые нажали оплатить, но не оплатили
-            async with db.execute('''
-                SELECT DISTINCT u.user_id, u.username, u.first_name
-                FROM users u
-                JOIN user_events e ON u.user_id = e.user_id
-                WHERE e.event_type = ?
-                AND e.created_at <= ?
-                AND u.has_paid = 0
-            ''', (EventType.PAYMENT_BUTTON_CLICKED, threshold_str)) as cursor:
-                rows = await cursor.fetchall()
-                return [dict(row) for row in rows]
-
-        elif trigger_type == 'rejected':
-            # Пользователи с отклонёнными запросами
-            async with db.execute('''
-                SELECT DISTINCT u.user_id, u.username, u.first_name
-                FROM users u
-                JOIN payment_requests pr ON u.user_id = pr.user_id
-                WHERE pr.status = 'rejected'
-                AND pr.created_at <= ?
-                AND u.has_paid = 0
-            ''', (threshold_str,)) as cursor:
-                rows = await cursor.fetchall()
-                return [dict(row) for row in rows]
-
-        elif trigger_type == 'no_screenshot':
-            # Пользователи, которые нажали "Я оплатил(а)" но не прислали скрин
-            async with db.execute('''
-                SELECT DISTINCT u.user_id, u.username, u.first_name
-                FROM users u
-                JOIN user_events e ON u.user_id = e.user_id
-                WHERE e.event_type = ?
-                AND e.created_at <= ?
-                AND u.has_paid = 0
-                AND NOT EXISTS (
-                    SELECT 1 FROM user_events e2
-                    WHERE e2.user_id = u.user_id
-                    AND e2.event_type = ?
-                )
-            ''', (EventType.PAYMENT_BUTTON_CLICKED, threshold_str, EventType.SCREENSHOT_SENT)) as cursor:
-                rows = await cursor.fetchall()
-                return [dict(row) for row in rows]
-
-        return []
+    user_ids = list(dict.fromkeys(user_ids))
+    if not user_ids:
+        return 0
+    inserted = 0
+    async with connection() as db:
+        # Многострочные вставки: rowcount каждой — число новых отметок
+        for i in range(0, len(user_ids), AUDIENCE_BATCH_SIZE):
+            batch = user_ids[i:i + AUDIENCE_BATCH_SIZE]
+            values = ', '.join(['(?, ?, ?)'] * len(batch))
+            sent_ts = int(time.time())
+            cursor = await db.execute(f'''
+                INSERT INTO auto_broadcast_sent (auto_broadcast_id, user_id, sent_ts)
+                VALUES {values}
+                ON CONFLICT (auto_broadcast_id, user_id) DO NOTHING
+            ''', [value for user_id in batch for value in (auto_id, user_id, sent_ts)])
+            inserted += cursor.rowcount
+        if inserted:
+            await db.execute('''
+                UPDATE auto_broadcasts SET sent_count = sent_count + ? WHERE id = ?
+            ''', (inserted, auto_id))
+        await db.commit()
+        return inserted
 
 
 # ==================== Broadcast Chain Management ====================
 
 async def init_chain_tables():
-    """Инициализация таблиц для цепочек рассылок"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        # Таблица цепочек рассылок (воронок)
-        await db.execute('''
-            CREATE TABLE IF NOT EXISTS broadcast_chains (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                description TEXT,
-                trigger_type TEXT NOT NULL CHECK(trigger_type IN ('manual', 'subscription_end', 'payment_approved', 'custom')),
-                is_active INTEGER DEFAULT 1,
-                created_by INTEGER NOT NULL,
-                created_by_username TEXT,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-
-        # Таблица шагов цепочки
-        await db.execute('''
-            CREATE TABLE IF NOT EXISTS chain_steps (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                chain_id INTEGER NOT NULL,
-                step_order INTEGER NOT NULL,
-                content TEXT NOT NULL,
-                media_type TEXT CHECK(media_type IN ('photo', 'video', NULL)),
-                media_file_id TEXT,
-                delay_hours INTEGER DEFAULT 0,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY(chain_id) REFERENCES broadcast_chains(id) ON DELETE CASCADE,
-                UNIQUE(chain_id, step_order)
-            )
-        ''')
-
-        # Таблица кнопок шага (с действиями)
-        await db.execute('''
-            CREATE TABLE IF NOT EXISTS chain_step_buttons (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                step_id INTEGER NOT NULL,
-                button_text TEXT NOT NULL,
-                button_order INTEGER NOT NULL,
-                action_type TEXT NOT NULL CHECK(action_type IN ('next_step', 'goto_step', 'url', 'command', 'stop_chain', 'payment_main', 'payment_fmd', 'payment_bundle')),
-                action_value TEXT,
-                next_step_id INTEGER,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY(step_id) REFERENCES chain_steps(id) ON DELETE CASCADE,
-                FOREIGN KEY(next_step_id) REFERENCES chain_steps(id) ON DELETE SET NULL
-            )
-        ''')
-
-        # Таблица состояния пользователя в цепочке
-        await db.execute('''
-            CREATE TABLE IF NOT EXISTS chain_user_state (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id INTEGER NOT NULL,
-                chain_id INTEGER NOT NULL,
-                current_step_id INTEGER NOT NULL,
-                status TEXT CHECK(status IN ('active', 'completed', 'stopped')) DEFAULT 'active',
-                started_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                last_action_at TEXT,
-                next_message_at TEXT,
-                FOREIGN KEY(user_id) REFERENCES users(user_id),
-                FOREIGN KEY(chain_id) REFERENCES broadcast_chains(id) ON DELETE CASCADE,
-                FOREIGN KEY(current_step_id) REFERENCES chain_steps(id),
-                UNIQUE(user_id, chain_id)
-            )
-        ''')
-
-        # Таблица истории отправок цепочки
-        await db.execute('''
-            CREATE TABLE IF NOT EXISTS chain_message_history (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id INTEGER NOT NULL,
-                chain_id INTEGER NOT NULL,
-                step_id INTEGER NOT NULL,
-                button_clicked TEXT,
-                sent_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY(user_id) REFERENCES users(user_id),
-                FOREIGN KEY(chain_id) REFERENCES broadcast_chains(id) ON DELETE CASCADE,
-                FOREIGN KEY(step_id) REFERENCES chain_steps(id) ON DELETE CASCADE
-            )
-        ''')
-
-        # Индексы
-        await db.execute('''
-            CREATE INDEX IF NOT EXISTS idx_chain_user_state_active 
-            ON chain_user_state(status, next_message_at)
-        ''')
-
-        await db.execute('''
-            CREATE INDEX IF NOT EXISTS idx_chain_steps_order 
-            ON chain_steps(chain_id, step_order)
-        ''')
-
-        await db.commit()
+    """Инициализация таблиц для цепочек рассылок (входят в миграции init_db)"""
+    await init_db()
 
 
 async def create_chain(
@@ -1652,19 +3566,20 @@ async def create_chain(
     description: str = None
 ) -> int:
     """Создать новую цепочку рассылок"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        cursor = await db.execute('''
+    async with connection() as db:
+        async with db.execute('''
             INSERT INTO broadcast_chains (name, description, trigger_type, created_by, created_by_username)
             VALUES (?, ?, ?, ?, ?)
-        ''', (name, description, trigger_type, created_by, created_by_username))
+            RETURNING id
+        ''', (name, description, trigger_type, created_by, created_by_username)) as cursor:
+            chain_id = (await cursor.fetchone())[0]
         await db.commit()
-        return cursor.lastrowid
+        return chain_id
 
 
 async def get_chain(chain_id: int) -> Optional[Dict]:
     """Получить цепочку по ID"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        db.row_factory = aiosqlite.Row
+    async with connection() as db:
         async with db.execute('''
             SELECT * FROM broadcast_chains WHERE id = ?
         ''', (chain_id,)) as cursor:
@@ -1674,8 +3589,7 @@ async def get_chain(chain_id: int) -> Optional[Dict]:
 
 async def get_all_chains(active_only: bool = False) -> List[Dict]:
     """Получить все цепочки"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        db.row_factory = aiosqlite.Row
+    async with connection() as db:
         if active_only:
             async with db.execute('''
                 SELECT * FROM broadcast_chains WHERE is_active = 1 ORDER BY created_at DESC
@@ -1701,7 +3615,7 @@ async def update_chain(chain_id: int, **kwargs) -> bool:
     set_clause = ', '.join([f"{k} = ?" for k in fields.keys()])
     values = list(fields.values()) + [chain_id]
 
-    async with aiosqlite.connect(DATABASE_NAME) as db:
+    async with connection() as db:
         cursor = await db.execute(f'''
             UPDATE broadcast_chains SET {set_clause} WHERE id = ?
         ''', values)
@@ -1711,7 +3625,7 @@ async def update_chain(chain_id: int, **kwargs) -> bool:
 
 async def delete_chain(chain_id: int) -> bool:
     """Удалить цепочку (каскадно удалит все шаги и состояния)"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
+    async with connection() as db:
         cursor = await db.execute('''
             DELETE FROM broadcast_chains WHERE id = ?
         ''', (chain_id,))
@@ -1721,7 +3635,7 @@ async def delete_chain(chain_id: int) -> bool:
 
 async def toggle_chain_active(chain_id: int) -> bool:
     """Переключить активность цепочки"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
+    async with connection() as db:
         async with db.execute('''
             SELECT is_active FROM broadcast_chains WHERE id = ?
         ''', (chain_id,)) as cursor:
@@ -1748,19 +3662,20 @@ async def add_chain_step(
     delay_hours: int = 0
 ) -> int:
     """Добавить шаг в цепочку"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        cursor = await db.execute('''
+    async with connection() as db:
+        async with db.execute('''
             INSERT INTO chain_steps (chain_id, step_order, content, media_type, media_file_id, delay_hours)
             VALUES (?, ?, ?, ?, ?, ?)
-        ''', (chain_id, step_order, content, media_type, media_file_id, delay_hours))
+            RETURNING id
+        ''', (chain_id, step_order, content, media_type, media_file_id, delay_hours)) as cursor:
+            step_id = (await cursor.fetchone())[0]
         await db.commit()
-        return cursor.lastrowid
+        return step_id
 
 
 async def get_chain_step(step_id: int) -> Optional[Dict]:
     """Получить шаг по ID"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        db.row_factory = aiosqlite.Row
+    async with connection() as db:
         async with db.execute('''
             SELECT * FROM chain_steps WHERE id = ?
         ''', (step_id,)) as cursor:
@@ -1770,8 +3685,7 @@ async def get_chain_step(step_id: int) -> Optional[Dict]:
 
 async def get_chain_steps(chain_id: int) -> List[Dict]:
     """Получить все шаги цепочки в порядке"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        db.row_factory = aiosqlite.Row
+    async with connection() as db:
         async with db.execute('''
             SELECT * FROM chain_steps WHERE chain_id = ? ORDER BY step_order ASC
         ''', (chain_id,)) as cursor:
@@ -1781,8 +3695,7 @@ async def get_chain_steps(chain_id: int) -> List[Dict]:
 
 async def get_first_chain_step(chain_id: int) -> Optional[Dict]:
     """Получить первый шаг цепочки"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        db.row_factory = aiosqlite.Row
+    async with connection() as db:
         async with db.execute('''
             SELECT * FROM chain_steps WHERE chain_id = ? ORDER BY step_order ASC LIMIT 1
         ''', (chain_id,)) as cursor:
@@ -1792,8 +3705,7 @@ async def get_first_chain_step(chain_id: int) -> Optional[Dict]:
 
 async def get_next_chain_step(chain_id: int, current_order: int) -> Optional[Dict]:
     """Получить следующий шаг цепочки"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        db.row_factory = aiosqlite.Row
+    async with connection() as db:
         async with db.execute('''
             SELECT * FROM chain_steps 
             WHERE chain_id = ? AND step_order > ?
@@ -1815,7 +3727,7 @@ async def update_chain_step(step_id: int, **kwargs) -> bool:
     set_clause = ', '.join([f"{k} = ?" for k in fields.keys()])
     values = list(fields.values()) + [step_id]
 
-    async with aiosqlite.connect(DATABASE_NAME) as db:
+    async with connection() as db:
         cursor = await db.execute(f'''
             UPDATE chain_steps SET {set_clause} WHERE id = ?
         ''', values)
@@ -1825,7 +3737,7 @@ async def update_chain_step(step_id: int, **kwargs) -> bool:
 
 async def delete_chain_step(step_id: int) -> bool:
     """Удалить шаг цепочки"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
+    async with connection() as db:
         cursor = await db.execute('''
             DELETE FROM chain_steps WHERE id = ?
         ''', (step_id,))
@@ -1835,7 +3747,7 @@ async def delete_chain_step(step_id: int) -> bool:
 
 async def get_chain_steps_count(chain_id: int) -> int:
     """Получить количество шагов в цепочке"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
+    async with connection() as db:
         async with db.execute('''
             SELECT COUNT(*) FROM chain_steps WHERE chain_id = ?
         ''', (chain_id,)) as cursor:
@@ -1854,19 +3766,20 @@ async def add_step_button(
     next_step_id: int = None
 ) -> int:
     """Добавить кнопку к шагу"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        cursor = await db.execute('''
+    async with connection() as db:
+        async with db.execute('''
             INSERT INTO chain_step_buttons (step_id, button_text, button_order, action_type, action_value, next_step_id)
             VALUES (?, ?, ?, ?, ?, ?)
-        ''', (step_id, button_text, button_order, action_type, action_value, next_step_id))
+            RETURNING id
+        ''', (step_id, button_text, button_order, action_type, action_value, next_step_id)) as cursor:
+            button_id = (await cursor.fetchone())[0]
         await db.commit()
-        return cursor.lastrowid
+        return button_id
 
 
 async def get_step_buttons(step_id: int) -> List[Dict]:
     """Получить все кнопки шага"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        db.row_factory = aiosqlite.Row
+    async with connection() as db:
         async with db.execute('''
             SELECT * FROM chain_step_buttons WHERE step_id = ? ORDER BY button_order ASC
         ''', (step_id,)) as cursor:
@@ -1876,8 +3789,7 @@ async def get_step_buttons(step_id: int) -> List[Dict]:
 
 async def get_step_button(button_id: int) -> Optional[Dict]:
     """Получить кнопку по ID"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        db.row_factory = aiosqlite.Row
+    async with connection() as db:
         async with db.execute('''
             SELECT * FROM chain_step_buttons WHERE id = ?
         ''', (button_id,)) as cursor:
@@ -1887,7 +3799,7 @@ async def get_step_button(button_id: int) -> Optional[Dict]:
 
 async def delete_step_button(button_id: int) -> bool:
     """Удалить кнопку шага"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
+    async with connection() as db:
         cursor = await db.execute('''
             DELETE FROM chain_step_buttons WHERE id = ?
         ''', (button_id,))
@@ -1897,7 +3809,7 @@ async def delete_step_button(button_id: int) -> bool:
 
 async def delete_step_buttons(step_id: int) -> int:
     """Удалить все кнопки шага"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
+    async with connection() as db:
         cursor = await db.execute('''
             DELETE FROM chain_step_buttons WHERE step_id = ?
         ''', (step_id,))
@@ -1907,43 +3819,66 @@ async def delete_step_buttons(step_id: int) -> int:
 
 # ==================== Chain User State ====================
 
-async def start_chain_for_user(user_id: int, chain_id: int, first_step_id: int) -> int:
-    """Запустить цепочку для пользователя"""
-    now = datetime.now().isoformat()
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        # Проверяем, есть ли уже запись для этого пользователя и цепочки
-        async with db.execute('''
-            SELECT id, status FROM chain_user_state WHERE user_id = ? AND chain_id = ?
-        ''', (user_id, chain_id)) as cursor:
-            existing = await cursor.fetchone()
-            if existing:
-                state_id, status = existing
-                if status == 'active':
-                    # Уже активна - возвращаем существующий ID
-                    return state_id
-                else:
-                    # Перезапускаем цепочку - обновляем запись
-                    await db.execute('''
-                        UPDATE chain_user_state 
-                        SET current_step_id = ?, status = 'active', started_at = ?, last_action_at = ?, next_message_at = ?
-                        WHERE id = ?
-                    ''', (first_step_id, now, now, now, state_id))
-                    await db.commit()
-                    return state_id
-
-        # Создаём новую запись
-        cursor = await db.execute('''
-            INSERT INTO chain_user_state (user_id, chain_id, current_step_id, status, started_at, last_action_at, next_message_at)
-            VALUES (?, ?, ?, 'active', ?, ?, ?)
-        ''', (user_id, chain_id, first_step_id, now, now, now))
-        await db.commit()
-        return cursor.lastrowid
+async def start_chain_for_users(chain_id: int, first_step_id: int, audience: str) -> Dict[str, int]:
+    """
+    Запустить цепочку для всей аудитории одним запросом
+
+    Новые пользователи записываются в цепочку, завершившие и остановленные —
+    перезапускаются с первого шага, активные остаются на своём шаге.
+    Всё выполняется в одной транзакции одним INSERT ... SELECT по условию
+    аудитории.
+    Возвращает {'enrolled': новых, 're_enrolled': перезапущенных}.
+    """
+    result = {'enrolled': 0, 're_enrolled': 0}
+    if audience not in _AUDIENCE_CONDITIONS:
+        return result
+    condition, params = _AUDIENCE_CONDITIONS[audience]
+    moment = datetime.now()
+    now, now_ts = moment.isoformat(), _epoch(moment)
+
+    async with connection() as db:
+        await db.execute('BEGIN IMMEDIATE')
+        try:
+            async with db.execute(
+                'SELECT COUNT(*) FROM chain_user_state WHERE chain_id = ?', (chain_id,)
+            ) as cursor:
+                before = (await cursor.fetchone())[0]
+
+            # rowcount upsert-а = вставленные + обновлённые строки
+            cursor = await db.execute(f'''
+                INSERT INTO chain_user_state (user_id, chain_id, current_step_id, status, started_at, last_action_at, next_message_at, next_message_ts)
+                SELECT u.user_id, CAST(? AS INTEGER), CAST(? AS INTEGER), 'active', ?, ?, ?, CAST(? AS INTEGER)
+                FROM users u
+                WHERE {condition}
+                ON CONFLICT(user_id, chain_id) DO UPDATE SET
+                    current_step_id = excluded.current_step_id,
+                    status = 'active',
+                    started_at = excluded.started_at,
+                    last_action_at = excluded.last_action_at,
+                    next_message_at = excluded.next_message_at,
+                    next_message_ts = excluded.next_message_ts
+                WHERE chain_user_state.status IS NULL OR chain_user_state.status != 'active'
+            ''', (chain_id, first_step_id, now, now, now, now_ts, *params))
+            changed = cursor.rowcount
+
+            async with db.execute(
+                'SELECT COUNT(*) FROM chain_user_state WHERE chain_id = ?', (chain_id,)
+            ) as cursor:
+                after = (await cursor.fetchone())[0]
+
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+
+    result['enrolled'] = after - before
+    result['re_enrolled'] = changed - result['enrolled']
+    return result
 
 
 async def get_user_chain_state(user_id: int, chain_id: int) -> Optional[Dict]:
     """Получить состояние пользователя в цепочке"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        db.row_factory = aiosqlite.Row
+    async with connection() as db:
         async with db.execute('''
             SELECT * FROM chain_user_state WHERE user_id = ? AND chain_id = ?
         ''', (user_id, chain_id)) as cursor:
@@ -1953,8 +3888,7 @@ async def get_user_chain_state(user_id: int, chain_id: int) -> Optional[Dict]:
 
 async def get_user_active_chains(user_id: int) -> List[Dict]:
     """Получить все активные цепочки пользователя"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        db.row_factory = aiosqlite.Row
+    async with connection() as db:
         async with db.execute('''
             SELECT cus.*, bc.name as chain_name 
             FROM chain_user_state cus
@@ -1987,6 +3921,8 @@ async def update_user_chain_state(
     if next_message_at is not None:
         updates.append("next_message_at = ?")
         values.append(next_message_at.isoformat())
+        updates.append("next_message_ts = ?")
+        values.append(_epoch(next_message_at))
 
     updates.append("last_action_at = ?")
     values.append(datetime.now().isoformat())
@@ -1996,7 +3932,7 @@ async def update_user_chain_state(
 
     values.extend([user_id, chain_id])
 
-    async with aiosqlite.connect(DATABASE_NAME) as db:
+    async with connection() as db:
         cursor = await db.execute(f'''
             UPDATE chain_user_state SET {', '.join(updates)} WHERE user_id = ? AND chain_id = ?
         ''', values)
@@ -2016,9 +3952,7 @@ async def complete_user_chain(user_id: int, chain_id: int) -> bool:
 
 async def get_pending_chain_messages() -> List[Dict]:
     """Получить все pending сообщения цепочки которые пора отправить"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        db.row_factory = aiosqlite.Row
-        now = datetime.now().isoformat()
+    async with connection() as db:
         async with db.execute('''
             SELECT cus.*, cs.content, cs.media_type, cs.media_file_id, cs.step_order,
                    bc.name as chain_name, u.username, u.first_name
@@ -2027,94 +3961,110 @@ async def get_pending_chain_messages() -> List[Dict]:
             JOIN broadcast_chains bc ON cus.chain_id = bc.id
             JOIN users u ON cus.user_id = u.user_id
             WHERE cus.status = 'active'
-            AND cus.next_message_at <= ?
+            AND cus.next_message_ts <= ?
             AND bc.is_active = 1
-        ''', (now,)) as cursor:
+        ''', (int(time.time()),)) as cursor:
             rows = await cursor.fetchall()
             return [dict(row) for row in rows]
 
 
 async def log_chain_message(user_id: int, chain_id: int, step_id: int, button_clicked: str = None):
     """Записать историю отправки сообщения цепочки"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
+    async with connection() as db:
         await db.execute('''
-            INSERT INTO chain_message_history (user_id, chain_id, step_id, button_clicked)
-            VALUES (?, ?, ?, ?)
-        ''', (user_id, chain_id, step_id, button_clicked))
+            INSERT INTO chain_message_history (user_id, chain_id, step_id, button_clicked, sent_ts)
+            VALUES (?, ?, ?, ?, ?)
+        ''', (user_id, chain_id, step_id, button_clicked, int(time.time())))
         await db.commit()
 
 
 # ==================== User Management ====================
 
-async def get_all_users() -> List[Dict]:
-    """Получить всех пользователей"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        db.row_factory = aiosqlite.Row
-        async with db.execute('''
-            SELECT user_id, username, first_name, has_paid, has_paid_fmd, has_paid_bundle, has_paid_dry, created_at
-            FROM users
-            ORDER BY created_at DESC
-        ''') as cursor:
-            rows = await cursor.fetchall()
-            return [dict(row) for row in rows]
-
+USER_PAGE_SIZE = 10  # Пользователей на странице списка в админке
 
-async def get_users_by_payment_filter(filter_type: str) -> List[Dict]:
-    """
-    Получить пользователей по фильтру оплаты
+# Условия фильтров списка пользователей (UserListCallback.payment_filter)
+USER_LIST_FILTERS = {
+    'all': '1 = 1',
+    'paid_main': 'has_paid = 1',
+    'paid_fmd': 'has_paid_fmd = 1',
+    'paid_bundle': 'has_paid_bundle = 1',
+    'paid_dry': 'has_paid_dry = 1',
+}
 
-    filter_type:
-    - 'all': все пользователи
-    - 'paid_main': оплатившие основной рацион
-    - 'paid_fmd': оплатившие FMD протокол
-    - 'paid_bundle': оплатившие комплект
-    - 'paid_dry': оплатившие Сушку
-    """
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        db.row_factory = aiosqlite.Row
 
-        if filter_type == 'paid_main':
-            async with db.execute('''
-                SELECT user_id, username, first_name, has_paid, has_paid_fmd, has_paid_bundle, has_paid_dry, created_at
-                FROM users
-                WHERE has_paid = 1
-                ORDER BY created_at DESC
-            ''') as cursor:
-                rows = await cursor.fetchall()
-                return [dict(row) for row in rows]
+def _user_list_condition(filter_type: str) -> str:
+    """Условие фильтра списка; неизвестный фильтр — ошибка, а не молча список всех"""
+    try:
+        return USER_LIST_FILTERS[filter_type]
+    except KeyError:
+        raise ValueError(f'Unknown user list filter: {filter_type}') from None
 
-        elif filter_type == 'paid_fmd':
-            async with db.execute('''
-                SELECT user_id, username, first_name, has_paid, has_paid_fmd, has_paid_bundle, has_paid_dry, created_at
-                FROM users
-                WHERE has_paid_fmd = 1
-                ORDER BY created_at DESC
-            ''') as cursor:
-                rows = await cursor.fetchall()
-                return [dict(row) for row in rows]
 
-        elif filter_type == 'paid_bundle':
-            async with db.execute('''
-                SELECT user_id, username, first_name, has_paid, has_paid_fmd, has_paid_bundle, has_paid_dry, created_at
-                FROM users
-                WHERE has_paid_bundle = 1
-                ORDER BY created_at DESC
-            ''') as cursor:
-                rows = await cursor.fetchall()
-                return [dict(row) for row in rows]
+async def get_users_page(
+    filter_type: str = 'all',
+    cursor: Optional[int] = None,
+    backward: bool = False,
+    limit: int = USER_PAGE_SIZE
+) -> Tuple[List[Dict], bool]:
+    """
+    Страница списка пользователей (новые сверху).
+
+    Keyset-пагинация по (created_at, user_id): cursor — user_id граничной
+    записи. Вперёд (backward=False) — последняя запись предыдущей страницы,
+    назад — первая запись следующей. Стоимость страницы не зависит от её номера.
+    Возвращает пользователей страницы и флаг, есть ли записи дальше
+    в направлении движения. filter_type — ключ USER_LIST_FILTERS,
+    для остальных значений ValueError.
+    """
+    condition = _user_list_condition(filter_type)
+    params = []
+    if cursor:
+        condition += f" AND (created_at, user_id) {'>' if backward else '<'} (" \
+            "(SELECT created_at FROM users WHERE user_id = ?), ?)"
+        params += [cursor, cursor]
+    order = 'ASC' if backward else 'DESC'
+    params.append(limit + 1)
+
+    async with read_connection() as db:
+        async with db.execute(f'''
+            SELECT user_id, username, first_name, has_paid, has_paid_fmd, has_paid_bundle, has_paid_dry, created_at
+            FROM users
+            WHERE {condition}
+            ORDER BY created_at {order}, user_id {order}
+            LIMIT ?
+        ''', params) as db_cursor:
+            rows = [dict(row) for row in await db_cursor.fetchall()]
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if backward:
+        rows.reverse()
+    return rows, has_more
+
+
+async def count_users(filter_type: str = 'all') -> int:
+    """Количество пользователей в списке с фильтром (без загрузки строк)"""
+    condition = _user_list_condition(filter_type)
+    async with read_connection() as db:
+        async with db.execute(f'SELECT COUNT(*) FROM users WHERE {condition}') as cursor:
+            row = await cursor.fetchone()
+            return row[0]
 
-        elif filter_type == 'paid_dry':
-            async with db.execute('''
-                SELECT user_id, username, first_name, has_paid, has_paid_fmd, has_paid_bundle, has_paid_dry, created_at
-                FROM users
-                WHERE has_paid_dry = 1
-                ORDER BY created_at DESC
-            ''') as cursor:
-                rows = await cursor.fetchall()
-                return [dict(row) for row in rows]
 
-        else:  # 'all'
-            return await get_all_users()
+async def get_user_counts() -> Dict:
+    """Всего пользователей и оплативших каждый продукт — одним запросом"""
+    async with read_connection() as db:
+        async with db.execute('''
+            SELECT
+                COUNT(*) AS total,
+                COUNT(CASE WHEN has_paid = 1 THEN 1 END) AS paid_main,
+                COUNT(CASE WHEN has_paid_fmd = 1 THEN 1 END) AS paid_fmd,
+                COUNT(CASE WHEN has_paid_bundle = 1 THEN 1 END) AS paid_bundle,
+                COUNT(CASE WHEN has_paid_dry = 1 THEN 1 END) AS paid_dry
+            FROM users
+        ''') as cursor:
+            row = await cursor.fetchone()
+            return {key: row[key] or 0 for key in row.keys()}
 
 
 async def reset_user_payment(user_id: int, payment_type: str) -> bool:
@@ -2128,7 +4078,7 @@ async def reset_user_payment(user_id: int, payment_type: str) -> bool:
     - 'dry': сбросить оплату Сушки
     - 'all': сбросить все оплаты
     """
-    async with aiosqlite.connect(DATABASE_NAME) as db:
+    async with connection() as db:
         if payment_type == 'main':
             cursor = await db.execute('''
                 UPDATE users SET has_paid = 0 WHERE user_id = ?
@@ -2152,20 +4102,45 @@ async def reset_user_payment(user_id: int, payment_type: str) -> bool:
         else:
             return False
 
+        updated = cursor.rowcount > 0
+        generation = await _bump_cache_generation(db, 'users')
         await db.commit()
-        return cursor.rowcount > 0
+    _user_cache.invalidate(user_id)
+    _cache_sync.seen('users', generation)
+    return updated
 
 
-async def search_user_by_username_or_id(query: str) -> List[Dict]:
-    """Поиск пользователя по username или user_id"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
-        db.row_factory = aiosqlite.Row
+USER_SEARCH_LIMIT = 50
+# Триграммный индекс ищет подстроки от 3 символов; короче — только начало
+# username или имени по обычному индексу
+USER_SEARCH_MIN_FTS_LENGTH = 3
+
+_USER_SEARCH_COLUMNS = 'user_id, username, first_name, has_paid, has_paid_fmd, has_paid_bundle, has_paid_dry, created_at'
+
+
+def _escape_like(text: str) -> str:
+    """Спецсимволы LIKE в запросе ищутся как обычные символы (ESCAPE '\\')"""
+    return text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
 
+
+async def search_user_by_username_or_id(query: str) -> List[Dict]:
+    """
+    Поиск пользователя по username, имени или user_id
+
+    Число сначала ищется как user_id. Текст ищется без учёта регистра:
+    сначала точное совпадение username, затем подстрока по триграммному
+    индексу (users_fts в SQLite, pg_trgm в PostgreSQL) — от лучшего
+    совпадения (bm25 или similarity) к худшему, при равенстве от новых
+    пользователей к старым. Запрос короче USER_SEARCH_MIN_FTS_LENGTH
+    ищется как начало username или имени, от новых к старым.
+    Выдача ограничена USER_SEARCH_LIMIT.
+    """
+    async with read_connection() as db:
         # Попытка поиска по user_id (если запрос — число)
         try:
             user_id = int(query)
-            async with db.execute('''
-                SELECT user_id, username, first_name, has_paid, has_paid_fmd, has_paid_bundle, has_paid_dry, created_at
+            async with db.execute(f'''
+                SELECT {_USER_SEARCH_COLUMNS}
                 FROM users
                 WHERE user_id = ?
             ''', (user_id,)) as cursor:
@@ -2175,22 +4150,95 @@ async def search_user_by_username_or_id(query: str) -> List[Dict]:
         except ValueError:
             pass
 
-        # Поиск по username (без @)
-        search_query = query.lstrip('@').lower()
-        async with db.execute('''
-            SELECT user_id, username, first_name, has_paid, has_paid_fmd, has_paid_bundle, has_paid_dry, created_at
+        # Поиск по username (без @) и имени
+        search_query = query.strip().lstrip('@')
+        if not search_query:
+            return []
+
+        if not _is_sqlite():
+            return await _search_users_postgres(db, search_query)
+
+        async with db.execute(f'''
+            SELECT {_USER_SEARCH_COLUMNS}
             FROM users
-            WHERE LOWER(username) LIKE ? OR LOWER(first_name) LIKE ?
-            ORDER BY created_at DESC
-            LIMIT 50
-        ''', (f'%{search_query}%', f'%{search_query}%')) as cursor:
-            rows = await cursor.fetchall()
-            return [dict(row) for row in rows]
+            WHERE username = ? COLLATE NOCASE
+        ''', (search_query,)) as cursor:
+            results = [dict(row) for row in await cursor.fetchall()]
+
+        limit = USER_SEARCH_LIMIT + len(results)
+        if len(search_query) < USER_SEARCH_MIN_FTS_LENGTH:
+            # LIKE без учёта регистра с префиксом идёт по индексам COLLATE NOCASE.
+            # SQLite выбирает такой план по привязанному значению, поэтому
+            # check_query_plans.py (параметры — NULL) видит обход по created_ts с LIMIT
+            prefix = _escape_like(search_query) + '%'
+            sql = f'''
+                SELECT {_USER_SEARCH_COLUMNS}
+                FROM users
+                WHERE username LIKE :prefix ESCAPE '\\' OR first_name LIKE :prefix ESCAPE '\\'
+                ORDER BY created_ts DESC
+                LIMIT :limit
+            '''
+            params = {'prefix': prefix, 'limit': limit}
+        else:
+            # Запрос целиком — одна фраза: trigram ищет её как подстроку
+            sql = '''
+                SELECT u.user_id, u.username, u.first_name, u.has_paid, u.has_paid_fmd,
+                       u.has_paid_bundle, u.has_paid_dry, u.created_at
+                FROM users_fts
+                JOIN users u ON u.user_id = users_fts.rowid
+                WHERE users_fts MATCH :phrase
+                ORDER BY bm25(users_fts), u.created_ts DESC
+                LIMIT :limit
+            '''
+            params = {'phrase': '"' + search_query.replace('"', '""') + '"', 'limit': limit}
+
+        async with db.execute(sql, params) as cursor:
+            found = {row['user_id'] for row in results}
+            for row in await cursor.fetchall():
+                if row['user_id'] not in found:
+                    results.append(dict(row))
+
+        return results[:USER_SEARCH_LIMIT]
+
+
+async def _search_users_postgres(db, search_query: str) -> List[Dict]:
+    """
+    Текстовый поиск в PostgreSQL: подстрока — LIKE по индексам pg_trgm,
+    короткий запрос — начало строки по индексам text_pattern_ops
+    """
+    async with db.execute(f'''
+        SELECT {_USER_SEARCH_COLUMNS}
+        FROM users
+        WHERE LOWER(username) = LOWER(?)
+    ''', (search_query,)) as cursor:
+        results = [dict(row) for row in await cursor.fetchall()]
+
+    query = search_query.lower()
+    params = {'query': query, 'limit': USER_SEARCH_LIMIT + len(results)}
+    if len(search_query) < USER_SEARCH_MIN_FTS_LENGTH:
+        params['like'] = _escape_like(query) + '%'
+        order = 'created_ts DESC'
+    else:
+        params['like'] = '%' + _escape_like(query) + '%'
+        order = 'GREATEST(similarity(LOWER(username), :query), similarity(LOWER(first_name), :query)) DESC, created_ts DESC'
+    async with db.execute(f'''
+        SELECT {_USER_SEARCH_COLUMNS}
+        FROM users
+        WHERE LOWER(username) LIKE :like OR LOWER(first_name) LIKE :like
+        ORDER BY {order}
+        LIMIT :limit
+    ''', params) as cursor:
+        found = {row['user_id'] for row in results}
+        for row in await cursor.fetchall():
+            if row['user_id'] not in found:
+                results.append(dict(row))
+
+    return results[:USER_SEARCH_LIMIT]
 
 
 async def get_chain_stats(chain_id: int) -> Dict:
     """Получить статистику цепочки"""
-    async with aiosqlite.connect(DATABASE_NAME) as db:
+    async with read_connection() as db:
         stats = {}
 
         # Всего пользователей запустили цепочку
@@ -2221,10 +4269,11 @@ async def get_chain_stats(chain_id: int) -> Dict:
             row = await cursor.fetchone()
             stats['stopped'] = row[0] if row else 0
 
-        # Всего отправлено сообщений
+        # Всего отправлено сообщений (вместе с вынесенными в архив)
         async with db.execute('''
-            SELECT COUNT(*) FROM chain_message_history WHERE chain_id = ?
-        ''', (chain_id,)) as cursor:
+            SELECT (SELECT COUNT(*) FROM chain_message_history WHERE chain_id = ?)
+                 + COALESCE((SELECT archived_messages FROM chain_message_totals WHERE chain_id = ?), 0)
+        ''', (chain_id, chain_id)) as cursor:
             row = await cursor.fetchone()
             stats['messages_sent'] = row[0] if row else 0
 
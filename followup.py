@@ -226,30 +226,28 @@ async def process_pending_broadcasts(bot: Bot):
         # Помечаем как sending
         await db.update_broadcast_status(broadcast_id, 'sending')
 
-        # Получаем пользователей
-        users = await db.get_broadcast_audience_users(audience)
-
         sent_count = 0
         failed_count = 0
 
-        for user in users:
-            user_id = user['user_id']
-            success = await send_broadcast_message(
-                bot,
-                user_id,
-                content,
-                media_type=media_type,
-                media_file_id=media_file_id,
-                buttons=buttons
-            )
+        # Аудитория читается пачками по мере отправки, а не списком целиком
+        async for user_ids in db.iter_audience_user_ids(audience):
+            for user_id in user_ids:
+                success = await send_broadcast_message(
+                    bot,
+                    user_id,
+                    content,
+                    media_type=media_type,
+                    media_file_id=media_file_id,
+                    buttons=buttons
+                )
 
-            if success:
-                sent_count += 1
-            else:
-                failed_count += 1
+                if success:
+                    sent_count += 1
+                else:
+                    failed_count += 1
 
-            # Небольшая задержка чтобы не флудить API
-            await asyncio.sleep(0.05)
+                # Небольшая задержка чтобы не флудить API
+                await asyncio.sleep(0.05)
 
         # Обновляем статус
         await db.update_broadcast_status(broadcast_id, 'sent', sent_count, failed_count)
@@ -406,6 +404,10 @@ async def schedule_new_followups(bot: Bot):
 
 # ==================== Auto-Broadcast System ====================
 
+# Через сколько успешных отправок записывать отметки auto_broadcast_sent:
+# после сбоя посреди пачки повторно получат рассылку не больше стольких пользователей
+AUTO_BROADCAST_MARK_CHUNK = 25
+
 async def process_auto_broadcasts(bot: Bot):
     """
     Обработать все активные автоматические рассылки
@@ -413,8 +415,9 @@ async def process_auto_broadcasts(bot: Bot):
 
     Для каждой активной авто-рассылки:
     1. Получаем пользователей, которые подходят под триггер
-    2. Проверяем, не отправляли ли мы им уже эту рассылку
-    3. Отправляем сообщение и помечаем как отправленное
+       и ещё не получали эту рассылку (отбор в одном запросе)
+    2. Отправляем сообщение
+    3. Помечаем отправленные одной транзакцией на каждые AUTO_BROADCAST_MARK_CHUNK отправок
     """
     # Получаем все активные авто-рассылки
     auto_broadcasts = await db.get_auto_broadcasts(active_only=True)
@@ -428,37 +431,40 @@ async def process_auto_broadcasts(bot: Bot):
         media_file_id = auto_bc.get('media_file_id')
         buttons = auto_bc.get('buttons')
 
-        # Получаем пользователей, подходящих под триггер
-        eligible_users = await db.get_auto_broadcast_eligible_users(trigger_type, delay_hours)
-
         sent_count = 0
-        for user in eligible_users:
-            user_id = user['user_id']
-
-            # Проверяем, не отправляли ли уже
-            already_sent = await db.is_auto_broadcast_sent(auto_id, user_id)
-            if already_sent:
-                continue
-
-            # Отправляем сообщение
-            success = await send_broadcast_message(
-                bot,
-                user_id,
-                content,
-                media_type=media_type,
-                media_file_id=media_file_id,
-                buttons=buttons
-            )
-
-            if success:
-                # Помечаем как отправленное
-                await db.mark_auto_broadcast_sent(auto_id, user_id)
-                await db.increment_auto_broadcast_sent(auto_id)
-                sent_count += 1
-                logger.info(f"Auto-broadcast {auto_id} sent to user {user_id}")
+        sent_user_ids = []
+        try:
+            # Пользователи, подходящие под триггер и ещё не получившие рассылку,
+            # читаются пачками по мере отправки
+            async for user_ids in db.iter_auto_broadcast_eligible_user_ids(auto_id, trigger_type, delay_hours):
+                for user_id in user_ids:
+                    # Отправляем сообщение
+                    success = await send_broadcast_message(
+                        bot,
+                        user_id,
+                        content,
+                        media_type=media_type,
+                        media_file_id=media_file_id,
+                        buttons=buttons
+                    )
 
-            # Небольшая задержка
-            await asyncio.sleep(0.05)
+                    if success:
+                        sent_user_ids.append(user_id)
+                        logger.info(f"Auto-broadcast {auto_id} sent to user {user_id}")
+
+                    # Помечаем отправленные и обновляем счётчик одной транзакцией
+                    # на AUTO_BROADCAST_MARK_CHUNK отправок
+                    if len(sent_user_ids) >= AUTO_BROADCAST_MARK_CHUNK:
+                        sent_count += await db.mark_auto_broadcast_sent_many(auto_id, sent_user_ids)
+                        sent_user_ids = []
+
+                    # Небольшая задержка
+                    await asyncio.sleep(0.05)
+        finally:
+            # Остаток отмечается и при ошибке или отмене задачи: иначе
+            # следующий запуск отправил бы этим пользователям рассылку повторно
+            if sent_user_ids:
+                sent_count += await db.mark_auto_broadcast_sent_many(auto_id, sent_user_ids)
 
         if sent_count > 0:
             logger.info(
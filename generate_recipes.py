@@ -1,6 +1,15 @@
 #!/usr/bin/env python3
+"""
+Рецепты из meal_days/*.md -> data/recipes_new.py (черновик для переноса
+в data/recipes_source.py).
+
+python generate_recipes.py --compile — собрать из data/recipes_source.py
+файлы data/compiled/*.marshal, из которых бот читает рецепты.
+"""
 import re
 import os
+import sys
+import time
 
 FILES = {
     "1200cal.md": 1200,
@@ -198,5 +207,27 @@ def get_days_count(calories: int) -> int:
         print(f'  {calories} kcal: {len(all_recipes[calories])} days')
 
 
+def compile_main():
+    from data.recipe_store import compile_recipes, compiled_path
+
+    started = time.perf_counter()
+    sizes = compile_recipes()
+    print(f'✓ Compiled recipes in {(time.perf_counter() - started) * 1000:.0f} ms')
+    for program, size in sizes.items():
+        print(f'  {compiled_path(program)}: {size / 1024:.1f} KB')
+
+    from data.recipe_index import get_recipe_index
+
+    problems = get_recipe_index().validate_days()
+    print(f'\nDays off their nominal calories: {len(problems) or "none"}')
+    for problem in problems:
+        actual = problem['actual'] if problem['actual'] is not None else 'КБЖУ не у всех приёмов пищи'
+        print(f"  {problem['program']} {problem['calories'] or ''} day {problem['day']}: "
+              f"{actual} vs {problem['expected']}")
+
+
 if __name__ == '__main__':
-    main()
+    if '--compile' in sys.argv:
+        compile_main()
+    else:
+        main()
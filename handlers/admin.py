@@ -1,11 +1,12 @@
 import logging
+import os
 import re
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 from aiogram import Router, Bot, F
 from aiogram.types import CallbackQuery, Message, ReplyKeyboardRemove
 from aiogram.enums import ParseMode
-from aiogram.filters import Command
+from aiogram.filters import Command, CommandObject
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 
@@ -90,7 +91,7 @@ from keyboards.admin_kb import (
     get_user_view_keyboard,
     get_user_confirm_reset_keyboard
 )
-from data.recipes import RECIPES, get_recipe_from_db
+from data.recipes import RECIPES, get_recipe_from_db, get_shopping_list_cache_stats
 
 logger = logging.getLogger(__name__)
 router = Router(name="admin")
@@ -245,6 +246,120 @@ async def cmd_admin(message: Message, state: FSMContext):
     )
 
 
+@router.message(Command("dbstats"))
+async def cmd_dbstats(message: Message, command: CommandObject):
+    """Статистика запросов к БД: /dbstats — показать, /dbstats reset — обнулить"""
+    if not is_admin(message.from_user.username):
+        return
+
+    if command.args and command.args.strip() == "reset":
+        db.reset_query_stats()
+        await message.answer("🧹 Статистика запросов обнулена.")
+        return
+
+    query_stats = db.get_query_stats(limit=15)
+    lines = [
+        "🗄 <b>Запросы к БД</b> (по суммарному времени)\n",
+        "<code>функция: вызовы · ср/макс мс · строки</code>",
+    ]
+    for item in query_stats:
+        lines.append(
+            f"<code>{item['function']}</code>: {item['calls']} · "
+            f"{item['avg_ms']}/{item['max_ms']} · {item['rows']}"
+            + (f" · ⚠️ {item['errors']} ошибок" if item['errors'] else "")
+            + (f" · 🐢 {item['slow']} медленных" if item['slow'] else "")
+        )
+    if not query_stats:
+        lines.append("Пока нет данных.")
+
+    cache = db.get_user_cache_stats()
+    recipe_texts = db.get_recipe_text_cache_stats()
+    events = db.get_event_buffer_stats()
+    retention = db.get_retention_stats()
+    lines.append(
+        f"\n👤 Кэш пользователей: {cache['size']} записей, "
+        f"попаданий {cache['hit_rate'] * 100:.0f}%"
+    )
+    lines.append(
+        f"📖 Кэш текстов дней: {recipe_texts['size']} дней, "
+        f"попаданий {recipe_texts['hit_rate'] * 100:.0f}%"
+    )
+    shopping_lists = get_shopping_list_cache_stats()
+    lines.append(
+        f"🛒 Кэш списков продуктов: {shopping_lists['size']} списков, "
+        f"попаданий {shopping_lists['hit_rate'] * 100:.0f}%"
+    )
+    lines.append(
+        f"📥 Буфер событий: записано {events['flushed']}, в очереди {events['queued']}, "
+        f"отброшено {events['dropped']}, ошибок {events['failed']}"
+    )
+    if retention:
+        lines.append(
+            f"🗃 Архивация {retention['started_at'][:16]}: "
+            f"{retention['archived']} строк за {retention['duration_ms']} мс"
+        )
+
+    backup = db.get_backup_stats()
+    if backup:
+        lines.append(
+            f"💾 Снимок {backup['started_at'][:16]}: "
+            f"{backup['size_bytes'] / 1024 / 1024:.1f} МБ за {backup['duration_ms']} мс"
+        )
+
+    await message.answer("\n".join(lines), parse_mode=ParseMode.HTML)
+
+
+@router.message(Command("backup"))
+async def cmd_backup(message: Message):
+    """Горячий снимок базы по запросу: бот продолжает работать во время копирования"""
+    if not is_admin(message.from_user.username):
+        return
+
+    await message.answer("💾 Делаю снимок базы...")
+    try:
+        stats = await db.run_backup()
+    except Exception as e:
+        logger.error(f"Error in cmd_backup: {e}")
+        await message.answer(f"❌ Не удалось сделать снимок: {e}")
+        return
+
+    if not stats:
+        await message.answer("ℹ️ Снимки делаются только для SQLite, для PostgreSQL используйте pg_dump.")
+        return
+
+    await message.answer(
+        f"✅ <b>Снимок готов</b>\n\n"
+        f"📄 <code>{os.path.basename(stats['path'])}</code>\n"
+        f"📦 Размер: {stats['size_bytes'] / 1024 / 1024:.1f} МБ"
+        + (" (gzip)" if stats['compressed'] else "") + "\n"
+        f"⏱ Время: {stats['duration_ms'] / 1000:.1f} с "
+        f"(копирование {stats['copy_ms'] / 1000:.1f} с, {stats['steps']} шагов)\n"
+        f"🔍 Проверка: {stats['quick_check']}\n"
+        f"🗑 Удалено старых снимков: {stats['removed']}",
+        parse_mode=ParseMode.HTML
+    )
+
+
+@router.message(Command("vacuum"))
+async def cmd_vacuum(message: Message):
+    """Один раз перевести базу на incremental_vacuum: место после архивации возвращается ОС"""
+    if not is_admin(message.from_user.username):
+        return
+
+    await message.answer("🧹 Перевожу базу на incremental_vacuum, запись на время VACUUM остановится...")
+    try:
+        enabled = await db.enable_incremental_vacuum()
+    except Exception as e:
+        logger.error(f"Error in cmd_vacuum: {e}")
+        await message.answer(f"❌ Не удалось выполнить VACUUM: {e}")
+        return
+
+    if enabled:
+        await message.answer("✅ База переведена: архивация теперь возвращает освободившееся место.")
+    else:
+        await message.answer("ℹ️ Ничего не нужно: база уже в этом режиме или это PostgreSQL.")
+
+
 @router.message(F.text == "📝 Редактировать рационы")
 async def edit_rations(message: Message, state: FSMContext):
     """Редактирование рационов"""
@@ -3642,24 +3757,7 @@ async def chain_select_audience(callback: CallbackQuery, callback_data: ChainAud
     await state.update_data(send_audience=audience)
 
     # Получаем количество пользователей
-    if audience == 'all':
-        users = await db.get_broadcast_audience_users('all')
-    elif audience == 'start_only':
-        users = await db.get_broadcast_audience_users('start_only')
-    elif audience == 'paid':
-        users = await db.get_users_by_status('paid')
-    elif audience == 'not_paid':
-        users = await db.get_users_by_status('only_start')
-        users2 = await db.get_users_by_status('clicked_no_screenshot')
-        # Объединяем уникальные user_id
-        user_ids = set(u['user_id'] for u in users)
-        for u in users2:
-            if u['user_id'] not in user_ids:
-                users.append(u)
-    else:
-        users = []
-
-    user_count = len(users)
+    user_count = await db.count_audience(audience)
     await state.update_data(send_user_count=user_count)
 
     chain = await db.get_chain(chain_id)
@@ -3706,23 +3804,7 @@ async def chain_confirm_send(callback: CallbackQuery, callback_data: ChainEditCa
         await callback.answer("❌ Цепочка или шаги не найдены", show_alert=True)
         return
 
-    # Получаем пользователей
-    if audience == 'all':
-        users = await db.get_broadcast_audience_users('all')
-    elif audience == 'start_only':
-        users = await db.get_broadcast_audience_users('start_only')
-    elif audience == 'paid':
-        users = await db.get_users_by_status('paid')
-    elif audience == 'not_paid':
-        users = await db.get_users_by_status('only_start')
-        users2 = await db.get_users_by_status('clicked_no_screenshot')
-        user_ids = set(u['user_id'] for u in users)
-        for u in users2:
-            if u['user_id'] not in user_ids:
-                users.append(u)
-    else:
-        users = []
-
+    user_count = data.get('send_user_count', 0)
     await state.clear()
 
     # Запускаем цепочку для пользователей
@@ -3733,52 +3815,56 @@ async def chain_confirm_send(callback: CallbackQuery, callback_data: ChainEditCa
 
     await callback.message.edit_text(
         f"⏳ <b>Запуск цепочки...</b>\n\n"
-        f"Отправка первого шага {len(users)} пользователям...",
+        f"Отправка первого шага {user_count} пользователям...",
         parse_mode=ParseMode.HTML
     )
 
     buttons = await db.get_step_buttons(first_step['id'])
 
-    for user in users:
-        user_id = user['user_id']
-        try:
-            # Создаём состояние пользователя в цепочке
-            await db.start_chain_for_user(user_id, chain_id, first_step['id'])
-
-            # Отправляем первое сообщение
-            reply_markup = build_chain_step_keyboard(
-                buttons, chain_id, first_step['id']) if buttons else None
-
-            if first_step.get('media_type') == 'photo' and first_step.get('media_file_id'):
-                await bot.send_photo(
-                    chat_id=user_id,
-                    photo=first_step['media_file_id'],
-                    caption=first_step['content'],
-                    reply_markup=reply_markup,
-                    parse_mode=ParseMode.HTML
-                )
-            elif first_step.get('media_type') == 'video' and first_step.get('media_file_id'):
-                await bot.send_video(
-                    chat_id=user_id,
-                    video=first_step['media_file_id'],
-                    caption=first_step['content'],
-                    reply_markup=reply_markup,
-                    parse_mode=ParseMode.HTML
-                )
-            else:
-                await bot.send_message(
-                    chat_id=user_id,
-                    text=first_step['content'],
-                    reply_markup=reply_markup,
-                    parse_mode=ParseMode.HTML
-                )
+    # Состояние цепочки создаётся для всей аудитории одной транзакцией
+    enrollment = await db.start_chain_for_users(chain_id, first_step['id'], audience)
+    logger.info(
+        f"Chain {chain_id}: enrolled {enrollment['enrolled']}, "
+        f"re-enrolled {enrollment['re_enrolled']} users")
 
-            # Логируем отправку
-            await db.log_chain_message(user_id, chain_id, first_step['id'])
-            success_count += 1
-        except Exception as e:
-            logger.warning(f"Failed to send chain message to {user_id}: {e}")
-            fail_count += 1
+    # Пользователи читаются пачками по мере отправки, а не списком целиком
+    async for user_ids in db.iter_audience_user_ids(audience):
+        for user_id in user_ids:
+            try:
+                # Отправляем первое сообщение
+                reply_markup = build_chain_step_keyboard(
+                    buttons, chain_id, first_step['id']) if buttons else None
+
+                if first_step.get('media_type') == 'photo' and first_step.get('media_file_id'):
+                    await bot.send_photo(
+                        chat_id=user_id,
+                        photo=first_step['media_file_id'],
+                        caption=first_step['content'],
+                        reply_markup=reply_markup,
+                        parse_mode=ParseMode.HTML
+                    )
+                elif first_step.get('media_type') == 'video' and first_step.get('media_file_id'):
+                    await bot.send_video(
+                        chat_id=user_id,
+                        video=first_step['media_file_id'],
+                        caption=first_step['content'],
+                        reply_markup=reply_markup,
+                        parse_mode=ParseMode.HTML
+                    )
+                else:
+                    await bot.send_message(
+                        chat_id=user_id,
+                        text=first_step['content'],
+                        reply_markup=reply_markup,
+                        parse_mode=ParseMode.HTML
+                    )
+
+                # Логируем отправку
+                await db.log_chain_message(user_id, chain_id, first_step['id'])
+                success_count += 1
+            except Exception as e:
+                logger.warning(f"Failed to send chain message to {user_id}: {e}")
+                fail_count += 1
 
     await callback.message.edit_text(
         f"✅ <b>Цепочка запущена!</b>\n\n"
@@ -3805,20 +3891,16 @@ async def user_management_menu(message: Message, state: FSMContext):
     await state.clear()
 
     # Получаем общую статистику
-    all_users = await db.get_all_users()
-    paid_main = len([u for u in all_users if u.get('has_paid')])
-    paid_fmd = len([u for u in all_users if u.get('has_paid_fmd')])
-    paid_bundle = len([u for u in all_users if u.get('has_paid_bundle')])
-    paid_dry = len([u for u in all_users if u.get('has_paid_dry')])
+    counts = await db.get_user_counts()
 
     await message.answer(
         "👥 <b>Управление пользователями</b>\n\n"
         f"📊 <b>Статистика:</b>\n"
-        f"├ Всего пользователей: <b>{len(all_users)}</b>\n"
-        f"├ 💰 Оплатили рационы: <b>{paid_main}</b>\n"
-        f"├ 🥗 Оплатили FMD: <b>{paid_fmd}</b>\n"
-        f"├ 🎁 Оплатили комплект: <b>{paid_bundle}</b>\n"
-        f"└ 🔥 Оплатили Сушку: <b>{paid_dry}</b>\n\n"
+        f"├ Всего пользователей: <b>{counts['total']}</b>\n"
+        f"├ 💰 Оплатили рационы: <b>{counts['paid_main']}</b>\n"
+        f"├ 🥗 Оплатили FMD: <b>{counts['paid_fmd']}</b>\n"
+        f"├ 🎁 Оплатили комплект: <b>{counts['paid_bundle']}</b>\n"
+        f"└ 🔥 Оплатили Сушку: <b>{counts['paid_dry']}</b>\n\n"
         "Выберите действие:",
         reply_markup=get_user_management_menu(),
         parse_mode=ParseMode.HTML
@@ -3833,7 +3915,7 @@ async def user_list_all(callback: CallbackQuery, state: FSMContext):
         return
 
     await state.clear()
-    users = await db.get_all_users()
+    users, has_next = await db.get_users_page("all")
 
     if not users:
         await callback.answer("📭 Нет пользователей", show_alert=True)
@@ -3843,9 +3925,10 @@ async def user_list_all(callback: CallbackQuery, state: FSMContext):
 
     await callback.message.edit_text(
         f"👥 <b>Все пользователи</b>\n\n"
-        f"Всего: {len(users)}\n\n"
+        f"Всего: {await db.count_users('all')}\n\n"
         "💰 = Рационы | 🥗 = FMD | 🎁 = Комплект | ⚪ = Не оплачено",
-        reply_markup=get_user_list_keyboard(users, page=0, filter_type="all"),
+        reply_markup=get_user_list_keyboard(
+            users, page=0, filter_type="all", has_next=has_next),
         parse_mode=ParseMode.HTML
     )
     await callback.answer()
@@ -3860,20 +3943,16 @@ async def user_back_to_menu(callback: CallbackQuery, state: FSMContext):
 
     await state.clear()
 
-    all_users = await db.get_all_users()
-    paid_main = len([u for u in all_users if u.get('has_paid')])
-    paid_fmd = len([u for u in all_users if u.get('has_paid_fmd')])
-    paid_bundle = len([u for u in all_users if u.get('has_paid_bundle')])
-    paid_dry = len([u for u in all_users if u.get('has_paid_dry')])
+    counts = await db.get_user_counts()
 
     await callback.message.edit_text(
         "👥 <b>Управление пользователями</b>\n\n"
         f"📊 <b>Статистика:</b>\n"
-        f"├ Всего пользователей: <b>{len(all_users)}</b>\n"
-        f"├ 💰 Оплатили рационы: <b>{paid_main}</b>\n"
-        f"├ 🥗 Оплатили FMD: <b>{paid_fmd}</b>\n"
-        f"├ 🎁 Оплатили комплект: <b>{paid_bundle}</b>\n"
-        f"└ 🔥 Оплатили Сушку: <b>{paid_dry}</b>\n\n"
+        f"├ Всего пользователей: <b>{counts['total']}</b>\n"
+        f"├ 💰 Оплатили рационы: <b>{counts['paid_main']}</b>\n"
+        f"├ 🥗 Оплатили FMD: <b>{counts['paid_fmd']}</b>\n"
+        f"├ 🎁 Оплатили комплект: <b>{counts['paid_bundle']}</b>\n"
+        f"└ 🔥 Оплатили Сушку: <b>{counts['paid_dry']}</b>\n\n"
         "Выберите действие:",
         reply_markup=get_user_management_menu(),
         parse_mode=ParseMode.HTML
@@ -3918,20 +3997,16 @@ async def user_search_cancel(message: Message, state: FSMContext):
         reply_markup=get_admin_main_menu()
     )
 
-    all_users = await db.get_all_users()
-    paid_main = len([u for u in all_users if u.get('has_paid')])
-    paid_fmd = len([u for u in all_users if u.get('has_paid_fmd')])
-    paid_bundle = len([u for u in all_users if u.get('has_paid_bundle')])
-    paid_dry = len([u for u in all_users if u.get('has_paid_dry')])
+    counts = await db.get_user_counts()
 
     await message.answer(
         "👥 <b>Управление пользователями</b>\n\n"
         f"📊 <b>Статистика:</b>\n"
-        f"├ Всего пользователей: <b>{len(all_users)}</b>\n"
-        f"├ 💰 Оплатили рационы: <b>{paid_main}</b>\n"
-        f"├ 🥗 Оплатили FMD: <b>{paid_fmd}</b>\n"
-        f"├ 🎁 Оплатили комплект: <b>{paid_bundle}</b>\n"
-        f"└ 🔥 Оплатили Сушку: <b>{paid_dry}</b>\n\n"
+        f"├ Всего пользователей: <b>{counts['total']}</b>\n"
+        f"├ 💰 Оплатили рационы: <b>{counts['paid_main']}</b>\n"
+        f"├ 🥗 Оплатили FMD: <b>{counts['paid_fmd']}</b>\n"
+        f"├ 🎁 Оплатили комплект: <b>{counts['paid_bundle']}</b>\n"
+        f"└ 🔥 Оплатили Сушку: <b>{counts['paid_dry']}</b>\n\n"
         "Выберите действие:",
         reply_markup=get_user_management_menu(),
         parse_mode=ParseMode.HTML
@@ -3967,13 +4042,18 @@ async def user_search_process(message: Message, state: FSMContext):
         user = users[0]
         await show_user_card(message, user)
     else:
-        # Показываем список найденных
+        # Показываем список найденных (первую страницу — без навигации)
+        shown = users[:db.USER_PAGE_SIZE]
+        more_hint = (
+            f"Показаны первые {len(shown)} — уточните запрос\n\n"
+            if len(users) > len(shown) else ""
+        )
         await message.answer(
             f"🔍 <b>Результаты поиска:</b> «{query}»\n\n"
-            f"Найдено: {len(users)}\n\n"
+            f"Найдено: {len(users)}\n"
+            f"{more_hint}\n"
             "💰 = Рационы | 🥗 = FMD | 🎁 = Комплект | ⚪ = Не оплачено",
-            reply_markup=get_user_list_keyboard(
-                users, page=0, filter_type="search"),
+            reply_markup=get_user_list_keyboard(shown, filter_type="search"),
             parse_mode=ParseMode.HTML
         )
 
@@ -4055,7 +4135,11 @@ async def user_list_view(callback: CallbackQuery, callback_data: UserListCallbac
         return
 
     filter_type = callback_data.payment_filter
-    users = await db.get_users_by_payment_filter(filter_type)
+    if filter_type not in db.USER_LIST_FILTERS:
+        # Кнопка старой версии бота с фильтром, которого больше нет
+        await callback.answer("⚠️ Неизвестный фильтр, откройте список заново", show_alert=True)
+        return
+    users, has_next = await db.get_users_page(filter_type)
 
     if not users:
         await callback.answer("📭 Нет пользователей", show_alert=True)
@@ -4071,10 +4155,10 @@ async def user_list_view(callback: CallbackQuery, callback_data: UserListCallbac
 
     await callback.message.edit_text(
         f"<b>{filter_names.get(filter_type, 'Пользователи')}</b>\n\n"
-        f"Всего: {len(users)}\n\n"
+        f"Всего: {await db.count_users(filter_type)}\n\n"
         "💰 = Рационы | 🥗 = FMD | 🎁 = Комплект | 🔥 = Сушка | ⚪ = Не оплачено",
         reply_markup=get_user_list_keyboard(
-            users, page=0, filter_type=filter_type),
+            users, page=0, filter_type=filter_type, has_next=has_next),
         parse_mode=ParseMode.HTML
     )
     await callback.answer()
@@ -4089,23 +4173,40 @@ async def user_list_page(callback: CallbackQuery, callback_data: UserListCallbac
 
     page = callback_data.page
     filter_type = callback_data.payment_filter
-    users = await db.get_users_by_payment_filter(filter_type)
+    if filter_type not in db.USER_LIST_FILTERS:
+        # Кнопка старой версии бота с фильтром, которого больше нет
+        await callback.answer("⚠️ Неизвестный фильтр, откройте список заново", show_alert=True)
+        return
+    users, has_more = await db.get_users_page(
+        filter_type, cursor=callback_data.cursor, backward=callback_data.backward)
+
+    if not users:
+        # Список изменился с момента отрисовки — начинаем с первой страницы
+        page = 0
+        users, has_more = await db.get_users_page(filter_type)
+        has_prev, has_next = False, has_more
+    elif callback_data.backward:
+        has_prev, has_next = has_more, True
+    else:
+        has_prev, has_next = True, has_more
+    if not has_prev:
+        page = 0
 
     filter_names = {
         'all': '👥 Все пользователи',
         'paid_main': '💰 Оплатившие рационы',
         'paid_fmd': '🥗 Оплатившие FMD',
         'paid_bundle': '🎁 Оплатившие комплект',
-        'paid_dry': '🔥 Оплатившие Сушку',
-        'search': '🔍 Результаты поиска'
+        'paid_dry': '🔥 Оплатившие Сушку'
     }
 
     await callback.message.edit_text(
         f"<b>{filter_names.get(filter_type, 'Пользователи')}</b>\n\n"
-        f"Всего: {len(users)}\n\n"
+        f"Всего: {await db.count_users(filter_type)}\n\n"
         "💰 = Рационы | 🥗 = FMD | 🎁 = Комплект | 🔥 = Сушка | ⚪ = Не оплачено",
         reply_markup=get_user_list_keyboard(
-            users, page=page, filter_type=filter_type),
+            users, page=page, filter_type=filter_type,
+            has_prev=has_prev, has_next=has_next),
         parse_mode=ParseMode.HTML
     )
     await callback.answer()
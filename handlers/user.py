@@ -1,13 +1,15 @@
 import logging
+import re
+from typing import Optional
 from aiogram import Router, F, Bot
 from aiogram.types import Message, CallbackQuery, ReplyKeyboardMarkup, KeyboardButton, ReplyKeyboardRemove
-from aiogram.filters import Command, CommandStart
+from aiogram.filters import Command, CommandObject, CommandStart
 from aiogram.enums import ParseMode
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 
 import database as db
-from database import EventType
+from database import EventType, Entitlement
 from config import PAYMENT_AMOUNT, PAYMENT_DETAILS, ADMIN_CHANNEL_ID, FMD_PAYMENT_AMOUNT, BUNDLE_PAYMENT_AMOUNT, DRY_PAYMENT_AMOUNT
 from keyboards.user_kb import (
     get_main_menu,
@@ -31,13 +33,14 @@ from keyboards.callbacks import (
     PaymentCallback, CaloriesCallback, DayCallback, BackCallback,
     FMDPaymentCallback, FMDDayCallback, ProductSelectCallback, BackToProductsCallback,
     FMDInfoCallback, ChainUserButtonCallback, BundlePaymentCallback,
-    DryPaymentCallback, DryDayCallback, DryInfoCallback
+    DryPaymentCallback, DryDayCallback, DryInfoCallback, ShoppingListCallback
 )
 from data.recipes import (
-    get_recipe_text_async, get_available_calories, get_fmd_recipe_text_async,
+    get_recipe_text_async, get_available_calories, get_days_count, get_fmd_recipe_text_async,
     get_fmd_shopping_list, get_fmd_info, get_dry_recipe_text_async,
-    get_dry_shopping_list, get_dry_info
+    get_dry_shopping_list, get_dry_info, get_shopping_list_text
 )
+from data.recipe_index import get_recipe_index, parse_search_query
 
 logger = logging.getLogger(__name__)
 router = Router(name="user")
@@ -182,10 +185,11 @@ async def cmd_status(message: Message):
 async def cmd_menu(message: Message):
     """Быстрый доступ к выбору рациона"""
     user_id = message.from_user.id
-    has_paid = await db.check_payment_status(user_id)
-    has_paid_fmd = await db.check_fmd_payment_status(user_id)
-    has_paid_bundle = await db.check_bundle_payment_status(user_id)
-    has_paid_dry = await db.check_dry_payment_status(user_id)
+    entitlements = await db.get_entitlements(user_id)
+    has_paid = Entitlement.MAIN in entitlements
+    has_paid_fmd = Entitlement.FMD in entitlements
+    has_paid_bundle = Entitlement.BUNDLE in entitlements
+    has_paid_dry = Entitlement.DRY in entitlements
 
     # Показываем меню продуктов с указанием что оплачено
     await message.answer(
@@ -235,9 +239,10 @@ async def cmd_fmd(message: Message):
 async def cmd_bundle(message: Message):
     """Быстрый доступ к оплате комплекта"""
     user_id = message.from_user.id
-    has_paid = await db.check_payment_status(user_id)
-    has_paid_fmd = await db.check_fmd_payment_status(user_id)
-    has_paid_bundle = await db.check_bundle_payment_status(user_id)
+    entitlements = await db.get_entitlements(user_id)
+    has_paid = Entitlement.MAIN in entitlements
+    has_paid_fmd = Entitlement.FMD in entitlements
+    has_paid_bundle = Entitlement.BUNDLE in entitlements
 
     if has_paid_bundle or (has_paid and has_paid_fmd):
         # Доступ есть - сообщаем об этом
@@ -299,6 +304,152 @@ async def cmd_dry(message: Message):
         await show_dry_payment_info(message)
 
 
+# ==================== Поиск по продуктам ====================
+
+SEARCH_MAX_LINES = 30  # Сколько совпадений показывать в одном ответе
+
+# Программа -> доступ, который к ней нужен, и подпись в ответе
+SEARCH_PROGRAMS = {
+    'rations': (Entitlement.MAIN, "📋 Рационы"),
+    'fmd': (Entitlement.FMD, "🥗 FMD"),
+    'dry': (Entitlement.DRY, "🔥 Сушка"),
+}
+MEAL_LABELS = {'breakfast': "Завтрак", 'snack': "Перекус", 'lunch': "Обед", 'dinner': "Ужин"}
+
+
+def _search_level_title(program: str, calories: int) -> str:
+    title = SEARCH_PROGRAMS[program][1]
+    return f"{title} {calories} ккал" if program == 'rations' else title
+
+
+async def _ration_calories(user_id: int, calories: Optional[int]) -> Optional[int]:
+    """Калорийность рационов: из запроса, иначе ближайшая к результату калькулятора, иначе None"""
+    available = get_available_calories()
+    if calories is None:
+        result = await db.get_last_calculator_result(user_id)
+        if not result:
+            return None
+        calories = result['calories']
+    return min(available, key=lambda level: abs(level - calories))
+
+
+@router.message(Command("search"))
+async def cmd_search(message: Message, command: CommandObject):
+    """Поиск дней и блюд по продуктам: /search курица -рыба"""
+    query = parse_search_query(command.args or "")
+    if not query['include'] and not query['exclude']:
+        await message.answer(
+            "🔎 <b>Поиск по продуктам</b>\n\n"
+            "Напиши продукты после команды:\n"
+            "<code>/search курица</code> — блюда с курицей\n"
+            "<code>/search курица -рыба</code> — с курицей, но без рыбы\n"
+            "<code>/search без рыбы</code> — дни, в которых нет рыбы\n"
+            "<code>/search творог 1600</code> — только рацион 1600 ккал\n\n"
+            "💡 Понимает и общие слова: рыба, мясо, морепродукты, молочное, яйца, орехи.",
+            parse_mode=ParseMode.HTML
+        )
+        return
+
+    entitlements = await db.get_entitlements(message.from_user.id)
+    programs = [program for program, (entitlement, _) in SEARCH_PROGRAMS.items() if entitlement in entitlements]
+    if not programs:
+        await message.answer(
+            "🔎 Поиск по продуктам доступен после покупки рациона.\n\n"
+            "Посмотреть все продукты: /menu",
+            parse_mode=ParseMode.HTML
+        )
+        return
+
+    index = get_recipe_index()
+    calories = await _ration_calories(message.from_user.id, query['calories']) if 'rations' in programs else None
+    lines = []
+    if query['include']:
+        # Есть что искать — показываем подходящие блюда
+        for program in programs:
+            rows = index.search(query['include'], query['exclude'], program=program,
+                                calories=calories if program == 'rations' else None)
+            current = None
+            for row in rows:
+                meal = index.meal(row)
+                level = (meal['program'], meal['calories'])
+                if level != current:
+                    current = level
+                    lines.append(f"\n<b>{_search_level_title(*level)}</b>")
+                lines.append(f"День {meal['day']}, {MEAL_LABELS[meal['meal_type']].lower()}: {meal['title']}")
+    else:
+        # Только исключения — показываем дни, где этих продуктов нет совсем
+        days = {}
+        for program in programs:
+            for program_code, level_calories, day in index.search_days(
+                    exclude=query['exclude'], program=program,
+                    calories=calories if program == 'rations' else None):
+                days.setdefault((program_code, level_calories), []).append(day)
+        for level, level_days in days.items():
+            lines.append(f"<b>{_search_level_title(*level)}</b>: дни {', '.join(map(str, sorted(level_days)))}")
+
+    query_text = ", ".join(query['include'])
+    if query['exclude']:
+        query_text = "; ".join(filter(None, [query_text, "без: " + ", ".join(query['exclude'])]))
+    if not lines:
+        await message.answer(f"🔎 По запросу «{query_text}» ничего не нашлось.")
+        return
+
+    # Блюда идут группами с пустой строкой перед заголовком, дни — сразу списком
+    separator = "\n" if query['include'] else "\n\n"
+    text = f"🔎 <b>{query_text}</b>{separator}" + "\n".join(lines[:SEARCH_MAX_LINES])
+    if len(lines) > SEARCH_MAX_LINES:
+        text += "\n\n…показаны не все совпадения. Уточни запрос или укажи калорийность."
+    await message.answer(text, parse_mode=ParseMode.HTML)
+
+
+# ==================== Список продуктов ====================
+
+@router.message(Command("shopping"))
+async def cmd_shopping(message: Message, command: CommandObject):
+    """Список продуктов рациона на любые дни: /shopping 1-7 1600"""
+    if not await db.check_payment_status(message.from_user.id):
+        await message.answer(
+            "🛒 Список продуктов доступен после покупки рационов.\n\n"
+            "Посмотреть все продукты: /menu"
+        )
+        return
+
+    args = command.args or ""
+    available = get_available_calories()
+    days_range = re.search(r'(\d+)\s*[-–—]\s*(\d+)', args)
+    numbers = [int(number) for number in re.findall(r'\d+', re.sub(r'\d+\s*[-–—]\s*\d+', ' ', args))]
+    # Число от 1000 — калорийность, меньше — день
+    calories = next((number for number in numbers if number >= 1000), None)
+    day = next((number for number in numbers if number < 1000), None)
+    calories = await _ration_calories(message.from_user.id, calories)
+    if calories is None:
+        await message.answer(
+            "🛒 <b>Список продуктов</b>\n\n"
+            "Укажи дни и калорийность рациона:\n"
+            "<code>/shopping 1-7 1600</code> — дни с 1 по 7\n"
+            "<code>/shopping 3 1600</code> — только 3-й день\n\n"
+            f"Доступная калорийность: {', '.join(map(str, available))}",
+            parse_mode=ParseMode.HTML
+        )
+        return
+
+    days_count = get_days_count(calories)
+    if days_range:
+        first_day, last_day = sorted(map(int, days_range.groups()))
+    elif day is not None:
+        first_day = last_day = day
+    else:
+        first_day, last_day = 1, days_count
+    if first_day < 1 or last_day > days_count:
+        await message.answer(f"❌ В рационе {calories} ккал дни с 1 по {days_count}")
+        return
+
+    await message.answer(
+        get_shopping_list_text('rations', calories, first_day, last_day),
+        parse_mode=ParseMode.HTML
+    )
+
+
 # ==================== Кнопки главного меню ====================
 
 @router.message(F.text == "🍽 Выбрать рацион")
@@ -308,10 +459,11 @@ async def choose_ration(message: Message, state: FSMContext):
     await state.clear()
 
     user_id = message.from_user.id
-    has_paid = await db.check_payment_status(user_id)
-    has_paid_fmd = await db.check_fmd_payment_status(user_id)
-    has_paid_bundle = await db.check_bundle_payment_status(user_id)
-    has_paid_dry = await db.check_dry_payment_status(user_id)
+    entitlements = await db.get_entitlements(user_id)
+    has_paid = Entitlement.MAIN in entitlements
+    has_paid_fmd = Entitlement.FMD in entitlements
+    has_paid_bundle = Entitlement.BUNDLE in entitlements
+    has_paid_dry = Entitlement.DRY in entitlements
 
     # Показываем меню продуктов с указанием что оплачено
     await message.answer(
@@ -674,9 +826,10 @@ async def select_product(callback: CallbackQuery, callback_data: ProductSelectCa
 
     elif product == "bundle":
         # Комплект: Рационы + FMD
-        has_paid = await db.check_payment_status(user_id)
-        has_paid_fmd = await db.check_fmd_payment_status(user_id)
-        has_paid_bundle = await db.check_bundle_payment_status(user_id)
+        entitlements = await db.get_entitlements(user_id)
+        has_paid = Entitlement.MAIN in entitlements
+        has_paid_fmd = Entitlement.FMD in entitlements
+        has_paid_bundle = Entitlement.BUNDLE in entitlements
 
         if has_paid_bundle or (has_paid and has_paid_fmd):
             # Доступ есть - показываем выбор рациона
@@ -687,8 +840,7 @@ async def select_product(callback: CallbackQuery, callback_data: ProductSelectCa
                 parse_mode=ParseMode.HTML
             )
             # Возвращаем к выбору продуктов
-            has_paid_bundle = await db.check_bundle_payment_status(user_id)
-            has_paid_dry = await db.check_dry_payment_status(user_id)
+            has_paid_dry = Entitlement.DRY in entitlements
             await callback.message.answer(
                 "🍽 <b>Выбери рацион питания:</b>",
                 reply_markup=get_products_keyboard(
@@ -749,10 +901,11 @@ async def select_product(callback: CallbackQuery, callback_data: ProductSelectCa
 async def back_to_products(callback: CallbackQuery):
     """Возврат к выбору продукта"""
     user_id = callback.from_user.id
-    has_paid = await db.check_payment_status(user_id)
-    has_paid_fmd = await db.check_fmd_payment_status(user_id)
-    has_paid_bundle = await db.check_bundle_payment_status(user_id)
-    has_paid_dry = await db.check_dry_payment_status(user_id)
+    entitlements = await db.get_entitlements(user_id)
+    has_paid = Entitlement.MAIN in entitlements
+    has_paid_fmd = Entitlement.FMD in entitlements
+    has_paid_bundle = Entitlement.BUNDLE in entitlements
+    has_paid_dry = Entitlement.DRY in entitlements
 
     await callback.message.edit_text(
         "🍽 <b>Выбери рацион питания:</b>\n\n"
@@ -946,8 +1099,8 @@ async def bundle_payment_done(callback: CallbackQuery, bot: Bot, state: FSMConte
         return
 
     # Проверяем, не оплачено ли уже
-    has_paid_bundle = await db.check_bundle_payment_status(user.id)
-    if has_paid_bundle:
+    entitlements = await db.get_entitlements(user.id)
+    if Entitlement.BUNDLE in entitlements:
         await callback.answer(
             "✅ У тебя уже есть доступ к комплекту!",
             show_alert=True
@@ -955,9 +1108,7 @@ async def bundle_payment_done(callback: CallbackQuery, bot: Bot, state: FSMConte
         return
 
     # Проверяем, может оба продукта уже оплачены отдельно
-    has_paid = await db.check_payment_status(user.id)
-    has_paid_fmd = await db.check_fmd_payment_status(user.id)
-    if has_paid and has_paid_fmd:
+    if Entitlement.MAIN in entitlements and Entitlement.FMD in entitlements:
         await callback.answer(
             "✅ У тебя уже есть доступ ко всем продуктам!",
             show_alert=True
@@ -1340,6 +1491,30 @@ async def select_day(callback: CallbackQuery, callback_data: DayCallback):
     await callback.answer()
 
 
+@router.callback_query(ShoppingListCallback.filter())
+async def select_shopping_list(callback: CallbackQuery, callback_data: ShoppingListCallback):
+    """Список продуктов рациона на неделю"""
+    # Проверяем доступ
+    has_paid = await db.check_payment_status(callback.from_user.id)
+    if not has_paid:
+        await callback.answer("⛔ Сначала оплати доступ!", show_alert=True)
+        return
+
+    # Данные кнопки приходят от клиента: диапазон дней проверяем сами
+    calories = callback_data.calories
+    if (calories not in get_available_calories()
+            or not 1 <= callback_data.first_day <= callback_data.last_day <= get_days_count(calories)):
+        await callback.answer("❌ Такого списка продуктов нет", show_alert=True)
+        return
+
+    await callback.message.answer(
+        get_shopping_list_text('rations', calories, callback_data.first_day, callback_data.last_day),
+        reply_markup=get_back_to_calories_keyboard(),
+        parse_mode=ParseMode.HTML
+    )
+    await callback.answer()
+
+
 @router.callback_query(BackCallback.filter())
 async def go_back(callback: CallbackQuery, callback_data: BackCallback):
     """Кнопка 'Назад'"""
@@ -1436,10 +1611,11 @@ async def handle_command_button(callback: CallbackQuery):
             )
 
     elif command == "/menu":
-        has_paid = await db.check_payment_status(user_id)
-        has_paid_fmd = await db.check_fmd_payment_status(user_id)
-        has_paid_bundle = await db.check_bundle_payment_status(user_id)
-        has_paid_dry = await db.check_dry_payment_status(user_id)
+        entitlements = await db.get_entitlements(user_id)
+        has_paid = Entitlement.MAIN in entitlements
+        has_paid_fmd = Entitlement.FMD in entitlements
+        has_paid_bundle = Entitlement.BUNDLE in entitlements
+        has_paid_dry = Entitlement.DRY in entitlements
 
         await callback.message.answer(
             "🍽 <b>Выбери рацион питания:</b>\n\n"
@@ -1182,15 +1182,16 @@ def get_user_management_menu() -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
-def get_user_list_keyboard(users: list, page: int = 0, per_page: int = 10, filter_type: str = "all") -> InlineKeyboardMarkup:
-    """Список пользователей с пагинацией"""
-    builder = InlineKeyboardBuilder()
+def get_user_list_keyboard(users: list, page: int = 0, filter_type: str = "all",
+                           has_prev: bool = False, has_next: bool = False) -> InlineKeyboardMarkup:
+    """Страница списка пользователей
 
-    start_idx = page * per_page
-    end_idx = start_idx + per_page
-    page_users = users[start_idx:end_idx]
+    users: пользователи текущей страницы (см. db.get_users_page)
+    has_prev / has_next: показывать ли кнопки «Назад» / «Вперёд»
+    """
+    builder = InlineKeyboardBuilder()
 
-    for user in page_users:
+    for user in users:
         # Формируем отображение пользователя
         username = user.get('username')
         first_name = user.get('first_name', 'Без имени')
@@ -1224,21 +1225,22 @@ def get_user_list_keyboard(users: list, page: int = 0, per_page: int = 10, filte
         )
 
     # Пагинация
-    nav_buttons = []
-    if page > 0:
+    # Курсор — user_id крайней записи страницы: соседняя страница
+    # начинается сразу за ней
+    if has_prev:
         builder.button(
             text="◀️ Назад",
             callback_data=UserListCallback(
-                action="page", page=page - 1, payment_filter=filter_type)
+                action="page", page=page - 1, payment_filter=filter_type,
+                cursor=users[0]['user_id'], backward=True)
         )
-        nav_buttons.append(1)
-    if end_idx < len(users):
+    if has_next:
         builder.button(
             text="Вперёд ▶️",
             callback_data=UserListCallback(
-                action="page", page=page + 1, payment_filter=filter_type)
+                action="page", page=page + 1, payment_filter=filter_type,
+                cursor=users[-1]['user_id'])
         )
-        nav_buttons.append(1)
 
     builder.button(
         text="🔙 В меню управления",
@@ -1246,10 +1248,10 @@ def get_user_list_keyboard(users: list, page: int = 0, per_page: int = 10, filte
     )
 
     # Adjust: пользователи по одному, затем навигация
-    rows = [1] * len(page_users)
-    if page > 0 and end_idx < len(users):
+    rows = [1] * len(users)
+    if has_prev and has_next:
         rows.append(2)  # Обе кнопки навигации
-    elif page > 0 or end_idx < len(users):
+    elif has_prev or has_next:
         rows.append(1)  # Одна кнопка навигации
     rows.append(1)  # Кнопка "В меню"
 
@@ -31,6 +31,13 @@ class DryInfoCallback(CallbackData, prefix="dry_info"):
     info_type: str  # 'shopping_list' или 'about'
 
 
+class ShoppingListCallback(CallbackData, prefix="shop"):
+    """Callback для списка продуктов рациона на несколько дней"""
+    calories: int
+    first_day: int
+    last_day: int
+
+
 class FMDDayCallback(CallbackData, prefix="fmd_day"):
     """Callback для выбора дня FMD протокола"""
     day: int
@@ -289,6 +296,8 @@ class UserListCallback(CallbackData, prefix="user_list"):
     user_id: int = 0
     page: int = 0
     payment_filter: str = "all"  # all / paid_main / paid_fmd / paid_bundle / paid_dry
+    cursor: int = 0  # user_id граничной записи соседней страницы (keyset-пагинация)
+    backward: bool = False  # True — листаем назад от cursor
 
 
 class UserActionCallback(CallbackData, prefix="user_act"):
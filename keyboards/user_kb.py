@@ -4,11 +4,14 @@ from aiogram.utils.keyboard import InlineKeyboardBuilder, ReplyKeyboardBuilder
 from keyboards.callbacks import (
     PaymentCallback, CaloriesCallback, DayCallback, BackCallback,
     FMDPaymentCallback, FMDDayCallback, ProductSelectCallback, BackToProductsCallback,
-    FMDInfoCallback, BundlePaymentCallback, DryPaymentCallback, DryDayCallback, DryInfoCallback
+    FMDInfoCallback, BundlePaymentCallback, DryPaymentCallback, DryDayCallback, DryInfoCallback,
+    ShoppingListCallback
 )
 from data.recipes import RECIPES, FMD_RECIPES, DRY_RECIPES
 from config import PAYMENT_AMOUNT, FMD_PAYMENT_AMOUNT, DRY_PAYMENT_AMOUNT
 
+SHOPPING_LIST_DAYS = 7  # Дней в одном списке продуктов на клавиатуре рациона
+
 
 def get_main_menu() -> ReplyKeyboardMarkup:
     """Главное меню с командами"""
@@ -54,27 +57,36 @@ def get_days_keyboard(calories: int) -> InlineKeyboardMarkup:
     """Клавиатура выбора дня для конкретной калорийности"""
     builder = InlineKeyboardBuilder()
 
-    days = RECIPES.get(calories, {})
-    for day in sorted(days.keys()):
+    days = sorted(RECIPES.get(calories, {}).keys())
+    for day in days:
         builder.button(
             text=f"📅 День {day}",
             callback_data=DayCallback(calories=calories, day=day)
         )
 
+    # Списки продуктов по неделям
+    weeks = [days[i:i + SHOPPING_LIST_DAYS] for i in range(0, len(days), SHOPPING_LIST_DAYS)]
+    for week in weeks:
+        builder.button(
+            text=f"🛒 Продукты: дни {week[0]}–{week[-1]}",
+            callback_data=ShoppingListCallback(calories=calories, first_day=week[0], last_day=week[-1])
+        )
+
     # Кнопка назад
     builder.button(
         text="⬅️ Назад к калориям",
         callback_data=BackCallback(to="calories")
     )
 
-    # Дни по 3 в ряд, кнопка назад отдельно
+    # Дни по 3 в ряд, списки продуктов в один ряд, кнопка назад отдельно
     days_count = len(days)
     if days_count <= 3:
-        builder.adjust(days_count, 1)
+        day_rows = [days_count] if days_count else []
     elif days_count == 4:
-        builder.adjust(2, 2, 1)
+        day_rows = [2, 2]
     else:
-        builder.adjust(3, 3, 1)
+        day_rows = [3] * (days_count // 3) + ([days_count % 3] if days_count % 3 else [])
+    builder.adjust(*day_rows, *([len(weeks)] if weeks else []), 1)
 
     return builder.as_markup()
 
@@ -0,0 +1,62 @@
+"""
+Общие фикстуры тестов.
+
+Тесты базы выполняются на обоих бэкендах: SQLite — всегда (файл во
+временном каталоге), PostgreSQL — если задан TEST_DATABASE_URL, иначе
+пропускаются. Перед каждым тестом схемы public и archive этой базы
+пересоздаются, поэтому TEST_DATABASE_URL должен указывать на отдельную
+базу только для тестов:
+
+    TEST_DATABASE_URL=postgresql://postgres@localhost/bot_test python -m pytest tests
+"""
+import asyncio
+import os
+
+import pytest
+
+import database as db
+
+TEST_DATABASE_URL = os.getenv('TEST_DATABASE_URL')
+
+
+async def _reset_postgres():
+    """Пустая база PostgreSQL: схемы public и archive пересоздаются"""
+    async with db.connection() as conn:
+        await conn.execute('DROP SCHEMA IF EXISTS archive CASCADE')
+        await conn.execute('DROP SCHEMA IF EXISTS public CASCADE')
+        await conn.execute('CREATE SCHEMA public')
+
+
+@pytest.fixture(params=['sqlite', 'postgresql'])
+def run_db(request, tmp_path, monkeypatch):
+    """
+    Выполнить async-функцию без аргументов на чистой базе бэкенда.
+
+    До неё открывается пул и применяются миграции, после — пул закрывается.
+    Каждый вызов идёт в своём цикле событий (asyncio.run).
+    """
+    if request.param == 'postgresql':
+        if not TEST_DATABASE_URL:
+            pytest.skip('TEST_DATABASE_URL не задан')
+        monkeypatch.setattr(db, 'DATABASE_URL', TEST_DATABASE_URL)
+    else:
+        monkeypatch.setattr(db, 'DATABASE_URL', None)
+        monkeypatch.setattr(db, 'DATABASE_NAME', str(tmp_path / 'bot.db'))
+
+    # Кэши модуля не должны переносить данные между тестами
+    monkeypatch.setattr(db, '_user_cache', db.UserCache())
+    monkeypatch.setattr(db, '_recipe_text_cache', db.RecipeTextCache())
+    monkeypatch.setattr(db, '_recipe_overrides', db.RecipeOverrides())
+    monkeypatch.setattr(db, '_cache_sync', db.CacheSync())
+
+    async def run_in_pool(test):
+        await db.init_pool()
+        try:
+            if not db._is_sqlite():
+                await _reset_postgres()
+            await db.init_db()
+            return await test()
+        finally:
+            await db.close_pool()
+
+    return lambda test: asyncio.run(run_in_pool(test))
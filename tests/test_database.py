@@ -0,0 +1,285 @@
+"""database.py на обоих бэкендах (см. фикстуру run_db в conftest.py)"""
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import database as db
+from database import EventType
+
+
+async def _fetchval(sql: str, parameters=()):
+    async with db.connection() as conn:
+        async with conn.execute(sql, parameters) as cursor:
+            return (await cursor.fetchone())[0]
+
+
+async def _insert_event(user_id: int, event_type: str, when: datetime):
+    """Событие с заданным временем в обход буфера"""
+    async with db.connection() as conn:
+        await conn.execute(
+            db._INSERT_EVENT_SQL, (user_id, event_type, None, when.isoformat(), db._epoch(when))
+        )
+        await conn.commit()
+
+
+# ==================== Миграции ====================
+
+def test_init_db_migrates_to_latest_version_once(run_db):
+    async def scenario():
+        async with db.connection() as conn:
+            assert await db._backend.get_schema_version(conn) == db.SCHEMA_VERSION
+        # Повторный запуск ничего не применяет и ничего не дозаполняет
+        assert await db.init_db() == []
+        assert await db.backfill_timestamps() == 0
+        for table in ('users', 'user_events', 'daily_rollups', 'chain_message_totals'):
+            assert await _fetchval(f'SELECT COUNT(*) FROM {table}') == 0
+
+    run_db(scenario)
+
+
+# ==================== rowcount и RETURNING ====================
+
+def test_returning_ids_and_rowcounts(run_db):
+    async def scenario():
+        await db.add_user(1, 'anna', 'Анна')
+        await db.add_user(2, 'kate', 'Kate')
+
+        first = await db.create_payment_request(1, 100, 'main')
+        second = await db.create_payment_request(2, 101, 'fmd')
+        assert isinstance(first, int) and second > first
+
+        chain_id = await db.create_chain('Welcome', 'manual', created_by=1)
+        assert await db.update_chain(chain_id, name='Welcome 2') is True
+        assert await db.update_chain(chain_id + 1000, name='Missing') is False
+
+        auto_id = await db.create_auto_broadcast('only_start', 'Hi', 24, created_by=1)
+        assert await db.mark_auto_broadcast_sent_many(auto_id, [1, 2, 2]) == 2
+        assert await db.mark_auto_broadcast_sent_many(auto_id, [1, 2]) == 0
+        assert await _fetchval(
+            'SELECT COUNT(*) FROM auto_broadcast_sent WHERE auto_broadcast_id = ?', (auto_id,)) == 2
+        assert await _fetchval('SELECT sent_count FROM auto_broadcasts WHERE id = ?', (auto_id,)) == 2
+
+    run_db(scenario)
+
+
+# ==================== Upsert ====================
+
+def test_add_user_updates_existing_row(run_db):
+    async def scenario():
+        await db.add_user(1, 'anna', 'Анна')
+        await db.add_user(1, 'anna_fit', 'Анна')
+        assert await _fetchval('SELECT COUNT(*) FROM users') == 1
+        assert (await db.get_user(1))['username'] == 'anna_fit'
+
+    run_db(scenario)
+
+
+def test_start_chain_for_users_enrolls_and_restarts(run_db):
+    async def scenario():
+        for user_id in (1, 2, 3):
+            await db.add_user(user_id, f'user{user_id}', 'User')
+        chain_id = await db.create_chain('Welcome', 'manual', created_by=1)
+        step_id = await db.add_chain_step(chain_id, 1, 'Hello')
+
+        assert await db.start_chain_for_users(chain_id, step_id, 'all') == {'enrolled': 3, 're_enrolled': 0}
+        # Активные остаются на своём шаге, завершившие перезапускаются
+        await db.complete_user_chain(2, chain_id)
+        assert await db.start_chain_for_users(chain_id, step_id, 'all') == {'enrolled': 0, 're_enrolled': 1}
+        assert (await db.get_user_chain_state(2, chain_id))['status'] == 'active'
+
+    run_db(scenario)
+
+
+# ==================== Daily Rollups ====================
+
+def test_reports_sum_rollups_and_tail(run_db):
+    async def scenario():
+        now = int(time.time())
+        for user_id in (1, 2, 3):
+            await db.add_user(user_id, f'user{user_id}', 'User')
+        await db._write_events([
+            (1, EventType.START_COMMAND, None, '', now - 10 * 86400),
+            (1, EventType.START_COMMAND, None, '', now),
+            (1, EventType.PAYMENT_BUTTON_CLICKED, None, '', now),
+            (1, EventType.RATION_VIEWED, None, '', now),
+            (2, EventType.START_COMMAND, None, '', now - 86400),
+        ])
+        # До первого пересчёта отчёт целиком считается по хвосту
+        before = await db.get_stats()
+        assert await db.refresh_daily_rollups() > 0
+        assert await db.get_stats() == before
+        assert before['started_users'] == 2
+        assert before['clicked_but_no_screenshot'] == 1
+        assert before['only_start'] == 2
+
+        # Пользователь 1 прислал скриншот после пересчёта: попадает в хвост
+        await db._write_events([(1, EventType.SCREENSHOT_SENT, None, '', now)])
+        stats = await db.get_stats()
+        assert stats['sent_screenshot'] == 1
+        assert stats['clicked_but_no_screenshot'] == 0
+        assert stats['started_users'] == 2
+
+        # Повторный пересчёт с перекрытием не удваивает уже посчитанные дни
+        await db.refresh_daily_rollups()
+        assert await db.get_stats() == stats
+        report = await db.get_weekly_report()
+        assert report['started_week'] == 1
+        assert report['clicked_payment_week'] == 1
+        assert report['new_users_week'] == 3
+
+    run_db(scenario)
+
+
+def test_rollup_days_follow_each_rows_utc_offset(run_db, monkeypatch):
+    async def scenario():
+        # Переход на летнее время: 29.03.2026 01:00 UTC, смещение +1 -> +2 часа
+        switch = int(datetime(2026, 3, 29, 1, tzinfo=timezone.utc).timestamp())
+        assert db._utc_offsets(switch - 86400, switch + 86400) == [
+            (switch - 86400, 3600), (switch, 7200),
+        ]
+        await db._write_events([
+            # 00:30 по Берлину 29.03 (ещё +1)
+            (1, EventType.START_COMMAND, None, '', switch - 1800),
+            # 23:30 29.03 и 00:30 30.03 по Берлину (уже +2)
+            (2, EventType.START_COMMAND, None, '', switch + 20 * 3600 + 1800),
+            (3, EventType.START_COMMAND, None, '', switch + 21 * 3600 + 1800),
+        ])
+        async with db.connection() as conn:
+            rollups = await db._rollup_rows(conn, switch - 86400, switch + 2 * 86400)
+        assert rollups == {
+            ('2026-03-29', 'all'): {'started_users': 2},
+            ('2026-03-30', 'all'): {'started_users': 1},
+        }
+
+    with monkeypatch.context() as context:
+        context.setenv('TZ', 'Europe/Berlin')
+        time.tzset()
+        try:
+            run_db(scenario)
+        finally:
+            context.undo()
+            time.tzset()
+
+
+# ==================== Правки рецептов ====================
+
+def test_reloaded_overrides_reset_changed_days(run_db):
+    async def scenario():
+        await db.save_recipe(1200, 1, 'breakfast', 'Омлет', updated_by='admin')
+        await db.load_recipe_overrides()
+        for day in (1, 2):
+            _, generation = db.get_cached_recipe_text('rations', 1200, day)
+            db.cache_recipe_text('rations', 1200, day, f'День {day}', generation)
+
+        # Правку дня 1 поменял другой процесс, набор перечитан по сроку
+        async with db.connection() as conn:
+            await conn.execute("UPDATE recipes SET content = 'Сырники' WHERE calories = 1200 AND day = 1")
+            await conn.commit()
+        assert (await db.load_recipe_overrides())[(1200, 1, 'breakfast')] == 'Сырники'
+
+        assert db.get_cached_recipe_text('rations', 1200, 1)[0] is None
+        assert db.get_cached_recipe_text('rations', 1200, 2)[0] == 'День 2'
+
+    run_db(scenario)
+
+
+# ==================== Сверка кэшей между процессами ====================
+
+async def _change_in_other_process(sql: str, cache: str):
+    """Изменение, сделанное другим процессом бота: его кэши этот процесс не видит"""
+    async with db.connection() as conn:
+        await conn.execute(sql)
+        await db._bump_cache_generation(conn, cache)
+        await conn.commit()
+
+
+def test_cache_sync_resets_caches_changed_by_other_process(run_db):
+    async def scenario():
+        await db.add_user(1, 'anna', 'Анна')
+        await db.add_user(2, 'kate', 'Kate')
+        await db._cache_sync.check()
+        await db.load_recipe_overrides()
+        assert await db.get_entitlements(1) == db.Entitlement.NONE
+
+        # Свои изменения сбрасываются точечно, полного сброса нет
+        await db.set_payment_status(2, True)
+        await db._cache_sync.check()
+        assert db._cache_sync.resets == 0
+        assert await db.get_entitlements(2) == db.Entitlement.MAIN
+
+        await _change_in_other_process('UPDATE users SET has_paid = 1 WHERE user_id = 1', 'users')
+        await _change_in_other_process(
+            "INSERT INTO recipes (calories, day, meal_type, content, updated_by) "
+            "VALUES (1200, 1, 'breakfast', 'Сырники', 'admin')", 'recipes')
+        assert await db.get_entitlements(1) == db.Entitlement.NONE
+        assert await db.get_recipe(1200, 1, 'breakfast') is None
+
+        await db._cache_sync.check()
+        assert db._cache_sync.resets == 2
+        assert await db.get_entitlements(1) == db.Entitlement.MAIN
+        assert await db.get_recipe(1200, 1, 'breakfast') == 'Сырники'
+
+    run_db(scenario)
+
+
+# ==================== Списки пользователей ====================
+
+def test_users_page_filters(run_db):
+    async def scenario():
+        for user_id in (1, 2, 3):
+            await db.add_user(user_id, None, f'User {user_id}')
+        await db.set_payment_status(2, True)
+
+        users, has_more = await db.get_users_page('paid_main')
+        assert [user['user_id'] for user in users] == [2] and not has_more
+        assert await db.count_users('all') == 3
+        # Неизвестный фильтр не подменяется списком всех пользователей
+        for query in (db.get_users_page('search'), db.count_users('paid')):
+            with pytest.raises(ValueError):
+                await query
+
+    run_db(scenario)
+
+
+# ==================== Поиск пользователей ====================
+
+def test_search_users(run_db):
+    async def scenario():
+        await db.add_user(1, 'anna_fit', 'Анна')
+        await db.add_user(2, 'kate', 'Kate')
+        await db.add_user(3, 'fit_kate', 'Катя')
+
+        assert [u['user_id'] for u in await db.search_user_by_username_or_id('2')] == [2]
+        assert [u['user_id'] for u in await db.search_user_by_username_or_id('@anna_fit')] == [1]
+        # Точное совпадение username — первым, остальные — от новых к старым
+        assert [u['user_id'] for u in await db.search_user_by_username_or_id('kate')] == [2, 3]
+        assert {u['user_id'] for u in await db.search_user_by_username_or_id('FIT')} == {1, 3}
+        assert [u['user_id'] for u in await db.search_user_by_username_or_id('Катя')] == [3]
+        assert await db.search_user_by_username_or_id('nobody') == []
+        # Короче трёх символов — только начало username или имени
+        assert [u['user_id'] for u in await db.search_user_by_username_or_id('KA')] == [2]
+        assert [u['user_id'] for u in await db.search_user_by_username_or_id('fi')] == [3]
+        assert await db.search_user_by_username_or_id('_') == []
+
+    run_db(scenario)
+
+
+# ==================== Архивация ====================
+
+def test_retention_archives_repeated_old_events(run_db):
+    async def scenario():
+        old = datetime.now() - timedelta(days=db.RETENTION_DAYS['user_events'] + 30)
+        await db.add_user(1, 'anna', 'Анна')
+        await _insert_event(1, EventType.START_COMMAND, old)
+        await _insert_event(1, EventType.START_COMMAND, old + timedelta(hours=1))
+        await _insert_event(1, EventType.RATION_VIEWED, old)
+        await _insert_event(1, EventType.START_COMMAND, datetime.now())
+
+        stats = await db.run_retention()
+        assert stats['tables']['user_events']['archived'] == 1
+        # Первое событие каждого типа остаётся: на нём держатся воронки и аудитории
+        assert await _fetchval('SELECT COUNT(*) FROM user_events') == 3
+        assert (await db.run_retention())['archived'] == 0
+
+    run_db(scenario)
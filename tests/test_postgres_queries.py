@@ -0,0 +1,63 @@
+"""Перевод запросов в стиле sqlite3 для asyncpg (без сервера PostgreSQL)"""
+import pytest
+
+from backends.postgres import _compile_query, _status_rowcount, translate_query
+
+
+def test_positional_parameters_are_numbered():
+    assert _compile_query('SELECT * FROM users WHERE user_id = ? AND has_paid = ?') == (
+        'SELECT * FROM users WHERE user_id = $1 AND has_paid = $2', (0, 1)
+    )
+
+
+def test_repeated_named_parameter_reuses_number():
+    query, keys = _compile_query('WHERE a >= :week_ago OR b >= :week_ago AND c = :start')
+    assert query == 'WHERE a >= $1 OR b >= $1 AND c = $2'
+    assert keys == ('week_ago', 'start')
+
+
+def test_quoted_strings_and_identifiers_are_kept():
+    sql = '''SELECT '?', 'it''s :name ?', "odd?column" FROM t WHERE a = ?'''
+    assert _compile_query(sql) == (
+        '''SELECT '?', 'it''s :name ?', "odd?column" FROM t WHERE a = $1''', (0,)
+    )
+
+
+def test_unterminated_string_is_kept_to_the_end():
+    assert _compile_query("SELECT ? || 'abc ?") == ("SELECT $1 || 'abc ?", (0,))
+
+
+def test_casts_are_not_parameters():
+    query, keys = _compile_query('SELECT created_ts::text, :value::integer, CAST(? AS INTEGER)')
+    assert query == 'SELECT created_ts::text, $1::integer, CAST($2 AS INTEGER)'
+    assert keys == ('value', 0)
+
+
+@pytest.mark.parametrize('sql, expected', [
+    ('-- user_id = ? :name\nSELECT ?', '-- user_id = ? :name\nSELECT $1'),
+    ('SELECT ? -- trailing ?', 'SELECT $1 -- trailing ?'),
+    ('/* ? :name */ SELECT ? /* ? */', '/* ? :name */ SELECT $1 /* ? */'),
+    ('SELECT ? /* unterminated ?', 'SELECT $1 /* unterminated ?'),
+])
+def test_comments_are_kept(sql, expected):
+    assert _compile_query(sql) == (expected, (0,))
+
+
+def test_translate_query_orders_arguments():
+    assert translate_query('SELECT :b, :a, :b', {'a': 1, 'b': 2}) == ('SELECT $1, $2, $1', [2, 1])
+    assert translate_query('SELECT ?, ?', (5, 6)) == ('SELECT $1, $2', [5, 6])
+    assert translate_query('SELECT 1', None) == ('SELECT 1', [])
+
+
+@pytest.mark.parametrize('status, rowcount', [
+    ('INSERT 0 5', 5),
+    ('INSERT 0 0', 0),
+    ('UPDATE 3', 3),
+    ('DELETE 1', 1),
+    ('SELECT 2', -1),
+    ('CREATE TABLE', -1),
+    ('BEGIN', -1),
+    ('COMMIT', -1),
+])
+def test_status_rowcount(status, rowcount):
+    assert _status_rowcount(status) == rowcount
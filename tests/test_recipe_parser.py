@@ -0,0 +1,29 @@
+"""Разбор строк ингредиентов (data/recipe_parser.py)"""
+import pytest
+
+from data.recipe_parser import parse_ingredient
+
+
+@pytest.mark.parametrize('line, name, quantity, unit, note', [
+    ('• Помидор - 50 г', 'Помидор', 50, 'г', ''),
+    ('• Молоко 2,5% — 1,5 л', 'Молоко 2,5%', 1500, 'мл', ''),
+    ('• Яйцо — 1-2 шт', 'Яйцо', 2, 'шт', ''),
+    ('• Хлеб — 80 г (2 кусочка по 40 г)', 'Хлеб', 80, 'г', '(2 кусочка по 40 г)'),
+    ('• Цельнозерновой хлеб – 2 кусочка', 'Цельнозерновой хлеб', 2, 'кусочек', ''),
+    ('• Чеснок — 3 зубчика', 'Чеснок', 3, 'зубчик', ''),
+    # Запятые в скобках — уточнение одного продукта
+    ('• Филе белой рыбы (треска, палтус) - 250 г', 'Филе белой рыбы (треска, палтус)', 250, 'г', ''),
+])
+def test_ingredient_with_quantity(line, name, quantity, unit, note):
+    assert parse_ingredient(line) == {'name': name, 'quantity': quantity, 'unit': unit, 'note': note}
+
+
+@pytest.mark.parametrize('line, name, note', [
+    ('• Соль, перец по вкусу', 'Соль, перец', ''),
+    ('• Соль — 2 щепотки', 'Соль', '2 щепотки'),
+    # Количество на несколько продуктов сразу не делится между ними
+    ('• Зеленый лук, сельдерей — 200 г', 'Зеленый лук, сельдерей', '200 г'),
+    ('• 1 целое яйцо + 3 белка', '1 целое яйцо + 3 белка', ''),
+])
+def test_ingredient_to_taste(line, name, note):
+    assert parse_ingredient(line) == {'name': name, 'quantity': None, 'unit': '', 'note': note}